@@ -0,0 +1,94 @@
+"""! This file contain the main function to run the benchmarks.
+Results are saved as JSON so they can be compared between two versions of the app.
+
+@author Benjamin PAUMARD
+@version 1.0.0
+@since 19 October 2026
+"""
+
+# !/usr/bin/env python
+
+# -*- coding: utf-8 -*-
+
+import json
+import sys
+
+from benchmark.benchmark_runner import BenchmarkRunner
+from benchmark.benchmark_comparator import BenchmarkComparator
+from benchmark.startup_benchmark import StartupBenchmark
+
+
+def print_help() -> None:
+    """! A function that print help."""
+
+    print("-o '{path}' run the benchmarks and save the results in a JSON file.")
+    print("   -n '{size}' number of generated records (default 1000).")
+    print("   -r '{richness}' richness of the generated records, from 0 to 3 (default 2).")
+    print("   -t '{times}' number of runs of each benchmark (default 3).")
+    print("   -s '{seed}' seed of the generators (default 42).")
+    print("-c '{base path}' '{new path}' compare two results, the exit code is 1 if a benchmark is slower.")
+    print("   -l '{ratio}' tolerated slowdown (default 0.1 for 10%).")
+    print("-u '{budget}' measure the imports of the short CLI commands, the exit code is 1 if one is over the budget in ms.")
+
+
+def main(argv: list) -> int:
+    """! Function executing the benchmarks and processing the arguments passed in parameters.
+
+    @param argv the parameters passed by the user.
+    @return the exit code.
+    """
+    # read the options, each option is followed by its value
+    options: dict[str, list[str]] = {}
+    i: int = 1
+    while i < len(argv):
+        if argv[i] == '-c':
+            options['-c'] = argv[i + 1:i + 3]
+            i += 3
+        else:
+            options[argv[i]] = argv[i + 1:i + 2]
+            i += 2
+
+    # run the benchmarks
+    if '-o' in options and len(options['-o']) == 1:
+        runner: BenchmarkRunner = BenchmarkRunner(
+            int(options.get('-n', ['1000'])[0]),
+            int(options.get('-r', ['2'])[0]),
+            int(options.get('-t', ['3'])[0]),
+            int(options.get('-s', ['42'])[0])
+        )
+        results: dict = runner.run()
+
+        with open(options['-o'][0], 'w') as f:
+            json.dump(results, f, indent=2)
+
+        # print a summary
+        for name, result in results['results'].items():
+            print(f"{name:<24}{result['seconds']:>12.4f} s")
+        return 0
+
+    # compare two results
+    if '-c' in options and len(options['-c']) == 2:
+        with open(options['-c'][0], 'r') as f:
+            base: dict = json.load(f)
+        with open(options['-c'][1], 'r') as f:
+            new: dict = json.load(f)
+
+        comparator: BenchmarkComparator = BenchmarkComparator(float(options.get('-l', ['0.1'])[0]))
+        rows = comparator.compare(base, new)
+        print(comparator.format(rows))
+
+        # fail if a benchmark is slower
+        return 1 if any(row[4] for row in rows) else 0
+
+    # measure the start of the CLI
+    if '-u' in options and len(options['-u']) == 1:
+        in_budget, report = StartupBenchmark(float(options['-u'][0])).run()
+        print(report)
+        return 0 if in_budget else 1
+
+    print_help()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
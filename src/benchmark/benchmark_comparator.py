@@ -0,0 +1,63 @@
+"""! File containing the comparator of benchmark results.
+Two JSON results are compared to find the slowdowns.
+
+@author Benjamin PAUMARD
+@version 1.0.0
+@since 19 October 2026
+"""
+
+
+class BenchmarkComparator:
+    """! Class that compare two benchmark results.
+    A benchmark is a slowdown when the new time is over the base time by more than the threshold.
+    Benchmarks too short to be measured reliably are never reported as slowdowns.
+
+    @author Benjamin PAUMARD
+    @version 1.0.0
+    @since 19 October 2026
+    """
+
+    def __init__(self, threshold: float = 0.1, min_seconds: float = 0.01) -> None:
+        """! Constructor of the BenchmarkComparator.
+
+        @param threshold the tolerated relative slowdown, 0.1 for 10% (optional).
+        @param min_seconds the base time under which a benchmark is too noisy to be reported (optional).
+        """
+        self.__threshold: float = threshold
+        self.__min_seconds: float = min_seconds
+
+    def compare(self, base: dict, new: dict) -> list[tuple[str, float, float, float, bool]]:
+        """! Method that compare two results.
+        Only the benchmarks present in both results are compared.
+
+        @param base the base result, loaded from JSON.
+        @param new the new result, loaded from JSON.
+        @return a list of (name, base seconds, new seconds, ratio, slowdown).
+        """
+        rows: list[tuple[str, float, float, float, bool]] = []
+        base_results: dict = base.get('results', {})
+        new_results: dict = new.get('results', {})
+
+        for name in base_results.keys():
+            if name not in new_results:
+                continue
+
+            base_seconds: float = base_results[name]['seconds']
+            new_seconds: float = new_results[name]['seconds']
+            ratio: float = new_seconds / base_seconds if base_seconds > 0 else 1
+            slowdown: bool = ratio > 1 + self.__threshold and base_seconds >= self.__min_seconds
+            rows.append((name, base_seconds, new_seconds, ratio, slowdown))
+
+        return rows
+
+    @staticmethod
+    def format(rows: list[tuple[str, float, float, float, bool]]) -> str:
+        """! Method that format a comparison as a table.
+
+        @param rows the rows returned by the compare method.
+        @return the table as a string.
+        """
+        lines: list[str] = [f"{'benchmark':<24}{'base (s)':>12}{'new (s)':>12}{'ratio':>9}"]
+        for name, base_seconds, new_seconds, ratio, slowdown in rows:
+            lines.append(f"{name:<24}{base_seconds:>12.4f}{new_seconds:>12.4f}{ratio:>9.2f}{'  SLOWER' if slowdown else ''}")
+        return '\n'.join(lines)
@@ -0,0 +1,145 @@
+"""! File containing the runner of the benchmarks.
+Every hot path of the managers and the CLI is timed on generated files.
+
+@author Benjamin PAUMARD
+@version 1.0.0
+@since 19 October 2026
+"""
+
+# importing libs
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import Callable
+
+# importing modules
+from benchmark.vcf_generator import VCFGenerator
+from benchmark.ics_generator import ICSGenerator
+from process.manager.vcf_manager import VCFManager
+from process.manager.ics_manager import ICSManager
+from process.builder.vcalendar_builder import VCalendarBuilder
+from process.stream.content_line_reader import ContentLineReader
+
+# path of the CLI script, run end-to-end
+CLI_PATH: str = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'cli.py')
+
+
+class BenchmarkRunner:
+    """! Class that run the benchmarks.
+    Each benchmark is run many times and the best time is kept, which is the least noisy measure.
+
+    @author Benjamin PAUMARD
+    @version 1.0.0
+    @since 19 October 2026
+    """
+
+    def __init__(self, size: int = 1000, richness: int = 2, repeat: int = 3, seed: int = 42) -> None:
+        """! Constructor of the BenchmarkRunner.
+
+        @param size the number of records of the generated files (optional).
+        @param richness the richness of the generated records, from 0 to 3 (optional).
+        @param repeat the number of runs of each benchmark (optional).
+        @param seed the seed of the generators (optional).
+        """
+        self.__size: int = size
+        self.__richness: int = richness
+        self.__repeat: int = repeat
+        self.__seed: int = seed
+        self.__results: dict[str, dict] = {}
+
+    def measure(self, name: str, function: Callable[[], None], records: int = 0, size: int = 0) -> None:
+        """! Method that time a function and store its result.
+
+        @param name the name of the benchmark.
+        @param function the function to time.
+        @param records the number of records handled by the function (optional).
+        @param size the number of bytes handled by the function (optional).
+        """
+        runs: list[float] = []
+        for _ in range(self.__repeat):
+            start: int = time.perf_counter_ns()
+            function()
+            runs.append((time.perf_counter_ns() - start) / 1e9)
+
+        self.__results[name] = {
+            'seconds': min(runs),
+            'runs': runs,
+            'records': records,
+            'bytes': size,
+        }
+
+    @staticmethod
+    def run_cli(*args: str) -> None:
+        """! Method that run the CLI in a new interpreter.
+        The output of the CLI is discarded.
+
+        @param args the arguments given to the CLI.
+        """
+        subprocess.run([sys.executable, CLI_PATH, *args], stdout=subprocess.DEVNULL, check=True)
+
+    def run(self) -> dict:
+        """! Method that run every benchmark.
+        The files are generated in a temporary directory that is removed at the end.
+
+        @return the results, ready to be saved as JSON.
+        """
+        self.__results = {}
+
+        with tempfile.TemporaryDirectory() as directory:
+            vcf_path: str = os.path.join(directory, 'contacts.vcf')
+            ics_path: str = os.path.join(directory, 'calendar.ics')
+            VCFGenerator(self.__seed).generate(vcf_path, self.__size, self.__richness)
+            ICSGenerator(self.__seed).generate(ics_path, self.__size, self.__richness)
+
+            # same benchmarks for both managers
+            for kind, path, manager in (('vcf', vcf_path, VCFManager()), ('ics', ics_path, ICSManager())):
+                size: int = os.path.getsize(path)
+                csv_path: str = os.path.join(directory, f"{kind}.csv")
+                html_path: str = os.path.join(directory, f"{kind}.html")
+                saved_path: str = os.path.join(directory, f"saved.{kind}")
+                sorted_path: str = os.path.join(directory, f"sorted.{kind}")
+                split_path: str = os.path.join(directory, f"split-{kind}")
+
+                self.measure(f"{kind}.read", lambda: manager.read(path), self.__size, size)
+                self.measure(f"{kind}.save", lambda: manager.save(saved_path), self.__size, size)
+                self.measure(f"{kind}.export_csv", lambda: manager.export_csv(csv_path), self.__size, size)
+                self.measure(f"{kind}.export_html", lambda: manager.export_html(html_path, True), self.__size, size)
+                self.measure(f"{kind}.import_csv", lambda: manager.import_from_file(csv_path), self.__size, os.path.getsize(csv_path))
+                self.measure(f"{kind}.import_html", lambda: manager.import_from_file(html_path), self.__size, os.path.getsize(html_path))
+
+                # end-to-end runs, including the start of the interpreter
+                self.measure(f"cli.{kind}.print", lambda: self.run_cli('-i', path), self.__size, size)
+                self.measure(f"cli.{kind}.export_csv", lambda: self.run_cli('-i', path, '-c', csv_path), self.__size, size)
+                self.measure(f"cli.{kind}.count", lambda: self.run_cli('-i', path, '--count'), self.__size, size)
+                self.measure(f"cli.{kind}.sort", lambda: self.run_cli('-sort', path, sorted_path, '1M'), self.__size, size)
+                self.measure(f"cli.{kind}.split", lambda: self.run_cli('-split', path, split_path, '--shards', '4'), self.__size, size)
+
+            # contacts with large photos cost about the same as the others, the photos are only decoded when extracted
+            photo_path: str = os.path.join(directory, 'photos.vcf')
+            VCFGenerator(self.__seed).generate(photo_path, self.__size, self.__richness, photo_size=24 * 1024)
+            photo_size: int = os.path.getsize(photo_path)
+            self.measure("vcf.read_photos", lambda: VCFManager(photo_path), self.__size, photo_size)
+            self.measure("cli.vcf.extract", lambda: self.run_cli('-extract', photo_path, os.path.join(directory, 'photos')), self.__size, photo_size)
+
+            # the calendar builder alone, on lines already read
+            lines: list[str] = list(ContentLineReader(ics_path).lines())
+            self.measure("ics.build", lambda: VCalendarBuilder().build(lines), self.__size, os.path.getsize(ics_path))
+
+            self.measure("cli.help", lambda: self.run_cli('-h'))
+
+        return {
+            'meta': {
+                'date': datetime.now().isoformat(timespec='seconds'),
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'size': self.__size,
+                'richness': self.__richness,
+                'repeat': self.__repeat,
+                'seed': self.__seed,
+            },
+            'results': self.__results,
+        }
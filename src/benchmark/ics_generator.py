@@ -0,0 +1,146 @@
+"""! File containing the generator of synthetic ICS files.
+Generated files are used by the benchmarks, the same seed always gives the same file.
+
+@author Benjamin PAUMARD
+@version 1.0.0
+@since 19 October 2026
+"""
+
+# importing libs
+import random
+from datetime import datetime, timedelta
+from io import TextIOWrapper
+
+# pieces used to build the events
+SUMMARIES: list[str] = ['Meeting', 'Lunch', 'Review', 'Call', 'Workshop', 'Lecture']
+LOCATIONS: list[str] = ['Paris', 'Cergy', 'Room 101', 'Online']
+TZIDS: list[str] = ['Europe/Paris', 'America/New_York', 'Asia/Tokyo']
+STATUSES: list[str] = ['CONFIRMED', 'TENTATIVE', 'CANCELLED']
+FREQUENCIES: list[str] = ['DAILY', 'WEEKLY', 'MONTHLY', 'YEARLY']
+
+# embedded timezone written at richness 2 and more
+VTIMEZONE: str = """BEGIN:VTIMEZONE
+TZID:Europe/Paris
+BEGIN:STANDARD
+DTSTART:19701025T030000
+TZOFFSETFROM:+0200
+TZOFFSETTO:+0100
+TZNAME:CET
+RRULE:FREQ=YEARLY;BYMONTH=10;BYDAY=-1SU
+END:STANDARD
+BEGIN:DAYLIGHT
+DTSTART:19700329T020000
+TZOFFSETFROM:+0100
+TZOFFSETTO:+0200
+TZNAME:CEST
+RRULE:FREQ=YEARLY;BYMONTH=3;BYDAY=-1SU
+END:DAYLIGHT
+END:VTIMEZONE
+"""
+
+
+class ICSGenerator:
+    """! Class that generate synthetic ICS files.
+    The richness controls how many properties each element has:
+    0 for the dates and summary only, 1 adds a location and a status, 2 adds timezones and alarms,
+    3 adds recurrence rules and todos.
+
+    @author Benjamin PAUMARD
+    @version 1.0.0
+    @since 19 October 2026
+    """
+
+    def __init__(self, seed: int = 42, start: datetime = datetime(2020, 1, 1)) -> None:
+        """! Constructor of the ICSGenerator.
+
+        @param seed the seed of the random generator (optional).
+        @param start the earliest date of the generated events (optional).
+        """
+        self.__random: random.Random = random.Random(seed)
+        self.__start: datetime = start
+
+    def write_event(self, f: TextIOWrapper, index: int, richness: int) -> None:
+        """! Method that write a single event.
+
+        @param f the file wrapper to use.
+        @param index the index of the event, used to make it unique.
+        @param richness the richness of the event.
+        """
+        rand: random.Random = self.__random
+
+        # events are spread over five years
+        dtstart: datetime = self.__start + timedelta(minutes=15 * rand.randrange(4 * 24 * 365 * 5))
+        dtend: datetime = dtstart + timedelta(minutes=15 * rand.randrange(1, 12))
+
+        f.write("BEGIN:VEVENT\n")
+        f.write(f"UID:event-{index}@vmanager\n")
+        f.write(f"DTSTAMP:{self.__start.strftime('%Y%m%dT%H%M%S')}\n")
+        f.write(f"SUMMARY:{rand.choice(SUMMARIES)} {index}\n")
+
+        if richness >= 2:
+            tzid: str = rand.choice(TZIDS)
+            f.write(f"DTSTART;TZID={tzid}:{dtstart.strftime('%Y%m%dT%H%M%S')}\n")
+            f.write(f"DTEND;TZID={tzid}:{dtend.strftime('%Y%m%dT%H%M%S')}\n")
+        else:
+            f.write(f"DTSTART:{dtstart.strftime('%Y%m%dT%H%M%S')}\n")
+            f.write(f"DTEND:{dtend.strftime('%Y%m%dT%H%M%S')}\n")
+
+        if richness >= 1:
+            f.write(f"LOCATION:{rand.choice(LOCATIONS)}\n")
+            f.write(f"STATUS:{rand.choice(STATUSES)}\n")
+
+        # one event out of ten is recurring
+        if richness >= 3 and index % 10 == 0:
+            until: datetime = dtstart + timedelta(days=rand.randrange(30, 365))
+            f.write(f"RRULE:FREQ={rand.choice(FREQUENCIES)};UNTIL={until.strftime('%Y%m%dT%H%M%S')}\n")
+
+        if richness >= 2:
+            f.write("BEGIN:VALARM\n")
+            f.write("TRIGGER:-PT10M\n")
+            f.write(f"DESCRIPTION:Reminder {index}\n")
+            f.write("ACTION:DISPLAY\n")
+            f.write("END:VALARM\n")
+
+        f.write("END:VEVENT\n")
+
+    def write_todo(self, f: TextIOWrapper, index: int) -> None:
+        """! Method that write a single todo.
+
+        @param f the file wrapper to use.
+        @param index the index of the todo, used to make it unique.
+        """
+        rand: random.Random = self.__random
+        dtstart: datetime = self.__start + timedelta(hours=rand.randrange(24 * 365 * 5))
+
+        f.write("BEGIN:VTODO\n")
+        f.write(f"UID:todo-{index}@vmanager\n")
+        f.write(f"DTSTAMP:{self.__start.strftime('%Y%m%dT%H%M%S')}\n")
+        f.write(f"SUMMARY:Task {index}\n")
+        f.write(f"DTSTART:{dtstart.strftime('%Y%m%dT%H%M%S')}\n")
+        f.write(f"DURATION:PT{rand.randrange(1, 8)}H\n")
+        f.write("STATUS:NEEDS-ACTION\n")
+        f.write("END:VTODO\n")
+
+    def generate(self, path: str, count: int, richness: int = 1) -> None:
+        """! Method that generate an ICS file.
+        At richness 3, one element out of five is a todo.
+
+        @param path the path of the file to write.
+        @param count the number of elements.
+        @param richness the richness of the elements (optional).
+        """
+        with open(path, 'w') as f:
+            f.write("BEGIN:VCALENDAR\n")
+            f.write("VERSION:2.0\n")
+            f.write("PRODID:-//vManager//Benchmark//EN\n")
+
+            if richness >= 2:
+                f.write(VTIMEZONE)
+
+            for index in range(count):
+                if richness >= 3 and index % 5 == 4:
+                    self.write_todo(f, index)
+                else:
+                    self.write_event(f, index, richness)
+
+            f.write("END:VCALENDAR\n")
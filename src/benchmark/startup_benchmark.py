@@ -0,0 +1,100 @@
+"""! File containing the benchmark of the start of the CLI.
+The imports of each command are measured with the -X importtime option of Python.
+
+@author Benjamin PAUMARD
+@version 1.0.0
+@since 19 October 2026
+"""
+
+# importing libs
+import os
+import subprocess
+import sys
+import tempfile
+
+# importing modules
+from benchmark.benchmark_runner import CLI_PATH
+from benchmark.vcf_generator import VCFGenerator
+from benchmark.ics_generator import ICSGenerator
+
+
+class StartupBenchmark:
+    """! Class that measure the time spent importing modules when running CLI commands.
+    The modules imported by an empty interpreter are not counted, they are part of every run.
+
+    @author Benjamin PAUMARD
+    @version 1.0.0
+    @since 19 October 2026
+    """
+
+    def __init__(self, budget_ms: float = 100, repeat: int = 3) -> None:
+        """! Constructor of the StartupBenchmark.
+
+        @param budget_ms the maximum import time of a command in milliseconds (optional).
+        @param repeat the number of runs of each command, the best one is kept (optional).
+        """
+        self.__budget_ms: float = budget_ms
+        self.__repeat: int = repeat
+
+    @staticmethod
+    def import_times(*args: str) -> dict[str, int]:
+        """! Method that run a Python command and returns the time spent importing each top level module.
+
+        @param args the arguments given to the interpreter.
+        @return the cumulative microseconds of each top level module.
+        """
+        result = subprocess.run([sys.executable, '-X', 'importtime', *args], stdout=subprocess.DEVNULL,
+                                stderr=subprocess.PIPE, text=True, check=True)
+
+        times: dict[str, int] = {}
+        for line in result.stderr.splitlines():
+            # lines are 'import time: self | cumulative | name', nested imports are indented
+            if not line.startswith('import time:'):
+                continue
+            fields: list[str] = line[len('import time:'):].split('|')
+            if len(fields) != 3 or not fields[1].strip().isdigit() or fields[2].startswith('  '):
+                continue
+            times[fields[2].strip()] = int(fields[1])
+        return times
+
+    def measure(self, *args: str) -> tuple[float, list[tuple[str, int]]]:
+        """! Method that measure the imports of a CLI command.
+
+        @param args the arguments given to the CLI.
+        @return the import time in milliseconds and the top level modules with their microseconds, slowest first.
+        """
+        baseline: dict[str, int] = self.import_times('-c', 'pass')
+
+        best: dict[str, int] | None = None
+        for _ in range(self.__repeat):
+            times: dict[str, int] = self.import_times(CLI_PATH, *args)
+            times = {name: value for name, value in times.items() if name not in baseline}
+            if best is None or sum(times.values()) < sum(best.values()):
+                best = times
+
+        modules: list[tuple[str, int]] = sorted(best.items(), key=lambda item: item[1], reverse=True)
+        return sum(best.values()) / 1000, modules
+
+    def run(self) -> tuple[bool, str]:
+        """! Method that measure the usual short commands of the CLI.
+
+        @return whether every command is in the budget, and a report to print.
+        """
+        lines: list[str] = [f"{'command':<12}{'imports (ms)':>14}  slowest modules"]
+        in_budget: bool = True
+
+        with tempfile.TemporaryDirectory() as directory:
+            vcf_path: str = os.path.join(directory, 'contacts.vcf')
+            ics_path: str = os.path.join(directory, 'calendar.ics')
+            VCFGenerator().generate(vcf_path, 10)
+            ICSGenerator().generate(ics_path, 10)
+
+            for name, args in (('help', ('-h',)), ('dir', ('-d', directory)),
+                               ('vcf', ('-i', vcf_path)), ('ics', ('-i', ics_path))):
+                milliseconds, modules = self.measure(*args)
+                over: bool = milliseconds > self.__budget_ms
+                in_budget = in_budget and not over
+                slowest: str = ', '.join(f"{module} {value / 1000:.1f}" for module, value in modules[:3])
+                lines.append(f"{name:<12}{milliseconds:>14.1f}  {slowest}{'  OVER BUDGET' if over else ''}")
+
+        return in_budget, '\n'.join(lines)
@@ -0,0 +1,111 @@
+"""! File containing the generator of synthetic VCF files.
+Generated files are used by the benchmarks, the same seed always gives the same file.
+
+@author Benjamin PAUMARD
+@version 1.0.0
+@since 19 October 2026
+"""
+
+# importing libs
+import base64
+import random
+from io import TextIOWrapper
+
+# pieces used to build the contacts
+FIRST_NAMES: list[str] = ['John', 'Jane', 'Marie', 'Paul', 'Luc', 'Anne', 'Jean', 'Pierre', 'Sophie', 'Lucas', 'Emma', 'Louis']
+LAST_NAMES: list[str] = ['Doe', 'Smith', 'Martin', 'Bernard', 'Dubois', 'Thomas', 'Robert', 'Richard', 'Petit', 'Durand']
+CITIES: list[str] = ['Paris', 'Lyon', 'Cergy', 'Lille', 'Nantes', 'Bordeaux']
+ORGS: list[str] = ['CY Cergy Paris University', 'Example', 'ACME', 'Initech']
+TYPES: list[str] = ['HOME', 'WORK', 'CELL']
+
+
+class VCFGenerator:
+    """! Class that generate synthetic VCF files.
+    The richness controls how many properties each card has:
+    0 for names only, 1 adds an email and a phone, 2 adds an address, an organization, a title, a note and categories,
+    3 adds more emails, phones and addresses and an embedded photo.
+
+    @author Benjamin PAUMARD
+    @version 1.0.0
+    @since 19 October 2026
+    """
+
+    def __init__(self, seed: int = 42) -> None:
+        """! Constructor of the VCFGenerator.
+
+        @param seed the seed of the random generator (optional).
+        """
+        self.__random: random.Random = random.Random(seed)
+
+    def write_card(self, f: TextIOWrapper, index: int, version: str, richness: int, photo_size: int = 0) -> None:
+        """! Method that write a single card.
+
+        @param f the file wrapper to use.
+        @param index the index of the card, used to make it unique.
+        @param version the version of the card, 2.1, 3.0 or 4.0.
+        @param richness the richness of the card.
+        @param photo_size the size of a photo added to the card, folded on lines of 75 characters, 0 for none (optional).
+        """
+        rand: random.Random = self.__random
+        first: str = rand.choice(FIRST_NAMES)
+        last: str = f"{rand.choice(LAST_NAMES)}{index}"
+
+        f.write("BEGIN:VCARD\n")
+        f.write(f"VERSION:{version}\n")
+        f.write(f"UID:urn:uuid:card-{index}\n")
+        f.write(f"N:{last};{first};;;\n")
+        f.write(f"FN:{first} {last}\n")
+
+        if richness >= 1:
+            # the number of each property grows with the richness
+            count: int = 1 if richness < 3 else 3
+            for i in range(count):
+                email_type: str = TYPES[i % len(TYPES)]
+                address: str = f"{first}.{last}{i}@example.com".lower()
+                phone: str = f"+33 6 {rand.randrange(10**8):08d}"
+
+                # types are written differently in the 4.0 version
+                if version == '4.0':
+                    f.write(f"EMAIL;VALUE={email_type}:{address}\n")
+                    f.write(f"TEL;VALUE={email_type}:{phone}\n")
+                else:
+                    f.write(f"EMAIL;TYPE={email_type}:{address}\n")
+                    f.write(f"TEL;TYPE={email_type}:{phone}\n")
+
+        if richness >= 2:
+            count: int = 1 if richness < 3 else 2
+            for i in range(count):
+                f.write(f"ADR;TYPE={TYPES[i]}:;;{rand.randrange(1, 200)} rue de la Paix;{rand.choice(CITIES)};;{rand.randrange(10000, 99999)};France\n")
+            f.write(f"ORG:{rand.choice(ORGS)}\n")
+            f.write(f"TITLE:Engineer {index}\n")
+            f.write(f"NOTE:Generated contact number {index}\n")
+            f.write("CATEGORIES:friends,work\n")
+
+        if richness >= 3:
+            # a small photo, written as a single base64 line
+            photo: str = base64.b64encode(rand.randbytes(3 * 1024)).decode()
+            if version == '2.1':
+                f.write(f"PHOTO;ENCODING=BASE64;TYPE=JPEG:{photo}\n")
+            else:
+                f.write(f"PHOTO;ENCODING=b;TYPE=JPEG:{photo}\n")
+
+        if photo_size > 0:
+            # a large photo, folded like most applications write them
+            line: str = f"PHOTO;ENCODING=b;TYPE=JPEG:{base64.b64encode(rand.randbytes(photo_size)).decode()}"
+            f.write('\n '.join(line[start:start + 74] for start in range(0, len(line), 74)) + '\n')
+
+        f.write("END:VCARD\n")
+
+    def generate(self, path: str, count: int, richness: int = 1, versions: list[str] = ['2.1', '3.0', '4.0'], photo_size: int = 0) -> None:
+        """! Method that generate a VCF file.
+        The versions are used in turn.
+
+        @param path the path of the file to write.
+        @param count the number of cards.
+        @param richness the richness of the cards (optional).
+        @param versions the versions of the cards (optional).
+        @param photo_size the size of a photo added to each card, 0 for none (optional).
+        """
+        with open(path, 'w') as f:
+            for index in range(count):
+                self.write_card(f, index, versions[index % len(versions)], richness, photo_size)
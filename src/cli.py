@@ -17,10 +17,8 @@ import sys
 # import constants
 import config.config as config
 
-# importing modules needed for the CLI to run correctly
-from process.manager.ics_manager import ICSManager
-from process.manager.vcf_manager import VCFManager
-from data.vcf.vcard import VCard
+# the modules needed by each command are imported by the command itself,
+#  so short runs like -h or -d do not load the managers and the data model
             
 
 class CLI:
@@ -36,18 +34,28 @@ class CLI:
         self.__app_version: str = app_version
 
     @staticmethod
-    def print_card_content(path: str) -> None:
+    def print_card_content(path: str, limit: int = -1) -> None:
         """! Method that print the content of a VCF file.
         The VCF file can contain multiple contacts.
         
         @param path the path of the file to explore.
+        @param limit the number of contacts to print, the file is read up to the last of them, -1 to print all (optional).
         """
-        # initiating the manager that will be used and pass it the path of the file
-        manager = VCFManager(path)
+        from process.manager.vcf_manager import VCFManager
 
-        # get the vcard list: the contacts in the folder
-        vcards: list[VCard] = manager.get_vcards()
+        # initiating the manager that will be used and read the file up to the limit
+        manager = VCFManager()
+        manager.read(path, limit)
 
+        # print the vcard list: the contacts in the folder
+        CLI.print_vcards(manager.get_vcards())
+
+    @staticmethod
+    def print_vcards(vcards: list) -> None:
+        """! Method that print contacts.
+
+        @param vcards the contacts to print.
+        """
         # for each vcard print data
         for vcard in vcards:
             # basic informations
@@ -91,17 +99,31 @@ class CLI:
                 print(f"    > Note: {vcard.get_note()}")
 
     @staticmethod
-    def print_calendar_content(path: str) -> None:
+    def print_calendar_content(path: str, limit: int = -1) -> None:
         """! Method that print the content from a calendar.
         All events and todo will be printed.
 
         @param the calendar path to print.
+        @param limit the number of events and todos to print, the file is read up to the last of them, -1 to print all (optional).
         """
-        # create the manager
-        manager = ICSManager(path)
+        from process.manager.ics_manager import ICSManager
+
+        # create the manager and read the file up to the limit
+        manager = ICSManager()
+        manager.read(path, limit)
 
+        # print the events and the todos
+        CLI.print_calendar(manager.get_vevents(), manager.get_vtodos())
+
+    @staticmethod
+    def print_calendar(vevents: list, vtodos: list) -> None:
+        """! Method that print events and todos.
+
+        @param vevents the events to print.
+        @param vtodos the todos to print.
+        """
         # for each event, print it
-        for event in manager.get_vevents():
+        for event in vevents:
             print("\n=> EVENT")
             print("     > Summary:         " + event.get_summary())
             print("     > Creation Date:   " + event.get_timestamp().strftime("%Y-%m-%d %H:%M:%S"))
@@ -110,7 +132,7 @@ class CLI:
             print("\n")
 
         # for each event, print it
-        for todo in manager.get_vtodos():
+        for todo in vtodos:
             print("\n=> TODO")
             print("     > Summary:         " + todo.get_summary())
             print("     > Creation Date:   " + todo.get_timestamp().strftime("%Y-%m-%d %H:%M:%S"))
@@ -118,6 +140,20 @@ class CLI:
             print("     > Duration:        " + todo.get_duration())
             print("\n")
 
+    @staticmethod
+    def print_count(path: str) -> None:
+        """! Method that print the number of records of a file without parsing it.
+
+        @param path the path of the VCF or ICS file.
+        """
+        from process.stream.content_line_reader import ContentLineReader
+
+        counts: dict[str, int] = ContentLineReader(path).count()
+        if path.endswith(".vcf"):
+            print(f"{counts.get('VCARD', 0)} contacts")
+        else:
+            print(f"{counts.get('VEVENT', 0)} events, {counts.get('VTODO', 0)} todos")
+
     @staticmethod
     def export_file(input_path: str, output_path: str, export_type: str, complete: bool = False):
         """! Export a file given an output and wether a complete HTML should be rendered or not.
@@ -131,6 +167,8 @@ class CLI:
 
         # if the input path is a VCF
         if input_path.endswith('.vcf'):
+            from process.manager.vcf_manager import VCFManager
+
             vcf_manager: VCFManager = VCFManager(input_path)
             
             # export VCF as CSV
@@ -149,6 +187,8 @@ class CLI:
         
         # else if the input is a calendar
         elif input_path.endswith('.ics'):
+            from process.manager.ics_manager import ICSManager
+
             ics_manager: ICSManager = ICSManager(input_path)
             
             # export a ICS into a CSV
@@ -169,6 +209,296 @@ class CLI:
         else:
             return "Incorrect file input"
 
+    @staticmethod
+    def shard_file(input_path: str, directory: str) -> str:
+        """! Method that convert an ICS file into a directory of monthly shards.
+
+        @param input_path the path of the ICS file.
+        @param directory the directory of the shards.
+        @return the message to print.
+        """
+        if not input_path.endswith('.ics'):
+            return "Incorrect file input"
+
+        from process.manager.ics_manager import ICSManager
+        from process.stream.content_line_reader import ContentLineReader
+
+        # the shards only keep the events, the todos and the timezones, the other components would be lost
+        for kind, _, _ in ContentLineReader(input_path).components('VCALENDAR'):
+            if kind not in ('VEVENT', 'VTODO', 'VTIMEZONE'):
+                return f"Error, incorrect component: {kind} cannot be sharded"
+
+        written: list[str] = ICSManager(input_path).save_shards(directory)
+        return f"The file has been split into {len(written)} shards"
+
+    @staticmethod
+    def unshard_directory(directory: str, output_path: str) -> str:
+        """! Method that convert a directory of monthly shards into an ICS file.
+
+        @param directory the directory of the shards.
+        @param output_path the path of the ICS file.
+        @return the message to print.
+        """
+        if not output_path.endswith('.ics'):
+            return "Incorrect file output"
+
+        from process.manager.ics_manager import ICSManager
+
+        manager: ICSManager = ICSManager()
+        manager.read_shards(directory)
+        manager.save(output_path)
+        return "The shards have been joined"
+
+    @staticmethod
+    def compact_file(input_path: str, archive_path: str, cutoff: str) -> str:
+        """! Method that move the events of a calendar that ended before a date into an archive.
+
+        @param input_path the path of the ICS file, compacted in place.
+        @param archive_path the path of the ICS archive, extended when it exists.
+        @param cutoff the date before which the events are archived, like 2024-01-01.
+        @return the message to print.
+        """
+        if not input_path.endswith('.ics') or not archive_path.endswith('.ics'):
+            return "Incorrect file input"
+
+        from datetime import datetime
+        from data.ics.vbase import VBase
+        from process.archive.calendar_compactor import CalendarCompactor
+
+        try:
+            date: datetime = datetime.fromisoformat(cutoff)
+        except ValueError:
+            return f"Error, incorrect date: {cutoff}"
+
+        compactor: CalendarCompactor = CalendarCompactor(VBase.to_utc_timestamp(date, None))
+        compactor.compact(input_path, archive_path)
+        return f"{compactor.get_archived_count()} events archived, {compactor.get_kept_count()} records kept"
+
+    @staticmethod
+    def sort_file(input_path: str, output_path: str, budget: str = '64M') -> str:
+        """! Method that sort a file larger than the memory, contacts by full name and events by start.
+
+        @param input_path the path of the VCF or ICS file to sort.
+        @param output_path the path of the sorted file, of the same type.
+        @param budget the memory used by each sorted run, like 512M (optional).
+        @return the message to print.
+        """
+        extension: str = input_path[-4:].lower()
+        if extension not in ('.vcf', '.ics'):
+            return "Incorrect file input"
+
+        if not output_path.lower().endswith(extension):
+            return "Incorrect file output"
+
+        from process.memory.memory_reporter import MemoryReporter
+        from process.sort.external_sorter import ExternalSorter
+
+        try:
+            sorter: ExternalSorter = ExternalSorter(MemoryReporter.parse_size(budget))
+        except ValueError:
+            return f"Error, incorrect budget: {budget}"
+
+        sorter.sort(input_path, output_path)
+        return (f"{sorter.get_record_count()} records sorted in {sorter.get_run_count()} runs, "
+                f"{sorter.get_elapsed():.2f} s, {sorter.get_throughput() / 1024 ** 2:.1f} MB/s")
+
+    @staticmethod
+    def split_file(input_path: str, directory: str, mode: str, value: str) -> str:
+        """! Method that split a file into shards, the records are copied without being parsed.
+
+        @param input_path the path of the VCF or ICS file to split.
+        @param directory the directory of the shards.
+        @param mode --shards for a number of shards, --size for a maximum size like 100M, --records for a maximum number of records.
+        @param value the number of shards, the size or the number of records.
+        @return the message to print.
+        """
+        if not input_path.lower().endswith(('.vcf', '.ics')):
+            return "Incorrect file input"
+
+        from process.memory.memory_reporter import MemoryReporter
+        from process.split.file_splitter import FileSplitter
+
+        # the limit must be a positive number, the size may have a unit
+        try:
+            number: int = MemoryReporter.parse_size(value) if mode == "--size" else int(value)
+        except ValueError:
+            number = 0
+        if number <= 0:
+            return f"Error, incorrect value: {value}"
+
+        match mode:
+            case "--shards":
+                splitter: FileSplitter = FileSplitter(shards=number)
+            case "--size":
+                splitter = FileSplitter(max_bytes=number)
+            case "--records":
+                splitter = FileSplitter(max_records=number)
+            case _:
+                return f"Error, unknown parameter: {mode}"
+
+        paths: list[str] = splitter.split(input_path, directory)
+        return f"{splitter.get_record_count()} records split into {len(paths)} files"
+
+    @staticmethod
+    def extract_blobs(input_path: str, directory: str) -> str:
+        """! Method that write the photos, logos and sounds of the contacts of a VCF file into a directory.
+
+        @param input_path the path of the VCF file.
+        @param directory the directory of the files.
+        @return the message to print.
+        """
+        if not input_path.lower().endswith('.vcf'):
+            return "Incorrect file input"
+
+        from process.extract.blob_extractor import BlobExtractor
+
+        extractor: BlobExtractor = BlobExtractor()
+        extractor.extract(input_path, directory)
+        return f"{extractor.get_file_count()} files extracted, {extractor.get_byte_count() / 1024 ** 2:.1f} MB"
+
+    @staticmethod
+    def merge_files(input_paths: list[str], output_path: str) -> str:
+        """! Merge many files of the same type into a single one.
+        Records are deduplicated by UID, the most recent version is kept.
+
+        @param input_paths the paths of the files to merge.
+        @param output_path the path of the merged file.
+        @return a message to print.
+        """
+        # every file must have the extension of the output
+        extension: str = output_path[-4:].lower()
+        if extension not in ('.vcf', '.ics'):
+            return "Incorrect file output"
+
+        for path in input_paths:
+            if not path.lower().endswith(extension):
+                return "Incorrect file input"
+
+        from process.merge.file_merger import FileMerger
+
+        # merge the files
+        merger: FileMerger = FileMerger()
+        merger.merge(input_paths, output_path)
+        return f"{merger.get_read_count()} records read, {merger.get_written_count()} records written"
+
+    @staticmethod
+    def dedupe_file(input_path: str, output_path: str) -> str:
+        """! Merge the near duplicated contacts of a VCF file.
+        The deduplicated contacts are saved in the output file.
+
+        @param input_path the path of the VCF file to read.
+        @param output_path the path of the VCF file to write.
+        @return a message to print.
+        """
+        if not input_path.endswith('.vcf'):
+            return "Incorrect file input"
+
+        if not output_path.endswith('.vcf'):
+            return "Incorrect file output"
+
+        from process.manager.vcf_manager import VCFManager
+        from process.dedupe.contact_deduplicator import ContactDeduplicator
+
+        # read the contacts and merge the duplicates
+        vcf_manager: VCFManager = VCFManager(input_path)
+        count: int = len(vcf_manager.get_vcards())
+        vcf_manager.set_vcards(ContactDeduplicator().dedupe(vcf_manager.get_vcards()))
+
+        # save the result
+        vcf_manager.save(output_path)
+        return f"{count} contacts merged into {len(vcf_manager.get_vcards())} contacts"
+
+    @staticmethod
+    def print_diff(old_path: str, new_path: str) -> None:
+        """! Method that print the differences between two files of the same type.
+        Records are matched by UID, or by full name and email for contacts without UID.
+
+        @param old_path the path of the old file.
+        @param new_path the path of the new file.
+        """
+        # both files must be of the same type
+        extension: str = old_path[-4:].lower()
+        if extension not in ('.vcf', '.ics') or not new_path.lower().endswith(extension):
+            print("Incorrect file input.")
+            return
+
+        from process.diff.file_diff import FileDiff
+
+        file_diff: FileDiff = FileDiff()
+
+        # print each difference
+        for status, key, changes in file_diff.diff(old_path, new_path):
+            if status == 'added':
+                print(f"+ {key}")
+            elif status == 'removed':
+                print(f"- {key}")
+            else:
+                print(f"~ {key}")
+                for name, (old_values, new_values) in changes.items():
+                    print(f"    > {name}: {' | '.join(old_values)} => {' | '.join(new_values)}")
+
+        added, removed, modified = file_diff.get_counts()
+        print(f"\n{added} added, {removed} removed, {modified} modified")
+
+    @staticmethod
+    def print_memory_report(path: str, budget: str = '1G') -> None:
+        """! Method that print the memory used by the elements of a file.
+
+        @param path the path of the vcf or ics file.
+        @param budget the memory budget used to estimate the capacity, like 512M (optional).
+        """
+        if not path.lower().endswith(('.vcf', '.ics')):
+            print("Incorrect file input.")
+            return
+
+        from process.memory.memory_reporter import MemoryReporter
+
+        try:
+            memory_reporter: MemoryReporter = MemoryReporter(MemoryReporter.parse_size(budget))
+        except ValueError:
+            print(f"Error, incorrect budget: {budget}")
+            return
+
+        print(memory_reporter.format(memory_reporter.measure(path)))
+
+    @staticmethod
+    def serve(socket_path: str, workers: int = 0) -> None:
+        """! Method that run the server answering the requests of the client over a Unix socket.
+        The server runs until it receives the stop command or is interrupted.
+
+        @param socket_path the path of the Unix socket.
+        @param workers the number of worker processes, the number of CPU if 0 (optional).
+        """
+        from process.server.socket_server import SocketServer
+
+        # the path of another file or of a running server is not replaced
+        try:
+            server: SocketServer = SocketServer(socket_path, workers)
+        except FileExistsError as e:
+            print(f"Error, incorrect socket path: {e}")
+            return
+
+        print(f"Listening on {socket_path}")
+        server.run()
+
+    @staticmethod
+    def serve_http(port: int, paths: list[str]) -> None:
+        """! Method that run the HTTP service exposing files as JSON on the loopback.
+        The service runs until it is interrupted.
+
+        @param port the port to listen on.
+        @param paths the paths of the vcf and ics files to serve.
+        """
+        for path in paths:
+            if not path.lower().endswith(('.vcf', '.ics')):
+                print("Incorrect file input.")
+                return
+
+        from process.server.http_service import HTTPService
+
+        print(f"Listening on http://127.0.0.1:{port}/files")
+        HTTPService(paths, '127.0.0.1', port).run()
+
     def dir_explorer(self, path: str, files: dict[str, list[str]] = {}) -> dict[str, list[str]]:
         """! Method that list all the .ics and all .vcf files present in a given directory.
 
@@ -232,9 +562,37 @@ class CLI:
         print(
             "-d '{path}' list all the vci and vcf files present in the specified directory.")
         print("-i '{path}' show the content of a specific vci or vsf file.")
+        print("-i '{path}' --count show the number of records of a vcf or ics file without reading them.")
+        print("-i '{path}' --limit '{number}' show the first records of a vcf or ics file, the rest of the file is not read.")
         print(
             "-i '{input path}' -h '{output path}' export a vci or vcf file to html.")
         print("-p Generate a complete HTML page, it must be placed at the end of the line.")
+        print(
+            "-i '{input path}' -dedupe '{output path}' merge the duplicated contacts of a vcf file.")
+        print(
+            "-diff '{old path}' '{new path}' show the differences between two vcf or ics files.")
+        print(
+            "-m '{output path}' '{input path}' ... merge vcf or ics files into one, duplicated UID are removed.")
+        print(
+            "-sort '{input path}' '{output path}' ['{budget}'] sort a vcf file by name or an ics file by start, runs of the budget like 512M are sorted on disk.")
+        print(
+            "-split '{input path}' '{directory}' --shards '{number}'|--size '{size}'|--records '{number}' split a vcf or ics file into shards of balanced or limited size.")
+        print(
+            "-extract '{path}' '{directory}' write the photos, logos and sounds of the contacts of a vcf file into a directory.")
+        print(
+            "-compact '{path}' '{archive path}' '{date}' move the events of an ics file that ended before the date into an archive.")
+        print(
+            "-shard '{input path}' '{directory}' split an ics file into monthly shards with a manifest.")
+        print(
+            "-unshard '{directory}' '{output path}' join monthly shards into an ics file.")
+        print(
+            "-memory '{path}' ['{budget}'] show the memory used by a vcf or ics file and the records that fit in a budget like 512M.")
+        print(
+            "-serve ['{socket path}'] ['{workers}'] run a server keeping the files parsed, use client.py to send it requests.")
+        print(
+            "-http '{port}' '{path}' ... serve vcf and ics files as JSON on the loopback.")
+        print(
+            "--profile[=cprofile:'{path}'|flame:'{path}'] print the time spent in each stage, it can be placed anywhere on the line.")
         print("You can also use the graphical version of the application using python.")
 
 
@@ -245,12 +603,39 @@ def main(argv: list) -> None:
     @param argv the parameters passed by the user.
     """
 
+    # the profiler can be enabled anywhere on the line, it wraps the whole run
+    profile_args: list = [arg for arg in argv if arg == "--profile" or arg.startswith("--profile=")]
+    if len(profile_args) > 0:
+        from process.profiling.profiler import Profiler
+
+        Profiler.enable(profile_args[-1].partition('=')[2])
+        try:
+            main([arg for arg in argv if arg not in profile_args])
+        finally:
+            Profiler.disable()
+            print(Profiler.report())
+        return
+
     cli: CLI = CLI(config.APP_NAME, config.VERSION)
 
     # getting the number of parameters
     #  of index 0 will be the call to the script
     argc: int = len(argv)
 
+    # the merge mode takes any number of input files
+    if argc >= 4 and argv[1] == "-m":
+        print(cli.merge_files(argv[3:], argv[2]))
+        return
+
+    # the HTTP mode takes any number of files to serve
+    if argc >= 4 and argv[1] == "-http":
+        # the port must be a number that a port can have
+        if not argv[2].isdigit() or int(argv[2]) > 65535:
+            print(f"Error, incorrect port: {argv[2]}")
+        else:
+            cli.serve_http(int(argv[2]), argv[3:])
+        return
+
     # calling the different methods depending on the parameters passed
     match argc:
         case 1:
@@ -260,6 +645,8 @@ def main(argv: list) -> None:
         case 2:
             if (argv[1] == "-h") or (argv[1] == "--help"):
                 cli.print_help()
+            elif argv[1] == "-serve":
+                cli.serve(config.SOCKET_PATH)
             else:
                 print(
                     "It seems your parameters are not correct, use -h or --help for more informations.")
@@ -267,6 +654,12 @@ def main(argv: list) -> None:
             # case there are 3 arguments
             if argv[1] == "-d":
                 cli.print_dir_explorer(argv[2])
+
+            elif argv[1] == "-memory":
+                cli.print_memory_report(argv[2])
+
+            elif argv[1] == "-serve":
+                cli.serve(argv[2])
             
             elif argv[1] == "-i":
 
@@ -279,6 +672,39 @@ def main(argv: list) -> None:
                 else:
                     print("Incorrect file input.")
         
+        case 4:
+            # case there are 4 arguments
+            if argv[1] == "-diff":
+                cli.print_diff(argv[2], argv[3])
+
+            elif argv[1] == "-memory":
+                cli.print_memory_report(argv[2], argv[3])
+
+            elif argv[1] == "-serve":
+                # the number of workers must be a number
+                if not argv[3].isdigit():
+                    print(f"Error, incorrect number of workers: {argv[3]}")
+                else:
+                    cli.serve(argv[2], int(argv[3]))
+
+            elif argv[1] == "-sort":
+                print(cli.sort_file(argv[2], argv[3]))
+
+            elif argv[1] == "-extract":
+                print(cli.extract_blobs(argv[2], argv[3]))
+
+            elif argv[1] == "-shard":
+                print(cli.shard_file(argv[2], argv[3]))
+
+            elif argv[1] == "-unshard":
+                print(cli.unshard_directory(argv[2], argv[3]))
+
+            elif (argv[1] == "-i") and (argv[3] == "--count"):
+                if argv[2].endswith((".ics", ".vcf")):
+                    cli.print_count(argv[2])
+                else:
+                    print("Incorrect file input.")
+
         case 5:
             # case there are 5 arguments
             if (argv[1] == "-i") and (argv[3] == "-h"):
@@ -287,6 +713,29 @@ def main(argv: list) -> None:
             elif (argv[1] == "-i") and (argv[3] == "-c"):
                 print(cli.export_file(argv[2], argv[4], 'CSV'))
 
+            elif (argv[1] == "-i") and (argv[3] == "-dedupe"):
+                print(cli.dedupe_file(argv[2], argv[4]))
+
+            elif argv[1] == "-sort":
+                print(cli.sort_file(argv[2], argv[3], argv[4]))
+
+            elif argv[1] == "-compact":
+                print(cli.compact_file(argv[2], argv[3], argv[4]))
+
+            elif (argv[1] == "-i") and (argv[3] == "--limit"):
+                # the limit must be a positive number
+                if not argv[4].isdigit():
+                    print(f"Error, incorrect limit: {argv[4]}")
+
+                elif argv[2].endswith(".ics"):
+                    cli.print_calendar_content(argv[2], int(argv[4]))
+
+                elif argv[2].endswith(".vcf"):
+                    cli.print_card_content(argv[2], int(argv[4]))
+
+                else:
+                    print("Incorrect file input.")
+
         case 6:
             # case there are 6 arguments
             if (argv[1] == "-i") and (argv[3] == "-h"):
@@ -297,6 +746,9 @@ def main(argv: list) -> None:
             
             elif (argv[1] == "-i") and (argv[3] == "-c"):
                 print(cli.export_file(argv[2], argv[4], 'CSV'))
+
+            elif argv[1] == "-split":
+                print(cli.split_file(argv[2], argv[3], argv[4], argv[5]))
     
         case other:
             pass
@@ -0,0 +1,93 @@
+"""! This file contain the main function of the client of the server.
+The client takes the parameters of the CLI and sends them to a server started with cli.py -serve.
+
+@author Benjamin PAUMARD
+@version 1.0.0
+@since 19 October 2026
+"""
+
+# !/usr/bin/env python
+
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+
+import config.config as config
+from process.server.socket_client import SocketClient
+
+
+def print_help() -> None:
+    """! A function that print help."""
+
+    print("The socket of the server is given by the VMANAGER_SOCKET environment variable, "
+          f"{config.SOCKET_PATH} by default.")
+    print("-i '{path}' show the content of a specific ics or vcf file.")
+    print("-i '{input path}' -c '{output path}' export an ics or vcf file to csv.")
+    print("-i '{input path}' -h '{output path}' [-p] export an ics or vcf file to html, -p for a complete page.")
+    print("-search '{text}' '{path}' show the contacts, events and todos containing a text.")
+    print("-query '{path}' '{start}' '{end}' show the events between two ISO datetimes.")
+    print("-stats show the latencies of the server.")
+    print("-stop stop the server.")
+
+
+def parse(argv: list) -> tuple[str, dict] | None:
+    """! Function that convert the parameters into a request.
+    Paths are made absolute, the server may not run in the same directory.
+
+    @param argv the parameters passed by the user.
+    @return the command and its arguments, None if the parameters are not correct.
+    """
+    argc: int = len(argv)
+
+    match argc:
+        case 2:
+            if argv[1] in ("-stats", "-stop"):
+                return argv[1][1:], {}
+        case 3:
+            if argv[1] == "-i":
+                return 'print', {'path': os.path.abspath(argv[2])}
+        case 4:
+            if argv[1] == "-search":
+                return 'search', {'text': argv[2], 'path': os.path.abspath(argv[3])}
+        case 5 | 6:
+            if argv[1] == "-query" and argc == 5:
+                return 'query', {'path': os.path.abspath(argv[2]), 'start': argv[3], 'end': argv[4]}
+            if argv[1] == "-i" and argv[3] in ("-c", "-h") and (argc == 5 or argv[5] == "-p"):
+                return 'export', {
+                    'path': os.path.abspath(argv[2]),
+                    'output': os.path.abspath(argv[4]),
+                    'type': 'CSV' if argv[3] == "-c" else 'HTML',
+                    'complete': argc == 6,
+                }
+    return None
+
+
+def main(argv: list) -> int:
+    """! Function sending the request to the server and printing its response.
+
+    @param argv the parameters passed by the user.
+    @return the exit code.
+    """
+    request: tuple[str, dict] | None = parse(argv)
+    if request is None:
+        print_help()
+        return 0 if len(argv) == 1 else 2
+
+    client: SocketClient = SocketClient(os.environ.get('VMANAGER_SOCKET', config.SOCKET_PATH))
+    try:
+        response: dict = client.request(*request)
+    except OSError as e:
+        print(f"Cannot reach the server: {e}")
+        return 1
+
+    if not response['ok']:
+        print(f"Error: {response['error']}")
+        return 1
+
+    print(response['output'], end='' if response['output'].endswith('\n') else '\n')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
@@ -18,3 +18,9 @@ WIDTH: int = 684
 
 # height of the app
 HEIGHT: int = 364
+
+# default path of the socket of the server
+SOCKET_PATH: str = '/tmp/vmanager.sock'
+
+# number of records rendered at once in the view of the GUI
+VIEW_CHUNK: int = 50
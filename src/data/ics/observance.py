@@ -0,0 +1,232 @@
+"""! File containing the class to store an observance of a timezone.
+Observances are the STANDARD and DAYLIGHT parts of a VTIMEZONE. Fore more information, please see vtimezone.py documentation.
+
+@author Benjamin PAUMARD
+@version 1.0.0
+@since 19 October 2026
+"""
+
+# importing libs
+from datetime import datetime, timedelta
+from io import TextIOWrapper
+
+# days of the week as written in the BYDAY part of a rule
+WEEKDAYS: dict[str, int] = {'MO': 0, 'TU': 1, 'WE': 2, 'TH': 3, 'FR': 4, 'SA': 5, 'SU': 6}
+
+
+class Observance:
+    """! Class that contains the elements of a timezone observance.
+    Observances are part of a VTimezone.
+
+    @author Benjamin PAUMARD
+    @version 1.0.0
+    @since 19 October 2026
+    """
+
+    def __init__(self, kind: str = 'STANDARD', dtstart: datetime = datetime(1970, 1, 1), offset_from: str = '+0000', offset_to: str = '+0000', tzname: str = '', rrule: str = '') -> None:
+        """! Constructor of an observance.
+        An observance describes the offset used by a timezone from a given onset.
+
+        @param kind STANDARD or DAYLIGHT (optional).
+        @param dtstart the first onset of the observance, in local time (optional).
+        @param offset_from the offset used before the onset, like +0200 (optional).
+        @param offset_to the offset used after the onset, like +0100 (optional).
+        @param tzname the name of the observance, like CET (optional).
+        @param rrule the raw recurrence rule of the onset, like FREQ=YEARLY;BYMONTH=10;BYDAY=-1SU (optional).
+        """
+        self.__kind: str = kind
+        self.__dtstart: datetime = dtstart
+        self.__offset_from: str = offset_from
+        self.__offset_to: str = offset_to
+        self.__tzname: str = tzname
+        self.__rrule: str = rrule
+
+    @staticmethod
+    def parse_offset(offset: str) -> timedelta:
+        """! Method that convert an offset string into a timedelta.
+        The offset must be formatted like +0200 or -053000.
+
+        @param offset the offset to convert.
+        @return the offset as a timedelta.
+        """
+        # get the sign of the offset
+        sign: int = -1 if offset.startswith('-') else 1
+        digits: str = offset.lstrip('+-')
+
+        # hours and minutes are mandatory, seconds are optional
+        seconds: int = int(digits[0:2]) * 3600 + int(digits[2:4]) * 60
+        if len(digits) >= 6:
+            seconds += int(digits[4:6])
+
+        return timedelta(seconds=sign * seconds)
+
+    def get_kind(self) -> str:
+        """! Method to get the kind of the observance.
+        It is STANDARD or DAYLIGHT.
+
+        @return the kind of the observance.
+        """
+        return self.__kind
+
+    def set_kind(self, kind: str) -> None:
+        """! Method to set the kind of the observance.
+        It is STANDARD or DAYLIGHT.
+
+        @param kind the kind of the observance.
+        """
+        self.__kind = kind
+
+    def get_dtstart(self) -> datetime:
+        """! Method to get the first onset of the observance.
+        The onset is a naive datetime in the local time before the transition.
+
+        @return the first onset.
+        """
+        return self.__dtstart
+
+    def set_dtstart(self, dtstart: datetime) -> None:
+        """! Method to set the first onset of the observance.
+        The onset is a naive datetime in the local time before the transition.
+
+        @param dtstart the first onset.
+        """
+        self.__dtstart = dtstart
+
+    def get_offset_from(self) -> str:
+        """! Method to get the offset used before the onset.
+        The offset is a string like +0200.
+
+        @return the offset before the onset.
+        """
+        return self.__offset_from
+
+    def set_offset_from(self, offset_from: str) -> None:
+        """! Method to set the offset used before the onset.
+        The offset is a string like +0200.
+
+        @param offset_from the offset before the onset.
+        """
+        self.__offset_from = offset_from
+
+    def get_offset_to(self) -> str:
+        """! Method to get the offset used after the onset.
+        The offset is a string like +0100.
+
+        @return the offset after the onset.
+        """
+        return self.__offset_to
+
+    def set_offset_to(self, offset_to: str) -> None:
+        """! Method to set the offset used after the onset.
+        The offset is a string like +0100.
+
+        @param offset_to the offset after the onset.
+        """
+        self.__offset_to = offset_to
+
+    def get_tzname(self) -> str:
+        """! Method to get the name of the observance.
+        The name is a string like CET.
+
+        @return the name of the observance.
+        """
+        return self.__tzname
+
+    def set_tzname(self, tzname: str) -> None:
+        """! Method to set the name of the observance.
+        The name is a string like CET.
+
+        @param tzname the name of the observance.
+        """
+        self.__tzname = tzname
+
+    def get_rrule(self) -> str:
+        """! Method to get the raw recurrence rule of the onset.
+        The rule is kept as written in the file.
+
+        @return the recurrence rule.
+        """
+        return self.__rrule
+
+    def set_rrule(self, rrule: str) -> None:
+        """! Method to set the raw recurrence rule of the onset.
+        The rule is kept as written in the file.
+
+        @param rrule the recurrence rule.
+        """
+        self.__rrule = rrule
+
+    def get_onset(self, year: int) -> datetime | None:
+        """! Method that compute the onset of the observance for a given year.
+        Only yearly rules using BYMONTH and BYDAY (like -1SU or 2SU) are expanded, which covers real world timezones.
+
+        @param year the year to compute.
+        @return the local datetime of the onset, None if the observance has no onset this year.
+        """
+        # no onset before the first one
+        if year < self.__dtstart.year:
+            return None
+
+        # without rule, the only onset is the starting date
+        if self.__rrule == '':
+            return self.__dtstart if year == self.__dtstart.year else None
+
+        # read the parts of the rule
+        parts: dict[str, str] = {}
+        for part in self.__rrule.split(';'):
+            if '=' in part:
+                key, value = part.split('=', 1)
+                parts[key.upper()] = value
+
+        # only yearly rules are supported
+        if parts.get('FREQ', '').upper() != 'YEARLY':
+            return None
+
+        # check the end of the rule
+        until: str = parts.get('UNTIL', '')
+        if until != '' and year > int(until[0:4]):
+            return None
+
+        month: int = int(parts.get('BYMONTH', self.__dtstart.month))
+        byday: str = parts.get('BYDAY', '')
+
+        # without BYDAY, the onset is the same day every year
+        if byday == '':
+            return self.__dtstart.replace(year=year, month=month)
+
+        # split the BYDAY like -1SU into an ordinal and a weekday
+        weekday: int = WEEKDAYS[byday[-2:].upper()]
+        ordinal: int = int(byday[:-2]) if len(byday) > 2 else 1
+
+        if ordinal > 0:
+            # count from the first day of the month
+            first: datetime = datetime(year, month, 1)
+            day: int = 1 + (weekday - first.weekday()) % 7 + (ordinal - 1) * 7
+        else:
+            # count from the last day of the month
+            next_month: datetime = datetime(year + month // 12, month % 12 + 1, 1)
+            last: datetime = next_month - timedelta(days=1)
+            day: int = last.day - (last.weekday() - weekday) % 7 + (ordinal + 1) * 7
+
+        return datetime(year, month, day, self.__dtstart.hour, self.__dtstart.minute, self.__dtstart.second)
+
+    def save(self, f: TextIOWrapper) -> None:
+        """! Method that save the observance into an ics file.
+        The observance is saved inside its VTIMEZONE.
+
+        @param f the file wrapper to use. It must be opened as 'w' or at least 'a'.
+        """
+        f.write(f"BEGIN:{self.__kind}\n")
+        f.write(f"DTSTART:{self.__dtstart.strftime('%Y%m%dT%H%M%S')}\n")
+        f.write(f"TZOFFSETFROM:{self.__offset_from}\n")
+        f.write(f"TZOFFSETTO:{self.__offset_to}\n")
+
+        # if name is not empty write it
+        if self.__tzname != '':
+            f.write(f"TZNAME:{self.__tzname}\n")
+
+        # if rule is not empty write it
+        if self.__rrule != '':
+            f.write(f"RRULE:{self.__rrule}\n")
+
+        f.write(f"END:{self.__kind}\n")
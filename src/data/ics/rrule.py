@@ -15,16 +15,22 @@ class RRule:
     @since 25 November 2022
     """
     
-    def __init__(self, frequency: str = '', until: str = '') -> None:
+    def __init__(self, frequency: str = '', until: str = '', count: int = 0, interval: int = 1, byday: list[str] = []) -> None:
         """! Constructor of the class containing a recurrence rule for an event.
         An event can contain multiple rules.
         
         @param frequency the frequency of the event.
         @param until the date of end.
+        @param count the number of occurrences, 0 for no limit (optional).
+        @param interval the number of periods between two occurrences (optional).
+        @param byday the days of the rule, like MO or -1FR (optional).
         """
         # setting attributes
         self.__frequency: str = frequency
         self.__until: str = until
+        self.__count: int = count
+        self.__interval: int = interval
+        self.__byday: list[str] = byday
 
     def get_frequency(self) -> str:
         """! Method to get the frequency.
@@ -57,3 +63,66 @@ class RRule:
         @param until time of the rule to use.
         """
         self.__until = until
+
+    def get_count(self) -> int:
+        """! Method to get the number of occurrences.
+        The occurrences removed by an EXDATE are counted.
+
+        @return the number of occurrences of the rule, 0 for no limit.
+        """
+        return self.__count
+
+    def set_count(self, count: int) -> None:
+        """! Method to set the number of occurrences.
+
+        @param count the number of occurrences of the rule, 0 for no limit.
+        """
+        self.__count = count
+
+    def get_interval(self) -> int:
+        """! Method to get the interval.
+        An interval of 2 with a weekly rule means every other week.
+
+        @return the number of periods between two occurrences.
+        """
+        return self.__interval
+
+    def set_interval(self, interval: int) -> None:
+        """! Method to set the interval.
+        An interval of 2 with a weekly rule means every other week.
+
+        @param interval the number of periods between two occurrences.
+        """
+        self.__interval = interval
+
+    def get_byday(self) -> list[str]:
+        """! Method to get the days of the rule.
+        A day may have an ordinal within the month, like 2TU or -1FR.
+
+        @return the days as written in the rule, empty if the rule has none.
+        """
+        return self.__byday
+
+    def set_byday(self, byday: list[str]) -> None:
+        """! Method to set the days of the rule.
+        A day may have an ordinal within the month, like 2TU or -1FR.
+
+        @param byday the days as written in the rule.
+        """
+        self.__byday = byday
+
+    def get_value(self) -> str:
+        """! Method to get the rule as written in an ics file.
+
+        @return the value of the RRULE line, like FREQ=WEEKLY;INTERVAL=2;BYDAY=MO,WE.
+        """
+        parts: list[str] = [f"FREQ={self.__frequency}"]
+        if self.__until != '':
+            parts.append(f"UNTIL={self.__until}")
+        if self.__count > 0:
+            parts.append(f"COUNT={self.__count}")
+        if self.__interval > 1:
+            parts.append(f"INTERVAL={self.__interval}")
+        if len(self.__byday) > 0:
+            parts.append(f"BYDAY={','.join(self.__byday)}")
+        return ';'.join(parts)
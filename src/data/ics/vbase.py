@@ -7,7 +7,7 @@ VEvents and VTodo herits from this class.
 """
 
 # importing libs
-from datetime import datetime
+from datetime import datetime, timezone, tzinfo
 from data.ics.valarm import VAlarm
 
 
@@ -37,6 +37,36 @@ class VBase:
         self.__dtstart: datetime = dtstart
         self.__tzstart: str = tzstart
         self.__valarms: list[VAlarm] = valarms
+        # resolved timezone of the beginning datetime, set once the TZID is resolved
+        self.__start_tzinfo: tzinfo | None = None
+        # UTC instant of the beginning, used to order elements without conversion
+        self.__utc_start: float = self.to_utc_timestamp(dtstart, None)
+        # original text of the element, emptied when the element is modified
+        self.__raw: str = ''
+        # line break of the original text, kept to generate the element again with it
+        self.__newline: str = '\n'
+
+    def __lt__(self, other: 'VBase') -> bool:
+        """! Method that compare two elements by their UTC starting instant.
+        The instants are precomputed, so sorting does not convert any datetime.
+
+        @param other the element to compare with.
+        @return True if the element starts before the other one.
+        """
+        return self.__utc_start < other.get_utc_start()
+
+    @staticmethod
+    def to_utc_timestamp(dt: datetime, tz: tzinfo | None) -> float:
+        """! Method that convert a datetime into a UTC POSIX timestamp.
+        Naive datetimes without timezone are considered as UTC.
+
+        @param dt the datetime to convert.
+        @param tz the timezone of the datetime if it is naive.
+        @return the UTC timestamp.
+        """
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=tz or timezone.utc)
+        return dt.timestamp()
 
     def get_timestamp(self) -> datetime:
         """! Method to get the creation date of the element.
@@ -53,6 +83,7 @@ class VBase:
         @param timestamp the creation date.
         """
         self.__timestamp = timestamp
+        self.__raw = ''
 
     def get_uid(self) -> str:
         """! Method to get the unique ID of the element.
@@ -69,6 +100,7 @@ class VBase:
         @param uid the unique ID.
         """
         self.__uid = uid
+        self.__raw = ''
 
     def get_dtstart(self) -> datetime:
         """! Method to get the starting time of the element.
@@ -85,6 +117,8 @@ class VBase:
         @param dtstart the starting time.
         """
         self.__dtstart = dtstart
+        self.__utc_start = self.to_utc_timestamp(dtstart, self.__start_tzinfo)
+        self.__raw = ''
 
     def get_tzstart(self) -> str:
         """! Method to get the timezone of the beginning time.
@@ -101,6 +135,39 @@ class VBase:
         @param tzstart the beginning date time zone.
         """
         self.__tzstart = tzstart
+        self.__raw = ''
+
+    def get_start_tzinfo(self) -> tzinfo | None:
+        """! Method to get the resolved timezone of the beginning time.
+        The tzinfo is set by the builder once the TZID is resolved.
+
+        @return the tzinfo of the beginning time, None if floating or unknown.
+        """
+        return self.__start_tzinfo
+
+    def set_start_tzinfo(self, start_tzinfo: tzinfo | None) -> None:
+        """! Method to set the resolved timezone of the beginning time.
+        The UTC instant of the beginning is computed again.
+
+        @param start_tzinfo the tzinfo of the beginning time.
+        """
+        self.__start_tzinfo = start_tzinfo
+        self.__utc_start = self.to_utc_timestamp(self.__dtstart, start_tzinfo)
+
+    def get_utc_start(self) -> float:
+        """! Method to get the UTC instant of the beginning time.
+        The instant is a POSIX timestamp, precomputed for sorting and indexing.
+
+        @return the UTC timestamp of the beginning.
+        """
+        return self.__utc_start
+
+    def get_utc_dtstart(self) -> datetime:
+        """! Method to get the beginning time as an aware UTC datetime.
+
+        @return the UTC beginning datetime.
+        """
+        return datetime.fromtimestamp(self.__utc_start, timezone.utc)
 
     def get_summary(self) -> str:
         """! Method to get the summary of the element.
@@ -117,6 +184,7 @@ class VBase:
         @param summary the summary.
         """
         self.__summary = summary
+        self.__raw = ''
 
     def get_valarms(self) -> list[VAlarm]:
         """! Method to get the alarms of the event.
@@ -133,6 +201,7 @@ class VBase:
         @param valarms the list of the alarms of the event.
         """
         self.__valarms = valarms
+        self.__raw = ''
 
     def add_valarm(self, valarm: VAlarm) -> None:
         """! Method to add a valarm to the event.
@@ -141,3 +210,40 @@ class VBase:
         @param valarm the alarm to add.
         """
         self.__valarms.append(valarm)
+        self.__raw = ''
+
+    def get_raw(self) -> str:
+        """! Method to get the original text of the element.
+        The text is empty once the element has been modified, or when it was not read from a file.
+
+        @return the text of the element as read, with its line breaks.
+        """
+        return self.__raw
+
+    def set_raw(self, raw: str) -> None:
+        """! Method to set the original text of the element.
+        As long as the element is not modified, the text is saved as is instead of being generated again.
+
+        @param raw the text of the element as read, with its line breaks, empty to generate it on save.
+        """
+        self.__raw = raw
+
+        # the line break of the text is kept once the element is modified
+        if raw != '':
+            end: int = raw.find('\n')
+            self.__newline = '\r\n' if end > 0 and raw[end - 1] == '\r' else '\n'
+
+    def get_newline(self) -> str:
+        """! Method to get the line break of the original text of the element.
+        A modified element is generated again with it, so an edited file keeps its line breaks.
+
+        @return \\r\\n or \\n, \\n when the element was not read from a file.
+        """
+        return self.__newline
+
+    def is_modified(self) -> bool:
+        """! Method that tells whether the element must be generated again on save.
+
+        @return True if the element has no original text.
+        """
+        return self.__raw == ''
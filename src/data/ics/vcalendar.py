@@ -6,9 +6,14 @@ This file does not manage or build vcalendar.
 @since 04 December 2022
 """
 
+# importing libs
+from io import StringIO
+
 # importing elements used in the VCalendar
 from data.ics.vevent import VEvent
 from data.ics.vtodo import VTodo
+from data.ics.vtimezone import VTimezone
+from data.ics.vfreebusy import VFreeBusy
 
 
 class VCalendar:
@@ -20,15 +25,20 @@ class VCalendar:
     @since 04 December 2022
     """
     
-    def __init__(self, vevents: list[VEvent] = [], vtodos: list[VTodo] = []) -> None:
+    def __init__(self, vevents: list[VEvent] = [], vtodos: list[VTodo] = [], vtimezones: list[VTimezone] = []) -> None:
         """! Constructor of a VCalendar.
         All the events are stored inside this class.
 
         @param vevents list of events (optional).
         @param vtodos list of todos (optional).
+        @param vtimezones list of embedded timezones (optional).
         """
         self.__vevents: list[VEvent] = vevents
         self.__vtodos: list[VTodo] = vtodos
+        self.__vtimezones: list[VTimezone] = vtimezones
+        self.__vfreebusys: list[VFreeBusy] = []
+        # properties of the calendar, like VERSION and PRODID, unfolded
+        self.__header: list[str] = ["VERSION:2.0", "PRODID:-//XYZproduct//EN"]
 
     def __str__(self) -> str:
         """! Method that returns the object as a string.
@@ -42,6 +52,21 @@ class VCalendar:
         string += "]}"
         return string
 
+    def get_header(self) -> list[str]:
+        """! Method that returns the properties of the calendar.
+        They are written at the beginning of the calendar, before the timezones.
+
+        @return the unfolded lines of the properties, like PRODID:-//XYZproduct//EN.
+        """
+        return self.__header
+
+    def set_header(self, header: list[str]) -> None:
+        """! Method that set the properties of the calendar.
+
+        @param header the unfolded lines of the properties, like the ones of the file read.
+        """
+        self.__header = header
+
     def get_vevents(self) -> list[VEvent]:
         """! Method that returns the events of the calendar.
         Only events will be returned, in VEvent objects.
@@ -90,26 +115,74 @@ class VCalendar:
         """
         self.__vtodos.append(vtodo)
 
+    def get_vtimezones(self) -> list[VTimezone]:
+        """! Method that returns the timezones embedded in the calendar.
+        The timezones are VTimezone objects.
+        
+        @return a list of VTimezone objects.
+        """
+        return self.__vtimezones
+
+    def add_vtimezone(self, vtimezone: VTimezone) -> None:
+        """! Add a vtimezone to the VCalendar.
+        The timezones are saved before the events using them.
+        
+        @param vtimezone the timezone to add.
+        """
+        self.__vtimezones.append(vtimezone)
+
+    def get_vfreebusys(self) -> list[VFreeBusy]:
+        """! Method that returns the free/busy components of the calendar.
+        The components are VFreeBusy objects.
+        
+        @return a list of VFreeBusy objects.
+        """
+        return self.__vfreebusys
+
+    def add_vfreebusy(self, vfreebusy: VFreeBusy) -> None:
+        """! Add a vfreebusy to the VCalendar.
+        The free/busy components are saved after the todos.
+        
+        @param vfreebusy the free/busy component to add.
+        """
+        self.__vfreebusys.append(vfreebusy)
+
     def save(self, f) -> None:
         """! Method to save a calendar into a file.
         All events will be automatically saved.
         
         @param f the file wrapper, it must be opened as 'w' or at least 'a'.
         """
+        # the file keeps the line break of the elements read, the generated parts are converted to it
+        elements: list = self.__vevents[:1] + self.__vtodos[:1]
+        newline: str = elements[0].get_newline() if len(elements) > 0 else '\n'
+        generated: StringIO = StringIO()
+
         # write the beginning of the file
-        f.write("BEGIN:VCALENDAR\n")
-        f.write(f"VERSION:2.0\n")
-        f.write(f"PRODID:-//XYZproduct//EN\n")
+        generated.write("BEGIN:VCALENDAR\n")
+        for line in self.__header:
+            generated.write(f"{line}\n")
+
+        # for each timezone, write it before the events using it
+        for vtimezone in self.__vtimezones:
+            vtimezone.save(generated)
+        f.write(generated.getvalue().replace('\n', newline))
 
         # for each vevent, write it
         for vevent in self.__vevents:
-            vevent.save(f)
+            vevent.save(f, newline)
 
         # for each vevent, write it
         for vtodos in self.__vtodos:
-            vtodos.save(f)
+            vtodos.save(f, newline)
+
+        # for each vfreebusy, write it
+        generated = StringIO()
+        for vfreebusy in self.__vfreebusys:
+            vfreebusy.save(generated)
 
-        f.write("END:VCALENDAR\n")
+        generated.write("END:VCALENDAR\n")
+        f.write(generated.getvalue().replace('\n', newline))
 
     def export_csv(self, f) -> None:
         """! Method to save a calendar into a CSV format.
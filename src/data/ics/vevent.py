@@ -7,8 +7,8 @@ This class inherits from VBase.
 """
 
 # importing libs
-from datetime import datetime
-from io import TextIOWrapper
+from datetime import datetime, timezone, tzinfo
+from io import StringIO, TextIOWrapper
 
 # importing modules
 from data.ics.vbase import VBase
@@ -25,7 +25,7 @@ class VEvent(VBase):
     @since 25 November 2022
     """
 
-    def __init__(self, timestamp: datetime, uid: str, dtstart: datetime, dtend: datetime, tzstart: str = '',  tzend: str = '', summary: str = '', location: str = '', description: str = '', status: str = '', valarms: list[VAlarm] = [], rules: list[RRule] = []) -> None:
+    def __init__(self, timestamp: datetime, uid: str, dtstart: datetime, dtend: datetime, tzstart: str = '',  tzend: str = '', summary: str = '', location: str = '', description: str = '', status: str = '', valarms: list[VAlarm] = [], rules: list[RRule] = [], transp: str = '', exdates: list[datetime] = [], recurrence_id: datetime | None = None) -> None:
         """! Class used to store an event.
         This class inherit from the VBase one.
 
@@ -40,6 +40,9 @@ class VEvent(VBase):
         @param status the status of the event (optional).
         @param valarms the alarms of the events (optional).
         @param rules the recursion rules of the event (optional).
+        @param transp the time transparency of the event, OPAQUE or TRANSPARENT (optional).
+        @param exdates the starts of the occurrences removed from the rules (optional).
+        @param recurrence_id the start of the occurrence replaced by the event, None if it replaces none (optional).
         """
 
         # init the inherit class
@@ -48,10 +51,16 @@ class VEvent(VBase):
         # set the attributes
         self.__dtend: datetime = dtend
         self.__tzend: str = tzend
+        # resolved timezone of the ending datetime and UTC instant of the end
+        self.__end_tzinfo: tzinfo | None = None
+        self.__utc_end: float = self.to_utc_timestamp(dtend, None)
         self.__location: str = location
         self.__description: str = description
         self.__status: str = status
         self.__rules: list[RRule] = rules
+        self.__transp: str = transp
+        self.__exdates: list[datetime] = exdates
+        self.__recurrence_id: datetime | None = recurrence_id
 
     def get_dtend(self) -> datetime:
         """! Method to get the ending time.
@@ -68,6 +77,8 @@ class VEvent(VBase):
         @param dtend the ending time.
         """
         self.__dtend = dtend
+        self.__utc_end = self.to_utc_timestamp(dtend, self.__end_tzinfo)
+        self.set_raw('')
 
     def get_tzend(self) -> str:
         """! Method to get the timezone of the ending time.
@@ -84,6 +95,39 @@ class VEvent(VBase):
         @param tzend the ending date time zone.
         """
         self.__tzend = tzend
+        self.set_raw('')
+
+    def get_end_tzinfo(self) -> tzinfo | None:
+        """! Method to get the resolved timezone of the ending time.
+        The tzinfo is set by the builder once the TZID is resolved.
+
+        @return the tzinfo of the ending time, None if floating or unknown.
+        """
+        return self.__end_tzinfo
+
+    def set_end_tzinfo(self, end_tzinfo: tzinfo | None) -> None:
+        """! Method to set the resolved timezone of the ending time.
+        The UTC instant of the end is computed again.
+
+        @param end_tzinfo the tzinfo of the ending time.
+        """
+        self.__end_tzinfo = end_tzinfo
+        self.__utc_end = self.to_utc_timestamp(self.__dtend, end_tzinfo)
+
+    def get_utc_end(self) -> float:
+        """! Method to get the UTC instant of the ending time.
+        The instant is a POSIX timestamp, precomputed for indexing.
+
+        @return the UTC timestamp of the end.
+        """
+        return self.__utc_end
+
+    def get_utc_dtend(self) -> datetime:
+        """! Method to get the ending time as an aware UTC datetime.
+
+        @return the UTC ending datetime.
+        """
+        return datetime.fromtimestamp(self.__utc_end, timezone.utc)
 
     def get_location(self) -> str:
         """! Method to get the location of the event.
@@ -100,6 +144,7 @@ class VEvent(VBase):
         @param location the location of the event.
         """
         self.__location = location
+        self.set_raw('')
 
     def get_description(self) -> str:
         """! Method to get the description of the event.
@@ -116,6 +161,7 @@ class VEvent(VBase):
         @param description the description of the event.
         """
         self.__description = description
+        self.set_raw('')
 
     def get_status(self) -> str:
         """! Method to get the status of the event.
@@ -132,6 +178,24 @@ class VEvent(VBase):
         @param status the status of the event.
         """
         self.__status = status
+        self.set_raw('')
+
+    def get_transp(self) -> str:
+        """! Method to get the time transparency of the event.
+        The transparency is OPAQUE or TRANSPARENT, transparent events do not block time.
+
+        @return the transparency of the event.
+        """
+        return self.__transp
+
+    def set_transp(self, transp: str) -> None:
+        """! Method to set the time transparency of the event.
+        The transparency is OPAQUE or TRANSPARENT, transparent events do not block time.
+
+        @param transp the transparency of the event.
+        """
+        self.__transp = transp
+        self.set_raw('')
 
     def get_rrules(self) -> list[RRule]:
         """! Method to get the recursion rules of the event.
@@ -148,6 +212,7 @@ class VEvent(VBase):
         @param vrules the list of the rules of the event.
         """
         self.__rules = rrules
+        self.set_raw('')
 
     def add_rrule(self, rule: RRule) -> None:
         """! Method to add a recursion rule of the event.
@@ -156,14 +221,69 @@ class VEvent(VBase):
         @param rules the list of the rules of the event.
         """
         self.__rules.append(rule)
+        self.set_raw('')
 
+    def get_exdates(self) -> list[datetime]:
+        """! Method to get the excluded dates of the event.
+        The occurrences of the rules starting at these dates are removed.
 
-    def save(self, f: TextIOWrapper) -> None:
+        @return the list of the excluded starts, in the timezone of the start when naive.
+        """
+        return self.__exdates
+
+    def set_exdates(self, exdates: list[datetime]) -> None:
+        """! Method to set the excluded dates of the event.
+        The occurrences of the rules starting at these dates are removed.
+
+        @param exdates the list of the excluded starts.
+        """
+        self.__exdates = exdates
+        self.set_raw('')
+
+    def add_exdate(self, exdate: datetime) -> None:
+        """! Method to add an excluded date to the event.
+        The occurrence of the rules starting at this date is removed.
+
+        @param exdate the excluded start.
+        """
+        self.__exdates.append(exdate)
+        self.set_raw('')
+
+    def get_recurrence_id(self) -> datetime | None:
+        """! Method to get the recurrence id of the event.
+        An event with a recurrence id replaces the occurrence of the recurring event with the same UID starting at it.
+
+        @return the start of the replaced occurrence, None if the event replaces none.
+        """
+        return self.__recurrence_id
+
+    def set_recurrence_id(self, recurrence_id: datetime | None) -> None:
+        """! Method to set the recurrence id of the event.
+        An event with a recurrence id replaces the occurrence of the recurring event with the same UID starting at it.
+
+        @param recurrence_id the start of the replaced occurrence, None if the event replaces none.
+        """
+        self.__recurrence_id = recurrence_id
+        self.set_raw('')
+
+    def save(self, f: TextIOWrapper, newline: str = '') -> None:
         """! Method that save the vevent into a file.
         All alarms and rules will be saved as well.
 
         @param f the file wrapper to use. It must be opened as 'w' or at least 'a'.
+        @param newline the line break of a generated element, the one of its original text by default (optional).
         """
+        # an element that was not modified is written as it was read
+        if not self.is_modified():
+            f.write(self.get_raw())
+            return
+
+        # the lines are generated with \n, they are converted to the line break of the file
+        newline = newline or self.get_newline()
+        target = f
+        if newline != '\n':
+            f = StringIO()
+
         # write all basic data
         f.write("BEGIN:VEVENT\n")
         f.write(f"UID:{self.get_uid()}\n")
@@ -197,14 +317,24 @@ class VEvent(VBase):
         if (self.get_status() != ''):
             f.write(f"STATUS:{self.get_status()}\n")
 
+        # if transparency is not empty write it
+        if (self.__transp != ''):
+            f.write(f"TRANSP:{self.__transp}\n")
+
         # print each rule
         for rule in self.__rules:
-            if (rule.get_until() != ''):
-                f.write(
-                f"RRULE:FREQ={rule.get_frequency()};UNTIL={rule.get_until()}\n")
+            f.write(f"RRULE:{rule.get_value()}\n")
+
+        # print the excluded dates and the replaced occurrence, in the timezone of the start
+        dates: list[tuple[str, datetime]] = [('EXDATE', exdate) for exdate in self.__exdates]
+        if self.__recurrence_id is not None:
+            dates.append(('RECURRENCE-ID', self.__recurrence_id))
+        for name, date in dates:
+            value: str = date.strftime('%Y%m%dT%H%M%S') + ('Z' if date.tzinfo is not None else '')
+            if self.get_tzstart() != '' and date.tzinfo is None:
+                f.write(f"{name};TZID={self.get_tzstart()}:{value}\n")
             else:
-               f.write(
-                f"RRULE:FREQ={rule.get_frequency()}\n") 
+                f.write(f"{name}:{value}\n")
 
         # print each alarm
         for alarm in self.get_valarms():
@@ -212,6 +342,9 @@ class VEvent(VBase):
         # write the end of the vevent
         f.write(f"END:VEVENT\n")
 
+        if f is not target:
+            target.write(f.getvalue().replace('\n', newline))
+
     def export_csv(self, f: TextIOWrapper) -> None:
         """! Method that export an event into a CSV.
         The file used may be opened in the calendar class.
@@ -0,0 +1,128 @@
+"""! File containing the class of a VFreeBusy.
+A VFreeBusy contains the busy periods of a calendar within a time window.
+
+@author Benjamin PAUMARD
+@version 1.0.0
+@since 19 October 2026
+"""
+
+# importing libs
+from datetime import datetime
+from io import TextIOWrapper
+
+
+class VFreeBusy:
+    """! Class that contains the elements of a free/busy component.
+    The periods are aware UTC datetimes with their free/busy type.
+
+    @author Benjamin PAUMARD
+    @version 1.0.0
+    @since 19 October 2026
+    """
+
+    def __init__(self, timestamp: datetime, uid: str, dtstart: datetime, dtend: datetime, periods: list[tuple[datetime, datetime, str]] = []) -> None:
+        """! Constructor of a VFreeBusy.
+        All the busy periods of the window are stored inside this class.
+
+        @param timestamp the creation date of the element.
+        @param uid the unique id of the element.
+        @param dtstart the beginning of the window, in UTC.
+        @param dtend the end of the window, in UTC.
+        @param periods the (start, end, type) busy periods, in UTC (optional).
+        """
+        self.__timestamp: datetime = timestamp
+        self.__uid: str = uid
+        self.__dtstart: datetime = dtstart
+        self.__dtend: datetime = dtend
+        self.__periods: list[tuple[datetime, datetime, str]] = periods
+
+    def get_timestamp(self) -> datetime:
+        """! Method to get the creation date of the element.
+
+        @return the creation date.
+        """
+        return self.__timestamp
+
+    def set_timestamp(self, timestamp: datetime) -> None:
+        """! Method to set the creation date of the element.
+
+        @param timestamp the creation date.
+        """
+        self.__timestamp = timestamp
+
+    def get_uid(self) -> str:
+        """! Method to get the unique ID of the element.
+
+        @return the unique ID.
+        """
+        return self.__uid
+
+    def set_uid(self, uid: str) -> None:
+        """! Method to set the unique ID of the element.
+
+        @param uid the unique ID.
+        """
+        self.__uid = uid
+
+    def get_dtstart(self) -> datetime:
+        """! Method to get the beginning of the window.
+
+        @return the beginning of the window.
+        """
+        return self.__dtstart
+
+    def set_dtstart(self, dtstart: datetime) -> None:
+        """! Method to set the beginning of the window.
+
+        @param dtstart the beginning of the window.
+        """
+        self.__dtstart = dtstart
+
+    def get_dtend(self) -> datetime:
+        """! Method to get the end of the window.
+
+        @return the end of the window.
+        """
+        return self.__dtend
+
+    def set_dtend(self, dtend: datetime) -> None:
+        """! Method to set the end of the window.
+
+        @param dtend the end of the window.
+        """
+        self.__dtend = dtend
+
+    def get_periods(self) -> list[tuple[datetime, datetime, str]]:
+        """! Method to get the busy periods.
+        Each period is a (start, end, type) tuple, the type is like BUSY or BUSY-TENTATIVE.
+
+        @return the list of periods.
+        """
+        return self.__periods
+
+    def add_period(self, start: datetime, end: datetime, fbtype: str = 'BUSY') -> None:
+        """! Method to add a busy period.
+
+        @param start the beginning of the period, in UTC.
+        @param end the end of the period, in UTC.
+        @param fbtype the type of the period (optional).
+        """
+        self.__periods.append((start, end, fbtype))
+
+    def save(self, f: TextIOWrapper) -> None:
+        """! Method that save the vfreebusy into a file.
+        Each period is written on its own FREEBUSY line.
+
+        @param f the file wrapper to use. It must be opened as 'w' or at least 'a'.
+        """
+        f.write("BEGIN:VFREEBUSY\n")
+        f.write(f"UID:{self.__uid}\n")
+        f.write(f"DTSTAMP:{self.__timestamp.strftime('%Y%m%dT%H%M%SZ')}\n")
+        f.write(f"DTSTART:{self.__dtstart.strftime('%Y%m%dT%H%M%SZ')}\n")
+        f.write(f"DTEND:{self.__dtend.strftime('%Y%m%dT%H%M%SZ')}\n")
+
+        # write each period
+        for start, end, fbtype in self.__periods:
+            f.write(f"FREEBUSY;FBTYPE={fbtype}:{start.strftime('%Y%m%dT%H%M%SZ')}/{end.strftime('%Y%m%dT%H%M%SZ')}\n")
+
+        f.write("END:VFREEBUSY\n")
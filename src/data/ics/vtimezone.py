@@ -0,0 +1,179 @@
+"""! File containing the class of a VTimezone.
+A VTimezone is a timezone embedded in an ics file, it can be used as a tzinfo object.
+
+@author Benjamin PAUMARD
+@version 1.0.0
+@since 19 October 2026
+"""
+
+# importing libs
+from datetime import datetime, timedelta, tzinfo
+from io import TextIOWrapper
+
+# importing modules
+from data.ics.observance import Observance
+
+
+class VTimezone(tzinfo):
+    """! Class that contains the elements of a timezone.
+    The class is a tzinfo, so datetimes can be converted with it.
+
+    @author Benjamin PAUMARD
+    @version 1.0.0
+    @since 19 October 2026
+    """
+
+    def __init__(self, tzid: str = '', observances: list[Observance] | None = None) -> None:
+        """! Constructor of a VTimezone.
+        A timezone is made of STANDARD and DAYLIGHT observances.
+
+        @param tzid the id of the timezone (optional).
+        @param observances the observances of the timezone, a new list by default (optional).
+        """
+        self.__tzid: str = tzid
+        self.__observances: list[Observance] = observances if observances is not None else []
+        # onsets already computed, indexed by year
+        self.__transitions: dict[int, list[tuple[datetime, Observance]]] = {}
+
+    def __repr__(self) -> str:
+        """! Method that returns the object as a string.
+
+        @return a string containing the object.
+        """
+        return f"VTimezone({self.__tzid})"
+
+    def get_tzid(self) -> str:
+        """! Method to get the id of the timezone.
+        The id is the value used by the TZID parameters.
+
+        @return the id of the timezone.
+        """
+        return self.__tzid
+
+    def set_tzid(self, tzid: str) -> None:
+        """! Method to set the id of the timezone.
+        The id is the value used by the TZID parameters.
+
+        @param tzid the id of the timezone.
+        """
+        self.__tzid = tzid
+
+    def get_observances(self) -> list[Observance]:
+        """! Method to get the observances of the timezone.
+        The observances are objects of type Observance.
+
+        @return the list of observances.
+        """
+        return self.__observances
+
+    def add_observance(self, observance: Observance) -> None:
+        """! Method to add an observance to the timezone.
+        The computed transitions are reset.
+
+        @param observance the observance to add.
+        """
+        self.__observances.append(observance)
+        self.__transitions.clear()
+
+    def __get_transitions(self, year: int) -> list[tuple[datetime, Observance]]:
+        """! Method that returns the sorted onsets of a year and the previous one.
+        The onsets are computed once per year then kept.
+
+        @param year the year to compute.
+        @return a list of onsets with their observance.
+        """
+        transitions: list[tuple[datetime, Observance]] | None = self.__transitions.get(year)
+
+        if transitions is None:
+            transitions = []
+            # the previous year is needed for dates before the first onset of the year
+            for y in (year - 1, year):
+                for observance in self.__observances:
+                    onset: datetime | None = observance.get_onset(y)
+                    if onset is not None:
+                        transitions.append((onset, observance))
+            transitions.sort(key=lambda transition: transition[0])
+            self.__transitions[year] = transitions
+
+        return transitions
+
+    def __get_observance(self, dt: datetime) -> Observance | None:
+        """! Method that returns the observance in use at a given local time.
+
+        @param dt the local datetime.
+        @return the observance in use, None if the timezone has no observance.
+        """
+        if len(self.__observances) == 0:
+            return None
+
+        # look for the last onset before the datetime
+        local: datetime = dt.replace(tzinfo=None)
+        current: Observance | None = None
+        for onset, observance in self.__get_transitions(local.year):
+            if onset <= local:
+                current = observance
+            else:
+                break
+
+        # before the very first onset, use the earliest observance
+        if current is None:
+            current = min(self.__observances, key=lambda observance: observance.get_dtstart())
+
+        return current
+
+    def utcoffset(self, dt: datetime | None) -> timedelta:
+        """! Method that returns the offset from UTC at a given local time.
+
+        @param dt the local datetime.
+        @return the offset as a timedelta.
+        """
+        if dt is None:
+            return timedelta(0)
+
+        observance: Observance | None = self.__get_observance(dt)
+        if observance is None:
+            return timedelta(0)
+        return Observance.parse_offset(observance.get_offset_to())
+
+    def dst(self, dt: datetime | None) -> timedelta:
+        """! Method that returns the daylight saving adjustment at a given local time.
+
+        @param dt the local datetime.
+        @return the adjustment as a timedelta.
+        """
+        if dt is None:
+            return timedelta(0)
+
+        observance: Observance | None = self.__get_observance(dt)
+        if observance is None or observance.get_kind().upper() != 'DAYLIGHT':
+            return timedelta(0)
+        return Observance.parse_offset(observance.get_offset_to()) - Observance.parse_offset(observance.get_offset_from())
+
+    def tzname(self, dt: datetime | None) -> str:
+        """! Method that returns the name of the observance at a given local time.
+
+        @param dt the local datetime.
+        @return the name, or the tzid if the observance has no name.
+        """
+        if dt is None:
+            return self.__tzid
+
+        observance: Observance | None = self.__get_observance(dt)
+        if observance is None or observance.get_tzname() == '':
+            return self.__tzid
+        return observance.get_tzname()
+
+    def save(self, f: TextIOWrapper) -> None:
+        """! Method that save the VTimezone into an ics file.
+        All observances will be saved as well.
+
+        @param f the file wrapper to use. It must be opened as 'w' or at least 'a'.
+        """
+        f.write("BEGIN:VTIMEZONE\n")
+        f.write(f"TZID:{self.__tzid}\n")
+
+        # save each observance
+        for observance in self.__observances:
+            observance.save(f)
+
+        f.write("END:VTIMEZONE\n")
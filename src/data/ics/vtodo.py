@@ -8,7 +8,7 @@ This class inherits from VBase.
 
 # importing libs
 from datetime import datetime
-from io import TextIOWrapper
+from io import StringIO, TextIOWrapper
 
 # importing modules
 from data.ics.valarm import VAlarm
@@ -61,6 +61,7 @@ class VTodo(VBase):
         @param tzend the ending date time zone.
         """
         self.__duration = duration
+        self.set_raw('')
 
     def get_location(self) -> str:
         """! Method to get the location of the todo.
@@ -77,6 +78,7 @@ class VTodo(VBase):
         @param location the location of the todo.
         """
         self.__location = location
+        self.set_raw('')
 
     def get_description(self) -> str:
         """! Method to get the description of the todo.
@@ -93,6 +95,7 @@ class VTodo(VBase):
         @param description the description of the todo.
         """
         self.__description = description
+        self.set_raw('')
 
     def get_status(self) -> str:
         """! Method to get the status of the todo.
@@ -109,13 +112,26 @@ class VTodo(VBase):
         @param status the status of the todo.
         """
         self.__status = status
+        self.set_raw('')
 
-    def save(self, f: TextIOWrapper) -> None:
+    def save(self, f: TextIOWrapper, newline: str = '') -> None:
         """! Method that save the vtodo into a file.
         All alarms and rules will be saved as well.
 
         @param f the file wrapper to use. It must be opened as 'w' or at least 'a'.
+        @param newline the line break of a generated element, the one of its original text by default (optional).
         """
+        # an element that was not modified is written as it was read
+        if not self.is_modified():
+            f.write(self.get_raw())
+            return
+
+        # the lines are generated with \n, they are converted to the line break of the file
+        newline = newline or self.get_newline()
+        target = f
+        if newline != '\n':
+            f = StringIO()
+
         # write all basic data
         f.write("BEGIN:VTODO\n")
         f.write(f"UID:{self.get_uid()}\n")
@@ -140,6 +156,9 @@ class VTodo(VBase):
         # write the end of the vtodo
         f.write(f"END:VTODO\n")
 
+        if f is not target:
+            target.write(f.getvalue().replace('\n', newline))
+
     def export_csv(self, f: TextIOWrapper) -> None:
         """! Method that export an todo into a CSV.
         The file used may be opened in the calendar class.
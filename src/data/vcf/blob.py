@@ -0,0 +1,159 @@
+"""! File that includes the class for a binary property of a vcard.
+Blobs are stored as a list in a VCard, like the PHOTO, LOGO and SOUND properties.
+
+@author Benjamin PAUMARD
+@version 1.0.0
+@since 19 October 2026
+"""
+
+# importing libs
+import base64
+import binascii
+import re
+
+# names of the binary properties
+BLOB_NAMES: tuple[str, ...] = ('PHOTO', 'LOGO', 'SOUND')
+# media type of a data URI, like data:image/jpeg;base64,
+DATA_URI: re.Pattern = re.compile(r'\s*data:([^;,]*)((?:;[^,]*)?),', re.IGNORECASE)
+
+
+class Blob:
+    """! Class that reference a binary property of a vcard.
+    The value is not copied, the blob keeps the text it was read from with the offset and the length of the value.
+    The value is only unfolded and decoded when its data is asked for, so reading a card with a large photo
+    costs no more than reading the other properties of the card.
+
+    @author Benjamin PAUMARD
+    @version 1.0.0
+    @since 19 October 2026
+    """
+
+    def __init__(self, name: str, parameters: str, source: str, offset: int, length: int) -> None:
+        """! Constructor of a Blob.
+
+        @param name the name of the property as written, with its group if any, like PHOTO or item1.LOGO.
+        @param parameters the parameters of the property as written, with their leading semicolon, like ;ENCODING=b;TYPE=JPEG.
+        @param source the text containing the value, usually the text of the card.
+        @param offset the offset of the value in the text.
+        @param length the length of the value in the text, folded lines included.
+        """
+        self.__name: str = name
+        self.__parameters: str = parameters
+        self.__source: str = source
+        self.__offset: int = offset
+        self.__length: int = length
+
+    def __str__(self) -> str:
+        """! Override the default __str__ method.
+        Allow to see the object as a string.
+
+        @return the object as a string."""
+        return f"BlobObject: {{name={self.__name}, parameters={self.__parameters}, length={self.__length}}}"
+
+    def get_name(self) -> str:
+        """! Return the name of the property, with its group if any.
+
+        @return the name as written, like PHOTO.
+        """
+        return self.__name
+
+    def get_kind(self) -> str:
+        """! Return the kind of the property, without its group.
+
+        @return PHOTO, LOGO or SOUND.
+        """
+        return self.__name.rpartition('.')[2].upper()
+
+    def get_parameters(self) -> str:
+        """! Return the parameters of the property as written.
+
+        @return the parameters with their leading semicolon, empty if there is none.
+        """
+        return self.__parameters
+
+    def get_offset(self) -> int:
+        """! Return the offset of the value in its text.
+
+        @return the offset of the value.
+        """
+        return self.__offset
+
+    def get_length(self) -> int:
+        """! Return the length of the value in its text.
+
+        @return the length of the value, folded lines included.
+        """
+        return self.__length
+
+    def get_value(self) -> str:
+        """! Return the value of the property, unfolded but not decoded.
+
+        @return the value, base64 data or a URI.
+        """
+        value: str = self.__source[self.__offset:self.__offset + self.__length]
+        for fold in ('\r\n ', '\r\n\t', '\n ', '\n\t'):
+            value = value.replace(fold, '')
+        return value
+
+    def is_inline(self) -> bool:
+        """! Return whether the data is in the card, as base64 or as a data URI, rather than at a URI.
+
+        @return True if the value can be decoded.
+        """
+        upper: str = self.__parameters.upper()
+        return 'BASE64' in upper or 'ENCODING=B' in upper or DATA_URI.match(self.__source, self.__offset) is not None
+
+    def get_media_type(self) -> str:
+        """! Return the type of the data, from the TYPE or MEDIATYPE parameters or from the data URI.
+
+        @return the type in lower case, like jpeg or image/jpeg, empty if unknown.
+        """
+        data_uri = DATA_URI.match(self.__source, self.__offset)
+        if data_uri is not None and data_uri.group(1) != '':
+            return data_uri.group(1).lower()
+
+        for parameter in self.__parameters.split(';'):
+            key, _, value = parameter.partition('=')
+            # vcard 2.1 gives the type alone, like ;JPEG
+            if value == '' and key.upper() not in ('', 'BASE64', 'PREF'):
+                return key.lower()
+            if key.upper() in ('TYPE', 'MEDIATYPE'):
+                return value.strip('"').lower()
+        return ''
+
+    def get_extension(self) -> str:
+        """! Return the extension of a file holding the data.
+
+        @return the extension without dot, like jpeg, bin if the type is unknown.
+        """
+        extension: str = re.sub(r'[^a-z0-9]', '', self.get_media_type().rpartition('/')[2])
+        return extension if extension != '' else 'bin'
+
+    def get_data(self) -> bytes:
+        """! Return the decoded data of the property.
+        The value is decoded on each call, the data is not kept.
+
+        @return the data, empty if the value is a URI or cannot be decoded.
+        """
+        if not self.is_inline():
+            return b''
+
+        value: str = self.get_value()
+        data_uri = DATA_URI.match(value)
+        if data_uri is not None:
+            value = value[data_uri.end():]
+
+        # the characters out of the base64 alphabet, like the spaces of the folded lines, are ignored
+        try:
+            return base64.b64decode(value)
+        except (binascii.Error, ValueError):
+            return b''
+
+    def save(self, f) -> None:
+        """! Method that save the property into a file, as it was read.
+        The folded lines are written with \\n, like the other generated lines of the card.
+
+        @param f the file wrapper to use. It must be opened as 'w' or at least 'a'.
+        """
+        value: str = self.__source[self.__offset:self.__offset + self.__length].replace('\r\n', '\n')
+        f.write(f"{self.__name}{self.__parameters}:{value}\n")
@@ -5,10 +5,14 @@ All elements of a vcard is saved in this class.
 @version 1.0.0
 @since 25 November 2022
 """
+# importing libs
+from io import StringIO
+
 # importing elements used in the VCard
 from data.vcf.email import Email
 from data.vcf.phone import Phone
 from data.vcf.address import Address
+from data.vcf.blob import Blob
 
 
 class VCard:
@@ -24,6 +28,8 @@ class VCard:
         """! Constructor of a VCard, the same class is used no matter the version. Only data extraction and saving will change/"""
         # version of the vcard
         self.__version: float = 0
+        # unique id of the contact
+        self.__uid: str = ''
         # names of the contact
         self.__names: list[str] = []
         # full name of the contact
@@ -42,6 +48,12 @@ class VCard:
         self.__note: str = ''
         # categories of the contact
         self.__categories: list[str] = []
+        # binary properties of the contact, like its photo, decoded on demand
+        self.__blobs: list[Blob] = []
+        # original text of the card, emptied when the card is modified
+        self.__raw: str = ''
+        # line break of the original text, kept to generate the card again with it
+        self.__newline: str = '\n'
 
     def __str__(self) -> str:
         """! Method that returns the object as a string.
@@ -66,6 +78,24 @@ class VCard:
         @param version the version.
         """
         self.__version = version
+        self.__raw = ''
+
+    def get_uid(self) -> str:
+        """! Get the unique id.
+        The UID is optional in a vcard, it is empty when the contact has none.
+        
+        @return the unique id of the contact.
+        """
+        return self.__uid
+
+    def set_uid(self, uid: str) -> None:
+        """! Set the unique id.
+        The UID is optional in a vcard, it is empty when the contact has none.
+        
+        @param uid the unique id of the contact.
+        """
+        self.__uid = uid
+        self.__raw = ''
 
     def get_names(self) -> list[str]:
         """! Get the list of the names.
@@ -82,6 +112,7 @@ class VCard:
         @param names the names of the person.
         """
         self.__names = names
+        self.__raw = ''
 
     def add_name(self, name) -> None:
         """! Get the list of the names.
@@ -90,6 +121,7 @@ class VCard:
         @return the names of the person.
         """
         self.__names.append(name)
+        self.__raw = ''
 
     def get_full_name(self) -> str:
         """! Get the full name.
@@ -106,6 +138,7 @@ class VCard:
         @param full_name the full name of the card.
         """
         self.__full_name = full_name
+        self.__raw = ''
 
     def get_org(self) -> str:
         """! Get the org of the card.
@@ -122,6 +155,7 @@ class VCard:
         @param org the org of the card.
         """
         self.__org = org
+        self.__raw = ''
 
     def get_title(self) -> str:
         """! Get the title of the card.
@@ -138,6 +172,7 @@ class VCard:
         @param title the title of the card.
         """
         self.__title = title
+        self.__raw = ''
 
     def get_addresses(self) -> list[Address]:
         """! Get the list of the addresses.
@@ -154,6 +189,7 @@ class VCard:
         @param address an Address object.
         """
         self.__addresses.append(address)
+        self.__raw = ''
 
     def get_emails(self) -> list[Email]:
         """! Get the list of the emails.
@@ -170,6 +206,7 @@ class VCard:
         @param email an Email object.
         """
         self.__emails.append(email)
+        self.__raw = ''
 
     def get_phones(self) -> list[Phone]:
         """! Get the list of the phones.
@@ -186,6 +223,7 @@ class VCard:
         @param phone an Phone object.
         """
         self.__phones.append(phone)
+        self.__raw = ''
 
     def get_note(self) -> str:
         """! Get the note of the card.
@@ -202,6 +240,7 @@ class VCard:
         @param note the note of the card.
         """
         self.__note = note
+        self.__raw = ''
 
     def get_categories(self) -> list[str]:
         """! Get the list of the categories.
@@ -218,16 +257,93 @@ class VCard:
         @param category a string representing a category.
         """
         self.__categories.append(category)
+        self.__raw = ''
+
+    def get_blobs(self) -> list[Blob]:
+        """! Get the list of the binary properties.
+        The photos, logos and sounds of the contact are stored here.
+
+        @return the binary properties of the contact.
+        """
+        return self.__blobs
+
+    def set_blobs(self, blobs: list[Blob]) -> None:
+        """! Set the list of the binary properties.
+        The current binary properties will be replaced.
+
+        @param blobs the list of Blob objects.
+        """
+        self.__blobs = blobs
+        self.__raw = ''
+
+    def add_blob(self, blob: Blob) -> None:
+        """! Add element to the list of the binary properties.
+        The photos, logos and sounds of the contact are stored here.
+
+        @param blob a Blob object.
+        """
+        self.__blobs.append(blob)
+        self.__raw = ''
+
+    def get_raw(self) -> str:
+        """! Method to get the original text of the card.
+        The text is empty once the card has been modified, or when it was not read from a file.
 
-    def save(self, f) -> None:
+        @return the text of the card as read, with its line breaks.
+        """
+        return self.__raw
+
+    def set_raw(self, raw: str) -> None:
+        """! Method to set the original text of the card.
+        As long as the card is not modified, the text is saved as is instead of being generated again.
+
+        @param raw the text of the card as read, with its line breaks, empty to generate it on save.
+        """
+        self.__raw = raw
+
+        # the line break of the text is kept once the card is modified
+        if raw != '':
+            end: int = raw.find('\n')
+            self.__newline = '\r\n' if end > 0 and raw[end - 1] == '\r' else '\n'
+
+    def get_newline(self) -> str:
+        """! Method to get the line break of the original text of the card.
+        A modified card is generated again with it, so an edited file keeps its line breaks.
+
+        @return \\r\\n or \\n, \\n when the card was not read from a file.
+        """
+        return self.__newline
+
+    def is_modified(self) -> bool:
+        """! Method that tells whether the card must be generated again on save.
+
+        @return True if the card has no original text.
+        """
+        return self.__raw == ''
+
+    def save(self, f, newline: str = '') -> None:
         """! Method that save the vcard into a file.
         All the data  will be saved
 
         @param f the file wrapper to use. It must be opened as 'w' or at least 'a'.
+        @param newline the line break of a generated card, the one of its original text by default (optional).
         """
+        # a card that was not modified is written as it was read
+        if self.__raw != '':
+            f.write(self.__raw)
+            return
+
+        # the lines are generated with \n, they are converted to the line break of the file
+        newline = newline or self.__newline
+        target = f
+        if newline != '\n':
+            f = StringIO()
+
         # save basic infos
         f.write("BEGIN:VCARD\n")
         f.write(f"VERSION:{self.__version}\n")
+        if self.__uid != '':
+            f.write(f"UID:{self.__uid}\n")
         f.write(f"N:{';'.join(self.__names)}\n")
         f.write(f"FN:{self.__full_name}\n")
         f.write(f"TITLE:{self.__title}\n")
@@ -267,8 +383,16 @@ class VCard:
             f.write(temp)
 
         f.write(f"NOTE:{self.__note}\n")
+
+        # save the binary properties as they were read
+        for blob in self.__blobs:
+            blob.save(f)
+
         f.write("END:VCARD\n")
 
+        if f is not target:
+            target.write(f.getvalue().replace('\n', newline))
+
     def export_csv(self, f) -> None:
         """! Method that export a vcard into a CSV.
         The file used may be opened in the vcf manager.
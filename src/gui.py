@@ -11,16 +11,29 @@ The GUI allow to open an ICS or VCF file and modify it.
 # -*- coding: utf-8 -*-
 
 from datetime import datetime
+import io
 import os
+import queue
+import threading
 
 import tkinter as tk
 from tkinter import filedialog as fd
 from tkinter import messagebox
+from tkinter import ttk
+from typing import TYPE_CHECKING, Callable, TextIO
 
 from config import config
 
-from process.manager.vcf_manager import VCFManager
-from process.manager.ics_manager import ICSManager
+# the managers and the data model are imported when first used, so the window opens without them
+if TYPE_CHECKING:
+    from process.manager.vcf_manager import VCFManager
+    from process.manager.ics_manager import ICSManager
+    from data.vcf.vcard import VCard
+    from data.ics.vevent import VEvent
+    from data.ics.vtodo import VTodo
+    from process.watch.incremental_loader import IncrementalLoader
+    from process.watch.file_watcher import FileWatcher
+    from process.writer.background_writer import BackgroundWriter
 
 class GUI(tk.Tk):
     """! Class that contains the GUI.
@@ -49,8 +62,14 @@ class GUI(tk.Tk):
         # title
         self.__title_label: tk.Label = tk.Label(self, text=config.APP_NAME, background=self.__bg_color, foreground=self.__fg_color, font=("Arial", 20))
         self.__opened_filename_label: tk.Label = tk.Label(self, text="No opened file", background=self.__bg_color, foreground=self.__fg_color, font=("Arial", 15))
+        self.__status_label: tk.Label = tk.Label(self, text='', background=self.__bg_color, foreground=self.__fg_color, font=("Arial", 10))
         self.__credits_label: tk.Label = tk.Label(self, text=f"{config.APP_NAME} | Version: {config.VERSION} | Project made at CYU University | Author: Benjamin PAUMARD", background=self.__bg_color, foreground=self.__fg_color, font=("Arial", 10))
         
+        # progress of the file being loaded, shown while loading
+        self.__loading_frame: tk.Frame = tk.Frame(self, background=self.__bg_color)
+        self.__progress_bar: ttk.Progressbar = ttk.Progressbar(self.__loading_frame, length=config.WIDTH//2, maximum=100)
+        self.__cancel_button: tk.Button = tk.Button(self.__loading_frame, text="Cancel", background=self.__button_bg_color, foreground=self.__fg_color, highlightthickness=0, command=self.cancel_loading)
+
         # main frame
         self.__work_frame: tk.Frame = tk.Frame(self, background=self.__bg_color, width=config.WIDTH, height=config.HEIGHT-90)
 
@@ -62,7 +81,7 @@ class GUI(tk.Tk):
         self.__scrollbar: tk.Scrollbar = tk.Scrollbar(self.__view_frame)
 
         # element list
-        self.__list_view: tk.Text = tk.Text(self.__view_frame, yscrollcommand=self.__scrollbar.set, background=self.__frame_bg_color, foreground=self.__fg_color, borderwidth=0, highlightthickness=0, state="disabled", font=("sans-serif", 12))
+        self.__list_view: tk.Text = tk.Text(self.__view_frame, yscrollcommand=self.on_view_scroll, background=self.__frame_bg_color, foreground=self.__fg_color, borderwidth=0, highlightthickness=0, state="disabled", font=("sans-serif", 12))
 
         # VCARD EDIT ELEMENTS
         # labels
@@ -111,13 +130,68 @@ class GUI(tk.Tk):
         # file management
         # file type opened
         self.__filetype: str = ''
-        # managers
-        self.__vcf: VCFManager = VCFManager()
-        self.__ics: ICSManager = ICSManager()
+        # records of the view frame, and the number of them already rendered
+        self.__view_records: list = []
+        self.__view_rendered: int = 0
+        self.__view_render_pending: bool = False
+        # managers, created when first used
+        self.__vcf: 'VCFManager | None' = None
+        self.__ics: 'ICSManager | None' = None
+        # loader and watcher of the opened file, the file is reloaded when it changes on the disk
+        self.__loader: 'IncrementalLoader | None' = None
+        self.__watcher: 'FileWatcher | None' = None
+        # event cancelling the file being loaded, None when no file is loading
+        self.__loading_stop: threading.Event | None = None
+        # writer of the saved and exported files, created by the first write
+        self.__writer: 'BackgroundWriter | None' = None
 
         self.init()
 
 
+    def get_vcf(self) -> 'VCFManager':
+        """! Method to get the manager of the contacts, it is created by the first call.
+
+        @return the VCF manager.
+        """
+        if self.__vcf is None:
+            from process.manager.vcf_manager import VCFManager
+
+            self.__vcf = VCFManager()
+        return self.__vcf
+
+    def get_ics(self) -> 'ICSManager':
+        """! Method to get the manager of the calendar, it is created by the first call.
+
+        @return the ICS manager.
+        """
+        if self.__ics is None:
+            from process.manager.ics_manager import ICSManager
+
+            self.__ics = ICSManager()
+        return self.__ics
+
+    def get_writer(self) -> 'BackgroundWriter':
+        """! Method to get the writer of the saved and exported files, it is created by the first call.
+
+        @return the background writer.
+        """
+        if self.__writer is None:
+            from process.writer.background_writer import BackgroundWriter
+
+            self.__writer = BackgroundWriter()
+        return self.__writer
+
+    def get_opened_path(self) -> str:
+        """! Method to get the path of the opened file.
+
+        @return the path of the opened VCF or ICS file, empty when no file is opened.
+        """
+        if self.__filetype == 'vcf' and self.__vcf is not None:
+            return self.__vcf.get_path()
+        if self.__filetype == 'ics' and self.__ics is not None:
+            return self.__ics.get_path()
+        return ''
+
     def init(self) -> None:
         """! Method that init the GUI."""
 
@@ -157,6 +231,10 @@ class GUI(tk.Tk):
         # scrollbar
         self.__scrollbar.pack(side="right", fill="y")
         self.__scrollbar.config(command=self.__list_view.yview)        
+
+        # progress of the loading
+        self.__progress_bar.pack(side="left", padx=5)
+        self.__cancel_button.pack(side="left", padx=5)
     
         self.__edit_frame.pack_propagate(False)
         self.__view_frame.pack_propagate(False)
@@ -166,6 +244,7 @@ class GUI(tk.Tk):
         # packing to the main window
         self.__title_label.pack()
         self.__opened_filename_label.pack()
+        self.__status_label.pack()
         self.__work_frame.pack()
         self.__credits_label.pack()
 
@@ -179,11 +258,53 @@ class GUI(tk.Tk):
 
         # elif is a VCF, then use the vcf manager
         elif (self.__filetype == 'vcf'):
-            self.__vcf.save()
+            self.write_file(self.get_vcf().get_path(), self.get_vcf().write)
         
         # elif its an ICS use the ICS manager
         elif (self.__filetype == 'ics'):
-            self.__ics.save()
+            self.write_file(self.get_ics().get_path(), self.get_ics().write)
+
+    def write_file(self, path: str, render: Callable[[TextIO], None]) -> None:
+        """! Method that write a file in the background.
+        The content is rendered now, on the thread of the GUI, so the records edited while the file is written
+        are not written half modified. The result is reported by handle_writes.
+
+        @param path the path of the file.
+        @param render the function writing the content into the text file it is given, like the write method of a manager.
+        """
+        self.__status_label["text"] = f"Saving {os.path.basename(path)}..."
+
+        # the line breaks are kept, like the bytes that are not valid UTF-8
+        content: io.StringIO = io.StringIO(newline='')
+        render(content)
+        data: bytes = content.getvalue().encode('utf-8', errors='surrogateescape')
+
+        def write(temporary: str) -> None:
+            with open(temporary, 'wb') as f:
+                f.write(data)
+
+        self.get_writer().submit(path, write)
+
+    def handle_writes(self) -> None:
+        """! Method that report the writes done in the background."""
+        if self.__writer is None:
+            return
+
+        for path, error in self.__writer.get_results():
+            # the change of the opened file is ours, it must not reload it
+            if self.__watcher is not None and path == self.get_opened_path():
+                self.__watcher.has_changed()
+
+            if error is None:
+                self.__status_label["text"] = f"Saved {os.path.basename(path)}"
+            else:
+                self.__status_label["text"] = ''
+                messagebox.showwarning(f"Cannot save - {config.APP_NAME}", f"The file {path} could not be written: {error}")
+
+    def check_writes(self) -> None:
+        """! Method that report the writes done in the background and schedules its next call."""
+        self.handle_writes()
+        self.after(200, self.check_writes)
 
     def save_as_file(self) -> None:
         """! Saves a file as requested by the user.
@@ -209,16 +330,16 @@ class GUI(tk.Tk):
         # if is a VCF, then use the vcf manager
         if (self.__filetype == 'vcf'):
             if (filename.endswith('.vcf')):
-                self.__vcf.save(filename)
+                self.write_file(filename, self.get_vcf().write)
             else:
-                self.__vcf.save(f"{filename}.vcf")
+                self.write_file(f"{filename}.vcf", self.get_vcf().write)
         
         # else its an ICS use the ICS manager
         elif (self.__filetype == 'ics'):
             if (filename.endswith('.ics')):
-                self.__ics.save(filename)
+                self.write_file(filename, self.get_ics().write)
             else:
-                self.__ics.save(f"{filename}.ics")
+                self.write_file(f"{filename}.ics", self.get_ics().write)
 
     def open_file(self) -> None:
         """! Open a file."""
@@ -237,30 +358,125 @@ class GUI(tk.Tk):
 
         # if is a VCF, then use the vcf manager
         elif (filename.endswith('.vcf') or filename.endswith('.VCF')):
-            try:
-                self.__vcf.read(filename)
-                self.__filetype = 'vcf'
-            except:
-                self.__list_view.config(state='disabled')
-                messagebox.showinfo(f"Corrupted file - {config.APP_NAME}", "The file you are trying to open cannot be read by the application.")
-                return
+            from process.manager.vcf_manager import VCFManager
+
+            manager: 'VCFManager | ICSManager' = VCFManager()
+            filetype: str = 'vcf'
 
         # else its an ICS use the ICS manager
         elif (filename.endswith('.ics') or filename.endswith('.ICS')):
-            try:
-                self.__ics.read(filename)
-                self.__filetype = 'ics'
-            except:
-                messagebox.showinfo(f"Corrupted file - {config.APP_NAME}", "The file you are trying to open cannot be read by the application.")
-                return
+            from process.manager.ics_manager import ICSManager
+
+            manager = ICSManager()
+            filetype = 'ics'
 
         else:
             messagebox.showinfo(f"Incorrect file - {config.APP_NAME}", "The file you are trying to open is not supported by the application.")
             return
 
+        # only one file is loaded at a time
+        self.cancel_loading()
+
+        # the file is parsed by a thread into a new manager, the opened file stays usable until the end
+        stop: threading.Event = threading.Event()
+        messages: queue.Queue = queue.Queue()
+        self.__loading_stop = stop
+        self.__progress_bar['value'] = 0
+        self.__loading_frame.pack(before=self.__work_frame)
+        self.set_view_records([])
+
+        threading.Thread(target=self.load_file, args=(manager, filename, stop, messages), daemon=True).start()
+        self.after(50, self.check_loading, manager, filetype, filename, stop, messages)
+
+    def load_file(self, manager: 'VCFManager | ICSManager', filename: str, stop: threading.Event, messages: queue.Queue) -> None:
+        """! Method that parse a file, it runs in its own thread.
+        Nothing is done on the widgets here, the progress and the result are sent to the main thread through the queue.
+
+        @param manager the manager to load the file into.
+        @param filename the path of the file.
+        @param stop the event cancelling the loading.
+        @param messages the queue of the messages for the main thread.
+        """
+        from process.watch.incremental_loader import IncrementalLoader
+
+        try:
+            loader: IncrementalLoader = IncrementalLoader(manager, filename, lambda consumed, total, records: messages.put(('progress', consumed, total, records)), stop)
+            messages.put(('cancelled',) if stop.is_set() else ('done', loader))
+        except:
+            messages.put(('error',))
+
+    def check_loading(self, manager: 'VCFManager | ICSManager', filetype: str, filename: str, stop: threading.Event, messages: queue.Queue) -> None:
+        """! Method that handle the messages of the thread loading a file.
+        The records are displayed as they are parsed. The method schedules its next call until the loading ends.
+
+        @param manager the manager the file is loaded into.
+        @param filetype the type of the file.
+        @param filename the path of the file.
+        @param stop the event cancelling the loading.
+        @param messages the queue of the messages of the thread.
+        """
+        # the loading has been cancelled or replaced by another one
+        if stop is not self.__loading_stop:
+            return
+
+        while True:
+            try:
+                message: tuple = messages.get_nowait()
+            except queue.Empty:
+                break
+
+            match message[0]:
+                case 'progress':
+                    self.__progress_bar['value'] = 100 * message[1] / max(message[2], 1)
+                    # display the first records, the next ones are rendered on scroll
+                    self.__view_records.extend(message[3])
+                    self.on_view_scroll(*self.__list_view.yview())
+
+                case 'done':
+                    self.end_loading()
+                    if filetype == 'vcf':
+                        self.__vcf = manager
+                    else:
+                        self.__ics = manager
+                    self.__loader = message[1]
+                    self.__filetype = filetype
+                    self.set_view_frame_content()
+                    self.set_selection_edit_frame()
+
+                    # watch the file, the GUI polls it so no thread is needed
+                    from process.watch.file_watcher import FileWatcher
+
+                    self.__watcher = FileWatcher(filename, use_inotify=False)
+                    self.set_opened_filename(filename)
+                    return
+
+                case 'error':
+                    self.end_loading()
+                    self.set_view_frame_content()
+                    messagebox.showinfo(f"Corrupted file - {config.APP_NAME}", "The file you are trying to open cannot be read by the application.")
+                    return
+
+        self.after(50, self.check_loading, manager, filetype, filename, stop, messages)
+
+    def end_loading(self) -> None:
+        """! Method that hide the progress of the loading."""
+        self.__loading_stop = None
+        self.__loading_frame.pack_forget()
+
+    def cancel_loading(self) -> None:
+        """! Method that cancel the file being loaded, the opened file is displayed again."""
+        if self.__loading_stop is None:
+            return
+
+        self.__loading_stop.set()
+        self.end_loading()
         self.set_view_frame_content()
-        self.set_selection_edit_frame()
 
+    def set_opened_filename(self, filename: str) -> None:
+        """! Method that display the name of the opened file.
+
+        @param filename the path of the file.
+        """
         # create the title
         temp: str = ''
         for char in filename[::-1]:
@@ -286,6 +502,9 @@ class GUI(tk.Tk):
         if (filename == ''):
             return
 
+        # the imported file replaces the file being loaded
+        self.cancel_loading()
+
         export_type: str = ''
 
         for widget in self.__edit_frame.winfo_children():
@@ -309,7 +528,7 @@ class GUI(tk.Tk):
             # if the exported file is a VCF
             if export_type == 'vcf':
                 try:
-                    self.__vcf.import_from_file(filename)
+                    self.get_vcf().import_from_file(filename)
                     self.__filetype = 'export-vcf'
                 except:
                     messagebox.showinfo(f"Corrupted file - {config.APP_NAME}", "The file you are trying to open cannot be read by the application.")
@@ -317,7 +536,7 @@ class GUI(tk.Tk):
             # else if the exported type is ICS
             elif export_type == 'ics':
                 try:
-                    self.__ics.import_from_file(filename)
+                    self.get_ics().import_from_file(filename)
                     self.__filetype = 'export-ics'
                 except Exception as e:
 
@@ -335,14 +554,14 @@ class GUI(tk.Tk):
 
             if export_type == 'vcf':
                 try:
-                    self.__vcf.import_from_file(filename)
+                    self.get_vcf().import_from_file(filename)
                     self.__filetype = 'export-vcf'
                 except:
                     messagebox.showinfo(f"Corrupted file - {config.APP_NAME}", "The file you are trying to open cannot be read by the application.")
 
             elif export_type == 'ics':
                 try:
-                    self.__ics.import_from_file(filename)
+                    self.get_ics().import_from_file(filename)
                     self.__filetype = 'export-ics'
                 except Exception as e:
                     messagebox.showinfo(f"Corrupted file - {config.APP_NAME}", "The file you are trying to open cannot be read by the application.")
@@ -390,131 +609,164 @@ class GUI(tk.Tk):
         if filename == '':
             return
         
-        if export_type == 'html':
-            # if is a VCF, then use the vcf manager
-            if (self.__filetype == 'vcf'):
-                
-                if (filename.endswith('.html')):
-                    self.__vcf.export_html(filename, full_html_page)
-                
-                else:
-                    self.__vcf.export_html(f"{filename}.html", full_html_page)
+        # the manager exporting the file
+        manager: 'VCFManager | ICSManager'
+        if (self.__filetype == 'vcf'):
+            manager = self.get_vcf()
+        elif (self.__filetype == 'ics'):
+            manager = self.get_ics()
+        else:
+            return
 
-            # else its an ICS use the ICS manager
-            elif (self.__filetype == 'ics'):
-                
-                if (filename.endswith('.html')):
-                    self.__ics.export_html(filename, full_html_page)
-                
-                else:
-                    self.__ics.export_html(f"{filename}.html", full_html_page)
+        if export_type == 'html':
+            if not filename.endswith('.html'):
+                filename = f"{filename}.html"
+            self.write_file(filename, lambda f: manager.write_html(f, full_html_page))
 
         elif export_type == 'csv':
-            # if is a VCF, then use the vcf manager
-            if (self.__filetype == 'vcf'):
-                
-                if (filename.endswith('.csv')):
-                    self.__vcf.export_csv(filename)
-                
-                else:
-                    self.__vcf.export_csv(f"{filename}.csv")
+            if not filename.endswith('.csv'):
+                filename = f"{filename}.csv"
+            self.write_file(filename, manager.write_csv)
 
-            # else its an ICS use the ICS manager
-            elif (self.__filetype == 'ics'):
-                
-                if (filename.endswith('.csv')):
-                    self.__ics.export_csv(filename)
-                
-                else:
-                    self.__ics.export_csv(f"{filename}.csv")
+    def format_vcard(self, vcard: 'VCard') -> str:
+        """! Format a contact for the view frame.
+        The parts are joined once, the string is not rebuilt for each part.
+
+        @param vcard the contact to format.
+        @return the contact as a string.
+        """
+        # basic informations
+        parts: list[str] = [vcard.get_full_name(), "\n", "\nName:\n", ' '.join(vcard.get_names()), "\n"]
+
+        # print data depending on their existence
+        if vcard.get_title() != '':
+            parts += ["\nTitle:\n", vcard.get_title(), "\n"]
+
+        # print data depending on their existence 
+        if vcard.get_org() != '':
+            parts += ["\nOrg:\n", vcard.get_org(), "\n"]
+
+        # print each address of the contact, with the preferred one marked
+        parts.append("\nAddresses:\n")
+        for address in vcard.get_addresses():
+            parts += [' '.join(address.get_address_elements()), " (preferred)\n" if address.is_preferred() else "\n"]
+
+        # print each email of the contact
+        parts.append("\nEmails:\n")
+        for email in vcard.get_emails():
+            parts += [email.get_email_address(), " (preferred)\n" if email.is_preferred() else "\n"]
+
+        # print each phone of the contact
+        parts.append("\nPhones:\n")
+        for phone in vcard.get_phones():
+            parts += [phone.get_phone_number(), " (preferred)\n" if phone.is_preferred() else "\n"]
+
+        # end with the note of the user
+        if vcard.get_note():
+            parts += ["\nNote:\n", vcard.get_note(), "\n\n"]
+        else:
+            parts.append("\n")
+
+        parts.append("---------------------------------------\n\n")
+        return ''.join(parts)
+
+    def format_vevent(self, event: 'VEvent') -> str:
+        """! Format an event for the view frame.
+
+        @param event the event to format.
+        @return the event as a string.
+        """
+        return ''.join((
+            f"{event.get_summary()}\n\n",
+            f"Creation Date\n{str(event.get_timestamp())}\n\n",
+            f"Starting date\n{str(event.get_dtstart())}\n\n",
+            f"End date\n{str(event.get_dtend())}\n\n",
+            f"Location\n{str(event.get_location())}\n\n",
+            "---------------------------------------\n\n",
+        ))
+
+    def format_vtodo(self, todo: 'VTodo') -> str:
+        """! Format a todo for the view frame.
+
+        @param todo the todo to format.
+        @return the todo as a string.
+        """
+        return ''.join((
+            f"{todo.get_summary()}\n\n",
+            f"Creation Date\n{str(todo.get_timestamp())}\n\n",
+            f"Starting date\n{str(todo.get_dtstart())}\n\n",
+            f"Duration\n{str(todo.get_duration())}\n\n",
+            "---------------------------------------\n\n",
+        ))
 
     def set_view_frame_content(self) -> None:
-        """! Set the content of the view frame."""
+        """! Set the content of the view frame.
+        Only the first records are rendered, the next ones are rendered when the view is scrolled near its end.
+        """
         # if is a VCF, then use the vcf manager
+        if (self.__filetype == 'vcf' or self.__filetype == 'export-vcf'):
+            self.set_view_records(list(self.get_vcf().get_vcards()))
+
+        # else its an ICS use the ICS manager, events then todos
+        elif self.__filetype == 'ics' or self.__filetype == 'export-ics':
+            self.set_view_records(self.get_ics().get_vevents() + self.get_ics().get_vtodos())
+
+        else:
+            self.set_view_records([])
+
+    def set_view_records(self, records: list) -> None:
+        """! Set the records displayed by the view frame.
+
+        @param records the contacts, events and todos to display.
+        """
+        # reset the view
         self.__list_view.config(state='normal')
         self.__list_view.delete(0.0, 'end')
         self.__list_view.config(state='disabled')
-        
-        if (self.__filetype == 'vcf' or self.__filetype == 'export-vcf'):
-            for vcard in self.__vcf.get_vcards():
-                # for each vcard print data
-                # basic informations
-                string: str = f"{vcard.get_full_name()}\n"
-                string += f"\nName:\n{' '.join(vcard.get_names())}\n"
-                
-                # print data depending on their existence
-                if vcard.get_title() != '':
-                    string += f"\nTitle:\n{vcard.get_title()}\n"
-            
-                # print data depending on their existence 
-                if vcard.get_org() != '':
-                    string += f"\nOrg:\n{vcard.get_org()}\n"
-                
-                # print each address of the contact
-                string += f"\nAddresses:\n"
-                for address in vcard.get_addresses():
-                    # check if the address is the preferred one or not
-                    if (address.is_preferred()):
-                        string += f"{' '.join(address.get_address_elements())} (preferred)\n"
-                    else:
-                        string += f"{' '.join(address.get_address_elements())}\n"
-                
-                # print each email of the contact
-                string += f"\nEmails:\n"
-                for email in vcard.get_emails():
-                    if (email.is_preferred()):
-                        # check if the email is the preferred one or not
-                        string += f"{email.get_email_address()} (preferred)\n"
-                    else:
-                        string += f"{email.get_email_address()}\n"
-            
-                # print each phone of the contact
-                string += f"\nPhones:\n"
-                for phone in vcard.get_phones():
-                    if (phone.is_preferred()):
-                        # check if the phone is the preferred one or not
-                        string += f"{phone.get_phone_number()} (preferred)\n"
-                    else:
-                        string += f"{phone.get_phone_number()}\n"
-            
-                # end with the note of the user
-                if vcard.get_note():
-                    string += f"\nNote:\n{vcard.get_note()}\n\n"
-                else:
-                    string += "\n"
-                
-                string += "---------------------------------------\n\n"
-                self.__list_view.config(state='normal')
-                self.__list_view.insert(tk.END, string)
-                self.__list_view.config(state='disabled')
 
-        # else its an ICS use the ICS manager
-        elif self.__filetype == 'ics' or self.__filetype == 'export-ics':
-            # for each event, print it
-            for event in self.__ics.get_vevents():
-                string: str = ''
-                string += f"{event.get_summary()}\n\n"
-                string += f"Creation Date\n{str(event.get_timestamp())}\n\n"
-                string += f"Starting date\n{str(event.get_dtstart())}\n\n"
-                string += f"End date\n{str(event.get_dtend())}\n\n"
-                string += f"Location\n{str(event.get_location())}\n\n"
-                string += "---------------------------------------\n\n"
-                self.__list_view.config(state='normal')
-                self.__list_view.insert(tk.END, string)
-                self.__list_view.config(state='disabled')
-            
-            # for each event, print it
-            for todo in self.__ics.get_vtodos():
-                string: str = ''
-                string += f"{todo.get_summary()}\n\n"
-                string += f"Creation Date\n{str(todo.get_timestamp())}\n\n"
-                string += f"Starting date\n{str(todo.get_dtstart())}\n\n"
-                string += f"Duration\n{str(todo.get_duration())}\n\n"
-                string += "---------------------------------------\n\n"
-                self.__list_view.config(state='normal')
-                self.__list_view.insert(tk.END, string)
-                self.__list_view.config(state='disabled')
+        self.__view_records = records
+        self.__view_rendered = 0
+        self.render_view()
+
+    def render_view(self) -> None:
+        """! Render the next records of the view frame.
+        The records are formatted and inserted by chunks, with a single insert for each chunk.
+        """
+        self.__view_render_pending = False
+        records: list = self.__view_records[self.__view_rendered:self.__view_rendered + config.VIEW_CHUNK]
+        if len(records) == 0:
+            return
+
+        # the records are already loaded, so are their classes
+        from data.vcf.vcard import VCard
+        from data.ics.vevent import VEvent
+
+        parts: list[str] = []
+        for record in records:
+            if isinstance(record, VCard):
+                parts.append(self.format_vcard(record))
+            elif isinstance(record, VEvent):
+                parts.append(self.format_vevent(record))
+            else:
+                parts.append(self.format_vtodo(record))
+        self.__view_rendered += len(records)
 
+        self.__list_view.config(state='normal')
+        self.__list_view.insert(tk.END, ''.join(parts))
+        self.__list_view.config(state='disabled')
+
+    def on_view_scroll(self, first: str, last: str) -> None:
+        """! Method called when the view frame is scrolled or its content changes.
+        More records are rendered when the end of the rendered ones is visible.
+
+        @param first the fraction of the content at the top of the view.
+        @param last the fraction of the content at the bottom of the view.
+        """
+        self.__scrollbar.set(first, last)
+
+        if float(last) > 0.9 and self.__view_rendered < len(self.__view_records) and not self.__view_render_pending:
+            self.__view_render_pending = True
+            self.after_idle(self.render_view)
 
     def set_selection_edit_frame(self) -> None:
         """! Change the content of the frame to edit data."""
@@ -528,14 +780,13 @@ class GUI(tk.Tk):
             scrollbar: tk.Scrollbar = tk.Scrollbar(self.__edit_frame)
             scrollbar.pack(side="right", fill="y")
             # element list
-            list_view: tk.Listbox = tk.Listbox(self.__edit_frame, width=(config.WIDTH//2)-10, yscrollcommand=self.__scrollbar.set, background=self.__frame_bg_color, foreground=self.__fg_color, borderwidth=0, highlightthickness=0)
+            list_view: tk.Listbox = tk.Listbox(self.__edit_frame, width=(config.WIDTH//2)-10, yscrollcommand=scrollbar.set, background=self.__frame_bg_color, foreground=self.__fg_color, borderwidth=0, highlightthickness=0)
             # set the list view
             list_view.pack(side="top", fill="both")
             # config the view
             scrollbar.config(command=list_view.yview)
-            # set the selections
-            for card in self.__vcf.get_vcards():
-                list_view.insert(tk.END, card.get_full_name())
+            # set the selections, in a single insert
+            list_view.insert(tk.END, *[card.get_full_name() for card in self.get_vcf().get_vcards()])
             # create the button and pack it
             edit_button: tk.Button = tk.Button(self.__edit_frame, text="Edit", padx=5, pady=5, background=self.__button_bg_color, foreground=self.__fg_color, borderwidth=0, highlightthickness=0, command=lambda: self.set_vcard_edit_frame(list_view, list_view.curselection()))
             edit_button.pack()
@@ -554,14 +805,13 @@ class GUI(tk.Tk):
             scrollbar_event: tk.Scrollbar = tk.Scrollbar(event_frame)
             scrollbar_event.pack(side="right", fill="y")
             # element list
-            list_view_event: tk.Listbox = tk.Listbox(event_frame, yscrollcommand=self.__scrollbar.set, width=(config.WIDTH//2)-10, height=5, background=self.__frame_bg_color, foreground=self.__fg_color, borderwidth=0, highlightthickness=0)
+            list_view_event: tk.Listbox = tk.Listbox(event_frame, yscrollcommand=scrollbar_event.set, width=(config.WIDTH//2)-10, height=5, background=self.__frame_bg_color, foreground=self.__fg_color, borderwidth=0, highlightthickness=0)
             # set the list view
             list_view_event.pack()
             # config the view
             scrollbar_event.config(command=list_view_event.yview)
-            # set the selections
-            for vevents in self.__ics.get_vevents():
-                list_view_event.insert(tk.END, vevents.get_summary())
+            # set the selections, in a single insert
+            list_view_event.insert(tk.END, *[vevent.get_summary() for vevent in self.get_ics().get_vevents()])
             event_frame.pack()
 
             ############## Part for the todo frame
@@ -575,14 +825,13 @@ class GUI(tk.Tk):
             scrollbar_todo: tk.Scrollbar = tk.Scrollbar(todo_frame)
             scrollbar_todo.pack(side="right", fill="y")
             # element list
-            list_view_todo: tk.Listbox = tk.Listbox(todo_frame, width=(config.WIDTH//2)-10, height=5, yscrollcommand=self.__scrollbar.set, background=self.__frame_bg_color, foreground=self.__fg_color, borderwidth=0, highlightthickness=0)
+            list_view_todo: tk.Listbox = tk.Listbox(todo_frame, width=(config.WIDTH//2)-10, height=5, yscrollcommand=scrollbar_todo.set, background=self.__frame_bg_color, foreground=self.__fg_color, borderwidth=0, highlightthickness=0)
             # set the list view
             list_view_todo.pack()
             # config the view
             scrollbar_todo.config(command=list_view_todo.yview)
-            # set the selections
-            for vtodos in self.__ics.get_vtodos():
-                list_view_todo.insert(tk.END, vtodos.get_summary())
+            # set the selections, in a single insert
+            list_view_todo.insert(tk.END, *[vtodo.get_summary() for vtodo in self.get_ics().get_vtodos()])
             todo_frame.pack()
         
     def set_vcard_edit_frame(self, elements: tk.Listbox,  ids: tuple) -> None:
@@ -593,7 +842,7 @@ class GUI(tk.Tk):
         @param ids a tuple containing the selected ID.
         """
         # reset the frame
-        card = self.__vcf.get_vcard_from_name(elements.get(ids[0]))
+        card = self.get_vcf().get_vcard_from_name(elements.get(ids[0]))
         if (card is None):
             return
 
@@ -638,7 +887,8 @@ class GUI(tk.Tk):
 
     def save_vcard(self) -> None:
         """! Method triggered by the save of a vcard."""
-        self.__vcf.update_current_card(self.__vcard_full_name_entry.get(), self.__vcard_names_entry.get().split(' '), self.__vcard_org_entry.get(), self.__vcard_title_entry.get())
+        self.get_vcf().update_current_card(self.__vcard_full_name_entry.get(), self.__vcard_names_entry.get().split(' '), self.__vcard_org_entry.get(), self.__vcard_title_entry.get(), False)
+        self.save_file()
         self.set_selection_edit_frame()
 
     def set_vevent_edit_frame(self, elements: tk.Listbox,  ids: tuple) -> None:
@@ -649,7 +899,7 @@ class GUI(tk.Tk):
         @param ids a tuple containing the selected ID.
         """
         # reset the frame
-        event = self.__ics.get_event_from_summary(elements.get(ids[0]))
+        event = self.get_ics().get_event_from_summary(elements.get(ids[0]))
         if (event is None):
             return
         for widgets in self.__edit_frame.winfo_children():
@@ -695,7 +945,8 @@ class GUI(tk.Tk):
     def save_vevent(self) -> None:
         """! Method triggered by the save of a vevent."""
         try:
-            self.__ics.update_current_event(self.__vevent_summary_entry.get(), datetime.fromisoformat(self.__vevent_dtstart_entry.get()), datetime.fromisoformat(self.__vevent_dtend_entry.get()), self.__vevent_location_entry.get())
+            self.get_ics().update_current_event(self.__vevent_summary_entry.get(), datetime.fromisoformat(self.__vevent_dtstart_entry.get()), datetime.fromisoformat(self.__vevent_dtend_entry.get()), self.__vevent_location_entry.get(), False)
+            self.save_file()
             self.set_selection_edit_frame()
         except:
             messagebox.showwarning(f"{config.APP_NAME}", "Warning, could not convert the dates entered.")
@@ -708,7 +959,7 @@ class GUI(tk.Tk):
         @param ids a tuple containing the selected ID.
         """
         # reset the frame
-        todo = self.__ics.get_todo_from_summary(elements.get(ids[0]))
+        todo = self.get_ics().get_todo_from_summary(elements.get(ids[0]))
         if (todo is None):
             return
         for widgets in self.__edit_frame.winfo_children():
@@ -754,14 +1005,55 @@ class GUI(tk.Tk):
     def save_vtodo(self) -> None:
         """! Method triggered by the save of a vtodo."""
         try:
-            self.__ics.update_current_todo(self.__vtodo_summary_entry.get(), datetime.fromisoformat(self.__vtodo_dtstart_entry.get()), self.__vtodo_duration_entry.get(), self.__vtodo_status_entry.get())
+            self.get_ics().update_current_todo(self.__vtodo_summary_entry.get(), datetime.fromisoformat(self.__vtodo_dtstart_entry.get()), self.__vtodo_duration_entry.get(), self.__vtodo_status_entry.get(), False)
+            self.save_file()
             self.set_selection_edit_frame()
         except:
             messagebox.showwarning(f"{config.APP_NAME}", "Warning, could not convert the date entered.")
 
+    def check_file(self) -> None:
+        """! Method that reload the opened file if it changed on the disk.
+        Only the changed contacts, events and todos are parsed again. The method schedules its next call.
+        """
+        # a file being written by the writer is not reloaded, its change is ours
+        writing: bool = self.__writer is not None and self.__writer.is_pending(self.get_opened_path())
+        self.handle_writes()
+
+        if not writing and self.__loading_stop is None and self.__watcher is not None and self.__loader is not None and self.__filetype in ('vcf', 'ics') and self.__watcher.has_changed():
+            try:
+                added, removed = self.__loader.refresh()
+                if len(added) > 0 or len(removed) > 0:
+                    self.set_view_frame_content()
+                    self.set_selection_edit_frame()
+            except:
+                messagebox.showinfo(f"Corrupted file - {config.APP_NAME}", "The file has been modified and cannot be read by the application.")
+
+        self.after(1000, self.check_file)
+
     def run(self) -> None:
-        """! method that run the GUI."""
-        self.mainloop()
+        """! method that run the GUI.
+        The profiler is enabled when the VMANAGER_PROFILE environment variable is set, its report is printed on exit.
+        The files being written in the background are written before returning.
+        """
+        self.after(1000, self.check_file)
+        self.after(200, self.check_writes)
+
+        # the profiler is only imported when asked, it loads every manager and builder
+        if os.environ.get('VMANAGER_PROFILE', '') not in ('', '0'):
+            from process.profiling.profiler import Profiler
+
+            Profiler.enable_from_environment()
+            try:
+                self.mainloop()
+                if self.__writer is not None:
+                    self.__writer.flush()
+            finally:
+                Profiler.disable()
+                print(Profiler.report())
+        else:
+            self.mainloop()
+            if self.__writer is not None:
+                self.__writer.flush()
 
 
 if __name__ == '__main__':
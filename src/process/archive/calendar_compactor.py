@@ -0,0 +1,221 @@
+"""! File containing the compactor moving the past events of a calendar into an archive.
+The calendar is streamed, only one component is held in memory at a time.
+
+@author Benjamin PAUMARD
+@version 1.0.0
+@since 19 October 2026
+"""
+
+# importing libs
+import os
+
+# importing modules
+from data.ics.vevent import VEvent
+from process.builder.vcalendar_builder import VCalendarBuilder
+from process.recurrence.recurrence_expander import RecurrenceExpander
+from process.stream.content_line_reader import ContentLineReader
+from process.stream.record_reader import RecordReader
+from process.timezone.timezone_resolver import TimezoneResolver
+from process.writer.file_writer import FileWriter
+
+
+class CalendarCompactor:
+    """! Class that move the events that ended before a cutoff out of a calendar.
+    An event without rule is archived when it ends before the cutoff. A recurring event is archived when every rule has
+    an UNTIL and its last occurrence ends before the cutoff, the rules without UNTIL never end. The modified occurrences
+    of a recurring event that is kept stay with it. Todos, timezones and the other components stay in the calendar.
+    The calendar is streamed twice: the first pass only keeps the UID of the recurring events that are kept.
+
+    @author Benjamin PAUMARD
+    @version 1.0.0
+    @since 19 October 2026
+    """
+
+    def __init__(self, cutoff: float) -> None:
+        """! Constructor of the CalendarCompactor.
+        Counters of the last compaction are available after a compaction.
+
+        @param cutoff the UTC timestamp before which the events are archived.
+        """
+        self.__cutoff: float = cutoff
+        self.__kept_count: int = 0
+        self.__archived_count: int = 0
+        self.__builder: VCalendarBuilder = VCalendarBuilder()
+        # timezones of the calendar, registered as they are read
+        self.__resolver: TimezoneResolver = TimezoneResolver()
+
+    def get_kept_count(self) -> int:
+        """! Method to get the number of components kept in the calendar by the last compaction.
+
+        @return the number of components kept, timezones excluded.
+        """
+        return self.__kept_count
+
+    def get_archived_count(self) -> int:
+        """! Method to get the number of events archived by the last compaction.
+
+        @return the number of events archived.
+        """
+        return self.__archived_count
+
+    def get_end(self, lines: list[str]) -> tuple[str, bool, float | None]:
+        """! Method that returns when an event ends for good.
+
+        @param lines the unfolded lines of the event.
+        @return the UID, whether the event is a recurring master, and the UTC end of its last occurrence, None if it never ends.
+        """
+        vevent: VEvent = self.__builder.build(['BEGIN:VCALENDAR'] + lines + ['END:VCALENDAR']).get_vevents()[0]
+
+        # the TZID are resolved with the timezones of the calendar
+        if vevent.get_tzstart() != '':
+            vevent.set_start_tzinfo(self.__resolver.resolve(vevent.get_tzstart()))
+        if vevent.get_tzend() != '':
+            vevent.set_end_tzinfo(self.__resolver.resolve(vevent.get_tzend()))
+
+        # an event without end or duration ends when it starts
+        end: float = vevent.get_utc_end()
+        if RecordReader.get_property(lines, 'DTEND') == '' and RecordReader.get_property(lines, 'DURATION') == '':
+            end = vevent.get_utc_start()
+
+        master: bool = len(vevent.get_rrules()) > 0 and RecordReader.get_property(lines, 'RECURRENCE-ID') == ''
+        if len(vevent.get_rrules()) == 0:
+            return vevent.get_uid(), master, end
+
+        # the last occurrence starts at the latest UNTIL at most
+        untils: list[float | None] = [RecurrenceExpander.parse_until(rule.get_until()) for rule in vevent.get_rrules()]
+        if None in untils:
+            return vevent.get_uid(), master, None
+        return vevent.get_uid(), master, max(untils) + end - vevent.get_utc_start()
+
+    @staticmethod
+    def get_key(lines: list[str]) -> str:
+        """! Method that returns the key of an event, an occurrence modified by a RECURRENCE-ID has its own key.
+
+        @param lines the unfolded lines of the event.
+        @return the key of the event, its content when it has no UID.
+        """
+        uid: str = RecordReader.get_property(lines, 'UID')
+        if uid == '':
+            return '\n'.join(lines)
+        return f"{uid}:{RecordReader.get_property(lines, 'RECURRENCE-ID')}"
+
+    def compact(self, path: str, archive_path: str, output_path: str = '') -> None:
+        """! Method that move the past events of a calendar into an archive.
+        The archive is extended when it exists, its timezones and events are kept. Both files are written before any
+        of them is replaced, then the archive is replaced before the calendar, so an interrupted compaction never loses
+        an event. The events already in the archive are not archived twice when a compaction is run again.
+
+        @param path the path of the calendar.
+        @param archive_path the path of the archive.
+        @param output_path the path of the compacted calendar, the calendar itself by default (optional).
+        """
+        self.__kept_count = 0
+        self.__archived_count = 0
+        self.__resolver = TimezoneResolver()
+        if output_path == '':
+            output_path = path
+
+        # first pass, the recurring events that are kept, their modified occurrences are kept with them
+        kept_uids: set[str] = set()
+        for kind, data, _ in ContentLineReader(path).components('VCALENDAR'):
+            lines: list[str] = ContentLineReader.split(data)
+            if kind == 'VTIMEZONE':
+                self.__register(lines)
+            elif kind == 'VEVENT' and b'RRULE' in data.upper():
+                uid, master, end = self.get_end(lines)
+                if master and (end is None or end >= self.__cutoff):
+                    kept_uids.add(uid)
+
+        # second pass, both files are written into temporary files
+        archive_temporary: str = FileWriter.get_temporary_path(archive_path)
+        output_temporary: str = FileWriter.get_temporary_path(output_path)
+        try:
+            self.__write(path, archive_path, archive_temporary, output_temporary, kept_uids)
+            # the archive is replaced first, the events leave the calendar once they are in the archive
+            FileWriter.replace(archive_temporary, archive_path)
+            FileWriter.replace(output_temporary, output_path)
+        finally:
+            FileWriter.remove(archive_temporary)
+            FileWriter.remove(output_temporary)
+
+    def __register(self, lines: list[str]) -> None:
+        """! Method that register a timezone of the calendar.
+
+        @param lines the unfolded lines of the VTIMEZONE.
+        """
+        for vtimezone in self.__builder.build(['BEGIN:VCALENDAR'] + lines + ['END:VCALENDAR']).get_vtimezones():
+            self.__resolver.register(vtimezone)
+
+    def __write(self, path: str, archive_path: str, archive_output: str, output: str, kept_uids: set[str]) -> None:
+        """! Method that stream the calendar into the compacted calendar and the archive.
+
+        @param path the path of the calendar.
+        @param archive_path the path of the current archive, extended when it exists.
+        @param archive_output the path where the archive is written.
+        @param output the path where the compacted calendar is written.
+        @param kept_uids the UID of the recurring events that are kept.
+        """
+        # the line breaks of the calendar are used for the lines written
+        newline: bytes = FileWriter.read_newline(path)
+
+        with open(output, 'wb') as calendar, open(archive_output, 'wb') as archive:
+            # the properties of the calendar are kept, the archive keeps its own ones
+            archived: bool = os.path.exists(archive_path)
+            FileWriter.write_header(calendar, path, newline)
+            FileWriter.write_header(archive, archive_path if archived else path, newline)
+
+            # the content of the current archive, the timezones and the events are not written twice
+            archive_timezones: set[str] = set()
+            archive_keys: set[str] = set()
+            if archived:
+                archive_timezones, archive_keys = self.__copy_archive(archive_path, archive, newline)
+
+            for kind, data, _ in ContentLineReader(path).components('VCALENDAR'):
+                # the last component of a file may have no line break
+                if not data.endswith(b'\n'):
+                    data += newline
+
+                if kind == 'VTIMEZONE':
+                    # every timezone stays in the calendar, the archive gets the ones it does not have
+                    calendar.write(data)
+                    tzid: str = RecordReader.get_property(ContentLineReader.split(data), 'TZID')
+                    if tzid not in archive_timezones:
+                        archive_timezones.add(tzid)
+                        archive.write(data)
+                    continue
+
+                if kind == 'VEVENT':
+                    lines: list[str] = ContentLineReader.split(data)
+                    uid, _, end = self.get_end(lines)
+                    if uid not in kept_uids and end is not None and end < self.__cutoff:
+                        # an event left in the calendar by an interrupted compaction is already archived
+                        if self.get_key(lines) not in archive_keys:
+                            archive.write(data)
+                        self.__archived_count += 1
+                        continue
+
+                calendar.write(data)
+                self.__kept_count += 1
+
+            calendar.write(b'END:VCALENDAR' + newline)
+            archive.write(b'END:VCALENDAR' + newline)
+
+    @classmethod
+    def __copy_archive(cls, archive_path: str, archive, newline: bytes) -> tuple[set[str], set[str]]:
+        """! Method that copy the components of the current archive into the new one.
+
+        @param archive_path the path of the current archive.
+        @param archive the binary file of the new archive.
+        @param newline the line break added when a component has none.
+        @return the TZID of the timezones and the keys of the events of the archive.
+        """
+        timezones: set[str] = set()
+        keys: set[str] = set()
+        for kind, data, _ in ContentLineReader(archive_path).components('VCALENDAR'):
+            lines: list[str] = ContentLineReader.split(data)
+            if kind == 'VTIMEZONE':
+                timezones.add(RecordReader.get_property(lines, 'TZID'))
+            elif kind == 'VEVENT':
+                keys.add(cls.get_key(lines))
+            archive.write(data if data.endswith(b'\n') else data + newline)
+        return timezones, keys
@@ -0,0 +1,149 @@
+"""! File containing the parser of the components of an ICS file.
+The components are parsed in a single pass, each of them is given to the handlers registered for its name.
+
+@author Benjamin PAUMARD
+@version 1.0.0
+@since 19 October 2026
+"""
+
+# importing libs
+from typing import Callable
+
+# parameters of a line without parameters, shared and never modified
+NO_PARAMETERS: dict[str, str] = {}
+# first letters of the BEGIN and END lines
+MARKER_INITIALS: frozenset[str] = frozenset('BbEe')
+
+
+class ComponentParser:
+    """! Class that parse the components of content lines with a stack.
+    A BEGIN line pushes a component, an END line pops it. For each component, the handlers registered for its name
+    create the object, receive its properties and attach it to its parent. The components without handlers are skipped,
+    as are their properties and the components they contain.
+
+    @author Benjamin PAUMARD
+    @version 1.0.0
+    @since 19 October 2026
+    """
+
+    def __init__(self) -> None:
+        """! Constructor of the ComponentParser."""
+        # handlers by component name: (begin, property, end)
+        self.__handlers: dict[str, tuple[Callable[[str, object], object],
+                                         Callable[[object, str, dict[str, str], str], None] | None,
+                                         Callable[[object, object], None] | None]] = {}
+
+    def register(self, name: str, begin: Callable[[str, object], object],
+                 on_property: Callable[[object, str, dict[str, str], str], None] | None = None,
+                 end: Callable[[object, object], None] | None = None) -> None:
+        """! Method that register the handlers of a component.
+
+        @param name the name of the component, like VEVENT.
+        @param begin the function creating the object of the component out of its name and the object of its parent.
+        @param on_property the function called with the object, the name, the parameters and the value of each property (optional).
+        @param end the function called with the object and the object of its parent at the end of the component (optional).
+        """
+        self.__handlers[name.upper()] = (begin, on_property, end)
+
+    @staticmethod
+    def split(line: str) -> tuple[str, dict[str, str], str]:
+        """! Method that split a content line into its name, its parameters and its value.
+        The colons and semicolons within quoted parameter values are part of the values.
+
+        @param line the unfolded line.
+        @return the name in upper case, the parameters by upper case name without quotes, and the value.
+        """
+        colon: int = line.find(':')
+        if colon == -1:
+            return line.upper(), NO_PARAMETERS, ''
+        head: str = line[:colon]
+
+        # a quote before the colon may hide it, look for the first colon outside quotes
+        quoted: bool = '"' in head
+        if quoted:
+            inside: bool = False
+            for index in range(line.find('"'), len(line)):
+                if line[index] == '"':
+                    inside = not inside
+                elif line[index] == ':' and not inside:
+                    colon = index
+                    break
+            head = line[:colon]
+
+        semicolon: int = head.find(';')
+        if semicolon == -1:
+            return head.upper(), NO_PARAMETERS, line[colon + 1:]
+
+        # cut the parameters on the semicolons outside quotes
+        parts: list[str] = []
+        if not quoted:
+            parts = head[semicolon + 1:].split(';')
+        else:
+            start: int = semicolon + 1
+            inside = False
+            for index in range(start, len(head)):
+                if head[index] == '"':
+                    inside = not inside
+                elif head[index] == ';' and not inside:
+                    parts.append(head[start:index])
+                    start = index + 1
+            parts.append(head[start:])
+
+        parameters: dict[str, str] = {}
+        for part in parts:
+            key, _, parameter = part.partition('=')
+            parameters[key.upper()] = parameter.replace('"', '')
+
+        return head[:semicolon].upper(), parameters, line[colon + 1:]
+
+    def parse(self, lines: list[str], root: object) -> None:
+        """! Method that parse lines and dispatch their components to the handlers.
+
+        @param lines the unfolded content lines.
+        @param root the object given as parent to the top level components.
+        """
+        # stack of the open components: (name, handlers, object), the handlers are None for a skipped component
+        current: tuple[str, tuple | None, object] = ('', None, root)
+        stack: list[tuple[str, tuple | None, object]] = [current]
+        # depth of the first skipped component, its content is skipped without looking at the handlers
+        skipped: int = 0
+
+        for line in lines:
+            # the BEGIN and END lines have no parameters, they are recognised without splitting the line
+            if line[:1] in MARKER_INITIALS:
+                marker: str = line[:6].upper()
+
+                if marker == 'BEGIN:':
+                    name: str = line[6:].strip().upper()
+                    handlers = self.__handlers.get(name) if skipped == 0 else None
+                    if handlers is None:
+                        current = (name, None, None)
+                        stack.append(current)
+                        if skipped == 0:
+                            skipped = len(stack)
+                    else:
+                        current = (name, handlers, handlers[0](name, current[2]))
+                        stack.append(current)
+                    continue
+
+                if marker[:4] == 'END:':
+                    name = line[4:].strip().upper()
+                    # an END without its BEGIN is ignored, an unclosed component is closed by its parent
+                    if current[0] != name and not any(component[0] == name for component in stack[1:]):
+                        continue
+                    while len(stack) > 1:
+                        component_name, handlers, component = stack.pop()
+                        if len(stack) < skipped:
+                            skipped = 0
+                        if handlers is not None and handlers[2] is not None:
+                            handlers[2](component, stack[-1][2])
+                        if component_name == name:
+                            break
+                    current = stack[-1]
+                    continue
+
+            # property of the current component
+            handlers = current[1]
+            if handlers is not None and skipped == 0 and handlers[1] is not None:
+                name, parameters, value = self.split(line)
+                handlers[1](current[2], name, parameters, value)
@@ -14,6 +14,11 @@ from data.ics.vevent import VEvent
 from data.ics.valarm import VAlarm
 from data.ics.rrule import RRule
 from data.ics.vtodo import VTodo
+from data.ics.vtimezone import VTimezone
+from data.ics.observance import Observance
+from data.ics.vfreebusy import VFreeBusy
+from process.builder.component_parser import ComponentParser
+from process.timezone.timezone_resolver import TimezoneResolver
 
 class VCalendarBuilder:
     """! Class that build a VCalendar object out of an ics file.
@@ -28,31 +33,24 @@ class VCalendarBuilder:
         This class can build a VCalendar object out of lines from an ics file.
         Methods to extract calendar from html and csv files are also available.
         """
-        pass
-
-    @staticmethod
-    def split(line: str) -> list[str]:
-        """! Method that split a line into a list.
-        The first element will contain the key of the line.
-        
-        @param line the line to split.
-        @return an array of string.
+        # parser of the components, each supported component has its handlers
+        self.__parser: ComponentParser = ComponentParser()
+        self.__parser.register("VCALENDAR", lambda name, parent: parent)
+        self.__parser.register("VEVENT", self.__begin_vevent, self.__set_vevent_property, self.__end_vevent)
+        self.__parser.register("VTODO", self.__begin_vtodo, self.__set_vtodo_property, self.__end_vtodo)
+        self.__parser.register("VALARM", self.__begin_valarm, self.__set_valarm_property, self.__end_valarm)
+        self.__parser.register("VTIMEZONE", self.__begin_vtimezone, self.__set_vtimezone_property, self.__end_vtimezone)
+        self.__parser.register("STANDARD", self.__begin_observance, self.__set_observance_property, self.__end_observance)
+        self.__parser.register("DAYLIGHT", self.__begin_observance, self.__set_observance_property, self.__end_observance)
+        self.__parser.register("VFREEBUSY", self.__begin_vfreebusy, self.__set_vfreebusy_property, self.__end_vfreebusy)
+
+    def get_parser(self) -> ComponentParser:
+        """! Method to get the parser of the components.
+        Handlers of other components can be registered on it.
+
+        @return the ComponentParser of the builder.
         """
-        # elements list will the the line splited with : or ;
-        elements: list[str] = ['']
-        
-        for char in line:
-            
-            # if the char is ; or : append a new element
-            if (char == ';') or (char == ':'):
-                elements.append('')
-            
-            else:
-                # else append the element to the last string in the element list
-                elements[len(elements)-1] += char
-        
-        # return the elements of the line
-        return elements
+        return self.__parser
 
     def build(self, lines: list[str]) -> VCalendar:
         """! Method that build a VCalendar object out of lines read from an ICS file.
@@ -62,266 +60,354 @@ class VCalendarBuilder:
         @return a VCalendar object.
         """
 
-        # init the calendar to return
-        vcalendar: VCalendar = VCalendar()
+        # init the calendar to return, lists are given to not share the default ones
+        vcalendar: VCalendar = VCalendar([], [], [])
 
-        # set the number of lines
-        count: int = len(lines)
+        # parse the components in a single pass
+        self.__parser.parse(lines, vcalendar)
 
-        # create the iteration index
-        i: int = 0
-        
-        # while index is lower than the number of lines
-        while i < count:
+        # resolve the timezones of the elements
+        self.resolve_timezones(vcalendar)
 
-            # split the line into elements
-            data: list[str] = self.split(lines[i])
+        # return the calendar
+        return vcalendar
 
-            # if first element is the beginning of something
-            if data[0].upper() == "BEGIN":
+    def __begin_vevent(self, name: str, parent: object) -> VEvent:
+        """! Method that create an event, lists are given to not share the default ones.
 
-                # match the starting element
-                match data[1].upper():
-                    
-                    # case where the calendar is starting, increment the index
-                    case "VCALENDAR":
-                        i += 1
-
-                    # case where an event starts
-                    case "VEVENT":
-                        
-                        # create an empty event
-                        vevent = VEvent(datetime.now(), '', datetime.now(), datetime.now(), valarms=[])
-                        i += 1
-                        
-                        # while the line does not indicate the end of an event and the index is not over the number of line
-                        while (i < count and lines[i] != "END:VEVENT"):
-                            
-                            # split the line into elements
-                            data = self.split(lines[i])
-                            
-                            # increment for next iteration
-                            i += 1
-                            # match the data key of the line
-                            match data[0].upper():
-                                
-                                # case where this is the UID of the event
-                                case "UID":
-                                    vevent.set_uid(data[1])
-                                
-                                # case where this is the start date of the event
-                                case "DTSTART":
-                                    # if the len of data is 2, it means no time zone is present
-                                    if (len(data) == 2):
-                                        vevent.set_dtstart(datetime.fromisoformat(data[1]))
-                                    
-                                    # else, there is a timezone to save
-                                    else:
-                                        # if the timezone is correctly formatted, save it
-                                        if( "=" in data[1]):
-                                            tz: str = data[1].split('=')[1]
-                                            vevent.set_tzstart(tz)
-                                        
-                                        # save the last item of the data as the date
-                                        vevent.set_dtstart(datetime.fromisoformat(data[len(data)-1]))
-                                
-                                # case where this is the end date of the event
-                                case "DTEND":
-
-                                    # if the len of data is 2, it means no time zone is present
-                                    if (len(data) == 2):
-                                        vevent.set_dtend(datetime.fromisoformat(data[1]))
-                                    
-                                    # else, there is a timezone to save
-                                    else:
-                                        # if the timezone is correctly formatted, save it
-                                        if("=" in data[1]):
-                                            tz: str = data[1].split('=')[1]
-                                            vevent.set_tzend(tz)
-
-                                        # save the last item of the data as the date
-                                        vevent.set_dtend(datetime.fromisoformat(data[len(data)-1]))
-
-                                # case where this is the creation date of the event
-                                case "DTSTAMP":
-                                    vevent.set_timestamp(datetime.fromisoformat(data[1]))
-                                
-                                # case where this is the summary of the event
-                                case "SUMMARY":
-                                    vevent.set_summary(data[1])
-
-                                # case where this is the status of the event
-                                case "STATUS":
-                                    vevent.set_status(data[1])
-                                
-                                # case where this is the location of the event
-                                case "LOCATION":
-                                    vevent.set_location(data[1])
-
-                                # case where this is a recursion rule of the event
-                                case "RRULE":
-                                    # split to get the frequency
-                                    freq: str = data[1].split('=')[1]
-                                    
-                                    # get the until time of the event
-                                    until: str = ''
-                                    if len(data) > 2:
-                                        until = data[2].split('=')[1]
-                                    
-                                    # add the rule to the event
-                                    vevent.add_rrule(RRule(freq, until))                                    
-                                         
-                                # case where this is the status of the todo
-                                case "BEGIN":
-                                    if data[1] == "VALARM":
-                                        valarm: VAlarm = VAlarm('', '', '')
-                                        i += 1
-                                        while (i < count and lines[i] != "END:VALARM"):
-
-                                            # split the line
-                                            data = self.split(lines[i])
-
-                                            # increment
-                                            i += 1
-
-                                            # match the data key of the line
-                                            match data[0].upper():
-
-                                                # case where the line is the trigger of the alarm
-                                                case "TRIGGER":
-                                                    valarm.set_trigger(data[1])
-
-                                                # case where the line is the description of the alarm
-                                                case "DESCRIPTION":
-                                                    valarm.set_description(data[1])
-
-                                                # case where the line is the action of the alarm
-                                                case "ACTION":
-                                                    valarm.set_action(data[1])
-
-                                        # add the alarm to the todo
-                                        vevent.add_valarm(valarm)
-
-                                        # increment
-                                        i += 1
-                                    
-                                    else:
-                                        i += 1
-                        # once read, append the event to the calendar
-                        vcalendar.add_vevent(vevent)
-                        
-                        # increment
-                        i += 1
-
-                    # case where a TODO starts
-                    case "VTODO":
-                        
-                        # create a VTodo object
-                        vtodo = VTodo(datetime.now(), '', datetime.now(), valarms=[])
-                        i+=1
-
-                        # while the vtodo is not complete
-                        while (i < count and lines[i] != "END:VTODO"):
-
-                            # split the line into elements
-                            data: list[str] = self.split(lines[i])
-                            
-                            # increment
-                            i += 1
-
-                            # match the first element of the line
-                            match data[0].upper():
-                                
-                                # case where this is the UID of the todo
-                                case "UID":
-                                    vtodo.set_uid(data[1])
-                                
-                                # case where this is the start date of the event
-                                case "DTSTART":
-
-                                    # if the len of data is 2, it means no time zone is present
-                                    if (len(data) == 2):
-                                        vtodo.set_dtstart(datetime.fromisoformat(data[1]))
-                                    
-                                    # else, there is a timezone to save
-                                    else:
-                                        # if the timezone is correctly formatted, save it
-                                        if('=' in data[1]):
-                                            tz: str = data[1].split('=')[1]
-                                            vtodo.set_tzstart(tz)
-                                        
-                                        # save the last item of the data as the date
-                                        vtodo.set_dtstart(datetime.fromisoformat(data[len(data)-1]))
-
-                                # case where this is the creation date of the event
-                                case "DTSTAMP":
-                                    vtodo.set_timestamp(datetime.fromisoformat(data[1]))
-                                
-                                # case where this is the summary of the todo
-                                case "SUMMARY":
-                                    vtodo.set_summary(data[1])
-
-                                # case where this is the status of the todo
-                                case "STATUS":
-                                    vtodo.set_status(data[1])
-                                
-                                # case where this is the duration of the todo
-                                case "DURATION":
-                                    vtodo.set_duration(data[1])
-
-                                # case where this is the status of the todo
-                                case "BEGIN":
-                                    if data[1] == "VALARM":
-                                        valarm: VAlarm = VAlarm('', '', '')
-                                        i += 1
-                                        while (i < count and lines[i] != "END:VALARM"):
-
-                                            # split the line
-                                            data = self.split(lines[i])
-
-                                            # increment
-                                            i += 1
-
-                                            # match the data key of the line
-                                            match data[0].upper():
-
-                                                # case where the line is the trigger of the alarm
-                                                case "TRIGGER":
-                                                    valarm.set_trigger(data[1])
-
-                                                # case where the line is the description of the alarm
-                                                case "DESCRIPTION":
-                                                    valarm.set_description(data[1])
-
-                                                # case where the line is the action of the alarm
-                                                case "ACTION":
-                                                    valarm.set_action(data[1])
-
-                                        # add the alarm to the todo
-                                        vtodo.add_valarm(valarm)
-
-                                        # increment
-                                        i += 1
-
-                                    else:
-                                        i += 1
-
-                        # add the todo to the calendar
-                        vcalendar.add_vtodo(vtodo)
-
-                        # increment
-                        i += 1
-                    
-                    # in case something else is starting
-                    # futur support for more data maybe added here
-                    case other:
-                        i+=1
-            # increment
-            else:
-                i += 1
+        @param name the name of the component.
+        @param parent the object of the parent component.
+        @return the empty event.
+        """
+        return VEvent(datetime.now(), '', datetime.now(), datetime.now(), valarms=[], rules=[], exdates=[])
 
-        # return the calendar
-        return vcalendar
+    def __set_vevent_property(self, vevent: VEvent, name: str, parameters: dict[str, str], value: str) -> None:
+        """! Method that set a property of an event.
+
+        @param vevent the event.
+        @param name the name of the property.
+        @param parameters the parameters of the property.
+        @param value the value of the property.
+        """
+        # match the data key of the line
+        match name:
+
+            # case where this is the UID of the event
+            case "UID":
+                vevent.set_uid(value)
+
+            # case where this is the start date of the event, with its timezone if any
+            case "DTSTART":
+                if "TZID" in parameters:
+                    vevent.set_tzstart(parameters["TZID"])
+                vevent.set_dtstart(datetime.fromisoformat(value))
+
+            # case where this is the end date of the event, with its timezone if any
+            case "DTEND":
+                if "TZID" in parameters:
+                    vevent.set_tzend(parameters["TZID"])
+                vevent.set_dtend(datetime.fromisoformat(value))
+
+            # case where this is the creation date of the event
+            case "DTSTAMP":
+                vevent.set_timestamp(datetime.fromisoformat(value))
+
+            # case where this is the summary of the event
+            case "SUMMARY":
+                vevent.set_summary(value)
+
+            # case where this is the status of the event
+            case "STATUS":
+                vevent.set_status(value)
+
+            # case where this is the location of the event
+            case "LOCATION":
+                vevent.set_location(value)
+
+            # case where this is the time transparency of the event
+            case "TRANSP":
+                vevent.set_transp(value)
+
+            # case where this is a recursion rule of the event
+            case "RRULE":
+                # read the parts of the rule, in any order
+                items = (item.partition('=') for item in value.split(';'))
+                parts: dict[str, str] = {key.upper(): part for key, _, part in items}
+                count: str = parts.get('COUNT', '')
+                interval: str = parts.get('INTERVAL', '')
+                byday: list[str] = [day.strip() for day in parts.get('BYDAY', '').split(',') if day.strip() != '']
+
+                # add the rule to the event, an invalid count or interval is ignored
+                vevent.add_rrule(RRule(parts.get('FREQ', ''), parts.get('UNTIL', ''), int(count) if count.isdigit() else 0,
+                                       int(interval) if interval.isdigit() and int(interval) > 0 else 1, byday))
+
+            # case where these are starts of occurrences removed from the rules, many can be on a line
+            case "EXDATE":
+                for exdate in value.split(','):
+                    if exdate.strip() != '':
+                        vevent.add_exdate(datetime.fromisoformat(exdate.strip()))
+
+            # case where the event replaces an occurrence of the recurring event with the same UID
+            case "RECURRENCE-ID":
+                vevent.set_recurrence_id(datetime.fromisoformat(value))
+
+    def __end_vevent(self, vevent: VEvent, parent: object) -> None:
+        """! Method that add an event to its calendar.
+
+        @param vevent the event.
+        @param parent the object of the parent component.
+        """
+        if isinstance(parent, VCalendar):
+            parent.add_vevent(vevent)
+
+    def __begin_vtodo(self, name: str, parent: object) -> VTodo:
+        """! Method that create a todo, lists are given to not share the default ones.
+
+        @param name the name of the component.
+        @param parent the object of the parent component.
+        @return the empty todo.
+        """
+        return VTodo(datetime.now(), '', datetime.now(), valarms=[])
+
+    def __set_vtodo_property(self, vtodo: VTodo, name: str, parameters: dict[str, str], value: str) -> None:
+        """! Method that set a property of a todo.
+
+        @param vtodo the todo.
+        @param name the name of the property.
+        @param parameters the parameters of the property.
+        @param value the value of the property.
+        """
+        # match the first element of the line
+        match name:
+
+            # case where this is the UID of the todo
+            case "UID":
+                vtodo.set_uid(value)
+
+            # case where this is the start date of the todo, with its timezone if any
+            case "DTSTART":
+                if "TZID" in parameters:
+                    vtodo.set_tzstart(parameters["TZID"])
+                vtodo.set_dtstart(datetime.fromisoformat(value))
+
+            # case where this is the creation date of the todo
+            case "DTSTAMP":
+                vtodo.set_timestamp(datetime.fromisoformat(value))
+
+            # case where this is the summary of the todo
+            case "SUMMARY":
+                vtodo.set_summary(value)
+
+            # case where this is the status of the todo
+            case "STATUS":
+                vtodo.set_status(value)
+
+            # case where this is the duration of the todo
+            case "DURATION":
+                vtodo.set_duration(value)
+
+    def __end_vtodo(self, vtodo: VTodo, parent: object) -> None:
+        """! Method that add a todo to its calendar.
+
+        @param vtodo the todo.
+        @param parent the object of the parent component.
+        """
+        if isinstance(parent, VCalendar):
+            parent.add_vtodo(vtodo)
+
+    def __begin_valarm(self, name: str, parent: object) -> VAlarm:
+        """! Method that create an alarm.
+
+        @param name the name of the component.
+        @param parent the object of the parent component.
+        @return the empty alarm.
+        """
+        return VAlarm('', '', '')
+
+    def __set_valarm_property(self, valarm: VAlarm, name: str, parameters: dict[str, str], value: str) -> None:
+        """! Method that set a property of an alarm.
+
+        @param valarm the alarm.
+        @param name the name of the property.
+        @param parameters the parameters of the property.
+        @param value the value of the property.
+        """
+        # match the data key of the line
+        match name:
+
+            # case where the line is the trigger of the alarm
+            case "TRIGGER":
+                valarm.set_trigger(value)
+
+            # case where the line is the description of the alarm
+            case "DESCRIPTION":
+                valarm.set_description(value)
+
+            # case where the line is the action of the alarm
+            case "ACTION":
+                valarm.set_action(value)
+
+    def __end_valarm(self, valarm: VAlarm, parent: object) -> None:
+        """! Method that add an alarm to its event or todo.
+
+        @param valarm the alarm.
+        @param parent the object of the parent component.
+        """
+        if isinstance(parent, (VEvent, VTodo)):
+            parent.add_valarm(valarm)
+
+    def __begin_vtimezone(self, name: str, parent: object) -> VTimezone:
+        """! Method that create a timezone, lists are given to not share the default ones.
+
+        @param name the name of the component.
+        @param parent the object of the parent component.
+        @return the empty timezone.
+        """
+        return VTimezone('', [])
+
+    def __set_vtimezone_property(self, vtimezone: VTimezone, name: str, parameters: dict[str, str], value: str) -> None:
+        """! Method that set a property of a timezone.
+
+        @param vtimezone the timezone.
+        @param name the name of the property.
+        @param parameters the parameters of the property.
+        @param value the value of the property.
+        """
+        # case where this is the id of the timezone
+        if name == "TZID":
+            vtimezone.set_tzid(value)
+
+    def __end_vtimezone(self, vtimezone: VTimezone, parent: object) -> None:
+        """! Method that add a timezone to its calendar.
+
+        @param vtimezone the timezone.
+        @param parent the object of the parent component.
+        """
+        if isinstance(parent, VCalendar):
+            parent.add_vtimezone(vtimezone)
+
+    def __begin_observance(self, name: str, parent: object) -> Observance:
+        """! Method that create an observance.
+
+        @param name the name of the component, STANDARD or DAYLIGHT.
+        @param parent the object of the parent component.
+        @return the empty observance.
+        """
+        return Observance(name)
+
+    def __set_observance_property(self, observance: Observance, name: str, parameters: dict[str, str], value: str) -> None:
+        """! Method that set a property of an observance.
+
+        @param observance the observance.
+        @param name the name of the property.
+        @param parameters the parameters of the property.
+        @param value the value of the property.
+        """
+        # match the data key of the line
+        match name:
+
+            # case where the line is the first onset
+            case "DTSTART":
+                observance.set_dtstart(datetime.fromisoformat(value))
+
+            # case where the line is the offset before the onset
+            case "TZOFFSETFROM":
+                observance.set_offset_from(value)
+
+            # case where the line is the offset after the onset
+            case "TZOFFSETTO":
+                observance.set_offset_to(value)
+
+            # case where the line is the name of the observance
+            case "TZNAME":
+                observance.set_tzname(value)
+
+            # case where the line is the rule of the onsets
+            case "RRULE":
+                observance.set_rrule(value)
+
+    def __end_observance(self, observance: Observance, parent: object) -> None:
+        """! Method that add an observance to its timezone.
+
+        @param observance the observance.
+        @param parent the object of the parent component.
+        """
+        if isinstance(parent, VTimezone):
+            parent.add_observance(observance)
+
+    def __begin_vfreebusy(self, name: str, parent: object) -> VFreeBusy:
+        """! Method that create a free/busy component, lists are given to not share the default ones.
+
+        @param name the name of the component.
+        @param parent the object of the parent component.
+        @return the empty free/busy component.
+        """
+        return VFreeBusy(datetime.now(), '', datetime.now(), datetime.now(), [])
+
+    def __set_vfreebusy_property(self, vfreebusy: VFreeBusy, name: str, parameters: dict[str, str], value: str) -> None:
+        """! Method that set a property of a free/busy component.
+
+        @param vfreebusy the free/busy component.
+        @param name the name of the property.
+        @param parameters the parameters of the property.
+        @param value the value of the property.
+        """
+        # match the data key of the line
+        match name:
+
+            # case where this is the UID of the component
+            case "UID":
+                vfreebusy.set_uid(value)
+
+            # case where this is the creation date of the component
+            case "DTSTAMP":
+                vfreebusy.set_timestamp(datetime.fromisoformat(value))
+
+            # case where this is the beginning of the window
+            case "DTSTART":
+                vfreebusy.set_dtstart(datetime.fromisoformat(value))
+
+            # case where this is the end of the window
+            case "DTEND":
+                vfreebusy.set_dtend(datetime.fromisoformat(value))
+
+            # case where the line is a list of busy periods, the periods ending with a duration are not supported
+            case "FREEBUSY":
+                for period in value.split(','):
+                    start, _, end = period.partition('/')
+                    if end != '' and not end.startswith(('P', '+P', '-P')):
+                        vfreebusy.add_period(datetime.fromisoformat(start), datetime.fromisoformat(end), parameters.get("FBTYPE", "BUSY"))
+
+    def __end_vfreebusy(self, vfreebusy: VFreeBusy, parent: object) -> None:
+        """! Method that add a free/busy component to its calendar.
+
+        @param vfreebusy the free/busy component.
+        @param parent the object of the parent component.
+        """
+        if isinstance(parent, VCalendar):
+            parent.add_vfreebusy(vfreebusy)
+
+    @staticmethod
+    def resolve_timezones(vcalendar: VCalendar) -> None:
+        """! Method that resolve the TZID of every element of a calendar.
+        Each TZID is resolved once, the UTC instants of the elements are then computed.
+        
+        @param vcalendar the calendar to resolve.
+        """
+        # the embedded timezones take precedence over the zoneinfo database
+        resolver: TimezoneResolver = TimezoneResolver(vcalendar.get_vtimezones())
+
+        # set the timezone of each event
+        for vevent in vcalendar.get_vevents():
+            if vevent.get_tzstart() != '':
+                vevent.set_start_tzinfo(resolver.resolve(vevent.get_tzstart()))
+            if vevent.get_tzend() != '':
+                vevent.set_end_tzinfo(resolver.resolve(vevent.get_tzend()))
+
+        # set the timezone of each todo
+        for vtodo in vcalendar.get_vtodos():
+            if vtodo.get_tzstart() != '':
+                vtodo.set_start_tzinfo(resolver.resolve(vtodo.get_tzstart()))
 
 
     def build_from_csv(self, lines: list[str]) -> VCalendar:
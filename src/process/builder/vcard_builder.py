@@ -6,6 +6,9 @@ VCards are managed through the VcfManager.
 @since 25 November 2022
 """
 
+# importing libs
+import re
+
 # importing modules
 # main vcards
 from data.vcf.vcard import VCard
@@ -14,6 +17,17 @@ from data.vcf.vcard import VCard
 from data.vcf.email import Email
 from data.vcf.phone import Phone
 from data.vcf.address import Address
+from data.vcf.blob import Blob
+
+# reader used to cut the text of the cards into lines
+from process.stream.content_line_reader import ContentLineReader
+
+# binary property at the beginning of a line, with its name and its parameters
+BINARY_LINE: re.Pattern = re.compile(r'((?:[\w-]+\.)?(?:PHOTO|LOGO|SOUND))((?:;[^:]*)?):', re.IGNORECASE)
+# binary property in the text of a card, up to the colon before its value
+BINARY: re.Pattern = re.compile(r'\n((?:[\w-]+\.)?(?:PHOTO|LOGO|SOUND))((?:;[^:\r\n]*)?):', re.IGNORECASE)
+# line break followed by a line that is not the continuation of a folded line
+NEXT_LINE: re.Pattern = re.compile(r'\n[^ \t]')
 
 
 class VCardBuilder:
@@ -148,6 +162,11 @@ class VCardBuilder:
                     # append the address to the list
                     self.__vcard.add_address(address)
 
+                case 'UID':
+                    # case UID is the unique id of the contact
+                    # the UID may contain colons, like urn:uuid:..., so it is taken from the raw line
+                    self.__vcard.set_uid(line.partition(':')[2])
+
                 case 'NOTE':
                     # case NOTE is a summary
                     # set the note
@@ -280,6 +299,11 @@ class VCardBuilder:
                     # append the address to the list
                     self.__vcard.add_address(address)
 
+                case 'UID':
+                    # case UID is the unique id of the contact
+                    # the UID may contain colons, like urn:uuid:..., so it is taken from the raw line
+                    self.__vcard.set_uid(line.partition(':')[2])
+
                 case 'NOTE':
                     # case NOTE is a summary
                     # set the note
@@ -411,6 +435,11 @@ class VCardBuilder:
                     # append the address to the list
                     self.__vcard.add_address(address)
 
+                case 'UID':
+                    # case UID is the unique id of the contact
+                    # the UID may contain colons, like urn:uuid:..., so it is taken from the raw line
+                    self.__vcard.set_uid(line.partition(':')[2])
+
                 case 'NOTE':
                     # case NOTE is a summary
                     # set the note
@@ -434,8 +463,16 @@ class VCardBuilder:
         # reset the card to a empty one
         self.__vcard: VCard = VCard()
         
-        # set the lines
+        # set the lines, the binary properties are not split, their value is referenced in the line
         self.__card_lines = lines
+        if VCardBuilder.has_binary('\n'.join(lines)):
+            self.__card_lines = []
+            for line in lines:
+                binary = BINARY_LINE.match(line)
+                if binary is None:
+                    self.__card_lines.append(line)
+                else:
+                    self.__vcard.add_blob(Blob(binary.group(1), binary.group(2), line, binary.end(), len(line) - binary.end()))
         
         # go through the lines until we find the version
         for line in self.__card_lines:
@@ -457,6 +494,53 @@ class VCardBuilder:
         # return the vcard
         return self.__vcard
 
+    @staticmethod
+    def has_binary(text: str) -> bool:
+        """! Method that tells whether a text may contain binary properties.
+        The check is much faster than looking for the properties, most of the cards have none.
+
+        @param text the text of a card.
+        @return False if the text has no binary property, True if it may have some.
+        """
+        upper: str = text.upper()
+        return 'PHOTO' in upper or 'LOGO' in upper or 'SOUND' in upper
+
+    def build_verbatim(self, data: bytes) -> VCard:
+        """! Method that build a VCard out of the bytes of its component, from its BEGIN line to its END line.
+        The card keeps its text to be saved as is. The binary properties are cut out of the text before it is
+        split into lines, so their values are neither copied nor decoded, the blobs reference them in the text.
+
+        @param data the bytes of the vcard.
+        @return a VCard object.
+        """
+        raw: str = ContentLineReader.verbatim(data)
+
+        # cut the binary properties out of the lines given to the builder
+        blobs: list[Blob] = []
+        pieces: list[str] = []
+        position: int = 0
+        binary = BINARY.search(raw) if VCardBuilder.has_binary(raw) else None
+        while binary is not None:
+            # the value goes on up to the next line that does not continue it, it is not looked at
+            next_line = NEXT_LINE.search(raw, binary.end())
+            end: int = next_line.start() + 1 if next_line is not None else len(raw)
+            value_end: int = end - 1 if raw[end - 2:end] != '\r\n' else end - 2
+
+            pieces.append(raw[position:binary.start() + 1])
+            blobs.append(Blob(binary.group(1), binary.group(2), raw, binary.end(), value_end - binary.end()))
+            position = end
+            binary = BINARY.search(raw, end - 1)
+
+        if len(blobs) > 0:
+            pieces.append(raw[position:])
+            data = ''.join(pieces).encode('utf-8', 'surrogateescape')
+
+        # the END line is not given to the builder
+        vcard: VCard = self.build(ContentLineReader.split(data)[:-1])
+        vcard.set_blobs(blobs + vcard.get_blobs())
+        vcard.set_raw(raw)
+        return vcard
+
     def build_from_csv(self, line: str) -> VCard:
         """! Method that build a VCard object out of lines read from a CSV file.
         The line must not contain \\n at the end of the file.
@@ -0,0 +1,291 @@
+"""! File containing the deduplicator of contacts.
+Near duplicated VCards are found with blocking keys, then merged into a single VCard.
+
+@author Benjamin PAUMARD
+@version 1.0.0
+@since 19 October 2026
+"""
+
+# importing libs
+import unicodedata
+from difflib import SequenceMatcher
+
+# importing modules
+from data.vcf.vcard import VCard
+from data.vcf.email import Email
+from data.vcf.phone import Phone
+from data.vcf.address import Address
+
+# letters ignored by the phonetic key, like in soundex
+SILENT_LETTERS: str = 'aeiouyhw'
+
+# number of digits of a phone number used to compare it, it ignores the country prefix
+PHONE_DIGITS: int = 9
+
+
+class ContactDeduplicator:
+    """! Class that find and merge duplicated contacts.
+    Cards are only compared to the cards sharing a blocking key (an email, a phone or a phonetic name),
+    which avoids comparing every pair of cards.
+
+    @author Benjamin PAUMARD
+    @version 1.0.0
+    @since 19 October 2026
+    """
+
+    def __init__(self, threshold: float = 0.7, max_block_size: int = 500) -> None:
+        """! Constructor of the ContactDeduplicator.
+
+        @param threshold the minimal score for two cards to be merged (optional).
+        @param max_block_size blocks bigger than this size are too common to be compared (optional).
+        """
+        self.__threshold: float = threshold
+        self.__max_block_size: int = max_block_size
+        # parents of the union-find used to build the clusters
+        self.__parents: list[int] = []
+
+    @staticmethod
+    def normalize_email(email: str) -> str:
+        """! Method that normalize an email address.
+        The address is lower cased and the mailto prefix is removed.
+
+        @param email the email address.
+        @return the normalized address.
+        """
+        email = email.strip().lower()
+        if email.startswith('mailto:'):
+            email = email[7:]
+        return email
+
+    @staticmethod
+    def normalize_phone(phone: str) -> str:
+        """! Method that normalize a phone number.
+        Only the last digits are kept, so +33 6 12 34 56 78 and 06.12.34.56.78 are equal.
+
+        @param phone the phone number.
+        @return the normalized number.
+        """
+        digits: str = ''.join(char for char in phone if char.isdigit())
+        return digits[-PHONE_DIGITS:]
+
+    @staticmethod
+    def normalize_name(name: str) -> str:
+        """! Method that normalize a name.
+        Accents and punctuation are removed, the words are sorted so 'Doe John' and 'John Doe' are equal.
+
+        @param name the name.
+        @return the normalized name.
+        """
+        # remove the accents
+        name = unicodedata.normalize('NFKD', name.lower())
+        name = ''.join(char if char.isalnum() else ' ' for char in name if not unicodedata.combining(char))
+        return ' '.join(sorted(name.split()))
+
+    @staticmethod
+    def phonetic_key(name: str) -> str:
+        """! Method that returns a phonetic key of a normalized name.
+        Each word is reduced to its first letter followed by its consonants, so Jon and John share a key.
+
+        @param name the normalized name.
+        @return the phonetic key.
+        """
+        words: list[str] = []
+        for word in name.split():
+            key: str = word[0]
+            for char in word[1:]:
+                # skip silent letters and repeated consonants
+                if char not in SILENT_LETTERS and char != key[-1]:
+                    key += char
+            words.append(key)
+        return ' '.join(words)
+
+    def __find(self, index: int) -> int:
+        """! Method that returns the root of the cluster of a card.
+
+        @param index the index of the card.
+        @return the index of the root.
+        """
+        parents: list[int] = self.__parents
+        while parents[index] != index:
+            # halve the path for the next searches
+            parents[index] = parents[parents[index]]
+            index = parents[index]
+        return index
+
+    def score(self, name_a: str, name_b: str, contacts_a: set[str], contacts_b: set[str], org_a: str = '', org_b: str = '') -> float:
+        """! Method that compute the similarity of two cards.
+        Half of the score comes from the names, the other half from the shared emails and phones, a shared organization adds a bonus.
+
+        @param name_a the normalized name of the first card.
+        @param name_b the normalized name of the second card.
+        @param contacts_a the normalized emails and phones of the first card.
+        @param contacts_b the normalized emails and phones of the second card.
+        @param org_a the normalized organization of the first card (optional).
+        @param org_b the normalized organization of the second card (optional).
+        @return a score between 0 and 1.
+        """
+        # shared email counts more than a shared phone, phones can be shared by a family
+        shared: set[str] = contacts_a & contacts_b
+        score: float = 0
+        if any(key.startswith('e:') for key in shared):
+            score = 0.5
+        elif len(shared) > 0:
+            score = 0.4
+
+        # same organization
+        if org_a != '' and org_a == org_b:
+            score += 0.2
+
+        # the names are only compared when they can reach the threshold, this is the costly part
+        if score + 0.5 < self.__threshold:
+            return score
+
+        matcher: SequenceMatcher = SequenceMatcher(None, name_a, name_b)
+        if score + 0.5 * matcher.real_quick_ratio() < self.__threshold:
+            return score
+
+        return min(1, score + 0.5 * matcher.ratio())
+
+    def find_clusters(self, vcards: list[VCard]) -> list[list[int]]:
+        """! Method that find the clusters of duplicated cards.
+        Cards sharing a blocking key are scored, cards reaching the threshold are put in the same cluster.
+
+        @param vcards the cards to check.
+        @return the clusters of indexes, each card is in exactly one cluster.
+        """
+        names: list[str] = []
+        orgs: list[str] = []
+        contacts: list[set[str]] = []
+        blocks: dict[str, list[int]] = {}
+
+        # normalize each card once and build the blocks
+        for index in range(len(vcards)):
+            vcard: VCard = vcards[index]
+            name: str = self.normalize_name(vcard.get_full_name() or ' '.join(vcard.get_names()))
+
+            keys: set[str] = set()
+            for email in vcard.get_emails():
+                address: str = self.normalize_email(email.get_email_address())
+                if address != '':
+                    keys.add(f"e:{address}")
+            for phone in vcard.get_phones():
+                number: str = self.normalize_phone(phone.get_phone_number())
+                if number != '':
+                    keys.add(f"p:{number}")
+
+            names.append(name)
+            orgs.append(vcard.get_org().strip().lower())
+            contacts.append(keys)
+
+            # the phonetic name is a blocking key but not a contact
+            block_keys: set[str] = set(keys)
+            if name != '':
+                block_keys.add(f"n:{self.phonetic_key(name)}")
+
+            for key in block_keys:
+                blocks.setdefault(key, []).append(index)
+
+        # each card starts in its own cluster
+        self.__parents = list(range(len(vcards)))
+
+        # compare the cards of each block
+        for members in blocks.values():
+            if len(members) < 2 or len(members) > self.__max_block_size:
+                continue
+            for i in range(len(members)):
+                for j in range(i + 1, len(members)):
+                    a: int = members[i]
+                    b: int = members[j]
+                    root_a: int = self.__find(a)
+                    root_b: int = self.__find(b)
+                    if root_a != root_b and self.score(names[a], names[b], contacts[a], contacts[b], orgs[a], orgs[b]) >= self.__threshold:
+                        self.__parents[root_b] = root_a
+
+        # group the cards by root
+        clusters: dict[int, list[int]] = {}
+        for index in range(len(vcards)):
+            clusters.setdefault(self.__find(index), []).append(index)
+
+        return list(clusters.values())
+
+    def merge(self, vcards: list[VCard]) -> VCard:
+        """! Method that merge a cluster of cards into a single card.
+        The most complete card is used as base, emails, phones, addresses, categories and blobs of the others are added.
+
+        @param vcards the cards to merge.
+        @return the merged card.
+        """
+        # the card with the most data is the base
+        base: VCard = max(vcards, key=lambda vcard: len(vcard.get_emails()) + len(vcard.get_phones()) + len(vcard.get_addresses()))
+
+        merged: VCard = VCard()
+        merged.set_version(base.get_version())
+        merged.set_names(list(base.get_names()))
+        merged.set_full_name(base.get_full_name())
+
+        emails: set[str] = set()
+        phones: set[str] = set()
+        addresses: set[tuple[str, ...]] = set()
+        blobs: set[tuple[str, str]] = set()
+
+        # base first, so its values are kept
+        for vcard in [base] + [vcard for vcard in vcards if vcard is not base]:
+
+            # fill the empty single values, the UID of the base is kept
+            if merged.get_uid() == '':
+                merged.set_uid(vcard.get_uid())
+            if merged.get_org() == '':
+                merged.set_org(vcard.get_org())
+            if merged.get_title() == '':
+                merged.set_title(vcard.get_title())
+            if merged.get_note() == '':
+                merged.set_note(vcard.get_note())
+
+            # union of the emails
+            for email in vcard.get_emails():
+                address: str = self.normalize_email(email.get_email_address())
+                if address not in emails:
+                    emails.add(address)
+                    merged.add_email(Email(list(email.get_email_types()), email.get_email_address(), email.is_preferred()))
+
+            # union of the phones
+            for phone in vcard.get_phones():
+                number: str = self.normalize_phone(phone.get_phone_number())
+                if number not in phones:
+                    phones.add(number)
+                    merged.add_phone(Phone(list(phone.get_phone_types()), phone.get_phone_number(), phone.is_preferred()))
+
+            # union of the addresses
+            for address in vcard.get_addresses():
+                elements: tuple[str, ...] = tuple(element.strip().lower() for element in address.get_address_elements() if element.strip() != '')
+                if elements not in addresses:
+                    addresses.add(elements)
+                    merged.add_address(Address(list(address.get_address_types()), list(address.get_address_elements()), address.is_preferred()))
+
+            # union of the categories
+            for category in vcard.get_categories():
+                if category not in merged.get_categories():
+                    merged.add_category(category)
+
+            # union of the photos, logos and sounds, the blobs keep referencing the text of their card
+            for blob in vcard.get_blobs():
+                if (blob.get_kind(), blob.get_value()) not in blobs:
+                    blobs.add((blob.get_kind(), blob.get_value()))
+                    merged.add_blob(blob)
+
+        return merged
+
+    def dedupe(self, vcards: list[VCard]) -> list[VCard]:
+        """! Method that returns the cards without duplicates.
+        The order of the first card of each cluster is kept.
+
+        @param vcards the cards to deduplicate.
+        @return the deduplicated cards.
+        """
+        result: list[VCard] = []
+        for cluster in self.find_clusters(vcards):
+            if len(cluster) == 1:
+                result.append(vcards[cluster[0]])
+            else:
+                result.append(self.merge([vcards[index] for index in cluster]))
+        return result
@@ -0,0 +1,232 @@
+"""! File containing the structural diff of two VCF or ICS files.
+Records are matched by key and compared property by property.
+
+@author Benjamin PAUMARD
+@version 1.0.0
+@since 19 October 2026
+"""
+
+# importing libs
+import os
+import tempfile
+import zlib
+from typing import Iterator
+
+# importing modules
+from process.stream.record_reader import RecordReader
+from process.merge.file_merger import FileMerger
+
+
+class FileDiff:
+    """! Class that compute the differences between two files.
+    Both files are streamed and partitioned by the hash of the record keys into temporary buckets,
+    each pair of buckets is then compared in memory. The memory used depends on the size of a bucket, not of the files.
+
+    @author Benjamin PAUMARD
+    @version 1.0.0
+    @since 19 October 2026
+    """
+
+    def __init__(self, memory_budget: int = 64 * 1024 * 1024) -> None:
+        """! Constructor of the FileDiff.
+
+        @param memory_budget the approximate number of bytes of records held in memory (optional).
+        """
+        self.__memory_budget: int = memory_budget
+        self.__added: int = 0
+        self.__removed: int = 0
+        self.__modified: int = 0
+
+    def get_counts(self) -> tuple[int, int, int]:
+        """! Method to get the counters of the last diff.
+
+        @return the number of added, removed and modified records.
+        """
+        return (self.__added, self.__removed, self.__modified)
+
+    @staticmethod
+    def get_key(name: str, lines: list[str]) -> str:
+        """! Method that returns the key used to match a record in both files.
+        The UID is used, vcards without UID use their full name and first email,
+        other records use a hash of their content.
+
+        @param name the name of the component.
+        @param lines the lines of the record.
+        @return the key of the record.
+        """
+        key: str = FileMerger.get_key(name, lines)
+        if key != '':
+            return key
+
+        # vcards without UID
+        if name == 'VCARD':
+            full_name: str = RecordReader.get_property(lines, 'FN')
+            # the address is after the parameters written in the value by older saves
+            email: str = RecordReader.get_property(lines, 'EMAIL').split(';')[-1].lower()
+            if full_name != '' or email != '':
+                return f"VCARD:{full_name}:{email}"
+
+        # records that cannot be identified only match an identical record
+        return f"{name}:#{zlib.crc32(chr(10).join(lines).encode()):08x}"
+
+    @staticmethod
+    def get_properties(lines: list[str]) -> dict[str, list[str]]:
+        """! Method that returns the properties of a record.
+        Properties of nested components are prefixed by the component, like VALARM/TRIGGER.
+
+        @param lines the lines of the record.
+        @return the values of each property, values keep their parameters.
+        """
+        properties: dict[str, list[str]] = {}
+        path: list[str] = []
+
+        # the first and last lines are the BEGIN and END of the record
+        for line in lines[1:-1]:
+            upper: str = line.upper()
+
+            if upper.startswith("BEGIN:"):
+                path.append(upper[6:])
+                continue
+            elif upper.startswith("END:"):
+                if len(path) > 0:
+                    path.pop()
+                continue
+
+            # the name stops at the first parameter or at the value
+            end: int = len(line)
+            for separator in (';', ':'):
+                position: int = line.find(separator)
+                if position != -1 and position < end:
+                    end = position
+
+            name: str = '/'.join(path + [line[:end].upper()])
+            value: str = line[end + 1:] if line[end:end + 1] == ':' else line[end:]
+            properties.setdefault(name, []).append(value)
+
+        return properties
+
+    @classmethod
+    def compare(cls, old_lines: list[str], new_lines: list[str]) -> dict[str, tuple[list[str], list[str]]]:
+        """! Method that compare two versions of a record.
+        Properties with many values are compared without order.
+
+        @param old_lines the lines of the old record.
+        @param new_lines the lines of the new record.
+        @return the (old values, new values) of each changed property.
+        """
+        old: dict[str, list[str]] = cls.get_properties(old_lines)
+        new: dict[str, list[str]] = cls.get_properties(new_lines)
+        changes: dict[str, tuple[list[str], list[str]]] = {}
+
+        for name in list(old.keys()) + [name for name in new.keys() if name not in old]:
+            old_values: list[str] = old.get(name, [])
+            new_values: list[str] = new.get(name, [])
+            if sorted(old_values) != sorted(new_values):
+                changes[name] = (old_values, new_values)
+
+        return changes
+
+    @classmethod
+    def match(cls, candidates: list[list[str]], lines: list[str]) -> tuple[int, dict[str, tuple[list[str], list[str]]]]:
+        """! Method that choose the old record matching a new one among the old records with the same key.
+        An identical record is chosen first, otherwise the first one, so the duplicates are matched in the order of the file.
+
+        @param candidates the lines of the old records with the key of the new record.
+        @param lines the lines of the new record.
+        @return the index of the chosen record and its changes.
+        """
+        for index, old_lines in enumerate(candidates):
+            changes: dict[str, tuple[list[str], list[str]]] = cls.compare(old_lines, lines)
+            if len(changes) == 0:
+                return index, changes
+        return 0, cls.compare(candidates[0], lines)
+
+    def __partition(self, path: str, directory: str, prefix: str, count: int) -> list[str]:
+        """! Method that split the records of a file into buckets by the hash of their key.
+
+        @param path the path of the file to split.
+        @param directory the directory of the buckets.
+        @param prefix the prefix of the bucket names.
+        @param count the number of buckets.
+        @return the paths of the buckets.
+        """
+        paths: list[str] = [os.path.join(directory, f"{prefix}{i}.txt") for i in range(count)]
+        buckets = [open(bucket, 'w', encoding='utf-8') for bucket in paths]
+
+        try:
+            for name, lines in RecordReader(path).records():
+                key: str = self.get_key(name, lines)
+                bucket = buckets[zlib.crc32(key.encode()) % count]
+                bucket.write('\n'.join(lines))
+                bucket.write('\n')
+        finally:
+            for bucket in buckets:
+                bucket.close()
+
+        return paths
+
+    def __diff_records(self, old_path: str,
+                       new_path: str) -> Iterator[tuple[str, str, dict[str, tuple[list[str], list[str]]]]]:
+        """! Method that compare the records of two files held in memory.
+        The files must fit in the memory budget, they are buckets or small files.
+
+        @param old_path the path of the old file.
+        @param new_path the path of the new file.
+        @return an iterator over (status, key, changes).
+        """
+        # index the old records by key, many records may share a key, like duplicated UIDs
+        old: dict[str, list[list[str]]] = {}
+        for name, lines in RecordReader(old_path).records():
+            old.setdefault(self.get_key(name, lines), []).append(lines)
+
+        # walk the new records
+        for name, lines in RecordReader(new_path).records():
+            key: str = self.get_key(name, lines)
+            candidates: list[list[str]] | None = old.get(key)
+
+            if candidates is None:
+                self.__added += 1
+                yield ('added', key, {})
+                continue
+
+            index, changes = self.match(candidates, lines)
+            del candidates[index]
+            if len(candidates) == 0:
+                del old[key]
+            if len(changes) > 0:
+                self.__modified += 1
+                yield ('modified', key, changes)
+
+        # the old records left have been removed
+        for key, candidates in old.items():
+            for _ in candidates:
+                self.__removed += 1
+                yield ('removed', key, {})
+
+    def diff(self, old_path: str, new_path: str) -> Iterator[tuple[str, str, dict[str, tuple[list[str], list[str]]]]]:
+        """! Method that compute the differences between two files.
+        Unchanged records are not reported.
+
+        @param old_path the path of the old file.
+        @param new_path the path of the new file.
+        @return an iterator over (status, key, changes), status is added, removed or modified.
+        """
+        self.__added = 0
+        self.__removed = 0
+        self.__modified = 0
+
+        # number of buckets needed to hold a bucket in memory
+        size: int = max(os.path.getsize(old_path), os.path.getsize(new_path))
+        count: int = size // self.__memory_budget + 1
+
+        # small files are compared directly
+        if count == 1:
+            yield from self.__diff_records(old_path, new_path)
+            return
+
+        with tempfile.TemporaryDirectory() as directory:
+            old_buckets: list[str] = self.__partition(old_path, directory, 'old', count)
+            new_buckets: list[str] = self.__partition(new_path, directory, 'new', count)
+
+            for i in range(count):
+                yield from self.__diff_records(old_buckets[i], new_buckets[i])
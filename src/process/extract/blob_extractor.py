@@ -0,0 +1,135 @@
+"""! File containing the extractor writing the photos, logos and sounds of a VCF file to disk.
+The cards are streamed, their binary properties are decoded and written in parallel.
+
+@author Benjamin PAUMARD
+@version 1.0.0
+@since 19 October 2026
+"""
+
+# importing libs
+import os
+import re
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+
+# importing modules
+from data.vcf.blob import Blob, BLOB_NAMES
+from process.builder.vcard_builder import VCardBuilder
+from process.stream.content_line_reader import ContentLineReader
+from process.writer.file_writer import FileWriter
+
+# characters replaced in the names of the files
+UNSAFE: re.Pattern = re.compile(r'[^\w-]+')
+# number of files waiting to be written for each worker, the cards are read while the files are written
+PENDING_PER_WORKER: int = 4
+
+
+class BlobExtractor:
+    """! Class that write the binary properties of the cards of a VCF file into files.
+    Only the blobs with inline data are written, the ones at a URI are skipped. A file is named after the position
+    of its card and its full name, like 000042-John_Doe-photo.jpeg. The cards are read one by one while the blobs
+    are decoded and written by a pool of threads, the number of blobs waiting is bounded so the memory stays low.
+
+    @author Benjamin PAUMARD
+    @version 1.0.0
+    @since 19 October 2026
+    """
+
+    def __init__(self, kinds: tuple[str, ...] = BLOB_NAMES, workers: int = 0) -> None:
+        """! Constructor of the BlobExtractor.
+
+        @param kinds the kinds of blobs to extract, like PHOTO (optional).
+        @param workers the number of files written at the same time, 0 for the number of processors (optional).
+        """
+        self.__kinds: tuple[str, ...] = tuple(kind.upper() for kind in kinds)
+        self.__workers: int = workers if workers > 0 else os.cpu_count() or 1
+        self.__file_count: int = 0
+        self.__byte_count: int = 0
+
+    def get_file_count(self) -> int:
+        """! Method to get the number of files written by the last extraction.
+
+        @return the number of files.
+        """
+        return self.__file_count
+
+    def get_byte_count(self) -> int:
+        """! Method to get the number of bytes written by the last extraction.
+
+        @return the size of the decoded data.
+        """
+        return self.__byte_count
+
+    @staticmethod
+    def get_file_name(number: int, full_name: str, blob: Blob, index: int) -> str:
+        """! Method that give the name of the file of a blob.
+
+        @param number the position of the card in the file, from 1.
+        @param full_name the full name of the contact.
+        @param blob the blob to write.
+        @param index the position of the blob among the blobs of the same kind of the card, from 0.
+        @return the name of the file.
+        """
+        name: str = UNSAFE.sub('_', full_name).strip('_')[:64] or 'contact'
+        suffix: str = str(index + 1) if index > 0 else ''
+        return f"{number:06d}-{name}-{blob.get_kind().lower()}{suffix}.{blob.get_extension()}"
+
+    def extract(self, path: str, directory: str) -> list[str]:
+        """! Method that write the blobs of a VCF file into a directory.
+
+        @param path the path of the VCF file.
+        @param directory the directory of the files, created if needed.
+        @return the paths of the files written, in the order of the file.
+        """
+        self.__file_count = 0
+        self.__byte_count = 0
+        os.makedirs(directory, exist_ok=True)
+        builder: VCardBuilder = VCardBuilder()
+        paths: list[str] = []
+        pending: deque[Future] = deque()
+
+        with ThreadPoolExecutor(self.__workers) as executor:
+            number: int = 0
+            for kind, data, _ in ContentLineReader(path).components():
+                if kind != 'VCARD':
+                    continue
+                number += 1
+
+                vcard = builder.build_verbatim(data)
+                indexes: dict[str, int] = {}
+                for blob in vcard.get_blobs():
+                    if blob.get_kind() not in self.__kinds or not blob.is_inline():
+                        continue
+                    index: int = indexes.get(blob.get_kind(), 0)
+                    indexes[blob.get_kind()] = index + 1
+
+                    blob_path: str = os.path.join(directory, self.get_file_name(number, vcard.get_full_name(), blob, index))
+                    paths.append(blob_path)
+                    pending.append(executor.submit(self.__write, blob_path, blob))
+
+                    # wait for the oldest files, the cards waiting keep their text in memory
+                    while len(pending) > self.__workers * PENDING_PER_WORKER:
+                        self.__byte_count += pending.popleft().result()
+
+            while len(pending) > 0:
+                self.__byte_count += pending.popleft().result()
+
+        self.__file_count = len(paths)
+        return paths
+
+    @staticmethod
+    def __write(path: str, blob: Blob) -> int:
+        """! Method that decode a blob and write it, it runs in a thread of the pool.
+
+        @param path the path of the file.
+        @param blob the blob to write.
+        @return the number of bytes written.
+        """
+        data: bytes = blob.get_data()
+
+        def write(temporary: str) -> None:
+            with open(temporary, 'wb') as f:
+                f.write(data)
+
+        FileWriter.write_atomically(path, write)
+        return len(data)
@@ -0,0 +1,162 @@
+"""! File containing the calculator of free/busy time.
+The events of one or many calendars are merged into sorted busy blocks.
+
+@author Benjamin PAUMARD
+@version 1.0.0
+@since 19 October 2026
+"""
+
+# importing libs
+from datetime import datetime, timezone
+
+# importing modules
+from data.ics.vbase import VBase
+from data.ics.vevent import VEvent
+from data.ics.vcalendar import VCalendar
+from data.ics.vfreebusy import VFreeBusy
+from process.recurrence.recurrence_expander import RecurrenceExpander
+
+
+class FreeBusyCalculator:
+    """! Class that compute the busy blocks of calendars.
+    The events of every added calendar are expanded then merged with a sweep line in a single pass.
+
+    @author Benjamin PAUMARD
+    @version 1.0.0
+    @since 19 October 2026
+    """
+
+    def __init__(self) -> None:
+        """! Constructor of the FreeBusyCalculator.
+        Calendars must be added before computing the blocks.
+        """
+        self.__expander: RecurrenceExpander = RecurrenceExpander()
+        # lists of events of the added calendars, they are not copied
+        self.__sources: list[list[VEvent]] = []
+
+    def add_calendar(self, vcalendar: VCalendar) -> None:
+        """! Method to add a calendar to the computation.
+        All the events of the calendar will be used.
+
+        @param vcalendar the calendar to add.
+        """
+        self.__sources.append(vcalendar.get_vevents())
+
+    def add_vevents(self, vevents: list[VEvent]) -> None:
+        """! Method to add a list of events to the computation.
+        It can be used with the events of an ICSManager.
+
+        @param vevents the events to add.
+        """
+        self.__sources.append(vevents)
+
+    @staticmethod
+    def get_fbtype(vevent: VEvent) -> str:
+        """! Method that returns the free/busy type of an event.
+        Cancelled and transparent events do not block time.
+
+        @param vevent the event to check.
+        @return BUSY, BUSY-TENTATIVE or an empty string if the event is free.
+        """
+        status: str = vevent.get_status().upper()
+
+        if status == 'CANCELLED' or vevent.get_transp().upper() == 'TRANSPARENT':
+            return ''
+        elif status == 'TENTATIVE':
+            return 'BUSY-TENTATIVE'
+        return 'BUSY'
+
+    @staticmethod
+    def merge(intervals: list[tuple[float, float]]) -> list[tuple[float, float]]:
+        """! Method that merge intervals into sorted, non overlapping blocks.
+        The intervals are sorted then swept once, touching intervals are merged.
+
+        @param intervals the (start, end) intervals, the list is sorted in place.
+        @return the merged blocks.
+        """
+        blocks: list[tuple[float, float]] = []
+        if len(intervals) == 0:
+            return blocks
+
+        intervals.sort()
+
+        # sweep the sorted intervals, extending the current block while they overlap
+        current_start, current_end = intervals[0]
+        for start, end in intervals:
+            if start <= current_end:
+                if end > current_end:
+                    current_end = end
+            else:
+                blocks.append((current_start, current_end))
+                current_start, current_end = start, end
+        blocks.append((current_start, current_end))
+
+        return blocks
+
+    def compute(self, start: datetime, end: datetime) -> dict[str, list[tuple[float, float]]]:
+        """! Method that compute the busy blocks within a window.
+        Recurring events are expanded, blocks are clipped to the window.
+
+        @param start the beginning of the window, naive datetimes are considered as UTC.
+        @param end the end of the window, naive datetimes are considered as UTC.
+        @return the merged (start, end) UTC timestamps, indexed by free/busy type.
+        """
+        window_start: float = VBase.to_utc_timestamp(start, None)
+        window_end: float = VBase.to_utc_timestamp(end, None)
+
+        # intervals of every calendar, indexed by type
+        intervals: dict[str, list[tuple[float, float]]] = {'BUSY': [], 'BUSY-TENTATIVE': []}
+
+        for vevents in self.__sources:
+            # the occurrences replaced by other events of the calendar are not busy, the other events are
+            overrides: dict[str, set[float]] = self.__expander.get_overrides(vevents)
+
+            for vevent in vevents:
+                fbtype: str = self.get_fbtype(vevent)
+                if fbtype == '':
+                    continue
+
+                target: list[tuple[float, float]] = intervals[fbtype]
+
+                # single events are checked inline, this is the hot path
+                if len(vevent.get_rrules()) == 0:
+                    event_start: float = vevent.get_utc_start()
+                    event_end: float = vevent.get_utc_end()
+                    if event_start < window_end and event_end > window_start:
+                        target.append((max(event_start, window_start), min(event_end, window_end)))
+
+                else:
+                    replaced: set[float] = overrides.get(vevent.get_uid(), set())
+                    for event_start, event_end in self.__expander.expand(vevent, window_start, window_end, replaced):
+                        if event_start < window_end:
+                            target.append((max(event_start, window_start), min(event_end, window_end)))
+
+        # merge the intervals of each type
+        return {fbtype: self.merge(values) for fbtype, values in intervals.items()}
+
+    def build_vfreebusy(self, start: datetime, end: datetime, uid: str = '') -> VFreeBusy:
+        """! Method that compute the busy blocks and store them in a VFreeBusy.
+        The component can be added to a VCalendar to be saved.
+
+        @param start the beginning of the window.
+        @param end the end of the window.
+        @param uid the unique id of the component (optional).
+        @return the VFreeBusy object.
+        """
+        blocks: dict[str, list[tuple[float, float]]] = self.compute(start, end)
+
+        vfreebusy: VFreeBusy = VFreeBusy(
+            datetime.now(timezone.utc),
+            uid,
+            datetime.fromtimestamp(VBase.to_utc_timestamp(start, None), timezone.utc),
+            datetime.fromtimestamp(VBase.to_utc_timestamp(end, None), timezone.utc),
+            []
+        )
+
+        # periods of every type are written in chronological order
+        periods: list[tuple[float, float, str]] = [(s, e, fbtype) for fbtype, values in blocks.items() for s, e in values]
+        periods.sort()
+        for s, e, fbtype in periods:
+            vfreebusy.add_period(datetime.fromtimestamp(s, timezone.utc), datetime.fromtimestamp(e, timezone.utc), fbtype)
+
+        return vfreebusy
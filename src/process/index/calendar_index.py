@@ -0,0 +1,223 @@
+"""! File containing the index of the components of an ICS file.
+The index is kept next to the file, in a sidecar file named after it, and rebuilt when the file changes.
+
+@author Benjamin PAUMARD
+@version 1.0.0
+@since 19 October 2026
+"""
+
+# importing libs
+import os
+import struct
+import sys
+from array import array
+
+# importing modules
+from process.builder.vcalendar_builder import VCalendarBuilder
+from process.stream.content_line_reader import ContentLineReader
+from process.writer.file_writer import FileWriter
+
+# first line of an index file, the numbers are stored in the byte order of the machine
+MAGIC: bytes = f"VMIDX1 {sys.byteorder}\n".encode('ascii')
+# size and modification time of the indexed file, and number of components
+HEADER: struct.Struct = struct.Struct('<qqq')
+# indexed components, a kind is stored as its position in this tuple
+KINDS: tuple[str, ...] = ('VTIMEZONE', 'VEVENT', 'VTODO')
+# number of components built at once while the index is built
+CHUNK: int = 1000
+
+
+class CalendarIndex:
+    """! Class of the index of the components of an ICS file.
+    For each VTIMEZONE, VEVENT and VTODO, the index stores its byte offset and length, its kind, its UID,
+    its UTC start and end, and whether it has a RRULE. The index is read from the sidecar file when it matches
+    the size and the modification time of the ICS file, otherwise it is built again and written.
+
+    @author Benjamin PAUMARD
+    @version 1.0.0
+    @since 19 October 2026
+    """
+
+    def __init__(self, path: str) -> None:
+        """! Constructor of the CalendarIndex.
+        The index is loaded from its sidecar file, or built when the file is missing or out of date.
+
+        @param path the path of the ICS file.
+        """
+        self.__path: str = path
+        # size and modification time of the indexed file
+        self.__size: int = -1
+        self.__mtime: int = -1
+        # columns of the index, one value per component in the order of the file
+        self.__offsets: array = array('q')
+        self.__lengths: array = array('q')
+        self.__kinds: bytearray = bytearray()
+        self.__recurring: bytearray = bytearray()
+        self.__starts: array = array('d')
+        self.__ends: array = array('d')
+        self.__uids: list[str] = []
+
+        if not self.load():
+            self.build()
+            # the index is still usable when its directory cannot be written
+            try:
+                FileWriter.write_atomically(self.get_index_path(), self.save)
+            except OSError:
+                pass
+
+    def get_path(self) -> str:
+        """! Method to get the path of the indexed file.
+
+        @return the path of the ICS file.
+        """
+        return self.__path
+
+    def get_index_path(self) -> str:
+        """! Method to get the path of the sidecar file of the index.
+
+        @return the path of the ICS file followed by .idx.
+        """
+        return f"{self.__path}.idx"
+
+    def get_count(self) -> int:
+        """! Method to get the number of indexed components.
+
+        @return the number of components.
+        """
+        return len(self.__offsets)
+
+    def get_entry(self, index: int) -> tuple[int, int, str, str, float, float, bool]:
+        """! Method to get an indexed component.
+
+        @param index the position of the component in the file.
+        @return the offset, the length, the kind, the UID, the UTC start, the UTC end and whether the component recurs.
+        """
+        return (self.__offsets[index], self.__lengths[index], KINDS[self.__kinds[index]], self.__uids[index],
+                self.__starts[index], self.__ends[index], self.__recurring[index] == 1)
+
+    def is_up_to_date(self) -> bool:
+        """! Method that tells whether the index matches the current content of the file.
+
+        @return True if the size and the modification time of the file did not change.
+        """
+        stat: os.stat_result = os.stat(self.__path)
+        return stat.st_size == self.__size and stat.st_mtime_ns == self.__mtime
+
+    def load(self) -> bool:
+        """! Method that read the index from its sidecar file.
+
+        @return True if the sidecar file exists, is valid and matches the file.
+        """
+        try:
+            with open(self.get_index_path(), 'rb') as f:
+                data: bytes = f.read()
+        except OSError:
+            return False
+
+        if not data.startswith(MAGIC) or len(data) < len(MAGIC) + HEADER.size:
+            return False
+        self.__size, self.__mtime, count = HEADER.unpack_from(data, len(MAGIC))
+        if not self.is_up_to_date():
+            return False
+
+        # read each column, a truncated file is rebuilt
+        position: int = len(MAGIC) + HEADER.size
+        try:
+            for column in (self.__offsets, self.__lengths, self.__starts, self.__ends):
+                del column[:]
+                column.frombytes(data[position:position + count * column.itemsize])
+                position += count * column.itemsize
+            self.__kinds = bytearray(data[position:position + count])
+            self.__recurring = bytearray(data[position + count:position + 2 * count])
+            position += 2 * count
+            self.__uids = data[position:].decode('utf-8', 'surrogateescape').split('\n') if count > 0 else []
+        except ValueError:
+            return False
+
+        return all(len(column) == count for column in (self.__offsets, self.__lengths, self.__starts, self.__ends,
+                                                          self.__kinds, self.__recurring, self.__uids))
+
+    def build(self) -> None:
+        """! Method that build the index out of the file.
+        The components are cut without being decoded, then the events and todos are built by chunks
+        with the timezones of the file to compute their UTC instants.
+        """
+        stat: os.stat_result = os.stat(self.__path)
+        self.__size, self.__mtime = stat.st_size, stat.st_mtime_ns
+
+        for column in (self.__offsets, self.__lengths, self.__starts, self.__ends):
+            del column[:]
+        self.__kinds = bytearray()
+        self.__recurring = bytearray()
+        self.__uids = []
+
+        # cut the file, the timezones are kept to resolve the TZID of every chunk
+        timezone_lines: list[str] = []
+        for kind, data, offset in ContentLineReader(self.__path).components('VCALENDAR'):
+            if kind not in KINDS:
+                continue
+            self.__offsets.append(offset)
+            self.__lengths.append(len(data))
+            self.__kinds.append(KINDS.index(kind))
+            if kind == 'VTIMEZONE':
+                timezone_lines.extend(ContentLineReader.split(data))
+
+        # build the events and todos by chunks, read from their offsets
+        elements: list[int] = [index for index in range(len(self.__kinds)) if self.__kinds[index] != 0]
+        times: dict[int, tuple[str, float, float, bool]] = {}
+        with open(self.__path, 'rb') as f:
+            for first in range(0, len(elements), CHUNK):
+                chunk: list[int] = elements[first:first + CHUNK]
+                lines: list[str] = ['BEGIN:VCALENDAR'] + timezone_lines
+                for index in chunk:
+                    f.seek(self.__offsets[index])
+                    lines.extend(ContentLineReader.split(f.read(self.__lengths[index])))
+                lines.append('END:VCALENDAR')
+
+                # the elements are built in the order of their components
+                vcalendar = VCalendarBuilder().build(lines)
+                vevents = iter(vcalendar.get_vevents())
+                vtodos = iter(vcalendar.get_vtodos())
+                for index in chunk:
+                    if KINDS[self.__kinds[index]] == 'VEVENT':
+                        vevent = next(vevents)
+                        times[index] = (vevent.get_uid(), vevent.get_utc_start(), vevent.get_utc_end(), len(vevent.get_rrules()) > 0)
+                    else:
+                        vtodo = next(vtodos)
+                        times[index] = (vtodo.get_uid(), vtodo.get_utc_start(), vtodo.get_utc_start(), False)
+
+        # the timezones have no time, they are always read
+        for index in range(len(self.__kinds)):
+            uid, start, end, recurring = times.get(index, ('', 0.0, 0.0, False))
+            self.__uids.append(uid)
+            self.__starts.append(start)
+            self.__ends.append(end)
+            self.__recurring.append(1 if recurring else 0)
+
+    def save(self, path: str) -> None:
+        """! Method that write the index into a file.
+
+        @param path the path of the sidecar file to write.
+        """
+        with open(path, 'wb') as f:
+            f.write(MAGIC)
+            f.write(HEADER.pack(self.__size, self.__mtime, len(self.__offsets)))
+            for column in (self.__offsets, self.__lengths, self.__starts, self.__ends):
+                f.write(column.tobytes())
+            f.write(self.__kinds)
+            f.write(self.__recurring)
+            f.write('\n'.join(self.__uids).encode('utf-8', 'surrogateescape'))
+
+    def find(self, start: float, end: float) -> list[tuple[int, int, str]]:
+        """! Method that find the components to read for a time window.
+        The timezones and the recurring elements are always returned, as their occurrences are not indexed.
+        The bounds are the ones of the RecurrenceExpander, so an element starting at the end of the window is returned.
+
+        @param start the UTC timestamp of the beginning of the window.
+        @param end the UTC timestamp of the end of the window.
+        @return the offset, the length and the kind of each component, in the order of the file.
+        """
+        return [(offset, length, KINDS[kind])
+                for offset, length, kind, recurring, element_start, element_end
+                in zip(self.__offsets, self.__lengths, self.__kinds, self.__recurring, self.__starts, self.__ends)
+                if kind == 0 or recurring == 1 or (element_start <= end and (element_end > start or element_start >= start))]
@@ -5,11 +5,21 @@ Everything contained in an ics file can be managed from this class.
 @version 1.0.0
 @version 03 December 2022
 """
+import io
+import math
+import os
 from datetime import datetime
+from typing import TextIO
 from data.ics.vevent import VEvent
 from data.ics.vtodo import VTodo
 from data.ics.vcalendar import VCalendar
+from data.ics.vtimezone import VTimezone
 from process.builder.vcalendar_builder import VCalendarBuilder
+from process.stream.content_line_reader import ContentLineReader
+from process.stream.record_reader import RecordReader
+
+# size of the buffer of the saved files, the unmodified records are copied by large writes
+WRITE_BUFFER_SIZE: int = 1 << 20
 
 class ICSManager:
     """! Class that the main manager of an ICS file.
@@ -29,15 +39,26 @@ class ICSManager:
 
         # init the values
         self.__builder: VCalendarBuilder = VCalendarBuilder()
-        self.__vcalendar: VCalendar = VCalendar()
+        self.__vcalendar: VCalendar = VCalendar([], [], [])
         self.__path: str = ''
         self.__current_event_index: int = -1
         self.__current_todo_index: int = -1
+        # directory of the shards that were read, and the elements of each shard as they were read
+        self.__shards = None
+        self.__shard_elements: dict[str, list] = {}
         # if the path is not empty read the file
         if path != '':
             self.__path = path
             self.read(path)
             
+    def get_vcalendar(self) -> VCalendar:
+        """! Method to get the calendar managed.
+        The lists of the calendar are the ones returned by the other getters.
+
+        @return the VCalendar.
+        """
+        return self.__vcalendar
+
     def get_vevents(self) -> list[VEvent]:
         """! Method to get the list of events of the calendar.
         The events have their own type: VEvent.
@@ -46,6 +67,38 @@ class ICSManager:
         """
         return self.__vcalendar.get_vevents()
 
+    def get_sorted_vevents(self) -> list[VEvent]:
+        """! Method to get the events of the calendar ordered by their UTC start.
+        The UTC instants are computed when reading, so events in different timezones are correctly ordered.
+
+        @return a sorted list of VEvent.
+        """
+        return sorted(self.get_vevents())
+
+    def get_vevents_between(self, start: float, end: float) -> list[VEvent]:
+        """! Method to get the events having an occurrence within a time window.
+        Recurring events are expanded, so an event is returned if any of its occurrences is in the window.
+
+        @param start the UTC timestamp of the beginning of the window.
+        @param end the UTC timestamp of the end of the window.
+        @return a list of VEvent ordered by their UTC start.
+        """
+        # the expander is only needed by the queries, it is not loaded with the manager
+        from process.recurrence.recurrence_expander import RecurrenceExpander
+
+        expander: RecurrenceExpander = RecurrenceExpander()
+        overrides: dict[str, set[float]] = expander.get_overrides(self.get_vevents())
+        return [vevent for vevent in self.get_sorted_vevents()
+                if next(expander.expand(vevent, start, end, overrides.get(vevent.get_uid(), set())), None) is not None]
+
+    def get_vtimezones(self) -> list[VTimezone]:
+        """! Method to get the timezones embedded in the calendar.
+        The timezones have their own type: VTimezone.
+
+        @return a list of VTimezone.
+        """
+        return self.__vcalendar.get_vtimezones()
+
     def get_event_from_summary(self, summary: str) -> VEvent | None:
         """! Returns a VEvent from a given summary.
         In the case the event does not exist, return None.
@@ -59,7 +112,7 @@ class ICSManager:
                 return self.get_vevents()[i]
         return None
 
-    def update_current_event(self, summary: str, dtstart: datetime, dtend: datetime, location: str):
+    def update_current_event(self, summary: str, dtstart: datetime, dtend: datetime, location: str, save: bool = True):
         """! Updating the event that was selected using the get_event_from_summary method.
         Only this method can update the current selected event.
         
@@ -67,6 +120,7 @@ class ICSManager:
         @param dtsart the ew date to use for start.
         @param dtend the ending date of the event.
         @param location the location of the event.
+        @param save whether the file is saved, the caller may save it itself (optional).
         """
         # update the element
         self.get_vevents()[self.__current_event_index].set_summary(summary)
@@ -74,7 +128,8 @@ class ICSManager:
         self.get_vevents()[self.__current_event_index].set_dtend(dtend)
         self.get_vevents()[self.__current_event_index].set_location(location)
         # save the file
-        self.save()
+        if save:
+            self.save()
 
 
     def get_vtodos(self) -> list[VTodo]:
@@ -99,7 +154,7 @@ class ICSManager:
                 return self.get_vtodos()[i]
         return None
 
-    def update_current_todo(self, summary: str, dtstart: datetime, duration: str, status: str):
+    def update_current_todo(self, summary: str, dtstart: datetime, duration: str, status: str, save: bool = True):
         """! Updating the todo that was selected using the get_todo_from_summary method.
         Only this method can update the current selected todo.
         
@@ -107,6 +162,7 @@ class ICSManager:
         @param dtsart the ew date to use for start.
         @param duration the ending date of the tdo.
         @param status the status of the todo.
+        @param save whether the file is saved, the caller may save it itself (optional).
         """
         # update the element
         self.get_vtodos()[self.__current_todo_index].set_summary(summary)
@@ -114,7 +170,8 @@ class ICSManager:
         self.get_vtodos()[self.__current_todo_index].set_duration(duration)
         self.get_vtodos()[self.__current_todo_index].set_status(status)
         # save the file
-        self.save()
+        if save:
+            self.save()
 
     def get_path(self) -> str:
         """! Method to get the path of the opened file.
@@ -132,30 +189,237 @@ class ICSManager:
         """
         self.__path = path
         
-    def read(self, path: str) -> None:
+    def read(self, path: str, limit: int = -1) -> None:
         """! Open a vcf file and extract all VCards contained inside.
         The vcf file can contain multiple VCards from different versions.
         To get the cards that have been read, please use get_cards method.
 
         @param path the path of the file to read.
+        @param limit the number of events and todos to read, the rest of the file is not read, -1 to read them all (optional).
+        It is meant for previews, saving the manager would drop the elements that were not read.
         """
         # reset the content of the calendar
         self.__vcalendar.get_vevents().clear()
         self.__vcalendar.get_vtodos().clear()
-        # open the file
-        with open(path, 'r') as f:
-            
-            # init the lines of the vcard
-            lines: list[str] = []
+        # read each unfolded line of the components of the calendar, without its line break
+        lines: list[str] = ['BEGIN:VCALENDAR']
+        # texts of the events and todos, in the order of the file
+        raws: list[tuple[str, str]] = []
+        for kind, data, _ in ContentLineReader(path).components('VCALENDAR'):
+            # stop reading the file once the limit is reached, the timezones are usually at the beginning
+            if len(raws) == limit:
+                break
+            lines.extend(ContentLineReader.split(data))
+            if kind in ('VEVENT', 'VTODO'):
+                raws.append((kind, ContentLineReader.verbatim(data)))
+        lines.append('END:VCALENDAR')
 
-            # read each line of the file
-            for line in f:
-                # replace return to line with empty string
-                line = line.replace("\n", '')
-                lines.append(line)
+        self.__vcalendar, _ = self.__build(lines, raws)
+        self.__read_header(path)
+        self.__path = path
+        # the calendar no longer comes from shards
+        self.__shards = None
+        self.__shard_elements = {}
 
-        self.__vcalendar = self.__builder.build(lines)
+    def read_range(self, path: str, start: float, end: float) -> None:
+        """! Open an ics file and extract only the elements that may occur within a time window.
+        The components are found with the index kept next to the file, which is built again when the file changes.
+        The timezones and the recurring events are always read, get_vevents_between gives the events that really occur.
+        It is meant for queries, saving the manager would drop the elements that were not read.
+
+        @param path the path of the file to read.
+        @param start the UTC timestamp of the beginning of the window.
+        @param end the UTC timestamp of the end of the window.
+        """
+        # the index is only needed by the partial reads
+        from process.index.calendar_index import CalendarIndex
+
+        lines: list[str] = ['BEGIN:VCALENDAR']
+        raws: list[tuple[str, str]] = []
+        # read each matching component at its offset
+        with open(path, 'rb') as f:
+            for offset, length, kind in CalendarIndex(path).find(start, end):
+                f.seek(offset)
+                data: bytes = f.read(length)
+                lines.extend(ContentLineReader.split(data))
+                if kind in ('VEVENT', 'VTODO'):
+                    raws.append((kind, ContentLineReader.verbatim(data)))
+        lines.append('END:VCALENDAR')
+
+        self.__vcalendar, _ = self.__build(lines, raws)
+        self.__read_header(path)
         self.__path = path
+        # the calendar no longer comes from shards
+        self.__shards = None
+        self.__shard_elements = {}
+
+    def read_shards(self, directory: str, start: float = -math.inf, end: float = math.inf) -> None:
+        """! Open a sharded calendar and extract the elements of the shards that may occur within a time window.
+        Only the shards selected by the manifest are read, get_vevents_between gives the events that really occur.
+
+        @param directory the directory of the shards.
+        @param start the UTC timestamp of the beginning of the window, all the shards are read by default (optional).
+        @param end the UTC timestamp of the end of the window (optional).
+        """
+        # the shards are only needed by the sharded calendars
+        from process.shard.calendar_shards import CalendarShards
+
+        self.__vcalendar = VCalendar([], [], [])
+        self.__shards = CalendarShards(directory)
+        self.__shard_elements = {}
+        # the properties of the calendar are kept by the manifest
+        if len(self.__shards.get_header()) > 0:
+            self.__vcalendar.set_header(self.__shards.get_header())
+        self.__read_shard_months(self.__shards.select(start, end))
+
+    def save_shards(self, directory: str = '') -> list[str]:
+        """! Save the calendar into monthly shards.
+        Only the shards whose elements changed are written again. When the directory is not the one that was read,
+        every shard is written and the shards of the directory that are no longer needed are removed.
+
+        @param directory the directory of the shards, the one that was read by default (optional).
+        @return the months of the shards written.
+        """
+        from process.shard.calendar_shards import CalendarShards
+
+        # elements of each shard as they were read, a shard that was not read is not written unless elements are added to it
+        shards: CalendarShards | None = self.__shards
+        read_elements: dict[str, list] = self.__shard_elements
+        if directory != '' and (shards is None or os.path.abspath(directory) != os.path.abspath(shards.get_directory())):
+            shards = CalendarShards(directory)
+            read_elements = {month: [] for month in shards.get_months()}
+        elif shards is None:
+            raise ValueError("No directory of shards to save")
+
+        # the shards only keep the events, the todos and the timezones
+        if len(self.__vcalendar.get_vfreebusys()) > 0:
+            raise ValueError("The free/busy components cannot be saved into shards")
+        header_changed: bool = shards.get_header() != self.__vcalendar.get_header()
+        shards.set_header(self.__vcalendar.get_header())
+
+        # an unmodified element is still in the month it was read from, only the other ones are placed
+        read_months: dict[int, str] = {id(element): month for month, shard_elements in read_elements.items() for element in shard_elements}
+        elements: list = self.get_vevents() + self.get_vtodos()
+        element_months: list[str] = [read_months[id(element)] if id(element) in read_months and not element.is_modified()
+                                     else CalendarShards.get_month(element) for element in elements]
+
+        # the shards that were not read but get new or moved elements are read first, their elements must be written too
+        months: set[str] = {month for element, month in zip(elements, element_months) if read_months.get(id(element)) != month}
+        months_to_read: list[str] = [month for month in shards.get_months() if month in months and month not in read_elements]
+        if len(months_to_read) > 0:
+            self.__read_shard_months(months_to_read)
+            read_months = {id(element): month for month, shard_elements in read_elements.items() for element in shard_elements}
+            elements = self.get_vevents() + self.get_vtodos()
+            element_months = [read_months[id(element)] if id(element) in read_months and not element.is_modified()
+                              else CalendarShards.get_month(element) for element in elements]
+
+        # elements of each month, in the order they are saved
+        groups: dict[str, list] = {}
+        for element, month in zip(elements, element_months):
+            groups.setdefault(month, []).append(element)
+
+        written: list[str] = []
+        removed: list[str] = []
+        for month in sorted(set(groups.keys()) | set(read_elements.keys())):
+            shard_elements: list = groups.get(month, [])
+            previous: list | None = read_elements.get(month)
+            if len(shard_elements) == 0:
+                shards.remove_shard(month)
+                removed.append(month)
+                continue
+
+            # a shard with the same unmodified elements is left as is
+            if previous is not None and len(previous) == len(shard_elements) \
+                    and all(element is other and not element.is_modified() for element, other in zip(shard_elements, previous)):
+                continue
+
+            # the modified elements keep their new text, the shard is not written again by the next save
+            self.__keep_texts(shard_elements)
+
+            shards.write_shard(month, self.get_vtimezones(), [element for element in shard_elements if isinstance(element, VEvent)],
+                               [element for element in shard_elements if isinstance(element, VTodo)])
+            written.append(month)
+
+        # the manifest only changes with the shards and the properties of the calendar
+        if len(written) > 0 or len(removed) > 0 or header_changed:
+            shards.save_manifest()
+        self.__shards = shards
+        self.__shard_elements = groups
+        return written
+
+    @staticmethod
+    def __keep_texts(elements: list) -> None:
+        """! Method that set the text of the modified elements to the one they are saved with.
+
+        @param elements the events and todos.
+        """
+        for element in elements:
+            if element.is_modified():
+                text: io.StringIO = io.StringIO()
+                element.save(text)
+                element.set_raw(text.getvalue())
+
+    def __read_header(self, path: str) -> None:
+        """! Method that read the properties of the calendar, like PRODID, they are saved with the calendar.
+        The default properties are kept when the file has none.
+
+        @param path the path of the file read.
+        """
+        header: list[str] = RecordReader(path).header()
+        if len(header) > 0:
+            self.__vcalendar.set_header(header)
+
+    def __read_shard_months(self, months: list[str]) -> None:
+        """! Method that read shards and add their elements to the calendar.
+        The timezones are read from the first shard when the calendar has none.
+
+        @param months the months of the shards to read.
+        """
+        lines: list[str] = ['BEGIN:VCALENDAR']
+        raws: list[tuple[str, str]] = []
+        # month of each element, in the order of the lines
+        sources: list[str] = []
+
+        for index, month in enumerate(months):
+            self.__shard_elements[month] = []
+            for kind, data, _ in ContentLineReader(self.__shards.get_shard_path(month)).components('VCALENDAR'):
+                # every shard has the timezones of the calendar
+                if kind == 'VTIMEZONE' and index > 0:
+                    continue
+                lines.extend(ContentLineReader.split(data))
+                if kind in ('VEVENT', 'VTODO'):
+                    raws.append((kind, ContentLineReader.verbatim(data)))
+                    sources.append(month)
+        lines.append('END:VCALENDAR')
+
+        vcalendar, elements = self.__build(lines, raws)
+        for element, month in zip(elements, sources):
+            self.__shard_elements[month].append(element)
+
+        self.get_vevents().extend(vcalendar.get_vevents())
+        self.get_vtodos().extend(vcalendar.get_vtodos())
+        if len(self.get_vtimezones()) == 0:
+            self.get_vtimezones().extend(vcalendar.get_vtimezones())
+
+    def __build(self, lines: list[str], raws: list[tuple[str, str]]) -> tuple[VCalendar, list]:
+        """! Method that build a calendar out of the lines of its components.
+
+        @param lines the unfolded lines, within BEGIN:VCALENDAR and END:VCALENDAR.
+        @param raws the kind and the text of each event and todo, in the order of the lines.
+        @return the calendar, and its events and todos in the order of the lines.
+        """
+        vcalendar: VCalendar = self.__builder.build(lines)
+
+        # keep the text of the elements to save them as is while they are not modified
+        elements: list = []
+        vevents = iter(vcalendar.get_vevents())
+        vtodos = iter(vcalendar.get_vtodos())
+        for kind, raw in raws:
+            element = next(vevents if kind == 'VEVENT' else vtodos)
+            element.set_raw(raw)
+            elements.append(element)
+
+        return vcalendar, elements
 
     def import_from_file(self, path: str) -> None:
         """! Method that set the calendar out of a HTML or CSV file.
@@ -208,6 +472,7 @@ class ICSManager:
     def save(self, path: str = '') -> None:
         """! Save all the contained contact into an ics file.
         All the VEvent and VTodo the calendar contains will be saved inside.
+        The elements that were not modified are written as they were read, only the modified ones are generated again.
 
         @param path the path of the file to store.
         """
@@ -215,9 +480,17 @@ class ICSManager:
         if path == '':
             path = self.__path
 
-        # save the file
-        with open(path, 'w') as f:
-            self.__vcalendar.save(f)
+        # save the file, the original texts keep their line breaks and the bytes that are not valid UTF-8
+        with open(path, 'w', encoding='utf-8', errors='surrogateescape', newline='', buffering=WRITE_BUFFER_SIZE) as f:
+            self.write(f)
+
+    def write(self, f: TextIO) -> None:
+        """! Write the calendar into a text file, like the save method.
+        The file must not translate the line breaks.
+
+        @param f the text file to write.
+        """
+        self.__vcalendar.save(f)
 
     def export_csv(self, output_path: str) -> None:
         """! Method that export a calendar into a CSV file.
@@ -226,7 +499,14 @@ class ICSManager:
         @param path the path of the file to store.
         """
         with open(output_path, 'w') as f:
-            self.__vcalendar.export_csv(f)
+            self.write_csv(f)
+
+    def write_csv(self, f: TextIO) -> None:
+        """! Method that write a calendar into a CSV text file, like the export_csv method.
+
+        @param f the text file to write.
+        """
+        self.__vcalendar.export_csv(f)
 
     def export_html(self, path: str, complete: bool = False) -> None:
         """! Method that export a calendar into a HTML file.
@@ -238,15 +518,23 @@ class ICSManager:
         
         # open the file
         with open(path, 'w') as f:
-            f.write("<!--vcalendar_export-->\n")
-            if (complete):
-                # if complete page write the beginning
-                f.write("<!DOCTYPE html>\n<html lang=\"fr\">\n<head>\n\t<title>Exported Calendar</title>\n</head>\n<body>\n")
+            self.write_html(f, complete)
+
+    def write_html(self, f: TextIO, complete: bool = False) -> None:
+        """! Method that write a calendar into a HTML text file, like the export_html method.
+
+        @param f the text file to write.
+        @param complete a boolean indicating if the page must be completed rendered.
+        """
+        f.write("<!--vcalendar_export-->\n")
+        if (complete):
+            # if complete page write the beginning
+            f.write("<!DOCTYPE html>\n<html lang=\"fr\">\n<head>\n\t<title>Exported Calendar</title>\n</head>\n<body>\n")
 
-            self.__vcalendar.export_html(f)
+        self.__vcalendar.export_html(f)
 
-            if (complete):
-                f.write("</body>\n</html>\n")
+        if (complete):
+            f.write("</body>\n</html>\n")
             
 
             
\ No newline at end of file
@@ -6,8 +6,14 @@ Features to export contacts to a vcf file are also available here.
 @version 1.0.0
 @since 03 December 2022
 """
+from typing import TextIO
+
 from data.vcf.vcard import VCard
 from process.builder.vcard_builder import VCardBuilder
+from process.stream.content_line_reader import ContentLineReader
+
+# size of the buffer of the saved files, the unmodified records are copied by large writes
+WRITE_BUFFER_SIZE: int = 1 << 20
 
 
 class VCFManager:
@@ -64,7 +70,7 @@ class VCFManager:
         # return None if not found
         return None
 
-    def update_current_card(self, full_name: str = '', names: list[str] = [], org: str = '', title: str = '') -> None:
+    def update_current_card(self, full_name: str = '', names: list[str] = [], org: str = '', title: str = '', save: bool = True) -> None:
         """! Updating the card that was selected using the get_card_from_name method.
         Only this method can update the current selected card.
         
@@ -72,6 +78,7 @@ class VCFManager:
         @param names the name list to use.
         @param org the org to mark.
         @param title the title to apply.
+        @param save whether the file is saved, the caller may save it itself (optional).
         """
         # update the card
         self.__vcards[self.__current_card_index].set_full_name(full_name)
@@ -79,7 +86,8 @@ class VCFManager:
         self.__vcards[self.__current_card_index].set_org(org)
         self.__vcards[self.__current_card_index].set_title(title)
         # save to the file
-        self.save()
+        if save:
+            self.save()
 
     def set_vcards(self, vcards: list[VCard]) -> None:
         """! Set the cards of the manager.
@@ -105,41 +113,27 @@ class VCFManager:
         """
         self.__path = path
 
-    def read(self, path: str) -> None:
+    def read(self, path: str, limit: int = -1) -> None:
         """! Open a vcf file and extract all VCards contained inside.
         The vcf file can contain multiple VCards from different versions.
         To get the cards that have been read, please use get_cards method.
 
         @param path the path of the file to read.
+        @param limit the number of VCards to read, the rest of the file is not read, -1 to read them all (optional).
+        It is meant for previews, saving the manager would drop the cards that were not read.
         """
         # reset the vcards
         self.__vcards.clear()
 
-        # open the file
-        with open(path, 'r') as f:
-            
-            # init the lines of the vcard
-            card_lines: list[str] = []
+        # read each VCard of the file with its bytes
+        for kind, data, _ in ContentLineReader(path).components():
+            # stop reading the file once the limit is reached
+            if len(self.__vcards) == limit:
+                break
 
-            # read each line of the file
-            for line in f:
-        
-                # replace return to line with empty string
-                line = line.replace("\n", '')
-
-                # if the line is the beginning of a VCard, reset the list
-                if line.upper() == "BEGIN:VCARD":
-                    card_lines = []
-                
-                # if the line indicate the end of a VCard, then create the VCard and store it
-                if line.upper() == "END:VCARD":
-                    card = None
-                    card = self.__builder.build(card_lines)
-                    self.__vcards.append(card)
-                
-                # else it's the content of a VCard, save it in the list of the lines
-                else:
-                    card_lines.append(line)
+            if kind == "VCARD":
+                # the card keeps its text to save it as is while it is not modified, its photos reference the text
+                self.__vcards.append(self.__builder.build_verbatim(data))
         self.__path = path
 
 
@@ -197,15 +191,28 @@ class VCFManager:
         """! Save all the contained contact into a vcf file.
         All the VCards this manager contains will be saved inside.
 
+        The cards that were not modified are written as they were read, only the modified ones are generated again.
+
         @param path the path of the file to store.
         """
         # if no path is provided, then save it in the original file
         if path == '':
             path = self.__path
 
-        with open(path, 'w') as f:
-            for vcard in self.__vcards:
-                vcard.save(f)
+        # the original texts keep their line breaks and the bytes that are not valid UTF-8
+        with open(path, 'w', encoding='utf-8', errors='surrogateescape', newline='', buffering=WRITE_BUFFER_SIZE) as f:
+            self.write(f)
+
+    def write(self, f: TextIO) -> None:
+        """! Write all the contained contact into a text file, like the save method.
+        The file must not translate the line breaks.
+
+        @param f the text file to write.
+        """
+        # the modified cards are generated with the line break of the file
+        newline: str = self.__vcards[0].get_newline() if len(self.__vcards) > 0 else '\n'
+        for vcard in self.__vcards:
+            vcard.save(f, newline)
 
     def export_csv(self, path: str) -> None:
         """! Save all the contained contact into a vcf file.
@@ -214,10 +221,16 @@ class VCFManager:
         @param path the path of the file to store.
         """
         with open(path, 'w') as f:
-            f.write("full name,emails,phones,addresses,organization\n")
-            for vcard in self.__vcards:
-                vcard.export_csv(f)
+            self.write_csv(f)
 
+    def write_csv(self, f: TextIO) -> None:
+        """! Write all the contained contact into a CSV text file, like the export_csv method.
+
+        @param f the text file to write.
+        """
+        f.write("full name,emails,phones,addresses,organization\n")
+        for vcard in self.__vcards:
+            vcard.export_csv(f)
 
     def export_html(self, path: str, complete: bool = False) -> None:
         """! Save all the contained contact into a vcf file.
@@ -228,19 +241,27 @@ class VCFManager:
         """
         # open the file
         with open(path, 'w') as f:
-            # write the commentary
-            f.write("<!--vcards_export-->\n")
-            
-            # if complete page is requested, set the header
-            if (complete):
-                f.write("<!DOCTYPE html>\n<html lang=\"fr\">\n<head>\n\t<title>Exported Contacts</title>\n</head>\n<body>\n")
+            self.write_html(f, complete)
+
+    def write_html(self, f: TextIO, complete: bool = False) -> None:
+        """! Write all the contained contact into a HTML text file, like the export_html method.
+
+        @param f the text file to write.
+        @param complete a boolean indicating if the page must be completed rendered.
+        """
+        # write the commentary
+        f.write("<!--vcards_export-->\n")
+
+        # if complete page is requested, set the header
+        if (complete):
+            f.write("<!DOCTYPE html>\n<html lang=\"fr\">\n<head>\n\t<title>Exported Contacts</title>\n</head>\n<body>\n")
 
-            # save all vcards
-            for vcard in self.__vcards:
-                vcard.export_html(f)
+        # save all vcards
+        for vcard in self.__vcards:
+            vcard.export_html(f)
 
-            # send the complete page
-            if (complete):
-                f.write("</body>\n</html>\n")
+        # send the complete page
+        if (complete):
+            f.write("</body>\n</html>\n")
 
             
@@ -0,0 +1,175 @@
+"""! File containing the reporter of the memory used by address books and calendars.
+The size of each kind of element is measured after a read, with the peak reached while parsing.
+
+@author Benjamin PAUMARD
+@version 1.0.0
+@since 19 October 2026
+"""
+
+# importing libs
+import sys
+import tracemalloc
+from datetime import tzinfo
+
+# resource is only available on Unix
+try:
+    import resource
+except ImportError:
+    resource = None
+
+# importing modules
+from data.vcf.vcard import VCard
+from data.vcf.email import Email
+from data.vcf.phone import Phone
+from data.vcf.address import Address
+from data.ics.vevent import VEvent
+from data.ics.vtodo import VTodo
+from data.ics.valarm import VAlarm
+from data.ics.rrule import RRule
+from process.manager.vcf_manager import VCFManager
+from process.manager.ics_manager import ICSManager
+
+# classes measured separately, everything else is counted as other
+TRACKED: tuple[type, ...] = (VCard, Email, Phone, Address, VEvent, VTodo, VAlarm, RRule)
+
+# multipliers of the memory sizes
+UNITS: dict[str, int] = {'K': 1024, 'M': 1024 ** 2, 'G': 1024 ** 3}
+
+
+class MemoryReporter:
+    """! Class that report the memory used by the elements of a file.
+    Each object is charged to the closest tracked element that owns it, so a string of an email is counted in Email.
+
+    @author Benjamin PAUMARD
+    @version 1.0.0
+    @since 19 October 2026
+    """
+
+    def __init__(self, budget: int = 1024 ** 3) -> None:
+        """! Constructor of the MemoryReporter.
+
+        @param budget the memory budget in bytes used to estimate the capacity (optional).
+        """
+        self.__budget: int = budget
+
+    @staticmethod
+    def parse_size(size: str) -> int:
+        """! Method that parse a memory size like 512M or 2G.
+
+        @param size the size, in bytes if there is no unit.
+        @return the size in bytes.
+        """
+        size = size.strip().upper().removesuffix('B')
+        if size[-1:] in UNITS:
+            return int(float(size[:-1]) * UNITS[size[-1]])
+        return int(size)
+
+    @staticmethod
+    def get_peak_rss() -> int:
+        """! Method that returns the peak resident memory of the process.
+
+        @return the peak in bytes, 0 if it can not be known.
+        """
+        if resource is None:
+            return 0
+        peak: int = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # macOS gives bytes, Linux gives kilobytes
+        return peak if sys.platform == 'darwin' else peak * 1024
+
+    @staticmethod
+    def measure_objects(root: object) -> dict[str, list[int]]:
+        """! Method that walk the objects reachable from a root and sum their sizes.
+        Timezones and classes are shared, they are not counted.
+
+        @param root the object to walk.
+        @return the number of instances and the bytes of each class, other objects are in 'other'.
+        """
+        sizes: dict[str, list[int]] = {cls.__name__: [0, 0] for cls in TRACKED}
+        sizes['other'] = [0, 0]
+        seen: set[int] = set()
+        stack: list[tuple[object, str]] = [(root, 'other')]
+
+        while len(stack) > 0:
+            obj, owner = stack.pop()
+            if id(obj) in seen or isinstance(obj, (tzinfo, type)):
+                continue
+            seen.add(id(obj))
+
+            # a tracked element owns everything it references
+            if isinstance(obj, TRACKED):
+                owner = type(obj).__name__
+                sizes[owner][0] += 1
+            sizes[owner][1] += sys.getsizeof(obj)
+
+            # add the children
+            if hasattr(obj, '__dict__'):
+                sizes[owner][1] += sys.getsizeof(obj.__dict__)
+                stack.extend((child, owner) for child in vars(obj).values())
+            elif isinstance(obj, dict):
+                stack.extend((child, owner) for child in obj.keys())
+                stack.extend((child, owner) for child in obj.values())
+            elif isinstance(obj, (list, tuple, set, frozenset)):
+                stack.extend((child, owner) for child in obj)
+
+        return sizes
+
+    def measure(self, path: str) -> dict:
+        """! Method that read a file and measure its memory.
+        The traced memory includes the temporary objects of the parsing, so the peak is over the retained memory.
+
+        @param path the path of the VCF or ICS file.
+        @return the report.
+        """
+        manager: VCFManager | ICSManager = VCFManager() if path.lower().endswith('.vcf') else ICSManager()
+
+        # trace the allocations of the read
+        tracemalloc.start()
+        manager.read(path)
+        traced, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        # walk the elements that have been read
+        if isinstance(manager, VCFManager):
+            records: int = len(manager.get_vcards())
+            sizes: dict[str, list[int]] = self.measure_objects(manager.get_vcards())
+        else:
+            records = len(manager.get_vevents()) + len(manager.get_vtodos())
+            sizes = self.measure_objects(manager)
+
+        # estimate the capacity from the memory of a record
+        per_record: int = traced // records if records > 0 else 0
+        peak_per_record: int = peak // records if records > 0 else 0
+
+        return {
+            'path': path,
+            'records': records,
+            'classes': sizes,
+            'traced_bytes': traced,
+            'traced_peak': peak,
+            'rss_peak': self.get_peak_rss(),
+            'bytes_per_record': per_record,
+            'budget': self.__budget,
+            'capacity': self.__budget // per_record if per_record > 0 else 0,
+            'parse_capacity': self.__budget // peak_per_record if peak_per_record > 0 else 0,
+        }
+
+    @staticmethod
+    def format(report: dict) -> str:
+        """! Method that format a report as text.
+
+        @param report the report returned by the measure method.
+        @return the report as a string.
+        """
+        lines: list[str] = [f"Memory of {report['path']} ({report['records']} records)\n",
+                            f"{'class':<12}{'instances':>12}{'bytes':>14}"]
+        for name, (count, size) in report['classes'].items():
+            if size > 0:
+                lines.append(f"{name:<12}{count:>12}{size:>14}")
+
+        lines.append("")
+        lines.append(f"Retained after read: {report['traced_bytes']} bytes ({report['bytes_per_record']} per record)")
+        lines.append(f"Peak while parsing:  {report['traced_peak']} bytes")
+        if report['rss_peak'] > 0:
+            lines.append(f"Peak RSS:            {report['rss_peak']} bytes")
+        lines.append(f"Capacity for {report['budget']} bytes: {report['capacity']} records retained, {report['parse_capacity']} records parsed at once")
+        return '\n'.join(lines)
@@ -0,0 +1,148 @@
+"""! File containing the merger of many VCF or ICS files into a single one.
+Records are deduplicated by UID, the most recent version is kept.
+
+@author Benjamin PAUMARD
+@version 1.0.0
+@since 19 October 2026
+"""
+
+# importing modules
+from process.stream.record_reader import RecordReader
+from process.writer.file_writer import FileWriter
+
+
+class FileMerger:
+    """! Class that merge many files of the same type into one.
+    Files are streamed twice: the first pass only keeps the position of the winner of each UID, the second one writes the winners.
+    The memory used depends on the number of unique UID, not on the size of the files.
+
+    @author Benjamin PAUMARD
+    @version 1.0.0
+    @since 19 October 2026
+    """
+
+    def __init__(self) -> None:
+        """! Constructor of the FileMerger.
+        Counters of the last merge are available after a merge.
+        """
+        self.__read_count: int = 0
+        self.__written_count: int = 0
+
+    def get_read_count(self) -> int:
+        """! Method to get the number of records read during the last merge.
+
+        @return the number of records read.
+        """
+        return self.__read_count
+
+    def get_written_count(self) -> int:
+        """! Method to get the number of records written during the last merge.
+
+        @return the number of records written.
+        """
+        return self.__written_count
+
+    @staticmethod
+    def get_key(name: str, lines: list[str]) -> str:
+        """! Method that returns the deduplication key of a record.
+        Events use their UID and RECURRENCE-ID, timezones their TZID.
+
+        @param name the name of the component.
+        @param lines the lines of the record.
+        @return the key, an empty string if the record cannot be deduplicated.
+        """
+        if name == 'VTIMEZONE':
+            return f"VTIMEZONE:{RecordReader.get_property(lines, 'TZID')}"
+
+        uid: str = RecordReader.get_property(lines, 'UID')
+        if uid == '':
+            return ''
+
+        # overridden occurrences share the UID of their master
+        return f"{name}:{uid}:{RecordReader.get_property(lines, 'RECURRENCE-ID')}"
+
+    @staticmethod
+    def get_revision(lines: list[str]) -> tuple[int, str]:
+        """! Method that returns the revision of a record, used to choose between duplicates.
+        Calendars use SEQUENCE then DTSTAMP, vcards use REV.
+
+        @param lines the lines of the record.
+        @return a comparable revision, the highest one wins.
+        """
+        sequence: str = RecordReader.get_property(lines, 'SEQUENCE')
+        stamp: str = RecordReader.get_property(lines, 'DTSTAMP') or RecordReader.get_property(lines, 'REV')
+
+        # timestamps are compared without separators, so 2022-11-25 and 20221125 are equal
+        stamp = stamp.replace('-', '').replace(':', '')
+
+        return (int(sequence) if sequence.isdigit() else 0, stamp)
+
+    def merge(self, paths: list[str], output_path: str) -> None:
+        """! Method that merge files into a single output file.
+        On equal revisions, the record of the last file wins.
+
+        @param paths the paths of the files to merge, they must all be vcf or ics files.
+        @param output_path the path of the merged file.
+        """
+        self.__read_count = 0
+        self.__written_count = 0
+
+        # first pass, keep the position of the winner of each key
+        # timezones are few and small, their lines are kept to be written before the events
+        winners: dict[str, tuple[tuple[int, str], int, int]] = {}
+        timezones: dict[str, list[str]] = {}
+        for file_index in range(len(paths)):
+            reader: RecordReader = RecordReader(paths[file_index])
+            position: int = 0
+            for name, lines in reader.records():
+                self.__read_count += 1
+                key: str = self.get_key(name, lines)
+                if name == 'VTIMEZONE':
+                    timezones[key] = lines
+                elif key != '':
+                    revision: tuple[int, str] = self.get_revision(lines)
+                    winner = winners.get(key)
+                    if winner is None or revision >= winner[0]:
+                        winners[key] = (revision, file_index, position)
+                position += 1
+
+        # second pass, write the winners and the records without key
+        calendar: bool = output_path.lower().endswith('.ics')
+
+        def write(temporary: str) -> None:
+            with open(temporary, 'wb') as f:
+                if calendar:
+                    # the properties of the first calendar are used
+                    FileWriter.write_header(f, paths[0] if len(paths) > 0 else '', b'\n')
+
+                # timezones are written first, events may use them
+                for lines in timezones.values():
+                    f.write(FileWriter.encode_lines(lines, b'\n'))
+                    self.__written_count += 1
+
+                self.__write_winners(f, paths, winners)
+
+                if calendar:
+                    f.write(b"END:VCALENDAR\n")
+
+        # the output may be one of the merged files, it is only replaced once written
+        FileWriter.write_atomically(output_path, write)
+
+    def __write_winners(self, f, paths: list[str], winners: dict[str, tuple[tuple[int, str], int, int]]) -> None:
+        """! Method that write the winner of each key and the records without key, timezones excluded.
+
+        @param f the binary file to write.
+        @param paths the paths of the files to merge.
+        @param winners the revision, file index and position of the winner of each key.
+        """
+        for file_index in range(len(paths)):
+            reader: RecordReader = RecordReader(paths[file_index])
+            position: int = 0
+            for name, lines in reader.records():
+                if name != 'VTIMEZONE':
+                    key: str = self.get_key(name, lines)
+                    winner = winners.get(key)
+                    if key == '' or (winner is not None and winner[1] == file_index and winner[2] == position):
+                        f.write(FileWriter.encode_lines(lines, b'\n'))
+                        self.__written_count += 1
+                position += 1
@@ -0,0 +1,79 @@
+"""! File containing the tracer writing flame graph compatible profiles.
+The output uses the collapsed stack format read by flamegraph.pl or speedscope.
+
+@author Benjamin PAUMARD
+@version 1.0.0
+@since 19 October 2026
+"""
+
+# importing libs
+import sys
+import time
+
+
+class FlameTracer:
+    """! Class that trace every Python call and sum the time spent in each stack.
+    Tracing every call is slow, the tracer must only be used to find where the time goes.
+
+    @author Benjamin PAUMARD
+    @version 1.0.0
+    @since 19 October 2026
+    """
+
+    def __init__(self) -> None:
+        """! Constructor of the FlameTracer."""
+        # names of the functions of the current stack, and the start of their running time
+        self.__stack: list[str] = []
+        self.__last: int = 0
+        # nanoseconds spent in each stack, without the callees
+        self.__stacks: dict[str, int] = {}
+
+    def __charge(self) -> None:
+        """! Method that charge the time since the last event to the current stack."""
+        now: int = time.perf_counter_ns()
+        if len(self.__stack) > 0:
+            key: str = ';'.join(self.__stack)
+            self.__stacks[key] = self.__stacks.get(key, 0) + now - self.__last
+        self.__last = now
+
+    def __trace(self, frame, event: str, arg) -> None:
+        """! Method called by the interpreter on each call and return.
+
+        @param frame the frame of the function.
+        @param event the name of the event.
+        @param arg the argument of the event.
+        """
+        if event == 'call' or event == 'c_call':
+            self.__charge()
+            if event == 'call':
+                code = frame.f_code
+                self.__stack.append(f"{code.co_name} ({code.co_filename.split('/')[-1]}:{code.co_firstlineno})")
+            else:
+                self.__stack.append(f"{getattr(arg, '__qualname__', str(arg))} (builtin)")
+
+        elif event in ('return', 'c_return', 'c_exception'):
+            self.__charge()
+            if len(self.__stack) > 0:
+                self.__stack.pop()
+
+    def start(self) -> None:
+        """! Method that start tracing the calls."""
+        self.__stack = []
+        self.__stacks = {}
+        self.__last = time.perf_counter_ns()
+        sys.setprofile(self.__trace)
+
+    def stop(self) -> None:
+        """! Method that stop tracing the calls."""
+        sys.setprofile(None)
+
+    def save(self, path: str) -> None:
+        """! Method that save the collapsed stacks into a file.
+        Each line is a stack followed by the microseconds spent in it.
+
+        @param path the path of the file to write.
+        """
+        with open(path, 'w') as f:
+            for stack, nanoseconds in self.__stacks.items():
+                if nanoseconds >= 1000:
+                    f.write(f"{stack} {nanoseconds // 1000}\n")
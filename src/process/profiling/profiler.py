@@ -0,0 +1,214 @@
+"""! File containing the profiler of the reading, building, saving and exporting stages.
+Counters of records, bytes and nanoseconds are kept for each stage.
+
+@author Benjamin PAUMARD
+@version 1.0.0
+@since 19 October 2026
+"""
+
+# importing libs
+import cProfile
+import functools
+import os
+import time
+from typing import Any, Callable
+
+# importing modules
+from process.profiling.flame_tracer import FlameTracer
+from process.manager.vcf_manager import VCFManager
+from process.manager.ics_manager import ICSManager
+from process.builder.vcard_builder import VCardBuilder
+from process.builder.vcalendar_builder import VCalendarBuilder
+from process.builder.component_parser import ComponentParser
+
+# name of the environment variable enabling the profiler, used by the GUI
+ENVIRONMENT_VARIABLE: str = 'VMANAGER_PROFILE'
+
+
+def file_size(path: str) -> int:
+    """! Function that returns the size of a file, 0 if it does not exist.
+
+    @param path the path of the file.
+    @return the size in bytes.
+    """
+    return os.path.getsize(path) if path != '' and os.path.isfile(path) else 0
+
+
+def lines_size(lines: list[str]) -> int:
+    """! Function that returns the number of characters of lines.
+
+    @param lines the lines.
+    @return the number of characters.
+    """
+    return sum(len(line) for line in lines)
+
+
+# methods wrapped by the profiler: (class, method, stage, function returning the records and bytes from the arguments and the result)
+TARGETS: list[tuple[type, str, str, Callable[..., tuple[int, int]]]] = [
+    (VCFManager, 'read', 'vcf.read', lambda args, result: (len(args[0].get_vcards()), file_size(args[1]))),
+    (VCFManager, 'import_from_file', 'vcf.import', lambda args, result: (len(args[0].get_vcards()), file_size(args[1]))),
+    (VCFManager, 'save', 'vcf.save', lambda args, result: (len(args[0].get_vcards()), file_size(args[1] if len(args) > 1 and args[1] != '' else args[0].get_path()))),
+    (VCFManager, 'export_csv', 'vcf.export_csv', lambda args, result: (len(args[0].get_vcards()), file_size(args[1]))),
+    (VCFManager, 'export_html', 'vcf.export_html', lambda args, result: (len(args[0].get_vcards()), file_size(args[1]))),
+    (VCardBuilder, 'build', 'vcf.build', lambda args, result: (1, lines_size(args[1]))),
+    (ICSManager, 'read', 'ics.read', lambda args, result: (len(args[0].get_vevents()) + len(args[0].get_vtodos()), file_size(args[1]))),
+    (ICSManager, 'import_from_file', 'ics.import', lambda args, result: (len(args[0].get_vevents()) + len(args[0].get_vtodos()), file_size(args[1]))),
+    (ICSManager, 'save', 'ics.save', lambda args, result: (len(args[0].get_vevents()) + len(args[0].get_vtodos()), file_size(args[1] if len(args) > 1 and args[1] != '' else args[0].get_path()))),
+    (ICSManager, 'export_csv', 'ics.export_csv', lambda args, result: (len(args[0].get_vevents()) + len(args[0].get_vtodos()), file_size(args[1]))),
+    (ICSManager, 'export_html', 'ics.export_html', lambda args, result: (len(args[0].get_vevents()) + len(args[0].get_vtodos()), file_size(args[1]))),
+    (VCalendarBuilder, 'build', 'ics.build', lambda args, result: (len(result.get_vevents()) + len(result.get_vtodos()), lines_size(args[1]))),
+    (ComponentParser, 'parse', 'ics.parse', lambda args, result: (1, lines_size(args[1]))),
+]
+
+
+class Profiler:
+    """! Class that measure the time spent in each stage of the managers and builders.
+    The methods are only wrapped while the profiler is enabled, so a disabled profiler costs nothing.
+    Times are inclusive: the read stage contains the build stage, which contains the parse stage.
+
+    @author Benjamin PAUMARD
+    @version 1.0.0
+    @since 19 October 2026
+    """
+
+    # counters of each stage: calls, records, bytes, nanoseconds
+    __stages: dict[str, list[int]] = {}
+    # original methods, restored when the profiler is disabled
+    __originals: list[tuple[type, str, Any]] = []
+    # optional detailed profilers
+    __cprofile: cProfile.Profile | None = None
+    __flame: FlameTracer | None = None
+    __output: str = ''
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        """! Method that returns whether the profiler is enabled.
+
+        @return True if the methods are wrapped.
+        """
+        return len(cls.__originals) > 0
+
+    @classmethod
+    def add(cls, stage: str, nanoseconds: int, records: int = 0, size: int = 0) -> None:
+        """! Method that add a measure to a stage.
+
+        @param stage the name of the stage.
+        @param nanoseconds the time spent.
+        @param records the number of records handled (optional).
+        @param size the number of bytes handled (optional).
+        """
+        counters: list[int] | None = cls.__stages.get(stage)
+        if counters is None:
+            counters = [0, 0, 0, 0]
+            cls.__stages[stage] = counters
+        counters[0] += 1
+        counters[1] += records
+        counters[2] += size
+        counters[3] += nanoseconds
+
+    @classmethod
+    def get_stages(cls) -> dict[str, list[int]]:
+        """! Method that returns the counters of the stages.
+
+        @return the calls, records, bytes and nanoseconds of each stage.
+        """
+        return cls.__stages
+
+    @classmethod
+    def reset(cls) -> None:
+        """! Method that reset the counters."""
+        cls.__stages = {}
+
+    @classmethod
+    def __wrap(cls, function: Callable, stage: str, counter: Callable[..., tuple[int, int]]) -> Callable:
+        """! Method that wrap a function to measure it.
+
+        @param function the function to wrap.
+        @param stage the name of the stage.
+        @param counter the function returning the records and bytes.
+        @return the wrapped function.
+        """
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            start: int = time.perf_counter_ns()
+            result = function(*args, **kwargs)
+            elapsed: int = time.perf_counter_ns() - start
+            records, size = counter(args, result)
+            cls.add(stage, elapsed, records, size)
+            return result
+
+        return wrapper
+
+    @classmethod
+    def enable(cls, option: str = '') -> None:
+        """! Method that enable the profiler.
+        The option can ask for a detailed profile: 'cprofile:path' dumps cProfile stats,
+        'flame:path' writes collapsed stacks for a flame graph.
+
+        @param option the detailed profile to produce (optional).
+        """
+        if cls.is_enabled():
+            return
+
+        # wrap each target
+        for target, name, stage, counter in TARGETS:
+            original = target.__dict__[name]
+            cls.__originals.append((target, name, original))
+            if isinstance(original, staticmethod):
+                setattr(target, name, staticmethod(cls.__wrap(original.__func__, stage, counter)))
+            else:
+                setattr(target, name, cls.__wrap(original, stage, counter))
+
+        # start the detailed profiler
+        kind, _, cls.__output = option.partition(':')
+        if kind == 'cprofile' and cls.__output != '':
+            cls.__cprofile = cProfile.Profile()
+            cls.__cprofile.enable()
+        elif kind == 'flame' and cls.__output != '':
+            cls.__flame = FlameTracer()
+            cls.__flame.start()
+
+    @classmethod
+    def enable_from_environment(cls) -> bool:
+        """! Method that enable the profiler if the environment variable is set.
+        The value of the variable is used as option, 1 enables the counters only.
+
+        @return True if the profiler has been enabled.
+        """
+        value: str = os.environ.get(ENVIRONMENT_VARIABLE, '')
+        if value == '' or value == '0':
+            return False
+        cls.enable('' if value == '1' else value)
+        return True
+
+    @classmethod
+    def disable(cls) -> None:
+        """! Method that disable the profiler.
+        The original methods are restored and the detailed profile is written.
+        """
+        # stop the detailed profiler
+        if cls.__cprofile is not None:
+            cls.__cprofile.disable()
+            cls.__cprofile.dump_stats(cls.__output)
+            cls.__cprofile = None
+        if cls.__flame is not None:
+            cls.__flame.stop()
+            cls.__flame.save(cls.__output)
+            cls.__flame = None
+
+        # restore the methods
+        for target, name, original in cls.__originals:
+            setattr(target, name, original)
+        cls.__originals = []
+
+    @classmethod
+    def report(cls) -> str:
+        """! Method that format the counters as a table.
+
+        @return the table as a string.
+        """
+        lines: list[str] = [f"{'stage':<16}{'calls':>10}{'records':>10}{'bytes':>14}{'time (ms)':>12}{'ns/record':>12}"]
+        for stage, (calls, records, size, nanoseconds) in sorted(cls.__stages.items()):
+            per_record: int = nanoseconds // records if records > 0 else 0
+            lines.append(f"{stage:<16}{calls:>10}{records:>10}{size:>14}{nanoseconds / 1e6:>12.2f}{per_record:>12}")
+        return '\n'.join(lines)
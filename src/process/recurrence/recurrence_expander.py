@@ -0,0 +1,272 @@
+"""! File containing the expander of the recurrence rules.
+Recurring events are expanded into their occurrences within a time window.
+
+@author Benjamin PAUMARD
+@version 1.0.0
+@since 19 October 2026
+"""
+
+# importing libs
+import calendar
+from datetime import datetime, timedelta, timezone
+from typing import Iterator
+
+# importing modules
+from data.ics.vbase import VBase
+from data.ics.vevent import VEvent
+from data.ics.rrule import RRule
+from data.ics.observance import WEEKDAYS
+
+# fixed steps of the frequencies, monthly and yearly rules are computed on the calendar
+STEPS: dict[str, timedelta] = {
+    'SECONDLY': timedelta(seconds=1),
+    'MINUTELY': timedelta(minutes=1),
+    'HOURLY': timedelta(hours=1),
+    'DAILY': timedelta(days=1),
+    'WEEKLY': timedelta(weeks=1),
+}
+
+# months between two occurrences of the calendar frequencies
+MONTHS: dict[str, int] = {'MONTHLY': 1, 'YEARLY': 12}
+
+
+class RecurrenceExpander:
+    """! Class that expand the recurrence rules of events.
+    Occurrences are given as UTC timestamps, the local time is used to follow daylight saving changes.
+
+    @author Benjamin PAUMARD
+    @version 1.0.0
+    @since 19 October 2026
+    """
+
+    def __init__(self) -> None:
+        """! Constructor of the RecurrenceExpander.
+        The expander does not keep any state between events.
+        """
+        pass
+
+    @staticmethod
+    def parse_until(until: str) -> float | None:
+        """! Method that convert the until time of a rule into a UTC timestamp.
+        Dates, local datetimes and UTC datetimes are accepted.
+
+        @param until the until time of the rule.
+        @return the UTC timestamp, None if the rule has no valid until time.
+        """
+        if until == '':
+            return None
+        try:
+            dt: datetime = datetime.fromisoformat(until)
+        except ValueError:
+            return None
+        return VBase.to_utc_timestamp(dt, None)
+
+    @staticmethod
+    def add_months(dt: datetime, months: int) -> datetime | None:
+        """! Method that add a number of months to a datetime.
+        Like in the RFC 5545, a day that does not exist in the month is skipped.
+
+        @param dt the datetime to move.
+        @param months the number of months to add.
+        @return the new datetime, None if the day does not exist or the year is out of range.
+        """
+        month: int = dt.month - 1 + months
+        try:
+            return dt.replace(year=dt.year + month // 12, month=month % 12 + 1)
+        except ValueError:
+            return None
+
+    @staticmethod
+    def parse_byday(byday: list[str]) -> list[tuple[int, int]]:
+        """! Method that read the days of a rule.
+
+        @param byday the days as written in the rule, like MO or -1FR.
+        @return the (ordinal, weekday) of the valid days, the ordinal is 0 for every such day of the period.
+        """
+        days: list[tuple[int, int]] = []
+        for day in byday:
+            weekday: int | None = WEEKDAYS.get(day[-2:].upper())
+            try:
+                ordinal: int = int(day[:-2]) if len(day) > 2 else 0
+            except ValueError:
+                continue
+            # a month has 5 weeks at most, a larger ordinal would never match
+            if weekday is not None and -5 <= ordinal <= 5:
+                days.append((ordinal, weekday))
+        return days
+
+    @staticmethod
+    def month_days(year: int, month: int, days: list[tuple[int, int]]) -> list[int]:
+        """! Method that give the days of a month matching days of a rule.
+
+        @param year the year of the month.
+        @param month the month, from 1.
+        @param days the (ordinal, weekday) of the rule, a negative ordinal counts from the end of the month.
+        @return the sorted days of the month, an ordinal beyond the month gives no day.
+        """
+        first, length = calendar.monthrange(year, month)
+        found: set[int] = set()
+
+        for ordinal, weekday in days:
+            # every matching weekday of the month
+            matching: list[int] = list(range(1 + (weekday - first) % 7, length + 1, 7))
+            index: int = ordinal - 1 if ordinal > 0 else ordinal
+            if ordinal == 0:
+                found.update(matching)
+            elif -len(matching) <= index < len(matching):
+                found.add(matching[index])
+
+        return sorted(found)
+
+    def occurrences(self, dtstart: datetime, rule: RRule, skip: int = 0) -> Iterator[datetime]:
+        """! Method that give the local starts of the occurrences of a rule, without end.
+        Like in the RFC 5545, BYDAY expands the weekly, monthly and yearly rules and limits the other ones.
+        A yearly rule is expanded within the month of its start, as the rules do not carry a BYMONTH.
+
+        @param dtstart the start of the event, the first occurrence.
+        @param rule the rule to expand.
+        @param skip the number of periods to skip from the start, used to jump close to a window (optional).
+        @return an iterator over the local starts, in order, a monthly or yearly rule ends with the last year.
+        """
+        frequency: str = rule.get_frequency().upper()
+        interval: int = max(rule.get_interval(), 1)
+        days: list[tuple[int, int]] = self.parse_byday(rule.get_byday())
+        weekdays: set[int] = {weekday for _, weekday in days}
+        period: int = skip
+
+        step: timedelta | None = STEPS.get(frequency)
+        if step is not None:
+            while True:
+                local: datetime = dtstart + step * interval * period
+                period += 1
+
+                if frequency == 'WEEKLY' and len(days) > 0:
+                    # the days of the week of the period, the weeks start on monday
+                    monday: datetime = local - timedelta(days=local.weekday())
+                    for weekday in sorted(weekdays):
+                        occurrence: datetime = monday + timedelta(days=weekday)
+                        if occurrence >= dtstart:
+                            yield occurrence
+                elif len(days) == 0 or local.weekday() in weekdays:
+                    yield local
+
+        elif frequency in MONTHS:
+            yield from self.month_occurrences(dtstart, interval * MONTHS[frequency], days, period)
+
+    def month_occurrences(self, dtstart: datetime, months: int, days: list[tuple[int, int]],
+                          period: int = 0) -> Iterator[datetime]:
+        """! Method that give the local starts of the occurrences of a monthly or yearly rule.
+        The rule ends with the last year of the datetimes.
+
+        @param dtstart the start of the event, the first occurrence.
+        @param months the number of months between two periods of the rule.
+        @param days the (ordinal, weekday) of the rule.
+        @param period the number of periods to skip from the start (optional).
+        @return an iterator over the local starts, in order.
+        """
+        # the months are counted from the first day, the day of the start may not exist in every month
+        first_day: datetime = dtstart.replace(day=1)
+        while True:
+            month: datetime | None = self.add_months(first_day, period * months)
+            if month is None:
+                return
+
+            # without days, a month without the day of the start is skipped
+            if len(days) == 0:
+                occurrence: datetime | None = self.add_months(dtstart, period * months)
+                if occurrence is not None:
+                    yield occurrence
+            else:
+                for day in self.month_days(month.year, month.month, days):
+                    occurrence = month.replace(day=day)
+                    if occurrence >= dtstart:
+                        yield occurrence
+            period += 1
+
+    def expand_rule(self, vevent: VEvent, rule: RRule, window_start: float, window_end: float,
+                    excluded: set[float] = set()) -> Iterator[tuple[float, float]]:
+        """! Method that expand one rule of an event within a window.
+        The occurrences overlapping the window are yielded in order, the excluded ones are skipped but still counted by COUNT.
+
+        @param vevent the recurring event.
+        @param rule the rule to expand.
+        @param window_start the UTC timestamp of the beginning of the window.
+        @param window_end the UTC timestamp of the end of the window.
+        @param excluded the UTC starts of the occurrences to skip, like the replaced ones (optional).
+        @return an iterator over (start, end) UTC timestamps.
+        """
+        frequency: str = rule.get_frequency().upper()
+        duration: float = vevent.get_utc_end() - vevent.get_utc_start()
+        tz = vevent.get_start_tzinfo()
+        local: datetime = vevent.get_dtstart()
+
+        # aware datetimes are expanded in UTC
+        if local.tzinfo is not None:
+            local = local.astimezone(timezone.utc).replace(tzinfo=None)
+            tz = timezone.utc
+
+        # the rule stops at the end of the window or at its until time
+        until: float | None = self.parse_until(rule.get_until())
+        last: float = window_end if until is None else min(window_end, until)
+
+        # jump close to the window instead of walking through the whole history, the COUNT needs every occurrence
+        skip: int = 0
+        step: timedelta | None = STEPS.get(frequency)
+        if step is not None and rule.get_count() == 0:
+            behind: float = window_start - duration - vevent.get_utc_start()
+            skip = max(int(behind // (step * max(rule.get_interval(), 1)).total_seconds()) - 1, 0)
+
+        # the excluded dates are in the timezone of the start when they are naive
+        tzstart = vevent.get_start_tzinfo()
+        skipped: set[float] = excluded | {VBase.to_utc_timestamp(exdate, tzstart) for exdate in vevent.get_exdates()}
+
+        count: int = 0
+        for occurrence in self.occurrences(local, rule, skip):
+            start: float = VBase.to_utc_timestamp(occurrence, tz)
+            count += 1
+            if start > last or (rule.get_count() > 0 and count > rule.get_count()):
+                return
+            if start + duration > window_start and start not in skipped:
+                yield (start, start + duration)
+
+    def expand(self, vevent: VEvent, window_start: float, window_end: float,
+               excluded: set[float] = set()) -> Iterator[tuple[float, float]]:
+        """! Method that expand an event within a window.
+        An event without rule has a single occurrence.
+
+        @param vevent the event to expand.
+        @param window_start the UTC timestamp of the beginning of the window.
+        @param window_end the UTC timestamp of the end of the window.
+        @param excluded the UTC starts of the occurrences replaced by other events, see get_overrides (optional).
+        @return an iterator over (start, end) UTC timestamps.
+        """
+        rules: list[RRule] = vevent.get_rrules()
+
+        # single occurrence
+        if len(rules) == 0:
+            start: float = vevent.get_utc_start()
+            end: float = vevent.get_utc_end()
+            if start <= window_end and end > window_start:
+                yield (start, end)
+            return
+
+        # every rule adds its own occurrences
+        for rule in rules:
+            yield from self.expand_rule(vevent, rule, window_start, window_end, excluded)
+
+    @staticmethod
+    def get_overrides(vevents: list[VEvent]) -> dict[str, set[float]]:
+        """! Method that find the occurrences replaced by other events.
+        An event with a RECURRENCE-ID replaces the occurrence of the recurring event with its UID, even when it is cancelled.
+
+        @param vevents the events of a calendar.
+        @return the UTC starts of the replaced occurrences, indexed by UID.
+        """
+        overrides: dict[str, set[float]] = {}
+        for vevent in vevents:
+            recurrence_id: datetime | None = vevent.get_recurrence_id()
+            if recurrence_id is not None:
+                # the recurrence id is in the timezone of the start of the event when it is naive
+                replaced: float = VBase.to_utc_timestamp(recurrence_id, vevent.get_start_tzinfo())
+                overrides.setdefault(vevent.get_uid(), set()).add(replaced)
+        return overrides
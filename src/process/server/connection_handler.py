@@ -0,0 +1,47 @@
+"""! File containing the handler of the connections to the socket server.
+Each connection carries a single request, as a line of JSON, and receives a single response.
+
+@author Benjamin PAUMARD
+@version 1.0.0
+@since 19 October 2026
+"""
+
+# importing libs
+import json
+import socketserver
+import time
+
+
+class ConnectionHandler(socketserver.StreamRequestHandler):
+    """! Class that answer a request.
+    A request is {"command": ..., "args": {...}}, a response is {"ok": ..., "output": ...} or {"ok": false, "error": ...}.
+
+    @author Benjamin PAUMARD
+    @version 1.0.0
+    @since 19 October 2026
+    """
+
+    def handle(self) -> None:
+        """! Method that read the request, run it and write the response."""
+        start: int = time.perf_counter_ns()
+        command: str = 'invalid'
+
+        try:
+            request: dict = json.loads(self.rfile.readline())
+            command = request.get('command', '')
+            args: dict = request.get('args', {})
+
+            # commands answered by the server itself
+            if command == 'stats':
+                response: dict = {'ok': True, 'output': self.server.format_percentiles(self.server.get_percentiles())}
+            elif command == 'stop':
+                response = {'ok': True, 'output': "The server is stopping"}
+                self.server.stop()
+            else:
+                response = {'ok': True, 'output': self.server.submit(command, args)}
+
+        except Exception as e:
+            response = {'ok': False, 'error': str(e)}
+
+        self.wfile.write(json.dumps(response).encode() + b'\n')
+        self.server.record_latency(command, time.perf_counter_ns() - start)
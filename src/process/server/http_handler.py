@@ -0,0 +1,156 @@
+"""! File containing the handler of the requests of the HTTP service.
+
+@author Benjamin PAUMARD
+@version 1.0.0
+@since 19 October 2026
+"""
+
+# importing libs
+import json
+import zlib
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler
+from urllib.parse import parse_qs, unquote, urlsplit
+
+# importing modules
+from process.server.json_serializer import JSONSerializer
+from process.manager.ics_manager import ICSManager
+from process.manager.vcf_manager import VCFManager
+from data.ics.vbase import VBase
+
+# default and maximum number of records of a page
+DEFAULT_LIMIT: int = 100
+MAX_LIMIT: int = 1000
+
+
+class HTTPHandler(BaseHTTPRequestHandler):
+    """! Class that answer the GET requests of the HTTP service.
+    GET /files lists the files, GET /files/{name}?offset=&limit= returns a page of records,
+    with start= and end= to only get the events within a time window, and GET /files/{name}/{uid} returns the records of a UID.
+
+    @author Benjamin PAUMARD
+    @version 1.0.0
+    @since 19 October 2026
+    """
+
+    def send_json(self, status: int, content: dict | list, etag: str = '') -> None:
+        """! Method that send a JSON response.
+        If the ETag matches the one of the request, only a 304 status is sent.
+
+        @param status the HTTP status.
+        @param content the content to send.
+        @param etag the ETag of the content (optional).
+        """
+        if etag != '' and self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.end_headers()
+            return
+
+        body: bytes = json.dumps(content).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        if etag != '':
+            self.send_header('ETag', etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_error_json(self, status: int, message: str) -> None:
+        """! Method that send an error as JSON.
+
+        @param status the HTTP status.
+        @param message the message of the error.
+        """
+        self.send_json(status, {'error': message})
+
+    def do_GET(self) -> None:
+        """! Method called on each GET request."""
+        url = urlsplit(self.path)
+        query: dict[str, list[str]] = parse_qs(url.query)
+        parts: list[str] = [unquote(part) for part in url.path.strip('/').split('/', 2)]
+
+        if parts[0] != 'files':
+            self.send_error_json(404, "Unknown path")
+            return
+
+        try:
+            # list of the files
+            if len(parts) == 1:
+                self.send_files()
+                return
+
+            # the response is built under the lock of the file, it is sent once the lock is released
+            response = self.server.read_model(parts[1], lambda etag, manager, by_uid:
+                                              self.get_response(parts, query, etag, manager, by_uid))
+            if response is None:
+                self.send_error_json(404, "Unknown file")
+                return
+            status, content, response_etag = response
+            self.send_json(status, content, response_etag)
+
+        except ValueError as e:
+            self.send_error_json(400, str(e))
+        except OSError as e:
+            self.send_error_json(500, str(e))
+
+    def send_files(self) -> None:
+        """! Method that send the list of the files with their number of records and their ETag."""
+        files: list[dict] = []
+        for name in self.server.get_names():
+            files.append(self.server.read_model(name, lambda etag, manager, _, name=name: {
+                'name': name,
+                'records': len(manager.get_vcards()) if isinstance(manager, VCFManager)
+                else len(manager.get_vevents()) + len(manager.get_vtodos()),
+                'etag': etag,
+            }))
+        self.send_json(200, files, f'"{zlib.crc32(";".join(file["etag"] for file in files).encode()):x}"')
+
+    def get_response(self, parts: list[str], query: dict[str, list[str]], etag: str, manager: VCFManager | ICSManager,
+                     by_uid: dict[str, list]) -> tuple[int, dict | list, str]:
+        """! Method that build the response of a request on a file, it is called with the lock of the file held.
+        The records are serialized, so the response does not change once the lock is released.
+
+        @param parts the parts of the path of the request: files, the name of the file and the UID if any.
+        @param query the parameters of the request.
+        @param etag the ETag of the file.
+        @param manager the manager of the file.
+        @param by_uid the records of the file by UID.
+        @return the status, the content and the ETag of the response.
+        """
+        # the content depends on the file and on the request
+        response_etag: str = f'"{etag}-{zlib.crc32(self.path.encode()):x}"'
+        # the client already has the content, it is not serialized
+        if self.headers.get('If-None-Match') == response_etag:
+            return 304, {}, response_etag
+
+        # records of a UID
+        if len(parts) == 3:
+            records: list = by_uid.get(parts[2], [])
+            if len(records) == 0:
+                return 404, {'error': "Unknown UID"}, ''
+            return 200, [JSONSerializer.to_dict(record) for record in records], response_etag
+
+        # records of the file, or events of a time window
+        if isinstance(manager, VCFManager):
+            records = manager.get_vcards()
+        elif 'start' in query or 'end' in query:
+            # recurring events are expanded, so the window must be bounded
+            if 'start' not in query or 'end' not in query:
+                raise ValueError("A time window needs a start and an end")
+            start: float = VBase.to_utc_timestamp(datetime.fromisoformat(query['start'][0]), None)
+            end: float = VBase.to_utc_timestamp(datetime.fromisoformat(query['end'][0]), None)
+            records = manager.get_vevents_between(start, end)
+        else:
+            records = manager.get_vevents() + manager.get_vtodos()
+
+        # paginate
+        offset: int = max(0, int(query.get('offset', ['0'])[0]))
+        limit: int = min(MAX_LIMIT, max(1, int(query.get('limit', [str(DEFAULT_LIMIT)])[0])))
+        return 200, {
+            'total': len(records),
+            'offset': offset,
+            'limit': limit,
+            'next': offset + limit if offset + limit < len(records) else None,
+            'items': [JSONSerializer.to_dict(record) for record in records[offset:offset + limit]],
+        }, response_etag
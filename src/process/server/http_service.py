@@ -0,0 +1,122 @@
+"""! File containing the HTTP service exposing contacts and calendars as JSON.
+Only the standard library is used, the service is meant for internal tools.
+
+@author Benjamin PAUMARD
+@version 1.0.0
+@since 19 October 2026
+"""
+
+# importing libs
+import os
+import threading
+from http.server import ThreadingHTTPServer
+from typing import Any, Callable
+
+# importing modules
+from process.server.http_handler import HTTPHandler
+from process.manager.vcf_manager import VCFManager
+from process.manager.ics_manager import ICSManager
+from process.watch.incremental_loader import IncrementalLoader
+
+
+class HTTPService(ThreadingHTTPServer):
+    """! Class of the HTTP service.
+    Each file is parsed once and kept in memory, when its modification time or size change only its changed records
+    are parsed again.
+    The ETag of a file is made of its modification time and the hash of its content.
+    A file is read under its lock, so a response is never built from a file being parsed again.
+
+    @author Benjamin PAUMARD
+    @version 1.0.0
+    @since 19 October 2026
+    """
+
+    daemon_threads = True
+
+    def __init__(self, paths: list[str], host: str = '127.0.0.1', port: int = 8080) -> None:
+        """! Constructor of the HTTPService.
+
+        @param paths the paths of the VCF and ICS files to serve, they are named by their file name.
+        @param host the address to listen on, the loopback by default (optional).
+        @param port the port to listen on (optional).
+        """
+        super().__init__((host, port), HTTPHandler)
+
+        self.__paths: dict[str, str] = {os.path.basename(path): os.path.abspath(path) for path in paths}
+        # loaded files: name -> (modification time, size, loader, manager, records by UID)
+        self.__models: dict[str, tuple[int, int, IncrementalLoader, VCFManager | ICSManager, dict[str, list]]] = {}
+        # a lock for each file, held while the file is parsed or read
+        self.__locks: dict[str, threading.Lock] = {name: threading.Lock() for name in self.__paths}
+
+    def get_names(self) -> list[str]:
+        """! Method that returns the names of the served files.
+
+        @return the names of the files.
+        """
+        return list(self.__paths.keys())
+
+    def read_model(self, name: str, read: Callable[[str, VCFManager | ICSManager, dict[str, list]], Any]) -> Any:
+        """! Method that call a function with the parsed content of a file, parsed again if the file changed.
+        The file is not parsed again while the function runs, so the content it reads matches its ETag.
+        The function must copy what it keeps, like the serialized records, the content may change once it returns.
+
+        @param name the name of the file.
+        @param read the function called with the ETag, the manager and the records by UID.
+        @return the result of the function, None if the file is not served.
+        """
+        if name not in self.__paths:
+            return None
+
+        # the other files are served while a file is parsed
+        with self.__locks[name]:
+            etag, manager, by_uid = self.__load(name)
+            return read(etag, manager, by_uid)
+
+    def __load(self, name: str) -> tuple[str, VCFManager | ICSManager, dict[str, list]]:
+        """! Method that parse a file, only its changed records when it was already parsed.
+        It is called with the lock of the file held.
+
+        @param name the name of the file.
+        @return the ETag, the manager and the records by UID.
+        """
+        path: str = self.__paths[name]
+        stat: os.stat_result = os.stat(path)
+        model = self.__models.get(name)
+        if model is not None and model[0] == stat.st_mtime_ns and model[1] == stat.st_size:
+            return f"{model[0]:x}-{model[2].get_digest()}", model[3], model[4]
+
+        if model is None:
+            # parse the whole file
+            manager: VCFManager | ICSManager = VCFManager() if path.lower().endswith('.vcf') else ICSManager()
+            loader: IncrementalLoader = IncrementalLoader(manager, path)
+            by_uid: dict[str, list] = {}
+            added: list = manager.get_vcards() if isinstance(manager, VCFManager) \
+                else manager.get_vevents() + manager.get_vtodos()
+            removed: list = []
+        else:
+            # parse the changed records only
+            _, _, loader, manager, by_uid = model
+            added, removed = loader.refresh()
+
+        # update the index, many records may share a UID, like the occurrences of a recurring event
+        for record in removed:
+            records: list | None = by_uid.get(record.get_uid())
+            if records is not None:
+                records[:] = [other for other in records if other is not record]
+                if len(records) == 0:
+                    del by_uid[record.get_uid()]
+        for record in added:
+            if record.get_uid() != '':
+                by_uid.setdefault(record.get_uid(), []).append(record)
+
+        self.__models[name] = (stat.st_mtime_ns, stat.st_size, loader, manager, by_uid)
+        return f"{stat.st_mtime_ns:x}-{loader.get_digest()}", manager, by_uid
+
+    def run(self) -> None:
+        """! Method that serve requests until the service is interrupted."""
+        try:
+            self.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.server_close()
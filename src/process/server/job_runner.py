@@ -0,0 +1,125 @@
+"""! File containing the runner of the jobs sent to the server.
+Jobs run in the worker processes, each worker keeps the files it has parsed.
+
+@author Benjamin PAUMARD
+@version 1.0.0
+@since 19 October 2026
+"""
+
+# importing libs
+import contextlib
+import io
+import os
+from datetime import datetime
+
+# importing modules
+from process.manager.vcf_manager import VCFManager
+from process.manager.ics_manager import ICSManager
+from process.watch.incremental_loader import IncrementalLoader
+from data.ics.vbase import VBase
+
+
+class JobRunner:
+    """! Class that run a job of the server.
+    The parsed files are cached in the worker, when their size or modification time change only their changed records are parsed again.
+
+    @author Benjamin PAUMARD
+    @version 1.0.0
+    @since 19 October 2026
+    """
+
+    # loaders of the parsed files: path -> (modification time, size, loader, manager)
+    __managers: dict[str, tuple[int, int, IncrementalLoader, VCFManager | ICSManager]] = {}
+
+    @staticmethod
+    def get_manager(path: str) -> VCFManager | ICSManager:
+        """! Method that returns the manager of a file, parsed once while the file does not change.
+
+        @param path the path of the VCF or ICS file.
+        @return the manager of the file.
+        """
+        if not path.lower().endswith(('.vcf', '.ics')):
+            raise ValueError("Incorrect file input")
+
+        stat: os.stat_result = os.stat(path)
+        cached = JobRunner.__managers.get(path)
+        if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[3]
+
+        if cached is None:
+            manager: VCFManager | ICSManager = VCFManager() if path.lower().endswith('.vcf') else ICSManager()
+            loader: IncrementalLoader = IncrementalLoader(manager, path)
+        else:
+            _, _, loader, manager = cached
+            loader.refresh()
+
+        JobRunner.__managers[path] = (stat.st_mtime_ns, stat.st_size, loader, manager)
+        return manager
+
+    @staticmethod
+    def print_records(manager: VCFManager | ICSManager, vcards: list, vevents: list, vtodos: list) -> str:
+        """! Method that print records like the CLI does.
+
+        @param manager the manager of the records, giving their type.
+        @param vcards the contacts to print.
+        @param vevents the events to print.
+        @param vtodos the todos to print.
+        @return the printed text.
+        """
+        from cli import CLI
+
+        output: io.StringIO = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            if isinstance(manager, VCFManager):
+                CLI.print_vcards(vcards)
+            else:
+                CLI.print_calendar(vevents, vtodos)
+        return output.getvalue()
+
+    @staticmethod
+    def run(command: str, args: dict) -> str:
+        """! Method that run a job.
+
+        @param command the command: print, export, search or query.
+        @param args the arguments of the command.
+        @return the output of the command.
+        """
+        manager: VCFManager | ICSManager = JobRunner.get_manager(args['path'])
+
+        match command:
+            case 'print':
+                if isinstance(manager, VCFManager):
+                    return JobRunner.print_records(manager, manager.get_vcards(), [], [])
+                return JobRunner.print_records(manager, [], manager.get_vevents(), manager.get_vtodos())
+
+            case 'export':
+                if args.get('type') == 'CSV':
+                    manager.export_csv(args['output'])
+                elif args.get('type') == 'HTML':
+                    manager.export_html(args['output'], args.get('complete', False))
+                else:
+                    return "Incorrect file output"
+                return "The file has been converted"
+
+            case 'search':
+                # case insensitive search in the names, emails, summaries and locations
+                text: str = args['text'].lower()
+                if isinstance(manager, VCFManager):
+                    vcards: list = [vcard for vcard in manager.get_vcards()
+                                    if text in vcard.get_full_name().lower() or text in vcard.get_org().lower()
+                                    or any(text in email.get_email_address().lower() for email in vcard.get_emails())]
+                    return JobRunner.print_records(manager, vcards, [], [])
+
+                vevents: list = [vevent for vevent in manager.get_vevents()
+                                 if text in vevent.get_summary().lower() or text in vevent.get_location().lower()]
+                vtodos: list = [vtodo for vtodo in manager.get_vtodos() if text in vtodo.get_summary().lower()]
+                return JobRunner.print_records(manager, [], vevents, vtodos)
+
+            case 'query':
+                if not isinstance(manager, ICSManager):
+                    raise ValueError("Only calendars can be queried")
+                start: float = VBase.to_utc_timestamp(datetime.fromisoformat(args['start']), None)
+                end: float = VBase.to_utc_timestamp(datetime.fromisoformat(args['end']), None)
+                return JobRunner.print_records(manager, [], manager.get_vevents_between(start, end), [])
+
+        raise ValueError(f"Unknown command {command}")
@@ -0,0 +1,107 @@
+"""! File containing the serializer of the records into JSON compatible dictionaries.
+
+@author Benjamin PAUMARD
+@version 1.0.0
+@since 19 October 2026
+"""
+
+# importing modules
+from data.vcf.vcard import VCard
+from data.ics.vevent import VEvent
+from data.ics.vtodo import VTodo
+
+
+class JSONSerializer:
+    """! Class that convert contacts, events and todos into dictionaries.
+    Datetimes are written in ISO format, the UTC instants are added for events and todos.
+
+    @author Benjamin PAUMARD
+    @version 1.0.0
+    @since 19 October 2026
+    """
+
+    @staticmethod
+    def vcard_to_dict(vcard: VCard) -> dict:
+        """! Method that convert a contact.
+
+        @param vcard the contact to convert.
+        @return the contact as a dictionary.
+        """
+        return {
+            'type': 'VCARD',
+            'uid': vcard.get_uid(),
+            'version': vcard.get_version(),
+            'names': vcard.get_names(),
+            'full_name': vcard.get_full_name(),
+            'org': vcard.get_org(),
+            'title': vcard.get_title(),
+            'addresses': [{'types': address.get_address_types(), 'elements': address.get_address_elements(),
+                           'preferred': address.is_preferred()} for address in vcard.get_addresses()],
+            'emails': [{'types': email.get_email_types(), 'address': email.get_email_address(),
+                        'preferred': email.is_preferred()} for email in vcard.get_emails()],
+            'phones': [{'types': phone.get_phone_types(), 'number': phone.get_phone_number(),
+                        'preferred': phone.is_preferred()} for phone in vcard.get_phones()],
+            'note': vcard.get_note(),
+            'categories': vcard.get_categories(),
+        }
+
+    @staticmethod
+    def vevent_to_dict(vevent: VEvent) -> dict:
+        """! Method that convert an event.
+
+        @param vevent the event to convert.
+        @return the event as a dictionary.
+        """
+        return {
+            'type': 'VEVENT',
+            'uid': vevent.get_uid(),
+            'timestamp': vevent.get_timestamp().isoformat(),
+            'summary': vevent.get_summary(),
+            'dtstart': vevent.get_dtstart().isoformat(),
+            'tzstart': vevent.get_tzstart(),
+            'dtend': vevent.get_dtend().isoformat(),
+            'tzend': vevent.get_tzend(),
+            'utc_start': vevent.get_utc_dtstart().isoformat(),
+            'utc_end': vevent.get_utc_dtend().isoformat(),
+            'location': vevent.get_location(),
+            'description': vevent.get_description(),
+            'status': vevent.get_status(),
+            'transp': vevent.get_transp(),
+            'rrules': [{'frequency': rrule.get_frequency(), 'until': rrule.get_until()} for rrule in vevent.get_rrules()],
+            'alarms': [{'trigger': valarm.get_trigger(), 'description': valarm.get_description(),
+                        'action': valarm.get_action()} for valarm in vevent.get_valarms()],
+        }
+
+    @staticmethod
+    def vtodo_to_dict(vtodo: VTodo) -> dict:
+        """! Method that convert a todo.
+
+        @param vtodo the todo to convert.
+        @return the todo as a dictionary.
+        """
+        return {
+            'type': 'VTODO',
+            'uid': vtodo.get_uid(),
+            'timestamp': vtodo.get_timestamp().isoformat(),
+            'summary': vtodo.get_summary(),
+            'dtstart': vtodo.get_dtstart().isoformat(),
+            'tzstart': vtodo.get_tzstart(),
+            'utc_start': vtodo.get_utc_dtstart().isoformat(),
+            'duration': vtodo.get_duration(),
+            'status': vtodo.get_status(),
+            'alarms': [{'trigger': valarm.get_trigger(), 'description': valarm.get_description(),
+                        'action': valarm.get_action()} for valarm in vtodo.get_valarms()],
+        }
+
+    @staticmethod
+    def to_dict(record: VCard | VEvent | VTodo) -> dict:
+        """! Method that convert any record.
+
+        @param record the contact, event or todo to convert.
+        @return the record as a dictionary.
+        """
+        if isinstance(record, VCard):
+            return JSONSerializer.vcard_to_dict(record)
+        if isinstance(record, VEvent):
+            return JSONSerializer.vevent_to_dict(record)
+        return JSONSerializer.vtodo_to_dict(record)
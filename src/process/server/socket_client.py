@@ -0,0 +1,41 @@
+"""! File containing the client of the socket server.
+
+@author Benjamin PAUMARD
+@version 1.0.0
+@since 19 October 2026
+"""
+
+# importing libs
+import json
+import socket
+
+
+class SocketClient:
+    """! Class that send requests to the socket server.
+
+    @author Benjamin PAUMARD
+    @version 1.0.0
+    @since 19 October 2026
+    """
+
+    def __init__(self, socket_path: str) -> None:
+        """! Constructor of the SocketClient.
+
+        @param socket_path the path of the Unix socket of the server.
+        """
+        self.__socket_path: str = socket_path
+
+    def request(self, command: str, args: dict = {}) -> dict:
+        """! Method that send a request and wait for the response.
+
+        @param command the command to run.
+        @param args the arguments of the command (optional).
+        @return the response, with the output if ok is True or the error otherwise.
+        """
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.connect(self.__socket_path)
+            client.sendall(json.dumps({'command': command, 'args': args}).encode() + b'\n')
+
+            # the response is a single line
+            with client.makefile('rb') as f:
+                return json.loads(f.readline())
@@ -0,0 +1,148 @@
+"""! File containing the server answering requests over a Unix socket.
+The server keeps worker processes running, so the files they parse stay in memory between requests.
+
+@author Benjamin PAUMARD
+@version 1.0.0
+@since 19 October 2026
+"""
+
+# importing libs
+import os
+import socket
+import socketserver
+import stat
+import threading
+import time
+import zlib
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+# importing modules
+from process.server.connection_handler import ConnectionHandler
+from process.server.job_runner import JobRunner
+
+# number of latencies kept for each command
+LATENCY_WINDOW: int = 10000
+
+
+class SocketServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """! Class of the server.
+    Connections are handled by threads, the jobs run in worker processes.
+    A file is always sent to the same worker, so it is only parsed by one of them.
+
+    @author Benjamin PAUMARD
+    @version 1.0.0
+    @since 19 October 2026
+    """
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: str, workers: int = 0) -> None:
+        """! Constructor of the SocketServer.
+
+        @param socket_path the path of the Unix socket.
+        @param workers the number of worker processes, the number of CPU if 0 (optional).
+        """
+        self.remove_stale_socket(socket_path)
+        super().__init__(socket_path, ConnectionHandler)
+
+        self.__socket_path: str = socket_path
+        # one process per worker, so the jobs of a file can be routed to the worker that parsed it
+        self.__pools: list[ProcessPoolExecutor] = [ProcessPoolExecutor(1) for _ in range(workers if workers > 0 else os.cpu_count() or 1)]
+        # latest latencies of each command, in nanoseconds
+        self.__latencies: dict[str, deque[int]] = {}
+        self.__lock: threading.Lock = threading.Lock()
+
+    @staticmethod
+    def remove_stale_socket(socket_path: str) -> None:
+        """! Method that remove the socket left by a server that did not stop cleanly.
+        Only a socket that refuses connections is removed, a FileExistsError is raised for the other files and for
+        the socket of a running server.
+
+        @param socket_path the path of the Unix socket.
+        """
+        if not os.path.lexists(socket_path):
+            return
+        if not stat.S_ISSOCK(os.lstat(socket_path).st_mode):
+            raise FileExistsError(f"{socket_path} is not a socket")
+
+        # a server listening on the socket accepts the connection
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+            try:
+                probe.connect(socket_path)
+            except ConnectionRefusedError:
+                os.remove(socket_path)
+                return
+        raise FileExistsError(f"{socket_path} is used by a running server")
+
+    def submit(self, command: str, args: dict) -> str:
+        """! Method that run a job in the worker of its file and wait for the result.
+
+        @param command the command of the job.
+        @param args the arguments of the job.
+        @return the output of the job.
+        """
+        pool: ProcessPoolExecutor = self.__pools[zlib.crc32(args.get('path', '').encode()) % len(self.__pools)]
+        return pool.submit(JobRunner.run, command, args).result()
+
+    def record_latency(self, command: str, nanoseconds: int) -> None:
+        """! Method that record the latency of a request.
+
+        @param command the command of the request.
+        @param nanoseconds the time spent answering the request.
+        """
+        with self.__lock:
+            if command not in self.__latencies:
+                self.__latencies[command] = deque(maxlen=LATENCY_WINDOW)
+            self.__latencies[command].append(nanoseconds)
+
+    def get_percentiles(self) -> dict[str, dict[str, float]]:
+        """! Method that returns the percentiles of the latencies of each command.
+
+        @return the number of requests, the p50, p90, p99 and max latencies in milliseconds of each command.
+        """
+        percentiles: dict[str, dict[str, float]] = {}
+        with self.__lock:
+            for command, latencies in self.__latencies.items():
+                values: list[int] = sorted(latencies)
+                count: int = len(values)
+                percentiles[command] = {'count': count}
+                for name, ratio in (('p50', 0.5), ('p90', 0.9), ('p99', 0.99)):
+                    percentiles[command][name] = values[min(count - 1, int(ratio * count))] / 1e6
+                percentiles[command]['max'] = values[-1] / 1e6
+        return percentiles
+
+    @staticmethod
+    def format_percentiles(percentiles: dict[str, dict[str, float]]) -> str:
+        """! Method that format the percentiles as a table.
+
+        @param percentiles the percentiles returned by the get_percentiles method.
+        @return the table as a string.
+        """
+        lines: list[str] = [f"{'command':<10}{'count':>8}{'p50 (ms)':>10}{'p90 (ms)':>10}{'p99 (ms)':>10}{'max (ms)':>10}"]
+        for command, values in sorted(percentiles.items()):
+            lines.append(f"{command:<10}{values['count']:>8}{values['p50']:>10.2f}{values['p90']:>10.2f}{values['p99']:>10.2f}{values['max']:>10.2f}")
+        return '\n'.join(lines)
+
+    def stop(self) -> None:
+        """! Method that ask the server to stop, from another thread."""
+        threading.Thread(target=self.shutdown).start()
+
+    def run(self) -> None:
+        """! Method that serve requests until the server is stopped.
+        The workers and the socket are removed at the end, and the latencies are printed.
+        """
+        start: int = time.perf_counter_ns()
+        try:
+            self.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.server_close()
+            for pool in self.__pools:
+                pool.shutdown(cancel_futures=True)
+            if os.path.exists(self.__socket_path):
+                os.remove(self.__socket_path)
+
+        print(f"Served for {(time.perf_counter_ns() - start) / 1e9:.1f} s")
+        print(self.format_percentiles(self.get_percentiles()))
@@ -0,0 +1,202 @@
+"""! File containing the storage of a calendar split into monthly shards.
+Each shard is a complete ICS file, a manifest gives the time range and the UIDs of each shard.
+
+@author Benjamin PAUMARD
+@version 1.0.0
+@since 19 October 2026
+"""
+
+# importing libs
+import json
+import math
+import os
+from datetime import datetime, timezone
+
+# importing modules
+from data.ics.vbase import VBase
+from data.ics.vevent import VEvent
+from data.ics.vtodo import VTodo
+from data.ics.vcalendar import VCalendar
+from data.ics.vtimezone import VTimezone
+from process.writer.file_writer import FileWriter
+
+# name of the manifest in the directory of the shards
+MANIFEST_NAME: str = 'manifest.json'
+# version of the manifest, a manifest of another version is not read
+MANIFEST_VERSION: int = 1
+# month of the elements whose start cannot be converted into a date
+UNDATED: str = 'undated'
+
+
+class CalendarShards:
+    """! Class that manage the directory of a sharded calendar.
+    The events and todos are stored by the month of their UTC start, in files named like 2024-01.ics which contain
+    the timezones of the calendar as well, so each shard can be opened on its own. For each shard, the manifest keeps
+    the UTC start of its first element, the UTC end of its last one, whether it contains recurring events and its UIDs.
+    The manifest keeps the properties of the calendar as well, like PRODID, so they are kept when the shards are joined.
+
+    @author Benjamin PAUMARD
+    @version 1.0.0
+    @since 19 October 2026
+    """
+
+    def __init__(self, directory: str) -> None:
+        """! Constructor of the CalendarShards.
+        The manifest is read when the directory has one.
+
+        @param directory the directory of the shards, created by the first write.
+        """
+        self.__directory: str = directory
+        # shards by month: {'file', 'start', 'end', 'recurring', 'uids'}
+        self.__shards: dict[str, dict] = {}
+        # months of each UID, built on the first lookup
+        self.__locations: dict[str, list[str]] | None = None
+        # properties of the calendar, like PRODID, written in every shard
+        self.__header: list[str] = []
+
+        manifest_path: str = os.path.join(directory, MANIFEST_NAME)
+        if os.path.exists(manifest_path):
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                manifest: dict = json.load(f)
+            if manifest.get('version') != MANIFEST_VERSION:
+                raise ValueError(f"Unknown version of the manifest {manifest_path}")
+            self.__shards = manifest['shards']
+            # the manifests written before the properties were kept have none
+            self.__header = manifest.get('header', [])
+
+    def get_directory(self) -> str:
+        """! Method to get the directory of the shards.
+
+        @return the path of the directory.
+        """
+        return self.__directory
+
+    def get_header(self) -> list[str]:
+        """! Method to get the properties of the sharded calendar.
+
+        @return the unfolded lines of the properties, like PRODID, empty when the manifest has none.
+        """
+        return self.__header
+
+    def set_header(self, header: list[str]) -> None:
+        """! Method to set the properties of the sharded calendar.
+        They are written in the shards written after, and in the manifest.
+
+        @param header the unfolded lines of the properties.
+        """
+        self.__header = list(header)
+
+    def get_months(self) -> list[str]:
+        """! Method to get the months that have a shard.
+
+        @return the months like 2024-01, in chronological order.
+        """
+        return sorted(self.__shards.keys())
+
+    def get_shard_path(self, month: str) -> str:
+        """! Method to get the path of the file of a shard.
+
+        @param month the month of the shard.
+        @return the path of the ICS file of the shard.
+        """
+        return os.path.join(self.__directory, f"{month}.ics")
+
+    @staticmethod
+    def get_month(element: VBase) -> str:
+        """! Method that give the month of the shard of an element.
+
+        @param element the event or the todo.
+        @return the month of its UTC start, like 2024-01.
+        """
+        try:
+            start: datetime = datetime.fromtimestamp(element.get_utc_start(), timezone.utc)
+        except (OverflowError, OSError, ValueError):
+            return UNDATED
+        return f"{start.year:04d}-{start.month:02d}"
+
+    def find_uid(self, uid: str) -> list[str]:
+        """! Method that find the shards containing an UID.
+        Many shards may contain a same UID, like the modified occurrences of a recurring event.
+
+        @param uid the UID to find.
+        @return the months of the shards containing the UID.
+        """
+        if self.__locations is None:
+            self.__locations = {}
+            for month in self.get_months():
+                for shard_uid in self.__shards[month]['uids']:
+                    self.__locations.setdefault(shard_uid, []).append(month)
+        return self.__locations.get(uid, [])
+
+    def select(self, start: float = -math.inf, end: float = math.inf) -> list[str]:
+        """! Method that select the shards that may have occurrences within a time window.
+        The shards containing recurring events are selected once they start before the end of the window.
+        Like for the RecurrenceExpander, a shard starting at the end of the window is selected.
+
+        @param start the UTC timestamp of the beginning of the window (optional).
+        @param end the UTC timestamp of the end of the window (optional).
+        @return the months of the selected shards, in chronological order.
+        """
+        months: list[str] = []
+        for month in self.get_months():
+            shard: dict = self.__shards[month]
+            if shard['start'] <= end and (shard['recurring'] or shard['end'] > start or shard['start'] >= start):
+                months.append(month)
+        return months
+
+    def write_shard(self, month: str, vtimezones: list[VTimezone], vevents: list[VEvent], vtodos: list[VTodo]) -> None:
+        """! Method that write the file of a shard and update its entry in the manifest.
+        The manifest itself is written by save_manifest. The shard of a month without element is removed.
+
+        @param month the month of the shard.
+        @param vtimezones the timezones of the calendar.
+        @param vevents the events of the month.
+        @param vtodos the todos of the month.
+        """
+        # a month without element has no shard
+        elements: list[VBase] = vevents + vtodos
+        if len(elements) == 0:
+            self.remove_shard(month)
+            return
+        os.makedirs(self.__directory, exist_ok=True)
+
+        vcalendar: VCalendar = VCalendar(vevents, vtodos, vtimezones)
+        if len(self.__header) > 0:
+            vcalendar.set_header(self.__header)
+
+        def write(path: str) -> None:
+            # like the manager, the unmodified elements are written as they were read
+            with open(path, 'w', encoding='utf-8', errors='surrogateescape', newline='') as f:
+                vcalendar.save(f)
+
+        FileWriter.write_atomically(self.get_shard_path(month), write)
+
+        # the todos have no end, they end when they start
+        self.__shards[month] = {
+            'file': os.path.basename(self.get_shard_path(month)),
+            'start': min(element.get_utc_start() for element in elements),
+            'end': max([vevent.get_utc_end() for vevent in vevents] + [vtodo.get_utc_start() for vtodo in vtodos]),
+            'recurring': any(len(vevent.get_rrules()) > 0 for vevent in vevents),
+            'uids': [element.get_uid() for element in elements],
+        }
+        self.__locations = None
+
+    def remove_shard(self, month: str) -> None:
+        """! Method that remove the file of a shard and its entry in the manifest.
+
+        @param month the month of the shard.
+        """
+        if os.path.exists(self.get_shard_path(month)):
+            os.remove(self.get_shard_path(month))
+        self.__shards.pop(month, None)
+        self.__locations = None
+
+    def save_manifest(self) -> None:
+        """! Method that write the manifest of the shards."""
+        os.makedirs(self.__directory, exist_ok=True)
+
+        def write(path: str) -> None:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump({'version': MANIFEST_VERSION, 'header': self.__header, 'shards': self.__shards}, f)
+
+        FileWriter.write_atomically(os.path.join(self.__directory, MANIFEST_NAME), write)
@@ -0,0 +1,245 @@
+"""! File containing the sorter of the records of files larger than the memory.
+The records are sorted by runs that fit in a memory budget, the runs are then merged into the output.
+
+@author Benjamin PAUMARD
+@version 1.0.0
+@since 19 October 2026
+"""
+
+# importing libs
+import heapq
+import os
+import pickle
+import tempfile
+import time
+from datetime import datetime, tzinfo
+from operator import itemgetter
+from typing import Iterator
+
+# importing modules
+from data.ics.vbase import VBase
+from process.builder.component_parser import ComponentParser
+from process.builder.vcalendar_builder import VCalendarBuilder
+from process.stream.content_line_reader import ContentLineReader
+from process.stream.record_reader import RecordReader
+from process.timezone.timezone_resolver import TimezoneResolver
+from process.writer.file_writer import FileWriter
+
+# bytes counted for each record held in memory besides its content: the key, the tuple and the bytes object
+RECORD_OVERHEAD: int = 160
+# maximum number of runs merged at once, the files of a merge are all open at the same time
+FAN_IN: int = 128
+# buffer of each run file read during a merge
+RUN_BUFFER_SIZE: int = 1 << 16
+
+
+class ExternalSorter:
+    """! Class that sort the records of a VCF or ICS file that may not fit in memory.
+    The contacts are sorted by full name, the events and todos by their UTC start. The records are streamed
+    and kept as bytes until the memory budget is reached, then they are sorted and spilled to a temporary run file.
+    The runs are merged with a heap into the output, a record is written as it was read.
+    Records with a same key keep the order of the file, the elements without start are written last.
+    The timezones and the properties of a calendar are written before its sorted components.
+
+    @author Benjamin PAUMARD
+    @version 1.0.0
+    @since 19 October 2026
+    """
+
+    def __init__(self, budget: int = 64 * 1024 ** 2) -> None:
+        """! Constructor of the ExternalSorter.
+        Counters of the last sort are available after a sort.
+
+        @param budget the memory in bytes that the records of a run may use (optional).
+        """
+        self.__budget: int = budget
+        self.__record_count: int = 0
+        self.__run_count: int = 0
+        self.__byte_count: int = 0
+        self.__elapsed: float = 0.0
+        self.__builder: VCalendarBuilder = VCalendarBuilder()
+        self.__resolver: TimezoneResolver = TimezoneResolver()
+
+    def get_budget(self) -> int:
+        """! Method to get the memory budget of a run.
+
+        @return the budget in bytes.
+        """
+        return self.__budget
+
+    def set_budget(self, budget: int) -> None:
+        """! Method to set the memory budget of a run.
+
+        @param budget the budget in bytes.
+        """
+        self.__budget = budget
+
+    def get_record_count(self) -> int:
+        """! Method to get the number of records sorted by the last sort.
+
+        @return the number of records, the timezones excluded.
+        """
+        return self.__record_count
+
+    def get_run_count(self) -> int:
+        """! Method to get the number of sorted runs of the last sort.
+
+        @return the number of runs, 1 when the records fitted in the budget.
+        """
+        return self.__run_count
+
+    def get_byte_count(self) -> int:
+        """! Method to get the size of the file sorted by the last sort.
+
+        @return the number of bytes read.
+        """
+        return self.__byte_count
+
+    def get_elapsed(self) -> float:
+        """! Method to get the duration of the last sort.
+
+        @return the duration in seconds.
+        """
+        return self.__elapsed
+
+    def get_throughput(self) -> float:
+        """! Method to get the throughput of the last sort.
+
+        @return the number of bytes sorted per second.
+        """
+        return self.__byte_count / self.__elapsed if self.__elapsed > 0 else 0.0
+
+    def get_key(self, kind: str, lines: list[str]) -> tuple[int, str | float]:
+        """! Method that give the key of a record.
+
+        @param kind the name of the component, like VCARD.
+        @param lines the unfolded lines of the record.
+        @return (0, the full name of a contact, case insensitive, or the UTC start of an element), (1, 0.0) without them.
+        """
+        if kind == 'VCARD':
+            return 0, RecordReader.get_property(lines, 'FN').casefold()
+
+        # only the start is read, the other properties are not needed
+        starts: list[str] = [line for line in lines if line[:7].upper() == 'DTSTART' and line[7:8] in (':', ';')]
+        if kind not in ('VEVENT', 'VTODO') or len(starts) == 0:
+            return 1, 0.0
+
+        _, parameters, value = ComponentParser.split(starts[0])
+        try:
+            start: datetime = datetime.fromisoformat(value)
+        except ValueError:
+            return 1, 0.0
+
+        # the TZID is resolved with the timezones of the calendar
+        tz: tzinfo | None = self.__resolver.resolve(parameters['TZID']) if 'TZID' in parameters else None
+        return 0, VBase.to_utc_timestamp(start, tz)
+
+    def sort(self, path: str, output_path: str) -> None:
+        """! Method that sort the records of a file into another one.
+        The runs are written next to the output, as the temporary directory may be held in memory.
+        The output is replaced atomically.
+
+        @param path the path of the VCF or ICS file to sort.
+        @param output_path the path of the sorted file.
+        """
+        started: float = time.perf_counter()
+        self.__record_count = 0
+        self.__run_count = 0
+        self.__byte_count = os.path.getsize(path)
+        self.__resolver = TimezoneResolver()
+        calendar: bool = path.lower().endswith('.ics')
+        container: str = 'VCALENDAR' if calendar else ''
+
+        # the line breaks of the file are used for the lines written
+        newline: bytes = FileWriter.read_newline(path)
+
+        # first pass of a calendar, the timezones are needed to compute the keys and written first
+        timezones: list[bytes] = []
+        if calendar:
+            for kind, data, _ in ContentLineReader(path).components(container):
+                if kind == 'VTIMEZONE':
+                    lines: list[str] = ContentLineReader.split(data)
+                    for vtimezone in self.__builder.build(['BEGIN:VCALENDAR'] + lines + ['END:VCALENDAR']).get_vtimezones():
+                        self.__resolver.register(vtimezone)
+                    timezones.append(data if data.endswith(b'\n') else data + newline)
+
+        with tempfile.TemporaryDirectory(prefix='vmanager-sort-', dir=os.path.dirname(os.path.abspath(output_path))) as directory:
+            # second pass, the records are sorted by runs
+            runs: list[str] = []
+            records: list[tuple[tuple, bytes]] = []
+            size: int = 0
+            for kind, data, _ in ContentLineReader(path).components(container):
+                if kind == 'VTIMEZONE':
+                    continue
+                if not data.endswith(b'\n'):
+                    data += newline
+
+                records.append((self.get_key(kind, ContentLineReader.split(data)), data))
+                size += len(data) + RECORD_OVERHEAD
+                if size >= self.__budget:
+                    runs.append(self.__spill(records, directory, len(runs)))
+                    records = []
+                    size = 0
+
+            # the last records stay in memory, they are merged with the runs on disk
+            records.sort(key=itemgetter(0))
+            self.__run_count = len(runs) + (1 if len(records) > 0 or len(runs) == 0 else 0)
+
+            # too many runs are merged by groups first, the merged run replaces them to keep the order of the file
+            spilled: int = len(runs)
+            while len(runs) >= FAN_IN:
+                merged: Iterator = heapq.merge(*[self.__read_run(run) for run in runs[:FAN_IN]], key=itemgetter(0))
+                runs = [self.__spill(merged, directory, spilled)] + runs[FAN_IN:]
+                spilled += 1
+
+            def write(temporary: str) -> None:
+                with open(temporary, 'wb') as f:
+                    if calendar:
+                        FileWriter.write_header(f, path, newline)
+                        for data in timezones:
+                            f.write(data)
+
+                    # the runs are in the order of the file, a heap keeps it for the records with a same key
+                    for _, data in heapq.merge(*[self.__read_run(run) for run in runs], iter(records), key=itemgetter(0)):
+                        f.write(data)
+                        self.__record_count += 1
+
+                    if calendar:
+                        f.write(b'END:VCALENDAR' + newline)
+
+            FileWriter.write_atomically(output_path, write)
+
+        self.__elapsed = time.perf_counter() - started
+
+    @staticmethod
+    def __spill(records, directory: str, number: int) -> str:
+        """! Method that write sorted records into a run file.
+
+        @param records the records as (key, content), sorted in place when it is a list.
+        @param directory the directory of the runs.
+        @param number the number of the run, used to name its file.
+        @return the path of the run file.
+        """
+        if isinstance(records, list):
+            records.sort(key=itemgetter(0))
+
+        path: str = os.path.join(directory, f"run-{number}.bin")
+        with open(path, 'wb') as f:
+            for record in records:
+                pickle.dump(record, f, pickle.HIGHEST_PROTOCOL)
+        return path
+
+    @staticmethod
+    def __read_run(path: str) -> Iterator[tuple[tuple, bytes]]:
+        """! Method that stream the records of a run file, the file is removed once read.
+
+        @param path the path of the run file.
+        @return an iterator over (key, content).
+        """
+        with open(path, 'rb', buffering=RUN_BUFFER_SIZE) as f:
+            while True:
+                try:
+                    yield pickle.load(f)
+                except EOFError:
+                    break
+        os.remove(path)
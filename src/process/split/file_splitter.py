@@ -0,0 +1,208 @@
+"""! File containing the splitter that cut a VCF or ICS file into smaller files.
+The records are cut on their boundaries without being decoded, the shards are written in parallel.
+
+@author Benjamin PAUMARD
+@version 1.0.0
+@since 19 October 2026
+"""
+
+# importing libs
+import mmap
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+# importing modules
+from process.stream.content_line_reader import ContentLineReader
+from process.writer.file_writer import FileWriter
+
+
+class FileSplitter:
+    """! Class that split a VCF or ICS file into shards.
+    The file is mapped in memory and only the BEGIN and END lines are looked for, the records are copied as they are.
+    The shards are a given number of files of balanced sizes, or files of at most a size or a number of records.
+    The records keep the order of the file, so the shards joined in order give the records of the file.
+    Each shard of a calendar is a complete calendar, with the properties of the calendar, like PRODID, and all its timezones.
+
+    @author Benjamin PAUMARD
+    @version 1.0.0
+    @since 19 October 2026
+    """
+
+    def __init__(self, shards: int = 0, max_bytes: int = 0, max_records: int = 0, workers: int = 0) -> None:
+        """! Constructor of the FileSplitter.
+        The number of shards is used when it is given, otherwise the shards are cut by size and number of records.
+
+        @param shards the number of shards, 0 to cut by size or number of records (optional).
+        @param max_bytes the maximum size of a shard in bytes, 0 for no limit (optional).
+        @param max_records the maximum number of records of a shard, 0 for no limit (optional).
+        @param workers the number of shards written at the same time, 0 for the number of processors (optional).
+        """
+        self.__shards: int = shards
+        self.__max_bytes: int = max_bytes
+        self.__max_records: int = max_records
+        self.__workers: int = workers if workers > 0 else os.cpu_count() or 1
+        self.__record_count: int = 0
+
+    def get_record_count(self) -> int:
+        """! Method to get the number of records split by the last split.
+
+        @return the number of records, the timezones excluded.
+        """
+        return self.__record_count
+
+    @staticmethod
+    def scan(data) -> tuple[bytes, list[tuple[int, int]], list[tuple[int, int]]]:
+        """! Method that find the records of a file.
+        The records are the top level VCARD of a vcf file, or the direct children of the VCALENDAR of an ics file.
+
+        @param data the content of the file, usually mapped in memory.
+        @return the properties of the calendar, empty for a vcf file, and the byte ranges of the timezones and of the other records.
+        """
+        header: bytes = b''
+        timezones: list[tuple[int, int]] = []
+        records: list[tuple[int, int]] = []
+        # depth where the records are, 0 for vcards, 1 inside a vcalendar
+        top: int = 0
+        depth: int = 0
+        start: int = 0
+        # end of the BEGIN:VCALENDAR line, -1 once the properties of the calendar are read
+        properties: int = -1
+        timezone: bool = False
+
+        for begin, name, marker_start, marker_end in ContentLineReader.markers(data):
+            if begin:
+                # BEGIN line, the calendar itself is not a record
+                if depth == 0 and name.strip().upper() == b'VCALENDAR':
+                    top = 1
+                    depth = 1
+                    if header == b'':
+                        properties = marker_end
+                    continue
+
+                if depth == top:
+                    start = marker_start
+                    timezone = top == 1 and name.strip().upper() == b'VTIMEZONE'
+                    # the properties of the calendar are before its first component
+                    if properties >= 0:
+                        header = data[properties:start]
+                        properties = -1
+                depth += 1
+
+            else:
+                # END line
+                depth -= 1
+                if depth == top:
+                    (timezones if timezone else records).append((start, marker_end))
+                elif depth < top:
+                    depth = 0
+
+        return header, timezones, records
+
+    def plan(self, records: list[tuple[int, int]], overhead: int = 0) -> list[list[tuple[int, int]]]:
+        """! Method that group the records into shards.
+
+        @param records the byte ranges of the records, in the order of the file.
+        @param overhead the bytes written in every shard besides its records, like the timezones (optional).
+        @return the byte ranges of the records of each shard.
+        """
+        groups: list[list[tuple[int, int]]] = []
+
+        if self.__shards > 0:
+            # balanced sizes, a shard ends once it reaches its share of the records bytes
+            total: int = sum(end - start for start, end in records)
+            count: int = min(self.__shards, len(records))
+            size: int = 0
+            for index, record in enumerate(records):
+                # every shard gets a record, even when a large record goes beyond the share of a shard
+                if len(groups) == 0 or (len(groups) < count and (size >= total * len(groups) / count
+                                                                 or len(records) - index <= count - len(groups))):
+                    groups.append([])
+                groups[-1].append(record)
+                size += record[1] - record[0]
+            return groups
+
+        size = 0
+        for start, end in records:
+            # a record larger than the limit gets a shard of its own
+            if len(groups) == 0 or (self.__max_bytes > 0 and size + end - start > self.__max_bytes and len(groups[-1]) > 0) \
+                    or (self.__max_records > 0 and len(groups[-1]) >= self.__max_records):
+                groups.append([])
+                size = overhead
+            groups[-1].append((start, end))
+            size += end - start
+        return groups
+
+    def split(self, path: str, directory: str) -> list[str]:
+        """! Method that split a file into shards.
+        The shards are named after the file, like contacts-0001.vcf, each of them is replaced atomically.
+
+        @param path the path of the VCF or ICS file.
+        @param directory the directory of the shards, created if needed.
+        @return the paths of the shards, in the order of the file.
+        """
+        self.__record_count = 0
+        os.makedirs(directory, exist_ok=True)
+        name, extension = os.path.splitext(os.path.basename(path))
+
+        with open(path, 'rb') as f:
+            # an empty file cannot be mapped
+            if os.fstat(f.fileno()).st_size == 0:
+                return []
+
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                header, timezones, records = self.scan(data)
+                calendar: bool = extension.lower() == '.ics'
+                self.__record_count = len(records)
+
+                # the line breaks of the file are used for the lines written
+                newline: bytes = FileWriter.get_newline(data)
+                if calendar and header.strip() == b'':
+                    header = FileWriter.encode_lines(FileWriter.get_header(''), newline)
+
+                overhead: int = sum(end - start for start, end in timezones)
+                if calendar:
+                    overhead += len(header) + len(b'BEGIN:VCALENDAR') + len(b'END:VCALENDAR') + 2 * len(newline)
+                groups: list[list[tuple[int, int]]] = self.plan(records, overhead)
+                paths: list[str] = [os.path.join(directory, f"{name}-{index + 1:04d}{extension}") for index in range(len(groups))]
+
+                # the view avoids copying the records, the writes run without the interpreter lock
+                view: memoryview = memoryview(data)
+
+                def write(shard_path: str, group: list[tuple[int, int]]) -> None:
+                    with open(shard_path, 'wb') as shard:
+                        if calendar:
+                            shard.write(b'BEGIN:VCALENDAR' + newline)
+                            shard.write(header)
+                            for start, end in timezones:
+                                self.__write_record(shard, view, start, end, newline)
+                        for start, end in group:
+                            self.__write_record(shard, view, start, end, newline)
+                        if calendar:
+                            shard.write(b'END:VCALENDAR' + newline)
+
+                try:
+                    with ThreadPoolExecutor(self.__workers) as executor:
+                        futures = [executor.submit(FileWriter.write_atomically, shard_path,
+                                                   lambda temporary, group=group: write(temporary, group))
+                                   for shard_path, group in zip(paths, groups)]
+                        # raise the first error of the writes
+                        for future in futures:
+                            future.result()
+                finally:
+                    view.release()
+
+        return paths
+
+    @staticmethod
+    def __write_record(f, view: memoryview, start: int, end: int, newline: bytes) -> None:
+        """! Method that copy a record into a shard.
+
+        @param f the binary file of the shard.
+        @param view the content of the file.
+        @param start the offset of the record.
+        @param end the end offset of the record.
+        @param newline the line break added when the record has none, like the last record of a file.
+        """
+        f.write(view[start:end])
+        if view[end - 1] != ord('\n'):
+            f.write(newline)
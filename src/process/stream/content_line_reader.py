@@ -0,0 +1,256 @@
+"""! File containing the reader of the content lines of a VCF or ICS file.
+The file is read in binary mode, the lines are unfolded then decoded. The components can also be read as their bytes.
+
+@author Benjamin PAUMARD
+@version 1.0.0
+@since 19 October 2026
+"""
+
+# importing libs
+import codecs
+import mmap
+import os
+import re
+from typing import Iterator
+
+# line break followed by a space or a tab, the next line continues the previous one
+FOLDS: tuple[bytes, ...] = (b'\r\n ', b'\r\n\t', b'\n ', b'\n\t')
+# CHARSET parameter of a property, like ;CHARSET=ISO-8859-1
+CHARSET: re.Pattern = re.compile(rb';CHARSET=("?)([^;:"]*)\1', re.IGNORECASE)
+# BEGIN and END lines, the only lines looked at to cut a file into components
+MARKER: re.Pattern = re.compile(rb'^(BEGIN|END):([^\r\n]*)\r?\n?', re.MULTILINE | re.IGNORECASE)
+# BEGIN and END lines after a line break, looked for much faster than at every line start, like in the long base64 values
+LINE_MARKER: re.Pattern = re.compile(rb'\n(BEGIN|END):([^\r\n]*)', re.IGNORECASE)
+# BEGIN lines of the records, looked for after a line break which is much faster than at every line start
+RECORD: re.Pattern = re.compile(rb'\nBEGIN:(VCARD|VEVENT|VTODO)[ \t]*\r?$', re.MULTILINE | re.IGNORECASE)
+
+
+class ContentLineReader:
+    """! Class that read the content lines of a file.
+    The file is read by large blocks and cut on LF or CRLF. A line starting with a space or a tab continues
+    the previous one (RFC 5545 and RFC 6350 folding), it is joined to it without its first character.
+    The lines are unfolded before being decoded, as UTF-8 unless they have a CHARSET parameter. Empty lines are skipped.
+
+    @author Benjamin PAUMARD
+    @version 1.0.0
+    @since 19 October 2026
+    """
+
+    def __init__(self, path: str, buffer_size: int = 1 << 20) -> None:
+        """! Constructor of the ContentLineReader.
+
+        @param path the path of the file to read.
+        @param buffer_size the number of bytes read at once (optional).
+        """
+        self.__path: str = path
+        self.__buffer_size: int = buffer_size
+
+    def get_path(self) -> str:
+        """! Method to get the path of the file read.
+
+        @return the path of the file.
+        """
+        return self.__path
+
+    @staticmethod
+    def decode(line: bytes) -> str:
+        """! Method that decode a content line.
+        The name and the parameters are ASCII, only the value is decoded with the CHARSET of the line.
+        The CHARSET parameter is removed as the returned value is no longer encoded.
+
+        @param line the unfolded line without its line break.
+        @return the decoded line.
+        """
+        colon: int = line.find(b':')
+        charset = CHARSET.search(line, 0, colon) if colon > 0 else None
+        if charset is None:
+            return line.decode('utf-8', 'replace')
+
+        # decode the value with the given charset, UTF-8 if it is unknown
+        encoding: str = charset.group(2).decode('ascii', 'replace')
+        try:
+            codecs.lookup(encoding)
+        except LookupError:
+            encoding = 'utf-8'
+
+        head: str = (line[:charset.start()] + line[charset.end():colon]).decode('utf-8', 'replace')
+        return f"{head}:{line[colon + 1:].decode(encoding, 'replace')}"
+
+    @staticmethod
+    def split(data: bytes) -> list[str]:
+        """! Method that cut a block of a file into decoded content lines.
+        The block is unfolded at once, then decoded at once unless a line has a CHARSET parameter or is not valid UTF-8.
+
+        @param data the bytes of complete lines.
+        @return the content lines.
+        """
+        # unfold, then keep only LF line breaks
+        for fold in FOLDS:
+            if fold in data:
+                data = data.replace(fold, b'')
+        if b'\r\n' in data:
+            data = data.replace(b'\r\n', b'\n')
+        if data.endswith(b'\r'):
+            data = data[:-1]
+
+        # most blocks are plain UTF-8
+        if CHARSET.search(data) is None:
+            try:
+                return [line for line in data.decode('utf-8').split('\n') if line != '']
+            except UnicodeDecodeError:
+                pass
+
+        return [ContentLineReader.decode(line) for line in data.split(b'\n') if line != b'']
+
+    def lines(self) -> Iterator[str]:
+        """! Method that yield the content lines of the file.
+
+        @return an iterator over the decoded lines, without line breaks.
+        """
+        # the last line of a block may be incomplete or continued by the next block
+        tail: bytes = b''
+
+        with open(self.__path, 'rb') as f:
+            while True:
+                block: bytes = f.read(self.__buffer_size)
+                if len(block) == 0:
+                    break
+                data: bytes = tail + block
+
+                # cut after the last line break followed by a line that is not a continuation
+                end: int = data.rfind(b'\n', 0, len(data) - 1)
+                while end >= 0 and data[end + 1] in b' \t':
+                    end = data.rfind(b'\n', 0, end)
+                end += 1
+
+                yield from self.split(data[:end])
+                tail = data[end:]
+
+        yield from self.split(tail)
+
+    @staticmethod
+    def verbatim(data: bytes) -> str:
+        """! Method that turn the bytes of a component into a text written back unchanged.
+        The bytes that are not valid UTF-8 are kept as surrogates, the file must be written with the surrogateescape error handler.
+
+        @param data the bytes of the component.
+        @return the text of the component, ending with a line break.
+        """
+        if not data.endswith(b'\n'):
+            data += b'\n'
+        return data.decode('utf-8', 'surrogateescape')
+
+    @staticmethod
+    def markers(data, start: int = 0, end: int = -1) -> Iterator[tuple[bool, bytes, int, int]]:
+        """! Method that yield the BEGIN and END lines of a block of a file.
+
+        @param data the content of the block, bytes or a file mapped in memory.
+        @param start the offset where the lines are looked for, at the beginning of a line (optional).
+        @param end the offset where the lines are no longer looked for, at the end of a line, -1 for the end of the data (optional).
+        @return an iterator over whether the line is a BEGIN line, the name after the colon, the offset of the line
+        and the offset after its line break.
+        """
+        if end < 0:
+            end = len(data)
+
+        # the first line has no line break before it
+        if start == 0:
+            first = MARKER.match(data, 0, end)
+            if first is not None:
+                yield len(first.group(1)) == 5, first.group(2), 0, first.end()
+
+        for marker in LINE_MARKER.finditer(data, max(start - 1, 0), end):
+            # the line break is part of the line
+            line_end: int = marker.end()
+            if data[line_end:line_end + 1] == b'\r' and line_end < end:
+                line_end += 1
+            if data[line_end:line_end + 1] == b'\n' and line_end < end:
+                line_end += 1
+            yield len(marker.group(1)) == 5, marker.group(2), marker.start() + 1, line_end
+
+    def components(self, container: str = '') -> Iterator[tuple[str, bytes, int]]:
+        """! Method that yield the top level components of the file with their bytes.
+        Only the BEGIN and END lines are looked at, the nested components are part of their parent.
+        The lines outside of the components, like the properties of the container, are skipped.
+
+        @param container the component containing the others, like VCALENDAR, its children are yielded instead of it (optional).
+        @return an iterator over the names in upper case, the bytes of the components, from their BEGIN line to their END line included,
+        and the offsets of the components in the file.
+        """
+        container = container.upper()
+        # bytes not yielded yet: the unfinished component, or the incomplete last line
+        tail: bytes = b''
+        # offset of the tail in the file
+        base: int = 0
+        # offset in the tail where the markers are looked for
+        position: int = 0
+        # offset of the current component in the tail, -1 outside of the components
+        start: int = -1
+        depth: int = 0
+        top: int = 0
+        kind: str = ''
+
+        with open(self.__path, 'rb') as f:
+            while True:
+                block: bytes = f.read(self.__buffer_size)
+                data: bytes = tail + block
+                # the markers are looked for in complete lines, the whole data is complete at the end of the file
+                end: int = data.rfind(b'\n') + 1 if len(block) > 0 else len(data)
+
+                for begin, marker_name, marker_start, marker_end in self.markers(data, position, end):
+                    if begin:
+                        # BEGIN line, only the names of the top level components are needed
+                        if depth == top:
+                            name: str = marker_name.strip().upper().decode('ascii', 'replace')
+                            # the children of the container are at the top level
+                            if depth == 0 and container != '' and name == container:
+                                top = 1
+                            else:
+                                start = marker_start
+                                kind = name
+                        depth += 1
+
+                    elif depth > 0:
+                        # END line
+                        depth -= 1
+                        if depth == top and start >= 0:
+                            yield kind, data[start:marker_end], base + start
+                            start = -1
+                        elif depth == 0:
+                            top = 0
+
+                # keep the bytes of the unfinished component or of the incomplete line
+                keep: int = start if start >= 0 else end
+                tail = data[keep:]
+                base += keep
+                position = end - keep
+                if start >= 0:
+                    start = 0
+
+                if len(block) == 0:
+                    break
+
+    def count(self) -> dict[str, int]:
+        """! Method that count the records of the file without parsing them.
+        The file is mapped in memory and only the BEGIN lines of the VCARD, VEVENT and VTODO are looked for.
+
+        @return the number of records by name in upper case, the names without records are missing.
+        """
+        counts: dict[str, int] = {}
+
+        with open(self.__path, 'rb') as f:
+            # an empty file cannot be mapped
+            if os.fstat(f.fileno()).st_size == 0:
+                return counts
+
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                # the first line has no line break before it
+                first = RECORD.match(b'\n' + data[:64])
+                if first is not None:
+                    counts[first.group(1).upper().decode('ascii')] = 1
+
+                for marker in RECORD.finditer(data):
+                    name: str = marker.group(1).upper().decode('ascii')
+                    counts[name] = counts.get(name, 0) + 1
+
+        return counts
@@ -0,0 +1,89 @@
+"""! File containing the reader that stream the records of a VCF or ICS file.
+Records are the VCARD of a vcf file or the components of the VCALENDAR of an ics file.
+
+@author Benjamin PAUMARD
+@version 1.0.0
+@since 19 October 2026
+"""
+
+# importing libs
+from typing import Iterator
+
+# importing modules
+from process.stream.content_line_reader import ContentLineReader
+
+
+class RecordReader:
+    """! Class that stream the records of a file without building objects.
+    Only one record is held in memory at a time, the file is cut by the ContentLineReader.
+
+    @author Benjamin PAUMARD
+    @version 1.0.0
+    @since 19 October 2026
+    """
+
+    def __init__(self, path: str) -> None:
+        """! Constructor of the RecordReader.
+
+        @param path the path of the file to read.
+        """
+        self.__path: str = path
+
+    def get_path(self) -> str:
+        """! Method to get the path of the file read.
+
+        @return the path of the file.
+        """
+        return self.__path
+
+    def records(self) -> Iterator[tuple[str, list[str]]]:
+        """! Method that yield the records of the file.
+        The records are the top level VCARD of a vcf file, or the direct children of the VCALENDAR of an ics file.
+        The lines are read like by the builders: unfolded, with LF or CRLF line breaks, and decoded with their CHARSET.
+
+        @return an iterator over (component name, lines of the record), lines contain the BEGIN and END lines.
+        """
+        for name, data, _ in ContentLineReader(self.__path).components('VCALENDAR'):
+            yield name, ContentLineReader.split(data)
+
+    def header(self) -> list[str]:
+        """! Method that returns the properties of the VCALENDAR of an ics file.
+        The properties like VERSION or PRODID are written before the first component.
+
+        @return the unfolded lines of the calendar properties, empty for a vcf file.
+        """
+        lines: list[str] = []
+
+        for line in ContentLineReader(self.__path).lines():
+            upper: str = line.strip().upper()
+
+            # skip the beginning of the calendar
+            if upper == "BEGIN:VCALENDAR":
+                continue
+
+            # stop at the first component
+            if upper.startswith("BEGIN:") or upper.startswith("END:"):
+                break
+
+            lines.append(line)
+
+        return lines
+
+    @staticmethod
+    def get_property(lines: list[str], name: str) -> str:
+        """! Method that returns the value of the first property of a record with a given name.
+        Parameters of the property are ignored, nested components are searched as well.
+
+        @param lines the lines of the record.
+        @param name the name of the property, like UID.
+        @return the value of the property, an empty string if not found.
+        """
+        name = name.upper()
+        size: int = len(name)
+
+        for line in lines:
+            # the name is followed by parameters or by the value
+            if line[:size].upper() == name and line[size:size + 1] in (':', ';'):
+                return line[line.find(':', size) + 1:] if ':' in line[size:] else ''
+
+        return ''
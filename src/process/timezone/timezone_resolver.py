@@ -0,0 +1,94 @@
+"""! File containing the resolver of the TZID parameters.
+TZID values are turned into tzinfo objects, using the VTIMEZONE of the file or the zoneinfo database.
+
+@author Benjamin PAUMARD
+@version 1.0.0
+@since 19 October 2026
+"""
+
+# importing libs
+from datetime import datetime, timezone, tzinfo
+
+# importing modules
+from data.ics.vtimezone import VTimezone
+
+
+class TimezoneResolver:
+    """! Class that resolve TZID parameters into tzinfo objects.
+    Each TZID is resolved once, the tzinfo objects of the zoneinfo database are shared by every resolver.
+
+    @author Benjamin PAUMARD
+    @version 1.0.0
+    @since 19 October 2026
+    """
+
+    # tzinfo objects from the zoneinfo database, shared by every resolver
+    __shared_cache: dict[str, tzinfo | None] = {'UTC': timezone.utc, 'Z': timezone.utc}
+
+    def __init__(self, vtimezones: list[VTimezone] = []) -> None:
+        """! Constructor of the TimezoneResolver.
+        The timezones embedded in a file take precedence over the zoneinfo database.
+
+        @param vtimezones the timezones of the calendar (optional).
+        """
+        self.__vtimezones: dict[str, VTimezone] = {}
+        for vtimezone in vtimezones:
+            self.register(vtimezone)
+
+    @staticmethod
+    def clean_tzid(tzid: str) -> str:
+        """! Method that clean a TZID as written in a file.
+        Quotes and the leading slash of globally unique ids are removed.
+
+        @param tzid the raw TZID.
+        @return the cleaned TZID.
+        """
+        return tzid.strip().strip('"').lstrip('/')
+
+    def register(self, vtimezone: VTimezone) -> None:
+        """! Method to register a timezone embedded in a calendar.
+        The timezone will be used for its TZID instead of the zoneinfo database.
+
+        @param vtimezone the timezone to register.
+        """
+        self.__vtimezones[self.clean_tzid(vtimezone.get_tzid())] = vtimezone
+
+    def resolve(self, tzid: str) -> tzinfo | None:
+        """! Method that returns the tzinfo of a TZID.
+        The result of the zoneinfo database is cached, unknown TZID are cached as well.
+
+        @param tzid the TZID to resolve.
+        @return a tzinfo object, None if the TZID is empty or unknown.
+        """
+        if tzid == '':
+            return None
+
+        tzid = self.clean_tzid(tzid)
+
+        # timezones of the calendar first
+        vtimezone: VTimezone | None = self.__vtimezones.get(tzid)
+        if vtimezone is not None:
+            return vtimezone
+
+        # then the shared cache, filled from the zoneinfo database
+        if tzid not in TimezoneResolver.__shared_cache:
+            # the database is only loaded when a file uses a TZID, it is slow to import
+            from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+            try:
+                TimezoneResolver.__shared_cache[tzid] = ZoneInfo(tzid)
+            except (ZoneInfoNotFoundError, ValueError):
+                TimezoneResolver.__shared_cache[tzid] = None
+
+        return TimezoneResolver.__shared_cache[tzid]
+
+    def to_utc(self, dt: datetime, tzid: str = '') -> datetime:
+        """! Method that convert a datetime into an aware UTC datetime.
+        Naive datetimes without known timezone are considered as UTC.
+
+        @param dt the datetime to convert.
+        @param tzid the TZID of the datetime (optional).
+        @return the UTC datetime.
+        """
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=self.resolve(tzid) or timezone.utc)
+        return dt.astimezone(timezone.utc)
@@ -0,0 +1,138 @@
+"""! File containing the watcher of the changes of a file.
+On Linux, inotify is used to wake up as soon as the file changes, other systems poll the file.
+
+@author Benjamin PAUMARD
+@version 1.0.0
+@since 19 October 2026
+"""
+
+# importing libs
+import os
+import select
+import threading
+import time
+from typing import Callable
+
+# inotify is only available on Linux, it is reached through the C library
+try:
+    import ctypes
+    import ctypes.util
+    libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+    libc.inotify_init1
+    libc.inotify_add_watch
+except (ImportError, OSError, AttributeError):
+    libc = None
+
+# inotify events meaning a file of the directory has been written, moved in or created
+IN_MODIFY: int = 0x002
+IN_CLOSE_WRITE: int = 0x008
+IN_MOVED_TO: int = 0x080
+IN_CREATE: int = 0x100
+IN_NONBLOCK: int = 0o4000
+
+
+class FileWatcher:
+    """! Class that detect the changes of a file.
+    A change is a new modification time, size or inode, so files replaced by a rename are detected too.
+    The directory is watched rather than the file, editors often replace the file instead of writing it.
+
+    @author Benjamin PAUMARD
+    @version 1.0.0
+    @since 19 October 2026
+    """
+
+    def __init__(self, path: str, interval: float = 1.0, use_inotify: bool = True) -> None:
+        """! Constructor of the FileWatcher.
+
+        @param path the path of the file to watch.
+        @param interval the time between two checks when polling, in seconds (optional).
+        @param use_inotify whether inotify can be used when available (optional).
+        """
+        self.__path: str = os.path.abspath(path)
+        self.__interval: float = interval
+        self.__signature: tuple[int, int, int] | None = self.get_signature()
+        self.__fd: int = -1
+
+        # watch the directory with inotify when possible
+        if use_inotify and libc is not None:
+            fd: int = libc.inotify_init1(IN_NONBLOCK)
+            if fd >= 0:
+                directory: bytes = os.fsencode(os.path.dirname(self.__path))
+                if libc.inotify_add_watch(fd, directory, IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE) >= 0:
+                    self.__fd = fd
+                else:
+                    os.close(fd)
+
+    def uses_inotify(self) -> bool:
+        """! Method that returns whether the watcher uses inotify.
+
+        @return True if inotify is used, False if the file is polled.
+        """
+        return self.__fd >= 0
+
+    def get_signature(self) -> tuple[int, int, int] | None:
+        """! Method that returns what identifies the current version of the file.
+
+        @return the modification time, size and inode of the file, None if it does not exist.
+        """
+        try:
+            stat: os.stat_result = os.stat(self.__path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+    def has_changed(self) -> bool:
+        """! Method that check without waiting whether the file changed since the last check.
+
+        @return True if the file changed.
+        """
+        signature: tuple[int, int, int] | None = self.get_signature()
+        if signature == self.__signature:
+            return False
+        self.__signature = signature
+        return True
+
+    def wait(self, timeout: float) -> bool:
+        """! Method that wait for a change of the file.
+
+        @param timeout the maximum time to wait, in seconds.
+        @return True if the file changed, False if the timeout expired.
+        """
+        deadline: float = time.monotonic() + timeout
+
+        while True:
+            if self.has_changed():
+                return True
+
+            remaining: float = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+
+            if self.__fd >= 0:
+                # wake up on any event of the directory, then check the file itself
+                readable, _, _ = select.select([self.__fd], [], [], remaining)
+                if len(readable) > 0:
+                    try:
+                        while len(os.read(self.__fd, 65536)) > 0:
+                            pass
+                    except BlockingIOError:
+                        pass
+            else:
+                time.sleep(min(self.__interval, remaining))
+
+    def watch(self, callback: Callable[[], None], stop: threading.Event) -> None:
+        """! Method that call a function on each change of the file until it is stopped.
+        It is meant to run in its own thread.
+
+        @param callback the function to call.
+        @param stop the event stopping the watch.
+        """
+        while not stop.is_set():
+            if self.wait(self.__interval):
+                callback()
+
+    def close(self) -> None:
+        """! Method that release the inotify descriptor."""
+        if self.__fd >= 0:
+            os.close(self.__fd)
+            self.__fd = -1
@@ -0,0 +1,269 @@
+"""! File containing the loader that keep a manager up to date with its file.
+Only the components that changed since the last load are parsed again.
+
+@author Benjamin PAUMARD
+@version 1.0.0
+@since 19 October 2026
+"""
+
+# importing libs
+import hashlib
+import threading
+from typing import Callable
+
+# importing modules
+from process.manager.vcf_manager import VCFManager
+from process.manager.ics_manager import ICSManager
+from process.builder.vcard_builder import VCardBuilder
+from process.builder.vcalendar_builder import VCalendarBuilder
+from process.stream.content_line_reader import ContentLineReader
+
+# number of components built between two progress reports
+CHUNK: int = 1000
+
+
+class IncrementalLoader:
+    """! Class that load a file into a manager and reload it incrementally.
+    The file is cut into components (VCARD, or the direct children of VCALENDAR) by their byte ranges,
+    each component is identified by the hash of its bytes. A component with a known hash reuses the object
+    built the previous time, only the new hashes are parsed. The lists of the manager are updated in place.
+
+    @author Benjamin PAUMARD
+    @version 1.0.0
+    @since 19 October 2026
+    """
+
+    def __init__(self, manager: VCFManager | ICSManager, path: str,
+                 progress: Callable[[int, int, list], None] | None = None, stop: threading.Event | None = None) -> None:
+        """! Constructor of the IncrementalLoader.
+        The file is loaded into the manager.
+
+        @param manager the manager to keep up to date.
+        @param path the path of the VCF or ICS file.
+        @param progress the function called after each chunk of components, see refresh (optional).
+        @param stop the event cancelling the load, see refresh (optional).
+        """
+        self.__manager: VCFManager | ICSManager = manager
+        self.__path: str = path
+        # components of the last load: (hash, kind, record), the record is None for timezones and unknown components
+        self.__components: list[tuple[bytes, str, object]] = []
+        # hash of the timezones of the last load, a change of them resolves every element again
+        self.__timezones_hash: bytes = b''
+        self.__parsed_count: int = 0
+        # hash of the whole file at the last load
+        self.__digest: str = ''
+
+        self.__manager.set_path(path)
+        self.refresh(progress, stop)
+
+    def get_digest(self) -> str:
+        """! Method that returns the hash of the file at the last load.
+
+        @return the hash as an hexadecimal string.
+        """
+        return self.__digest
+
+    def get_parsed_count(self) -> int:
+        """! Method that returns the number of components parsed by the last refresh.
+
+        @return the number of components parsed.
+        """
+        return self.__parsed_count
+
+    @staticmethod
+    def get_lines(data: bytes, start: int, end: int) -> list[str]:
+        """! Method that decode the lines of a component, like the managers read them.
+
+        @param data the content of the file.
+        @param start the offset of the component.
+        @param end the end offset of the component.
+        @return the unfolded lines without line breaks.
+        """
+        return ContentLineReader.split(data[start:end])
+
+    def scan(self) -> tuple[bytes, list[tuple[int, int, bytes, str]], bytes]:
+        """! Method that cut the file into components.
+        Only the BEGIN and END lines are looked at, the lines of a component are decoded when it is parsed.
+
+        @return the content of the file, the components as (start offset, end offset, hash, kind),
+        and the hash of the timezones.
+        """
+        components: list[tuple[int, int, bytes, str]] = []
+        timezones = hashlib.blake2b(digest_size=16)
+        # the VCARD are at the top level, the calendar components are in the VCALENDAR
+        top: int = 0 if isinstance(self.__manager, VCFManager) else 1
+
+        with open(self.__path, 'rb') as f:
+            data: bytes = f.read()
+
+        depth: int = 0
+        start: int = 0
+        kind: str = ''
+
+        for begin, name, marker_start, marker_end in ContentLineReader.markers(data):
+            if begin:
+                # BEGIN line
+                if depth == top:
+                    start = marker_start
+                    kind = name.strip().upper().decode('ascii', 'replace')
+                depth += 1
+
+            else:
+                # END line
+                depth -= 1
+                if depth == top:
+                    end: int = marker_end
+                    digest: bytes = hashlib.blake2b(data[start:end], digest_size=16).digest()
+                    components.append((start, end, digest, kind))
+                    if kind == 'VTIMEZONE':
+                        timezones.update(digest)
+
+        return data, components, timezones.digest()
+
+    def refresh(self, progress: Callable[[int, int, list], None] | None = None,
+                stop: threading.Event | None = None) -> tuple[list, list]:
+        """! Method that load the changes of the file into the manager.
+        The components are built by chunks, the progress is reported and the stop event checked after each of them.
+        The chunks are built aside, the manager and the loader are only updated after the last one,
+        so a cancelled refresh leaves them as they were.
+
+        @param progress the function called with the bytes consumed, the size of the file and the records of the chunk
+        (optional).
+        @param stop the event cancelling the refresh, it can be set from another thread (optional).
+        @return the records added and the records removed, a modified record is both removed and added.
+        """
+        data, components, timezones_hash = self.scan()
+        known, new_components, to_parse = self.__match(components)
+
+        # build the new records by chunks, a calendar always builds at least one to keep its timezones
+        chunks: list[list[int]] = [to_parse[first:first + CHUNK] for first in range(0, len(to_parse), CHUNK)]
+        if len(chunks) == 0 and isinstance(self.__manager, ICSManager):
+            chunks.append([])
+
+        vtimezones: list = []
+        for chunk in chunks:
+            if stop is not None and stop.is_set():
+                return [], []
+
+            if isinstance(self.__manager, VCFManager):
+                self.__build_vcards(data, components, new_components, chunk)
+            else:
+                vtimezones = self.__build_calendar_components(data, components, new_components, chunk)
+
+            if progress is not None:
+                consumed: int = components[chunk[-1]][1] if len(chunk) > 0 else len(data)
+                records: list = [new_components[index][2] for index in chunk if new_components[index][2] is not None]
+                progress(consumed, len(data), records)
+
+        # every record of the last load not reused has been removed
+        removed: list = [record for records in known.values() for record in records if record is not None]
+        added: list = [new_components[index][2] for index in to_parse if new_components[index][2] is not None]
+
+        self.__update_manager(new_components, vtimezones, timezones_hash)
+        self.__components = new_components
+        self.__timezones_hash = timezones_hash
+        self.__parsed_count = len(to_parse)
+        self.__digest = hashlib.blake2b(data, digest_size=8).hexdigest()
+        return added, removed
+
+    def __match(self, components: list[tuple[int, int, bytes, str]]) -> tuple[dict[bytes, list], list, list[int]]:
+        """! Method that match the components of the file with the ones of the last load by their hash.
+
+        @param components the components of the file.
+        @return the records of the last load not reused by hash, the components with the reused records,
+        and the indexes of the components to build.
+        """
+        # records of the last load, by hash, in the order of the file
+        known: dict[bytes, list] = {}
+        for digest, _, record in self.__components:
+            known.setdefault(digest, []).append(record)
+
+        # components to parse, the others reuse their record
+        new_components: list[tuple[bytes, str, object]] = []
+        to_parse: list[int] = []
+        for index, (_, _, digest, kind) in enumerate(components):
+            records: list | None = known.get(digest)
+            if records is not None and len(records) > 0:
+                new_components.append((digest, kind, records.pop(0)))
+            else:
+                new_components.append((digest, kind, None))
+                to_parse.append(index)
+
+        return known, new_components, to_parse
+
+    def __update_manager(self, new_components: list, vtimezones: list, timezones_hash: bytes) -> None:
+        """! Method that replace the records of the manager by the ones of the refresh, the lists are updated in place.
+
+        @param new_components the components of the file with their record.
+        @param vtimezones the timezones of the file, for a calendar.
+        @param timezones_hash the hash of the timezones of the file.
+        """
+        if isinstance(self.__manager, VCFManager):
+            self.__manager.get_vcards()[:] = [record for _, kind, record in new_components
+                                              if kind == 'VCARD' and record is not None]
+            return
+
+        self.__manager.get_vevents()[:] = [record for _, kind, record in new_components
+                                           if kind == 'VEVENT' and record is not None]
+        self.__manager.get_vtodos()[:] = [record for _, kind, record in new_components
+                                          if kind == 'VTODO' and record is not None]
+        # the timezones are kept by the calendar
+        self.__manager.get_vtimezones()[:] = vtimezones
+
+        # the reused elements must be resolved again when the timezones of the file changed
+        if timezones_hash != self.__timezones_hash and len(self.__components) > 0:
+            VCalendarBuilder.resolve_timezones(self.__manager.get_vcalendar())
+
+    @staticmethod
+    def __build_vcards(data: bytes, components: list, new_components: list, to_parse: list[int]) -> None:
+        """! Method that build changed cards.
+
+        @param data the content of the file.
+        @param components the components of the file.
+        @param new_components the components with their record, updated in place.
+        @param to_parse the indexes of the components to build.
+        """
+        builder: VCardBuilder = VCardBuilder()
+        for index in to_parse:
+            digest, kind, _ = new_components[index]
+            if kind == 'VCARD':
+                # like the manager, the card keeps its text
+                vcard = builder.build_verbatim(data[components[index][0]:components[index][1]])
+                new_components[index] = (digest, kind, vcard)
+
+    def __build_calendar_components(self, data: bytes, components: list, new_components: list, to_parse: list[int]) -> list:
+        """! Method that build changed components of a calendar.
+        The events and todos are built at once, with the timezones of the file to resolve their TZID.
+
+        @param data the content of the file.
+        @param components the components of the file.
+        @param new_components the components with their record, updated in place.
+        @param to_parse the indexes of the components to build.
+        @return the timezones of the file.
+        """
+        lines: list[str] = ['BEGIN:VCALENDAR']
+        for start, end, _, kind in components:
+            if kind == 'VTIMEZONE':
+                lines.extend(self.get_lines(data, start, end))
+        for index in to_parse:
+            if components[index][3] in ('VEVENT', 'VTODO'):
+                lines.extend(self.get_lines(data, components[index][0], components[index][1]))
+        lines.append('END:VCALENDAR')
+
+        vcalendar = VCalendarBuilder().build(lines)
+        vevents = iter(vcalendar.get_vevents())
+        vtodos = iter(vcalendar.get_vtodos())
+
+        # the records are built in the order of their components, they keep their text to be saved as is
+        for index in to_parse:
+            digest, kind, _ = new_components[index]
+            record = None
+            if kind == 'VEVENT':
+                record = next(vevents, None)
+            elif kind == 'VTODO':
+                record = next(vtodos, None)
+            if record is not None:
+                record.set_raw(ContentLineReader.verbatim(data[components[index][0]:components[index][1]]))
+                new_components[index] = (digest, kind, record)
+
+        return vcalendar.get_vtimezones()
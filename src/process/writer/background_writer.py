@@ -0,0 +1,100 @@
+"""! File containing the writer saving and exporting files in the background.
+The files are written by a thread, so the GUI is not blocked while a large file is written.
+
+@author Benjamin PAUMARD
+@version 1.0.0
+@since 19 October 2026
+"""
+
+# importing libs
+import queue
+import threading
+from typing import Callable
+
+# importing modules
+from process.writer.file_writer import FileWriter
+
+
+class BackgroundWriter:
+    """! Class that write files in its own thread.
+    The writes of a same path are coalesced: a write requested while another one is waiting replaces it,
+    only the latest is done. A file is written atomically by the FileWriter, so it is never left half written.
+    The results are queued and read by the caller when it wants.
+
+    @author Benjamin PAUMARD
+    @version 1.0.0
+    @since 19 October 2026
+    """
+
+    def __init__(self) -> None:
+        """! Constructor of the BackgroundWriter.
+        The thread is started by the first write.
+        """
+        # waiting writes by path, in the order of their first request
+        self.__pending: dict[str, Callable[[str], None]] = {}
+        # path being written
+        self.__writing: str = ''
+        self.__condition: threading.Condition = threading.Condition()
+        # results of the writes: (path, error), the error is None on success
+        self.__results: queue.Queue = queue.Queue()
+        self.__thread: threading.Thread | None = None
+
+    def submit(self, path: str, write: Callable[[str], None]) -> None:
+        """! Method that request the write of a file.
+
+        @param path the path of the file.
+        @param write the function writing the content into the path it is given, like the save method of a manager.
+        """
+        with self.__condition:
+            self.__pending[path] = write
+            if self.__thread is None:
+                self.__thread = threading.Thread(target=self.run, daemon=True)
+                self.__thread.start()
+            self.__condition.notify_all()
+
+    def is_pending(self, path: str) -> bool:
+        """! Method that returns whether a file is waiting to be written or being written.
+
+        @param path the path of the file.
+        @return True if the file has not been written yet.
+        """
+        with self.__condition:
+            return path in self.__pending or self.__writing == path
+
+    def flush(self) -> None:
+        """! Method that wait until every requested write is done."""
+        with self.__condition:
+            while len(self.__pending) > 0 or self.__writing != '':
+                self.__condition.wait()
+
+    def get_results(self) -> list[tuple[str, Exception | None]]:
+        """! Method that returns the results of the writes done since the last call.
+
+        @return the path of each written file with its error, None if the write succeeded.
+        """
+        results: list[tuple[str, Exception | None]] = []
+        while True:
+            try:
+                results.append(self.__results.get_nowait())
+            except queue.Empty:
+                return results
+
+    def run(self) -> None:
+        """! Method that write the files, it runs in the thread of the writer."""
+        while True:
+            with self.__condition:
+                while len(self.__pending) == 0:
+                    # wake up the callers waiting for the writes
+                    self.__writing = ''
+                    self.__condition.notify_all()
+                    self.__condition.wait()
+                # oldest waiting path first
+                path: str = next(iter(self.__pending))
+                write: Callable[[str], None] = self.__pending.pop(path)
+                self.__writing = path
+
+            try:
+                FileWriter.write_atomically(path, write)
+                self.__results.put((path, None))
+            except Exception as e:
+                self.__results.put((path, e))
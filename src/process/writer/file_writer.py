@@ -0,0 +1,128 @@
+"""! File containing the helpers shared by the commands writing VCF or ICS files.
+The written files keep the line breaks and the calendar properties of the file they come from.
+
+@author Benjamin PAUMARD
+@version 1.0.0
+@since 19 October 2026
+"""
+
+# importing libs
+import os
+import shutil
+from typing import Callable
+
+# importing modules
+from process.stream.record_reader import RecordReader
+
+# calendar properties written when the calendar has none
+DEFAULT_HEADER: list[str] = ["VERSION:2.0", "PRODID:-//XYZproduct//EN"]
+# number of bytes read to find the line breaks of a file
+NEWLINE_SAMPLE_SIZE: int = 1 << 16
+
+
+class FileWriter:
+    """! Class that gather the ways the files are written.
+    A file is written into a temporary file of its directory then renamed over the original, so it is never left half
+    written. The line breaks of a file are the ones of its beginning, the beginning of a calendar is the properties
+    of another calendar, or the default ones.
+
+    @author Benjamin PAUMARD
+    @version 1.0.0
+    @since 19 October 2026
+    """
+
+    @staticmethod
+    def get_newline(data: bytes) -> bytes:
+        """! Method that returns the line break used by a content.
+
+        @param data the content, only its beginning is looked at.
+        @return CRLF when the content uses it, LF otherwise.
+        """
+        return b'\r\n' if b'\r\n' in data[:NEWLINE_SAMPLE_SIZE] else b'\n'
+
+    @classmethod
+    def read_newline(cls, path: str) -> bytes:
+        """! Method that returns the line break used by a file.
+
+        @param path the path of the file.
+        @return CRLF when the file uses it, LF otherwise.
+        """
+        with open(path, 'rb') as f:
+            return cls.get_newline(f.read(NEWLINE_SAMPLE_SIZE))
+
+    @staticmethod
+    def get_header(path: str) -> list[str]:
+        """! Method that returns the properties of a calendar, like VERSION and PRODID.
+
+        @param path the path of the calendar, an empty path gives the default properties.
+        @return the unfolded lines of the properties, the default ones when the calendar has none.
+        """
+        header: list[str] = RecordReader(path).header() if path != '' else []
+        return header if len(header) > 0 else list(DEFAULT_HEADER)
+
+    @staticmethod
+    def encode_lines(lines: list[str], newline: bytes) -> bytes:
+        """! Method that encode lines, each of them ends with a line break.
+
+        @param lines the lines to encode.
+        @param newline the line break to use.
+        @return the lines encoded in UTF-8.
+        """
+        return b''.join(line.encode('utf-8') + newline for line in lines)
+
+    @classmethod
+    def write_header(cls, f, path: str, newline: bytes) -> None:
+        """! Method that write the beginning of a calendar with the properties of another one.
+
+        @param f the binary file to write.
+        @param path the path of the calendar whose properties are used, an empty path uses the default ones.
+        @param newline the line break to use.
+        """
+        f.write(b'BEGIN:VCALENDAR' + newline)
+        f.write(cls.encode_lines(cls.get_header(path), newline))
+
+    @staticmethod
+    def get_temporary_path(path: str) -> str:
+        """! Method that returns the temporary file of a file.
+        The temporary file is in the same directory, so its rename is atomic.
+
+        @param path the path of the file.
+        @return the path of the temporary file.
+        """
+        return f"{path}.{os.getpid()}.tmp"
+
+    @staticmethod
+    def replace(temporary: str, path: str) -> None:
+        """! Method that rename a temporary file over a file.
+
+        @param temporary the path of the written temporary file.
+        @param path the path of the file.
+        """
+        # keep the permissions of the replaced file
+        if os.path.exists(path):
+            shutil.copymode(path, temporary)
+        os.replace(temporary, path)
+
+    @staticmethod
+    def remove(temporary: str) -> None:
+        """! Method that remove a temporary file left by a failed write.
+
+        @param temporary the path of the temporary file.
+        """
+        if os.path.exists(temporary):
+            os.remove(temporary)
+
+    @classmethod
+    def write_atomically(cls, path: str, write: Callable[[str], None]) -> None:
+        """! Method that write a file through a temporary file renamed over it.
+
+        @param path the path of the file.
+        @param write the function writing the content into the path it is given.
+        """
+        temporary: str = cls.get_temporary_path(path)
+        try:
+            write(temporary)
+            cls.replace(temporary, path)
+        except BaseException:
+            cls.remove(temporary)
+            raise
@@ -0,0 +1,14 @@
+"""! File containing the configuration of the tests.
+The modules are imported from the src directory, like the commands do.
+
+@author Benjamin PAUMARD
+@version 1.0.0
+@since 19 October 2026
+"""
+
+# importing libs
+import os
+import sys
+
+# the modules of the application are imported from src
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
@@ -0,0 +1,119 @@
+"""! File containing the tests of the writes done in the background.
+The writes of a same path are coalesced, a failed write leaves the file as it was and is reported.
+
+@author Benjamin PAUMARD
+@version 1.0.0
+@since 19 October 2026
+"""
+
+# importing libs
+import io
+import os
+import stat
+import threading
+
+import pytest
+
+# importing modules
+from process.manager.vcf_manager import VCFManager
+from process.writer.background_writer import BackgroundWriter
+from process.writer.file_writer import FileWriter
+
+
+def write_text(text: str):
+    def write(temporary: str) -> None:
+        with open(temporary, 'w') as f:
+            f.write(text)
+    return write
+
+
+def test_waiting_writes_of_a_path_are_coalesced(tmp_path):
+    first: str = str(tmp_path / 'first.txt')
+    second: str = str(tmp_path / 'second.txt')
+    started: threading.Event = threading.Event()
+    release: threading.Event = threading.Event()
+    written: list[str] = []
+
+    def blocking(temporary: str) -> None:
+        started.set()
+        release.wait()
+        write_text('first')(temporary)
+
+    def versioned(text: str):
+        def write(temporary: str) -> None:
+            written.append(text)
+            write_text(text)(temporary)
+        return write
+
+    writer: BackgroundWriter = BackgroundWriter()
+    writer.submit(first, blocking)
+    started.wait()
+    # the second file waits for the first one, only its latest content is written
+    writer.submit(second, versioned('old'))
+    writer.submit(second, versioned('new'))
+    assert writer.is_pending(first) and writer.is_pending(second)
+    release.set()
+    writer.flush()
+
+    assert written == ['new']
+    assert not writer.is_pending(second)
+    with open(second) as f:
+        assert f.read() == 'new'
+    assert writer.get_results() == [(first, None), (second, None)]
+    assert writer.get_results() == []
+
+
+def test_failed_write_keeps_the_file_and_is_reported(tmp_path):
+    path: str = str(tmp_path / 'contacts.vcf')
+    with open(path, 'w') as f:
+        f.write('original')
+    os.chmod(path, 0o600)
+
+    def failing(temporary: str) -> None:
+        write_text('half')(temporary)
+        raise OSError('disk full')
+
+    writer: BackgroundWriter = BackgroundWriter()
+    writer.submit(path, failing)
+    writer.flush()
+
+    results = writer.get_results()
+    assert len(results) == 1 and results[0][0] == path and isinstance(results[0][1], OSError)
+    with open(path) as f:
+        assert f.read() == 'original'
+    assert os.listdir(tmp_path) == ['contacts.vcf']
+
+    # a successful write replaces the file and keeps its permissions
+    writer.submit(path, write_text('saved'))
+    writer.flush()
+    assert writer.get_results() == [(path, None)]
+    with open(path) as f:
+        assert f.read() == 'saved'
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+
+
+def test_interrupted_write_removes_the_temporary_file(tmp_path):
+    path: str = str(tmp_path / 'contacts.vcf')
+
+    def interrupted(temporary: str) -> None:
+        write_text('half')(temporary)
+        raise KeyboardInterrupt()
+
+    with pytest.raises(KeyboardInterrupt):
+        FileWriter.write_atomically(path, interrupted)
+    assert os.listdir(tmp_path) == []
+
+
+def test_rendered_content_matches_the_saved_file(tmp_path):
+    path: str = str(tmp_path / 'contacts.vcf')
+    with open(path, 'wb') as f:
+        f.write(b'BEGIN:VCARD\r\nVERSION:3.0\r\nFN:Ren\xc3\xa9\r\nN:Ren\xc3\xa9;;;;\r\nEND:VCARD\r\n')
+    manager: VCFManager = VCFManager()
+    manager.read(path)
+
+    # the GUI renders the content before it is written in the background
+    content: io.StringIO = io.StringIO(newline='')
+    manager.write(content)
+    manager.save(str(tmp_path / 'saved.vcf'))
+    with open(tmp_path / 'saved.vcf', 'rb') as f:
+        assert content.getvalue().encode('utf-8', errors='surrogateescape') == f.read()
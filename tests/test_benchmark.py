@@ -0,0 +1,35 @@
+"""! File containing the tests of the benchmark suite.
+The generated files are seeded and every benchmark runs on small files.
+
+@author Benjamin PAUMARD
+@version 1.0.0
+@since 19 October 2026
+"""
+
+# importing modules
+from benchmark.benchmark_comparator import BenchmarkComparator
+from benchmark.benchmark_runner import BenchmarkRunner
+from benchmark.ics_generator import ICSGenerator
+from benchmark.vcf_generator import VCFGenerator
+
+
+def test_generators_are_seeded(tmp_path):
+    for name, generator in (('vcf', VCFGenerator), ('ics', ICSGenerator)):
+        generator(7).generate(str(tmp_path / f"first.{name}"), 20, 3)
+        generator(7).generate(str(tmp_path / f"second.{name}"), 20, 3)
+        assert (tmp_path / f"first.{name}").read_bytes() == (tmp_path / f"second.{name}").read_bytes()
+
+
+def test_every_benchmark_runs():
+    results: dict = BenchmarkRunner(size=20, richness=3, repeat=1).run()['results']
+
+    assert {'vcf.read', 'vcf.save', 'ics.read', 'ics.export_html'} <= set(results)
+    assert all(result['seconds'] > 0 for result in results.values())
+
+
+def test_comparator_flags_the_slowdowns():
+    base: dict = {'results': {'read': {'seconds': 1.0}, 'save': {'seconds': 1.0}, 'noise': {'seconds': 0.001}}}
+    new: dict = {'results': {'read': {'seconds': 1.5}, 'save': {'seconds': 1.05}, 'noise': {'seconds': 0.01}}}
+    rows: list = BenchmarkComparator(0.1).compare(base, new)
+
+    assert [(name, slowdown) for name, _, _, _, slowdown in rows] == [('read', True), ('save', False), ('noise', False)]
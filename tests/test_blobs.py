@@ -0,0 +1,101 @@
+"""! File containing the tests of the photos, logos and sounds of the contacts.
+The values are only decoded when their data is asked for, and can be extracted into files.
+
+@author Benjamin PAUMARD
+@version 1.0.0
+@since 19 October 2026
+"""
+
+# importing libs
+import base64
+import os
+
+# importing modules
+import data.vcf.blob
+from cli import CLI
+from process.builder.vcard_builder import VCardBuilder
+from process.extract.blob_extractor import BlobExtractor
+from process.manager.vcf_manager import VCFManager
+
+PHOTO: bytes = bytes(range(256)) * 4
+LOGO: bytes = b'\x89PNG logo'
+
+
+def fold(line: str) -> str:
+    """! Function that fold a line at 75 characters, like the vcard writers.
+
+    @param line the line to fold.
+    @return the folded line with CRLF line breaks.
+    """
+    return '\r\n '.join(line[index:index + 75] for index in range(0, len(line), 75)) + '\r\n'
+
+
+def vcard(name: str, *properties: str) -> str:
+    return f"BEGIN:VCARD\r\nVERSION:3.0\r\nFN:{name}\r\nN:{name};;;;\r\n" + ''.join(properties) + "END:VCARD\r\n"
+
+
+def test_blobs_are_decoded_on_demand(monkeypatch):
+    # the decoded values
+    decoded: list[str] = []
+    b64decode = base64.b64decode
+    monkeypatch.setattr(data.vcf.blob.base64, 'b64decode', lambda value: decoded.append(value) or b64decode(value))
+
+    text: str = vcard('Alice', fold(f"PHOTO;ENCODING=b;TYPE=JPEG:{base64.b64encode(PHOTO).decode()}"))
+    card = VCardBuilder().build_verbatim(text.encode())
+    blob = card.get_blobs()[0]
+
+    # the card is built without decoding the photo, the blob references the text of the card
+    assert decoded == []
+    assert (blob.get_kind(), blob.get_media_type(), blob.get_extension()) == ('PHOTO', 'jpeg', 'jpeg')
+    value: str = text[blob.get_offset():blob.get_offset() + blob.get_length()]
+    assert value.replace('\r\n ', '') == blob.get_value() == base64.b64encode(PHOTO).decode()
+    assert blob.get_data() == PHOTO
+    assert len(decoded) == 1
+
+
+def test_data_uri_and_uri_values():
+    text: str = vcard('Alice', f"LOGO:data:image/png;base64,{base64.b64encode(LOGO).decode()}\r\n",
+                      "SOUND;VALUE=uri:https://example.com/alice.ogg\r\n")
+    logo, sound = VCardBuilder().build_verbatim(text.encode()).get_blobs()
+
+    assert (logo.is_inline(), logo.get_media_type(), logo.get_data()) == (True, 'image/png', LOGO)
+    assert (sound.is_inline(), sound.get_data()) == (False, b'')
+    assert sound.get_value() == 'https://example.com/alice.ogg'
+
+
+def test_cards_with_blobs_are_saved_as_read(tmp_path):
+    path = tmp_path / 'contacts.vcf'
+    path.write_text(vcard('Alice', fold(f"PHOTO;ENCODING=b;TYPE=JPEG:{base64.b64encode(PHOTO).decode()}"))
+                    + vcard('Bob'), newline='')
+    output: str = str(tmp_path / 'saved.vcf')
+    VCFManager(str(path)).save(output)
+
+    with open(output, 'rb') as f:
+        assert f.read() == path.read_bytes()
+
+
+def test_extract_writes_the_inline_blobs(tmp_path):
+    path = tmp_path / 'contacts.vcf'
+    path.write_text(vcard('Alice Doe', fold(f"PHOTO;ENCODING=b;TYPE=JPEG:{base64.b64encode(PHOTO).decode()}"),
+                          f"PHOTO;ENCODING=b;TYPE=JPEG:{base64.b64encode(LOGO).decode()}\r\n")
+                    + vcard('Bob', "LOGO;VALUE=uri:https://example.com/bob.png\r\n",
+                            f"item1.LOGO:data:image/png;base64,{base64.b64encode(LOGO).decode()}\r\n"), newline='')
+    directory: str = str(tmp_path / 'blobs')
+    extractor: BlobExtractor = BlobExtractor(workers=2)
+    paths: list[str] = extractor.extract(str(path), directory)
+
+    assert [os.path.basename(blob_path) for blob_path in paths] == ['000001-Alice_Doe-photo.jpeg',
+                                                                     '000001-Alice_Doe-photo2.jpeg',
+                                                                     '000002-Bob-logo.png']
+    with open(paths[0], 'rb') as f:
+        assert f.read() == PHOTO
+    assert (extractor.get_file_count(), extractor.get_byte_count()) == (3, len(PHOTO) + 2 * len(LOGO))
+    assert sorted(os.listdir(directory)) == sorted(os.path.basename(blob_path) for blob_path in paths)
+
+
+def test_cli_extract(tmp_path):
+    path = tmp_path / 'contacts.vcf'
+    path.write_text(vcard('Alice', f"PHOTO;ENCODING=b;TYPE=JPEG:{base64.b64encode(PHOTO).decode()}\r\n"), newline='')
+
+    assert CLI.extract_blobs(str(path), str(tmp_path / 'blobs')) == "1 files extracted, 0.0 MB"
+    assert CLI.extract_blobs(str(tmp_path / 'calendar.ics'), str(tmp_path / 'blobs')) == "Incorrect file input"
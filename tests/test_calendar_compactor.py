@@ -0,0 +1,91 @@
+"""! File containing the tests of the compaction of a calendar into an archive.
+A compaction interrupted between the replacement of the two files must not lose an event.
+
+@author Benjamin PAUMARD
+@version 1.0.0
+@since 19 October 2026
+"""
+
+# importing libs
+import os
+from datetime import datetime, timezone
+
+import pytest
+
+# importing modules
+from process.archive.calendar_compactor import CalendarCompactor
+from process.stream.record_reader import RecordReader
+from process.writer.file_writer import FileWriter
+
+CALENDAR: bytes = b'BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:-//a//EN\r\n' \
+                  b'BEGIN:VEVENT\r\nUID:past\r\nDTSTART:20200101T090000Z\r\nDTEND:20200101T100000Z\r\nEND:VEVENT\r\n' \
+                  b'BEGIN:VEVENT\r\nUID:future\r\nDTSTART:20300101T090000Z\r\nDTEND:20300101T100000Z\r\nEND:VEVENT\r\n' \
+                  b'END:VCALENDAR\r\n'
+CUTOFF: float = datetime(2025, 1, 1, tzinfo=timezone.utc).timestamp()
+
+
+def get_uids(path: str) -> list[str]:
+    return [RecordReader.get_property(lines, 'UID') for _, lines in RecordReader(path).records()]
+
+
+def test_compact_moves_the_past_events(tmp_path):
+    path: str = str(tmp_path / 'calendar.ics')
+    archive_path: str = str(tmp_path / 'archive.ics')
+    with open(path, 'wb') as f:
+        f.write(CALENDAR)
+
+    compactor: CalendarCompactor = CalendarCompactor(CUTOFF)
+    compactor.compact(path, archive_path)
+
+    assert get_uids(path) == ['future']
+    assert get_uids(archive_path) == ['past']
+    assert (compactor.get_kept_count(), compactor.get_archived_count()) == (1, 1)
+    assert RecordReader(archive_path).header() == ['VERSION:2.0', 'PRODID:-//a//EN']
+
+
+def test_failure_between_the_renames_loses_no_event(tmp_path, monkeypatch):
+    path: str = str(tmp_path / 'calendar.ics')
+    archive_path: str = str(tmp_path / 'archive.ics')
+    with open(path, 'wb') as f:
+        f.write(CALENDAR)
+
+    # the rename of the calendar fails once the archive is replaced
+    replace = FileWriter.replace
+
+    def fail(temporary: str, destination: str) -> None:
+        if destination == path:
+            raise OSError('interrupted')
+        replace(temporary, destination)
+
+    monkeypatch.setattr(FileWriter, 'replace', staticmethod(fail))
+    with pytest.raises(OSError):
+        CalendarCompactor(CUTOFF).compact(path, archive_path)
+
+    # the event is in the archive and still in the calendar, no temporary file is left
+    assert get_uids(path) == ['past', 'future']
+    assert get_uids(archive_path) == ['past']
+    assert sorted(os.listdir(tmp_path)) == ['archive.ics', 'calendar.ics']
+
+    # the compaction run again does not archive the event twice
+    monkeypatch.setattr(FileWriter, 'replace', staticmethod(replace))
+    CalendarCompactor(CUTOFF).compact(path, archive_path)
+    assert get_uids(path) == ['future']
+    assert get_uids(archive_path) == ['past']
+
+
+def test_failure_of_the_write_keeps_both_files(tmp_path, monkeypatch):
+    path: str = str(tmp_path / 'calendar.ics')
+    archive_path: str = str(tmp_path / 'archive.ics')
+    with open(path, 'wb') as f:
+        f.write(CALENDAR)
+
+    def fail(temporary: str, destination: str) -> None:
+        raise OSError('interrupted')
+
+    monkeypatch.setattr(FileWriter, 'replace', staticmethod(fail))
+    with pytest.raises(OSError):
+        CalendarCompactor(CUTOFF).compact(path, archive_path)
+
+    with open(path, 'rb') as f:
+        assert f.read() == CALENDAR
+    assert sorted(os.listdir(tmp_path)) == ['calendar.ics']
@@ -0,0 +1,26 @@
+"""! File containing the tests of the partial reads of a calendar with its index.
+The events read with the index are compared with the ones of a full read.
+
+@author Benjamin PAUMARD
+@version 1.0.0
+@since 19 October 2026
+"""
+
+# importing modules
+from benchmark.ics_generator import ICSGenerator
+from process.manager.ics_manager import ICSManager
+
+
+def test_read_range_finds_the_events_of_a_full_read(tmp_path):
+    path: str = str(tmp_path / 'calendar.ics')
+    ICSGenerator().generate(path, 100)
+    full: ICSManager = ICSManager()
+    full.read(path)
+
+    # windows ending at the start of an event, or reduced to it
+    for vevent in full.get_vevents():
+        for start, end in ((vevent.get_utc_start() - 3600, vevent.get_utc_start()), (vevent.get_utc_start(), vevent.get_utc_start())):
+            expected: set[str] = {found.get_uid() for found in full.get_vevents_between(start, end)}
+            partial: ICSManager = ICSManager()
+            partial.read_range(path, start, end)
+            assert expected <= {found.get_uid() for found in partial.get_vevents_between(start, end)}
@@ -0,0 +1,82 @@
+"""! File containing the tests of the calendars split into monthly shards.
+The shards joined again must give the calendar, with its properties.
+
+@author Benjamin PAUMARD
+@version 1.0.0
+@since 19 October 2026
+"""
+
+# importing libs
+import json
+import os
+
+import pytest
+
+# importing modules
+from cli import CLI
+from process.manager.ics_manager import ICSManager
+from process.shard.calendar_shards import CalendarShards, MANIFEST_NAME
+from process.stream.record_reader import RecordReader
+
+HEADER: str = "BEGIN:VCALENDAR\nVERSION:2.0\nPRODID:-//a//EN\nX-WR-CALNAME:Team\n"
+
+
+def vevent(uid: str, start: str) -> str:
+    return f"BEGIN:VEVENT\nUID:{uid}\nDTSTART:{start}\nDTEND:{start}\nSUMMARY:{uid}\nEND:VEVENT\n"
+
+
+def test_shards_keep_the_properties_of_the_calendar(tmp_path):
+    path = tmp_path / 'calendar.ics'
+    path.write_text(HEADER + vevent('a', '20240105T090000Z') + vevent('b', '20240210T090000Z') + "END:VCALENDAR\n")
+    directory: str = str(tmp_path / 'shards')
+
+    assert ICSManager(str(path)).save_shards(directory) == ['2024-01', '2024-02']
+
+    # the manifest and every shard keep the properties
+    with open(os.path.join(directory, MANIFEST_NAME)) as f:
+        assert json.load(f)['header'] == ['VERSION:2.0', 'PRODID:-//a//EN', 'X-WR-CALNAME:Team']
+    for month in ('2024-01', '2024-02'):
+        assert RecordReader(os.path.join(directory, f"{month}.ics")).header() == ['VERSION:2.0', 'PRODID:-//a//EN',
+                                                                                 'X-WR-CALNAME:Team']
+
+    # the joined calendar too
+    output: str = str(tmp_path / 'joined.ics')
+    manager: ICSManager = ICSManager()
+    manager.read_shards(directory)
+    manager.save(output)
+    assert RecordReader(output).header() == ['VERSION:2.0', 'PRODID:-//a//EN', 'X-WR-CALNAME:Team']
+    assert [RecordReader.get_property(lines, 'UID') for _, lines in RecordReader(output).records()] == ['a', 'b']
+
+
+def test_manifest_without_properties_is_read(tmp_path):
+    with open(tmp_path / MANIFEST_NAME, 'w') as f:
+        json.dump({'version': 1, 'shards': {}}, f)
+
+    assert CalendarShards(str(tmp_path)).get_header() == []
+
+
+def test_empty_month_has_no_shard(tmp_path):
+    path = tmp_path / 'calendar.ics'
+    path.write_text(HEADER + vevent('a', '20240105T090000Z') + "END:VCALENDAR\n")
+    directory: str = str(tmp_path / 'shards')
+    ICSManager(str(path)).save_shards(directory)
+
+    shards: CalendarShards = CalendarShards(directory)
+    shards.write_shard('2024-01', [], [], [])
+    shards.save_manifest()
+
+    assert CalendarShards(directory).get_months() == []
+    assert os.listdir(directory) == [MANIFEST_NAME]
+
+
+def test_free_busy_components_are_not_sharded(tmp_path):
+    path = tmp_path / 'calendar.ics'
+    path.write_text(HEADER + vevent('a', '20240105T090000Z')
+                    + "BEGIN:VFREEBUSY\nUID:f\nDTSTART:20240101T000000Z\nDTEND:20240201T000000Z\nEND:VFREEBUSY\n"
+                    + "END:VCALENDAR\n")
+    directory: str = str(tmp_path / 'shards')
+
+    assert CLI.shard_file(str(path), directory) == "Error, incorrect component: VFREEBUSY cannot be sharded"
+    with pytest.raises(ValueError):
+        ICSManager(str(path)).save_shards(directory)
+    assert not os.path.exists(directory)
@@ -0,0 +1,32 @@
+"""! File containing the tests of the merge of duplicated contacts.
+
+@author Benjamin PAUMARD
+@version 1.0.0
+@since 19 October 2026
+"""
+
+# importing modules
+from data.vcf.vcard import VCard
+from process.builder.vcard_builder import VCardBuilder
+from process.dedupe.contact_deduplicator import ContactDeduplicator
+
+# a card with a UID and a photo, and a richer duplicate without them
+WITH_PHOTO: bytes = b'BEGIN:VCARD\r\nVERSION:3.0\r\nUID:u1\r\nFN:John Doe\r\nN:Doe;John;;;\r\nEMAIL:john@example.com\r\n' \
+                    b'PHOTO;ENCODING=b;TYPE=JPEG:aGVsbG8gd29y\r\n bGQ=\r\nEND:VCARD\r\n'
+WITHOUT_PHOTO: bytes = b'BEGIN:VCARD\r\nVERSION:3.0\r\nFN:John Doe\r\nN:Doe;John;;;\r\nEMAIL:john@example.com\r\n' \
+                       b'TEL:+33 6 00 00 00 00\r\nEND:VCARD\r\n'
+
+
+def test_merge_keeps_the_uid_and_the_blobs():
+    vcards: list[VCard] = [VCardBuilder().build_verbatim(WITH_PHOTO), VCardBuilder().build_verbatim(WITHOUT_PHOTO)]
+    merged: list[VCard] = ContactDeduplicator().dedupe(vcards)
+
+    assert len(merged) == 1
+    assert merged[0].get_uid() == 'u1'
+    assert [blob.get_data() for blob in merged[0].get_blobs()] == [b'hello world']
+    assert len(merged[0].get_phones()) == 1
+
+
+def test_merge_does_not_repeat_a_shared_blob():
+    merged: VCard = ContactDeduplicator().merge([VCardBuilder().build_verbatim(WITH_PHOTO), VCardBuilder().build_verbatim(WITH_PHOTO)])
+    assert len(merged.get_blobs()) == 1
@@ -0,0 +1,76 @@
+"""! File containing the tests of the sort of files larger than the memory budget.
+The records spilled into many runs must come out like a stable sort in memory.
+
+@author Benjamin PAUMARD
+@version 1.0.0
+@since 19 October 2026
+"""
+
+# importing modules
+import process.sort.external_sorter as external_sorter
+from process.sort.external_sorter import ExternalSorter
+from process.stream.record_reader import RecordReader
+
+# full names with duplicates, the NOTE keeps the position in the file
+NAMES: list[str] = ['Carol', 'alice', 'Bob', 'Alice', 'carol', 'Bob', 'Dave', 'alice', 'Bob', 'Eve']
+
+
+def write_contacts(path: str) -> None:
+    with open(path, 'wb') as f:
+        for index, name in enumerate(NAMES):
+            f.write(f"BEGIN:VCARD\r\nVERSION:3.0\r\nFN:{name}\r\nNOTE:{index}\r\nEND:VCARD\r\n".encode())
+
+
+def get_notes(path: str) -> list[int]:
+    return [int(RecordReader.get_property(lines, 'NOTE')) for _, lines in RecordReader(path).records()]
+
+
+def test_runs_give_a_stable_sort(tmp_path):
+    path: str = str(tmp_path / 'contacts.vcf')
+    output_path: str = str(tmp_path / 'sorted.vcf')
+    write_contacts(path)
+
+    # every record is spilled into its own run
+    sorter: ExternalSorter = ExternalSorter(1)
+    sorter.sort(path, output_path)
+
+    expected: list[int] = sorted(range(len(NAMES)), key=lambda index: NAMES[index].casefold())
+    assert get_notes(output_path) == expected
+    assert sorter.get_run_count() == len(NAMES)
+    assert sorter.get_record_count() == len(NAMES)
+    # the line breaks of the file are kept
+    with open(output_path, 'rb') as f:
+        data: bytes = f.read()
+    assert data.count(b'\r\n') == data.count(b'\n') == len(NAMES) * 5
+
+
+def test_runs_over_the_fan_in_are_merged_by_groups(tmp_path, monkeypatch):
+    path: str = str(tmp_path / 'contacts.vcf')
+    output_path: str = str(tmp_path / 'sorted.vcf')
+    write_contacts(path)
+
+    # the runs are merged 3 by 3 before the output is written
+    monkeypatch.setattr(external_sorter, 'FAN_IN', 3)
+    ExternalSorter(1).sort(path, output_path)
+
+    expected: list[int] = sorted(range(len(NAMES)), key=lambda index: NAMES[index].casefold())
+    assert get_notes(output_path) == expected
+    # the runs are removed once merged
+    assert sorted(p.name for p in tmp_path.iterdir()) == ['contacts.vcf', 'sorted.vcf']
+
+
+def test_calendar_keeps_its_header_and_timezones(tmp_path):
+    path: str = str(tmp_path / 'calendar.ics')
+    output_path: str = str(tmp_path / 'sorted.ics')
+    with open(path, 'wb') as f:
+        f.write(b'BEGIN:VCALENDAR\nVERSION:2.0\nPRODID:-//a//EN\n'
+                b'BEGIN:VEVENT\nUID:late\nDTSTART:20240301T090000Z\nEND:VEVENT\n'
+                b'BEGIN:VTIMEZONE\nTZID:Europe/Paris\nEND:VTIMEZONE\n'
+                b'BEGIN:VEVENT\nUID:early\nDTSTART:20240101T090000Z\nEND:VEVENT\n'
+                b'END:VCALENDAR\n')
+
+    ExternalSorter(1).sort(path, output_path)
+
+    assert RecordReader(output_path).header() == ['VERSION:2.0', 'PRODID:-//a//EN']
+    assert [name for name, _ in RecordReader(output_path).records()] == ['VTIMEZONE', 'VEVENT', 'VEVENT']
+    assert [RecordReader.get_property(lines, 'UID') for _, lines in RecordReader(output_path).records()][1:] == ['early', 'late']
@@ -0,0 +1,51 @@
+"""! File containing the tests of the diff of files whose records share a key.
+The records with a same UID are matched one by one, none of them is lost.
+
+@author Benjamin PAUMARD
+@version 1.0.0
+@since 19 October 2026
+"""
+
+# importing modules
+from process.diff.file_diff import FileDiff
+
+
+def write_calendar(path, summaries: list[str]) -> str:
+    """! Function that write a calendar whose events all have the same UID.
+
+    @param path the path of the calendar.
+    @param summaries the summary of each event.
+    @return the path as a string.
+    """
+    events: str = ''.join(f"BEGIN:VEVENT\nUID:same\nSUMMARY:{summary}\nEND:VEVENT\n" for summary in summaries)
+    path.write_text(f"BEGIN:VCALENDAR\nVERSION:2.0\n{events}END:VCALENDAR\n")
+    return str(path)
+
+
+def test_duplicated_keys_are_all_reported(tmp_path):
+    old_path: str = write_calendar(tmp_path / 'old.ics', ['a', 'b'])
+    new_path: str = write_calendar(tmp_path / 'new.ics', ['c'])
+    diff: FileDiff = FileDiff()
+    results: list = list(diff.diff(old_path, new_path))
+
+    assert sorted(status for status, _, _ in results) == ['modified', 'removed']
+    assert diff.get_counts() == (0, 1, 1)
+
+
+def test_reordered_duplicates_are_not_changes(tmp_path):
+    old_path: str = write_calendar(tmp_path / 'old.ics', ['a', 'b'])
+    new_path: str = write_calendar(tmp_path / 'new.ics', ['b', 'a'])
+    diff: FileDiff = FileDiff()
+
+    assert list(diff.diff(old_path, new_path)) == []
+    assert diff.get_counts() == (0, 0, 0)
+
+
+def test_identical_duplicates_are_counted(tmp_path):
+    old_path: str = write_calendar(tmp_path / 'old.ics', ['a'])
+    new_path: str = write_calendar(tmp_path / 'new.ics', ['a', 'a', 'b'])
+    diff: FileDiff = FileDiff()
+    results: list = list(diff.diff(old_path, new_path))
+
+    assert [status for status, _, _ in results] == ['added', 'added']
+    assert diff.get_counts() == (2, 0, 0)
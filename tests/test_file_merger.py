@@ -0,0 +1,53 @@
+"""! File containing the tests of the merge of files by UID.
+The most recent version of a record is kept, the records without UID are all kept.
+
+@author Benjamin PAUMARD
+@version 1.0.0
+@since 19 October 2026
+"""
+
+# importing modules
+from process.merge.file_merger import FileMerger
+from process.stream.record_reader import RecordReader
+
+
+def write(path, content: str) -> str:
+    path.write_bytes(content.encode())
+    return str(path)
+
+
+def vevent(uid: str, summary: str, sequence: int = 0, recurrence_id: str = '') -> str:
+    recurrence: str = f"RECURRENCE-ID:{recurrence_id}\n" if recurrence_id != '' else ''
+    return f"BEGIN:VEVENT\nUID:{uid}\n{recurrence}SEQUENCE:{sequence}\nSUMMARY:{summary}\nEND:VEVENT\n"
+
+
+def test_merge_keeps_the_latest_revision(tmp_path):
+    first: str = write(tmp_path / 'first.ics', "BEGIN:VCALENDAR\nVERSION:2.0\nPRODID:-//first//EN\n"
+                       + vevent('a', 'new', 2) + vevent('b', 'b') + vevent('r', 'master')
+                       + "END:VCALENDAR\n")
+    second: str = write(tmp_path / 'second.ics', "BEGIN:VCALENDAR\nVERSION:2.0\nPRODID:-//second//EN\n"
+                        + vevent('a', 'old', 1) + vevent('r', 'moved', 0, '20240102T090000Z')
+                        + "BEGIN:VEVENT\nSUMMARY:no uid\nEND:VEVENT\nEND:VCALENDAR\n")
+    output: str = str(tmp_path / 'merged.ics')
+
+    merger: FileMerger = FileMerger()
+    merger.merge([first, second], output)
+
+    summaries: list[str] = [RecordReader.get_property(lines, 'SUMMARY') for _, lines in RecordReader(output).records()]
+    # the modified occurrence does not replace its master
+    assert summaries == ['new', 'b', 'master', 'moved', 'no uid']
+    assert (merger.get_read_count(), merger.get_written_count()) == (6, 5)
+    # the properties of the first calendar are kept
+    assert RecordReader(output).header() == ['VERSION:2.0', 'PRODID:-//first//EN']
+
+
+def test_merge_into_one_of_the_merged_files(tmp_path):
+    first: str = write(tmp_path / 'first.vcf', "BEGIN:VCARD\nVERSION:3.0\nUID:a\nFN:New\nREV:2024-02-01\nEND:VCARD\n")
+    second: str = write(tmp_path / 'second.vcf', "BEGIN:VCARD\nVERSION:3.0\nUID:a\nFN:Old\nREV:20240101\nEND:VCARD\n"
+                        "BEGIN:VCARD\nVERSION:3.0\nUID:b\nFN:Other\nEND:VCARD\n")
+
+    # the winner is read from the output while it is written
+    FileMerger().merge([first, second], first)
+
+    assert [RecordReader.get_property(lines, 'FN') for _, lines in RecordReader(first).records()] == ['New', 'Other']
+    assert sorted(p.name for p in tmp_path.iterdir()) == ['first.vcf', 'second.vcf']
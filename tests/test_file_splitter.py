@@ -0,0 +1,76 @@
+"""! File containing the tests of the split of a file into shards.
+The shards joined in order must give the records of the file, each shard of a calendar being a complete calendar.
+
+@author Benjamin PAUMARD
+@version 1.0.0
+@since 19 October 2026
+"""
+
+# importing libs
+import os
+
+# importing modules
+from process.split.file_splitter import FileSplitter
+from process.stream.record_reader import RecordReader
+
+TIMEZONE: bytes = b'BEGIN:VTIMEZONE\r\nTZID:Europe/Paris\r\nBEGIN:STANDARD\r\nDTSTART:19701025T030000\r\n' \
+                  b'TZOFFSETFROM:+0200\r\nTZOFFSETTO:+0100\r\nEND:STANDARD\r\nEND:VTIMEZONE\r\n'
+
+
+def write_calendar(path: str, sizes: list[int]) -> None:
+    with open(path, 'wb') as f:
+        f.write(b'BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:-//a//EN\r\n' + TIMEZONE)
+        for index, size in enumerate(sizes):
+            f.write(f"BEGIN:VEVENT\r\nUID:{index:02d}\r\nDTSTART;TZID=Europe/Paris:20240101T090000\r\n"
+                    f"DESCRIPTION:{'x' * size}\r\nEND:VEVENT\r\n".encode())
+        f.write(b'END:VCALENDAR\r\n')
+
+
+def test_balanced_shards_keep_the_calendar(tmp_path):
+    path: str = str(tmp_path / 'calendar.ics')
+    write_calendar(path, [10] * 12)
+
+    splitter: FileSplitter = FileSplitter(shards=3, workers=2)
+    paths: list[str] = splitter.split(path, str(tmp_path / 'shards'))
+
+    assert [os.path.basename(shard) for shard in paths] == ['calendar-0001.ics', 'calendar-0002.ics', 'calendar-0003.ics']
+    assert splitter.get_record_count() == 12
+
+    uids: list[str] = []
+    for shard in paths:
+        # every shard is a calendar with the properties and the timezones of the file, and its line breaks
+        with open(shard, 'rb') as f:
+            data: bytes = f.read()
+        assert data.startswith(b'BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:-//a//EN\r\n' + TIMEZONE)
+        assert data.endswith(b'END:VCALENDAR\r\n')
+        assert data.count(b'\r\n') == data.count(b'\n')
+
+        records: list = list(RecordReader(shard).records())
+        assert records[0][0] == 'VTIMEZONE'
+        # the records have the same size, so the shards have the same number of them
+        assert len(records) == 5
+        uids += [RecordReader.get_property(lines, 'UID') for name, lines in records if name == 'VEVENT']
+
+    assert uids == [f"{index:02d}" for index in range(12)]
+
+
+def test_large_record_gets_a_shard(tmp_path):
+    path: str = str(tmp_path / 'calendar.ics')
+    write_calendar(path, [1000, 10, 10, 10])
+
+    paths: list[str] = FileSplitter(shards=2).split(path, str(tmp_path / 'shards'))
+
+    counts: list[int] = [len(list(RecordReader(shard).records())) - 1 for shard in paths]
+    assert counts == [1, 3]
+
+
+def test_calendar_without_properties_gets_the_default_ones(tmp_path):
+    path: str = str(tmp_path / 'calendar.ics')
+    with open(path, 'wb') as f:
+        f.write(b'BEGIN:VCALENDAR\nBEGIN:VEVENT\nUID:0\nEND:VEVENT\nEND:VCALENDAR\n')
+
+    paths: list[str] = FileSplitter(max_records=1).split(path, str(tmp_path / 'shards'))
+
+    assert RecordReader(paths[0]).header() == ['VERSION:2.0', 'PRODID:-//XYZproduct//EN']
+    with open(paths[0], 'rb') as f:
+        assert b'\r\n' not in f.read()
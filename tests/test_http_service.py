@@ -0,0 +1,97 @@
+"""! File containing the tests of the HTTP service.
+A response must match its ETag, even when the file is parsed again while it is built.
+
+@author Benjamin PAUMARD
+@version 1.0.0
+@since 19 October 2026
+"""
+
+# importing libs
+import json
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+
+# importing modules
+from process.server.http_service import HTTPService
+
+
+def vcard(uid: str, name: str) -> str:
+    return f"BEGIN:VCARD\nVERSION:3.0\nUID:{uid}\nFN:{name}\nN:{name};;;;\nEND:VCARD\n"
+
+
+@pytest.fixture
+def service(tmp_path):
+    path = tmp_path / 'contacts.vcf'
+    path.write_text(vcard('a', 'Alice') + vcard('b', 'Bob'))
+    service: HTTPService = HTTPService([str(path)], '127.0.0.1', 0)
+    thread: threading.Thread = threading.Thread(target=service.serve_forever, daemon=True)
+    thread.start()
+    yield service, path
+    service.shutdown()
+    service.server_close()
+
+
+def get(service: HTTPService, path: str, etag: str = '') -> tuple[int, str, object]:
+    request: urllib.request.Request = urllib.request.Request(f"http://127.0.0.1:{service.server_address[1]}{path}")
+    if etag != '':
+        request.add_header('If-None-Match', etag)
+    try:
+        with urllib.request.urlopen(request) as response:
+            return response.status, response.headers['ETag'], json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        return e.code, e.headers['ETag'], None
+
+
+def test_pages_and_uid(service):
+    service, _ = service
+    status, _, files = get(service, '/files')
+    assert status == 200 and files[0]['name'] == 'contacts.vcf' and files[0]['records'] == 2
+
+    status, _, page = get(service, '/files/contacts.vcf?limit=1')
+    assert (page['total'], page['next'], len(page['items'])) == (2, 1, 1)
+
+    status, _, records = get(service, '/files/contacts.vcf/b')
+    assert status == 200 and records[0]['full_name'] == 'Bob'
+    assert get(service, '/files/contacts.vcf/c')[0] == 404
+    assert get(service, '/files/other.vcf')[0] == 404
+
+
+def test_etag_gives_a_304_until_the_file_changes(service):
+    service, path = service
+    status, etag, _ = get(service, '/files/contacts.vcf')
+    assert status == 200 and etag != ''
+
+    status, cached_etag, content = get(service, '/files/contacts.vcf', etag)
+    assert (status, cached_etag, content) == (304, etag, None)
+
+    # the changed file gets a new ETag and its new content
+    path.write_text(vcard('a', 'Alice') + vcard('b', 'Bob') + vcard('c', 'Carol'))
+    status, new_etag, page = get(service, '/files/contacts.vcf', etag)
+    assert status == 200 and new_etag != etag and page['total'] == 3
+
+
+def test_file_is_not_parsed_again_while_it_is_read(service):
+    service, path = service
+    read: list[tuple[str, int]] = []
+
+    def reload() -> None:
+        read.append(service.read_model('contacts.vcf', lambda etag, manager, _: (etag, len(manager.get_vcards()))))
+
+    def slow_read(etag: str, manager, by_uid: dict) -> tuple[str, int]:
+        # the file changes while it is read, the other read waits for this one
+        path.write_text(vcard('a', 'Alice'))
+        thread.start()
+        thread.join(0.2)
+        assert thread.is_alive()
+        assert len(manager.get_vcards()) == 2 and sorted(by_uid.keys()) == ['a', 'b']
+        return etag, len(manager.get_vcards())
+
+    thread: threading.Thread = threading.Thread(target=reload)
+    etag, count = service.read_model('contacts.vcf', slow_read)
+    thread.join()
+
+    assert count == 2
+    assert read[0][0] != etag and read[0][1] == 1
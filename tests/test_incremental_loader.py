@@ -0,0 +1,70 @@
+"""! File containing the tests of the incremental reload of a file.
+A refresh cancelled after some chunks must leave the manager and the loader as they were.
+
+@author Benjamin PAUMARD
+@version 1.0.0
+@since 19 October 2026
+"""
+
+# importing libs
+import threading
+
+# importing modules
+import process.watch.incremental_loader as incremental_loader
+from process.manager.ics_manager import ICSManager
+from process.manager.vcf_manager import VCFManager
+from process.watch.incremental_loader import IncrementalLoader
+
+
+def calendar(tzid: str, uids: list[str]) -> str:
+    events: str = ''.join(f"BEGIN:VEVENT\nUID:{uid}\nSUMMARY:{uid}\nDTSTART;TZID={tzid}:20240101T090000\n"
+                          f"DTEND;TZID={tzid}:20240101T100000\nEND:VEVENT\n" for uid in uids)
+    return f"BEGIN:VCALENDAR\nVERSION:2.0\nPRODID:-//a//EN\nBEGIN:VTIMEZONE\nTZID:{tzid}\nBEGIN:STANDARD\n" \
+           f"DTSTART:19701025T030000\nTZOFFSETFROM:+0200\nTZOFFSETTO:+0100\nEND:STANDARD\nEND:VTIMEZONE\n" \
+           f"{events}END:VCALENDAR\n"
+
+
+def test_cancelled_refresh_keeps_the_calendar(tmp_path, monkeypatch):
+    path = tmp_path / 'calendar.ics'
+    path.write_text(calendar('Europe/Paris', ['a', 'b']))
+    manager: ICSManager = ICSManager()
+    loader: IncrementalLoader = IncrementalLoader(manager, str(path))
+    vevents: list = list(manager.get_vevents())
+    vtimezones: list = list(manager.get_vtimezones())
+    digest: str = loader.get_digest()
+
+    # the refresh is cancelled once its first chunk is built
+    monkeypatch.setattr(incremental_loader, 'CHUNK', 1)
+    path.write_text(calendar('Europe/Berlin', ['c', 'd', 'e']))
+    stop: threading.Event = threading.Event()
+    assert loader.refresh(lambda consumed, size, records: stop.set(), stop) == ([], [])
+
+    assert manager.get_vevents() == vevents and manager.get_vtimezones() == vtimezones
+    assert [vtimezone.get_tzid() for vtimezone in manager.get_vtimezones()] == ['Europe/Paris']
+    assert loader.get_digest() == digest
+
+    # the next refresh loads the whole change
+    added, removed = loader.refresh()
+    assert [vevent.get_uid() for vevent in manager.get_vevents()] == ['c', 'd', 'e']
+    assert [vtimezone.get_tzid() for vtimezone in manager.get_vtimezones()] == ['Europe/Berlin']
+    assert (len(added), len(removed)) == (3, 2)
+    assert loader.get_digest() != digest
+
+
+def test_cancelled_refresh_keeps_the_cards(tmp_path, monkeypatch):
+    path = tmp_path / 'contacts.vcf'
+    path.write_text("BEGIN:VCARD\nVERSION:3.0\nFN:Alice\nEND:VCARD\n")
+    manager: VCFManager = VCFManager()
+    loader: IncrementalLoader = IncrementalLoader(manager, str(path))
+    vcards: list = list(manager.get_vcards())
+
+    monkeypatch.setattr(incremental_loader, 'CHUNK', 1)
+    path.write_text("BEGIN:VCARD\nVERSION:3.0\nFN:Bob\nEND:VCARD\nBEGIN:VCARD\nVERSION:3.0\nFN:Carol\nEND:VCARD\n")
+    stop: threading.Event = threading.Event()
+    loader.refresh(lambda consumed, size, records: stop.set(), stop)
+
+    assert manager.get_vcards() == vcards
+    # the unchanged cards are reused by the next refresh
+    loader.refresh()
+    assert [vcard.get_full_name() for vcard in manager.get_vcards()] == ['Bob', 'Carol']
+    assert loader.get_parsed_count() == 2
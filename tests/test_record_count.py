@@ -0,0 +1,83 @@
+"""! File containing the tests of the count and of the preview of the records of a file.
+The count only looks for the BEGIN lines, the preview stops reading the file after its last record.
+
+@author Benjamin PAUMARD
+@version 1.0.0
+@since 19 October 2026
+"""
+
+# importing modules
+from cli import main
+from process.manager.ics_manager import ICSManager
+from process.manager.vcf_manager import VCFManager
+from process.stream.content_line_reader import ContentLineReader
+
+
+def vcard(name: str) -> str:
+    return f"BEGIN:VCARD\r\nVERSION:3.0\r\nFN:{name}\r\nN:{name};;;;\r\nEND:VCARD\r\n"
+
+
+def test_count_finds_the_records_only(tmp_path):
+    path = tmp_path / 'calendar.ics'
+    path.write_text("BEGIN:VCALENDAR\nVERSION:2.0\nBEGIN:VEVENT\nUID:a\nDESCRIPTION:BEGIN:VEVENT\n"
+                    "BEGIN:VALARM\nACTION:DISPLAY\nEND:VALARM\nEND:VEVENT\nbegin:vevent\nUID:b\nEND:VEVENT\n"
+                    "BEGIN:VTODO\nUID:c\nEND:VTODO\nEND:VCALENDAR")
+
+    assert ContentLineReader(str(path)).count() == {'VEVENT': 2, 'VTODO': 1}
+
+
+def test_count_of_the_first_line_and_of_an_empty_file(tmp_path):
+    path = tmp_path / 'contacts.vcf'
+    path.write_text(vcard('A') + vcard('B'), newline='')
+    empty = tmp_path / 'empty.vcf'
+    empty.write_bytes(b'')
+
+    assert ContentLineReader(str(path)).count() == {'VCARD': 2}
+    assert ContentLineReader(str(empty)).count() == {}
+
+
+def test_limit_stops_reading_the_file(tmp_path, monkeypatch):
+    path = tmp_path / 'contacts.vcf'
+    path.write_text(''.join(vcard(name) for name in 'ABCDEFGH'), newline='')
+
+    # the components streamed from the file
+    streamed: list[str] = []
+    components = ContentLineReader.components
+
+    def spy(self, *args):
+        for component in components(self, *args):
+            streamed.append(component[0])
+            yield component
+
+    monkeypatch.setattr(ContentLineReader, 'components', spy)
+    manager: VCFManager = VCFManager()
+    manager.read(str(path), 3)
+
+    assert [card.get_full_name() for card in manager.get_vcards()] == ['A', 'B', 'C']
+    assert len(streamed) == 4
+
+
+def test_limit_of_a_calendar_counts_the_events_and_todos(tmp_path):
+    path = tmp_path / 'calendar.ics'
+    path.write_text("BEGIN:VCALENDAR\nVERSION:2.0\nBEGIN:VTODO\nUID:t\nSUMMARY:t\nEND:VTODO\n"
+                    + ''.join(f"BEGIN:VEVENT\nUID:{uid}\nSUMMARY:{uid}\nEND:VEVENT\n" for uid in 'abc') + "END:VCALENDAR\n")
+    manager: ICSManager = ICSManager()
+    manager.read(str(path), 2)
+
+    assert [todo.get_summary() for todo in manager.get_vtodos()] == ['t']
+    assert [event.get_summary() for event in manager.get_vevents()] == ['a']
+
+
+def test_cli_count_and_limit(tmp_path, capsys):
+    path = tmp_path / 'contacts.vcf'
+    path.write_text(vcard('Alice') + vcard('Bob'), newline='')
+
+    main(['cli.py', '-i', str(path), '--count'])
+    assert capsys.readouterr().out == "2 contacts\n"
+
+    main(['cli.py', '-i', str(path), '--limit', 'x'])
+    assert capsys.readouterr().out == "Error, incorrect limit: x\n"
+
+    main(['cli.py', '-i', str(path), '--limit', '1'])
+    output: str = capsys.readouterr().out
+    assert '=> Alice' in output and 'Bob' not in output
@@ -0,0 +1,44 @@
+"""! File containing the tests of the records streamed by the merge and the diff.
+The records are read like by the builders, so the line breaks and the folding of a file do not matter.
+
+@author Benjamin PAUMARD
+@version 1.0.0
+@since 19 October 2026
+"""
+
+# importing modules
+from process.diff.file_diff import FileDiff
+from process.stream.record_reader import RecordReader
+
+# the same calendar, folded with CRLF line breaks and unfolded with LF line breaks
+FOLDED: bytes = b'BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:-//a//EN\r\nBEGIN:VEVENT\r\nUID:e1\r\n' \
+                b'DTSTART:20240101T090000\r\nSUMMARY:long\r\n  summary\r\nEND:VEVENT\r\nEND:VCALENDAR\r\n'
+UNFOLDED: bytes = b'BEGIN:VCALENDAR\nVERSION:2.0\nPRODID:-//a//EN\nBEGIN:VEVENT\nUID:e1\n' \
+                  b'DTSTART:20240101T090000\nSUMMARY:long summary\nEND:VEVENT\nEND:VCALENDAR\n'
+
+
+def test_records_are_unfolded(tmp_path):
+    path = tmp_path / 'folded.ics'
+    path.write_bytes(FOLDED)
+    records: list = list(RecordReader(str(path)).records())
+
+    assert [name for name, _ in records] == ['VEVENT']
+    assert 'SUMMARY:long summary' in records[0][1]
+    assert RecordReader(str(path)).header() == ['VERSION:2.0', 'PRODID:-//a//EN']
+
+
+def test_records_are_decoded_with_their_charset(tmp_path):
+    path = tmp_path / 'latin.vcf'
+    path.write_bytes(b'BEGIN:VCARD\r\nVERSION:2.1\r\nFN;CHARSET=ISO-8859-1:Ren\xe9\r\nEND:VCARD\r\n')
+    assert list(RecordReader(str(path)).records()) == [('VCARD', ['BEGIN:VCARD', 'VERSION:2.1', 'FN:René', 'END:VCARD'])]
+
+
+def test_folding_and_line_breaks_are_not_differences(tmp_path):
+    old_path = tmp_path / 'old.ics'
+    new_path = tmp_path / 'new.ics'
+    old_path.write_bytes(FOLDED)
+    new_path.write_bytes(UNFOLDED)
+
+    file_diff: FileDiff = FileDiff()
+    assert list(file_diff.diff(str(old_path), str(new_path))) == []
+    assert file_diff.get_counts() == (0, 0, 0)
@@ -0,0 +1,121 @@
+"""! File containing the tests of the expansion of the recurrence rules.
+The busy blocks of small calendars are compared with the expected occurrences.
+
+@author Benjamin PAUMARD
+@version 1.0.0
+@since 19 October 2026
+"""
+
+# importing libs
+from datetime import datetime, timezone
+
+# importing modules
+from data.ics.vcalendar import VCalendar
+from process.builder.vcalendar_builder import VCalendarBuilder
+from process.freebusy.freebusy_calculator import FreeBusyCalculator
+
+
+def busy(*components: str, start: datetime = datetime(2024, 1, 1), end: datetime = datetime(2024, 4, 1)) -> list[str]:
+    """! Function that compute the busy blocks of a calendar.
+
+    @param components the lines of the components of the calendar.
+    @param start the beginning of the window (optional).
+    @param end the end of the window (optional).
+    @return the starts of the busy blocks, like 20240101T090000.
+    """
+    lines: list[str] = ['BEGIN:VCALENDAR'] + '\n'.join(components).split('\n') + ['END:VCALENDAR']
+    vcalendar: VCalendar = VCalendarBuilder().build(lines)
+    calculator: FreeBusyCalculator = FreeBusyCalculator()
+    calculator.add_calendar(vcalendar)
+    return [datetime.fromtimestamp(block_start, timezone.utc).strftime('%Y%m%dT%H%M%S')
+            for block_start, _ in calculator.compute(start, end)['BUSY']]
+
+
+def vevent(*properties: str, uid: str = 'event@test', dtstart: str = '20240101T090000') -> str:
+    """! Function that write an event of an hour.
+
+    @param properties the other lines of the event.
+    @param uid the UID of the event (optional).
+    @param dtstart the start of the event (optional).
+    @return the lines of the event.
+    """
+    end: str = dtstart[:9] + f"{int(dtstart[9:11]) + 1:02d}" + dtstart[11:]
+    return '\n'.join(['BEGIN:VEVENT', f"UID:{uid}", f"DTSTART:{dtstart}", f"DTEND:{end}", *properties, 'END:VEVENT'])
+
+
+def test_count_limits_the_occurrences():
+    assert busy(vevent('RRULE:FREQ=DAILY;COUNT=2')) == ['20240101T090000', '20240102T090000']
+
+
+def test_until_limits_the_occurrences():
+    assert busy(vevent('RRULE:FREQ=DAILY;UNTIL=20240103T090000')) == ['20240101T090000', '20240102T090000', '20240103T090000']
+
+
+def test_interval_skips_periods():
+    blocks: list[str] = busy(vevent('RRULE:FREQ=WEEKLY;INTERVAL=2'), end=datetime(2024, 2, 1))
+    assert blocks == ['20240101T090000', '20240115T090000', '20240129T090000']
+
+
+def test_interval_of_months():
+    blocks: list[str] = busy(vevent('RRULE:FREQ=MONTHLY;INTERVAL=2;COUNT=3'), end=datetime(2025, 1, 1))
+    assert blocks == ['20240101T090000', '20240301T090000', '20240501T090000']
+
+
+def test_interval_jumps_to_the_window():
+    blocks: list[str] = busy(vevent('RRULE:FREQ=DAILY;INTERVAL=3'), start=datetime(2024, 3, 1), end=datetime(2024, 3, 8))
+    assert blocks == ['20240301T090000', '20240304T090000', '20240307T090000']
+
+
+def test_weekly_byday_expands_the_week():
+    blocks: list[str] = busy(vevent('RRULE:FREQ=WEEKLY;BYDAY=MO,WE,FR;COUNT=4'))
+    assert blocks == ['20240101T090000', '20240103T090000', '20240105T090000', '20240108T090000']
+
+
+def test_daily_byday_limits_the_days():
+    blocks: list[str] = busy(vevent('RRULE:FREQ=DAILY;BYDAY=SA,SU'), end=datetime(2024, 1, 15))
+    assert blocks == ['20240106T090000', '20240107T090000', '20240113T090000', '20240114T090000']
+
+
+def test_monthly_byday_with_ordinals():
+    blocks: list[str] = busy(vevent('RRULE:FREQ=MONTHLY;BYDAY=-1FR;COUNT=3'))
+    assert blocks == ['20240126T090000', '20240223T090000', '20240329T090000']
+
+
+def test_monthly_byday_ends_with_the_last_year():
+    blocks: list[str] = busy(vevent('RRULE:FREQ=MONTHLY;BYDAY=1MO;COUNT=10', dtstart='99991001T090000'),
+                             start=datetime(9999, 10, 1), end=datetime(9999, 12, 31))
+    assert blocks == ['99991004T090000', '99991101T090000', '99991206T090000']
+
+
+def test_exdate_removes_an_occurrence_counted_by_count():
+    blocks: list[str] = busy(vevent('RRULE:FREQ=DAILY;COUNT=3', 'EXDATE:20240102T090000'))
+    assert blocks == ['20240101T090000', '20240103T090000']
+
+
+def test_exdate_with_many_dates():
+    blocks: list[str] = busy(vevent('RRULE:FREQ=DAILY;COUNT=4', 'EXDATE:20240102T090000,20240104T090000'))
+    assert blocks == ['20240101T090000', '20240103T090000']
+
+
+def test_recurrence_id_replaces_an_occurrence():
+    blocks: list[str] = busy(vevent('RRULE:FREQ=DAILY;COUNT=3'),
+                             vevent('RECURRENCE-ID:20240102T090000', dtstart='20240102T140000'))
+    assert blocks == ['20240101T090000', '20240102T140000', '20240103T090000']
+
+
+def test_cancelled_recurrence_id_frees_an_occurrence():
+    blocks: list[str] = busy(vevent('RRULE:FREQ=DAILY;COUNT=3'),
+                             vevent('RECURRENCE-ID:20240102T090000', 'STATUS:CANCELLED', dtstart='20240102T090000'))
+    assert blocks == ['20240101T090000', '20240103T090000']
+
+
+def test_recurrence_id_of_another_event_is_ignored():
+    blocks: list[str] = busy(vevent('RRULE:FREQ=DAILY;COUNT=2'),
+                             vevent('RECURRENCE-ID:20240102T090000', 'STATUS:CANCELLED', uid='other@test'))
+    assert blocks == ['20240101T090000', '20240102T090000']
+
+
+def test_rule_is_saved_with_its_parts():
+    lines: list[str] = vevent('RRULE:FREQ=WEEKLY;INTERVAL=2;BYDAY=MO,WE;COUNT=6').split('\n')
+    vcalendar: VCalendar = VCalendarBuilder().build(['BEGIN:VCALENDAR'] + lines + ['END:VCALENDAR'])
+    assert vcalendar.get_vevents()[0].get_rrules()[0].get_value() == 'FREQ=WEEKLY;COUNT=6;INTERVAL=2;BYDAY=MO,WE'
@@ -0,0 +1,71 @@
+"""! File containing the tests of the line breaks of the saved files.
+An edited file keeps the line breaks it was read with.
+
+@author Benjamin PAUMARD
+@version 1.0.0
+@since 19 October 2026
+"""
+
+# importing libs
+import re
+
+# importing modules
+from benchmark.ics_generator import ICSGenerator
+from benchmark.vcf_generator import VCFGenerator
+from process.manager.ics_manager import ICSManager
+from process.manager.vcf_manager import VCFManager
+
+# a line feed that does not follow a carriage return
+BARE_LINE_FEED: re.Pattern = re.compile(rb'(?<!\r)\n')
+
+
+def to_crlf(path: str) -> None:
+    """! Function that convert the line breaks of a file to \\r\\n.
+
+    @param path the path of the file.
+    """
+    with open(path, 'rb') as f:
+        data: bytes = f.read()
+    with open(path, 'wb') as f:
+        f.write(data.replace(b'\r\n', b'\n').replace(b'\n', b'\r\n'))
+
+
+def test_edited_calendar_keeps_its_crlf(tmp_path):
+    path: str = str(tmp_path / 'calendar.ics')
+    ICSGenerator().generate(path, 20)
+    to_crlf(path)
+
+    ics_manager: ICSManager = ICSManager()
+    ics_manager.read(path)
+    ics_manager.get_vevents()[3].set_summary('edited')
+    ics_manager.save()
+
+    with open(path, 'rb') as f:
+        assert BARE_LINE_FEED.search(f.read()) is None
+
+
+def test_edited_contacts_keep_their_crlf(tmp_path):
+    path: str = str(tmp_path / 'contacts.vcf')
+    VCFGenerator().generate(path, 20, photo_size=300)
+    to_crlf(path)
+
+    vcf_manager: VCFManager = VCFManager()
+    vcf_manager.read(path)
+    vcf_manager.get_vcards()[3].set_note('edited')
+    vcf_manager.save()
+
+    with open(path, 'rb') as f:
+        assert BARE_LINE_FEED.search(f.read()) is None
+
+
+def test_edited_calendar_keeps_its_lf(tmp_path):
+    path: str = str(tmp_path / 'calendar.ics')
+    ICSGenerator().generate(path, 20)
+
+    ics_manager: ICSManager = ICSManager()
+    ics_manager.read(path)
+    ics_manager.get_vevents()[3].set_summary('edited')
+    ics_manager.save()
+
+    with open(path, 'rb') as f:
+        assert b'\r\n' not in f.read()
@@ -0,0 +1,50 @@
+"""! File containing the tests of the socket left by a previous server.
+Only a socket refusing connections may be removed when the server starts.
+
+@author Benjamin PAUMARD
+@version 1.0.0
+@since 19 October 2026
+"""
+
+# importing libs
+import os
+import socket
+
+import pytest
+
+# importing modules
+from process.server.socket_server import SocketServer
+
+
+def test_stale_socket_is_replaced(tmp_path):
+    socket_path: str = str(tmp_path / 's.sock')
+    # a socket bound then closed without being removed, like after a crash
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as stale:
+        stale.bind(socket_path)
+
+    server: SocketServer = SocketServer(socket_path, 1)
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.connect(socket_path)
+    finally:
+        server.server_close()
+
+
+def test_other_file_is_kept(tmp_path):
+    path = tmp_path / 'notes.txt'
+    path.write_text('keep me')
+
+    with pytest.raises(FileExistsError):
+        SocketServer(str(path), 1)
+    assert path.read_text() == 'keep me'
+
+
+def test_socket_of_a_running_server_is_kept(tmp_path):
+    socket_path: str = str(tmp_path / 's.sock')
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as running:
+        running.bind(socket_path)
+        running.listen()
+
+        with pytest.raises(FileExistsError):
+            SocketServer(socket_path, 1)
+        assert os.path.exists(socket_path)
@@ -0,0 +1,23 @@
+"""! File containing the tests of the timezones embedded in a calendar.
+
+@author Benjamin PAUMARD
+@version 1.0.0
+@since 19 October 2026
+"""
+
+# importing libs
+from datetime import datetime, timedelta
+
+# importing modules
+from data.ics.observance import Observance
+from data.ics.vtimezone import VTimezone
+
+
+def test_timezones_do_not_share_their_observances():
+    paris: VTimezone = VTimezone('Europe/Paris')
+    paris.add_observance(Observance('STANDARD', offset_from='+0100', offset_to='+0100'))
+    utc: VTimezone = VTimezone('UTC')
+
+    assert utc.get_observances() == []
+    assert utc.utcoffset(datetime(2024, 1, 1)) == timedelta(0)
+    assert paris.utcoffset(datetime(2024, 1, 1)) == timedelta(hours=1)